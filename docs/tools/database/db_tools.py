@@ -26,6 +26,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_legacy_dir = Path(__file__).parent / "legacy"
+if str(_legacy_dir) not in sys.path:
+    sys.path.insert(0, str(_legacy_dir))
+
+# 解析済みYAMLの共有ディスクキャッシュ（他ツールと共用）
+from shared.performance.yaml_cache import cached_yaml_load
+
+# --profile / --profile-memory（他ツールと共通）
+from shared.monitoring.profiling import add_profile_arguments, profile_command
+
+
+def load_yaml(yaml_path: Path) -> Any:
+    """YAMLファイルを読み込み（共有ディスクキャッシュ経由）"""
+    return cached_yaml_load(yaml_path)
+
 
 class DatabaseToolsConfig:
     """ツール設定管理"""
@@ -69,8 +84,7 @@ class YAMLValidator:
         }
         
         try:
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(yaml_path)
                 
             # 必須セクションチェック
             for section in self.config.required_sections:
@@ -139,8 +153,7 @@ class TableGenerator:
     def generate_ddl(self, yaml_path: Path, output_path: Optional[Path] = None) -> bool:
         """YAMLからDDLを生成"""
         try:
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(yaml_path)
                 
             table_name = data.get('table_name', 'UNKNOWN_TABLE')
             
@@ -163,8 +176,7 @@ class TableGenerator:
     def generate_markdown(self, yaml_path: Path, output_path: Optional[Path] = None) -> bool:
         """YAMLからMarkdown定義書を生成"""
         try:
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(yaml_path)
                 
             table_name = data.get('table_name', 'UNKNOWN_TABLE')
             logical_name = data.get('logical_name', 'テーブル')
@@ -362,8 +374,7 @@ class ConsistencyChecker:
         # 対応するDDL・Markdownファイルの存在チェック
         for yaml_file in yaml_files:
             try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
+                data = load_yaml(yaml_file)
                     
                 table_name = data.get('table_name', '')
                 logical_name = data.get('logical_name', '')
@@ -449,6 +460,7 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     # 共通オプション
     parser.add_argument('--verbose', '-v', action='store_true', help='詳細ログ')
     parser.add_argument('--quiet', '-q', action='store_true', help='エラーのみ出力')
+    add_profile_arguments(parser)
     
     return parser
 
@@ -463,7 +475,13 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     elif args.quiet:
         logging.getLogger().setLevel(logging.ERROR)
-        
+    
+    with profile_command(args, args.command):
+        return run_command(args, parser)
+
+
+def run_command(args, parser: argparse.ArgumentParser) -> int:
+    """コマンド実行"""
     config = DatabaseToolsConfig()
     
     try:
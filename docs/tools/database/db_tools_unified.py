@@ -29,6 +29,10 @@ from modules.table_generator import TableGenerator
 from modules.consistency_checker import ConsistencyChecker
 from modules.sample_data_generator import SampleDataGenerator
 
+# --profile / --profile-memory（他ツールと共通）
+sys.path.append(str(project_root / "legacy"))
+from shared.monitoring.profiling import add_profile_arguments, profile_command
+
 
 class DatabaseToolsUnified:
     """統合データベースツール"""
@@ -200,6 +204,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument('--config', type=str, help='設定ファイルパス')
     parser.add_argument('--log-level', type=str, choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                        default='INFO', help='ログレベル')
+    add_profile_arguments(parser)
     
     return parser
 
@@ -213,6 +218,12 @@ def main():
         parser.print_help()
         return 1
     
+    with profile_command(args, args.command):
+        return run_command(args)
+
+
+def run_command(args) -> int:
+    """コマンド実行"""
     try:
         # 設定の初期化
         config = Config(
@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
 from pathlib import Path
 from core.models import CheckResult, CheckSeverity
 from core.logger import ConsistencyLogger
@@ -12,6 +12,9 @@ from checkers.multitenant_compliance_checker import MultitenantComplianceChecker
 from checkers.requirement_traceability_checker import RequirementTraceabilityChecker
 from checkers.performance_impact_checker import PerformanceImpactChecker
 from parsers.table_list_parser import TableListParser
+from core.schema_snapshot import SchemaSnapshot
+from core.result_cache import CheckResultCache, InputFingerprinter
+from shared.monitoring.tracing import current_span, trace_span
 
 class CheckExecutor:
     """
@@ -26,17 +29,158 @@ class CheckExecutor:
         self.table_existence_checker = TableExistenceChecker(self.logger)
         self.column_consistency_checker = ColumnConsistencyChecker(self.logger)
         self.foreign_key_checker = ForeignKeyChecker(self.logger)
-        self.data_type_checker = DataTypeConsistencyChecker(Path(config.base_dir))
-        self.yaml_format_checker = YamlFormatChecker(config.base_dir)
+        # データ型・YAMLフォーマットのチェッカーは ddl/ と table-details/ の親ディレクトリを基準にする
+        self.data_type_checker = DataTypeConsistencyChecker(Path(config.design_dir))
+        self.yaml_format_checker = YamlFormatChecker(config.design_dir)
         self.constraint_checker = ConstraintConsistencyChecker(self.logger)
         self.multitenant_compliance_checker = MultitenantComplianceChecker(self.logger)
         self.requirement_traceability_checker = RequirementTraceabilityChecker(self.logger)
         self.performance_impact_checker = PerformanceImpactChecker(self.logger)
         self.table_list_parser = TableListParser(self.logger)
+        self.snapshot: Optional[SchemaSnapshot] = None
+        # 直近の実行におけるスナップショットの読み込み・解析回数
+        self.snapshot_statistics: Dict = {}
+
+        # インクリメンタルモード: 入力ハッシュが一致するテーブルは前回結果を再利用
+        self.result_cache: Optional[CheckResultCache] = None
+        self.fingerprinter: Optional[InputFingerprinter] = None
+        if getattr(check_config, 'incremental', False):
+            cache_dir = getattr(config, 'cache_dir', None) or Path(config.base_dir) / ".cache"
+            self.result_cache = CheckResultCache(
+                Path(cache_dir) / "consistency_checker",
+                CheckResultCache.make_config_fingerprint(config, check_config),
+                self.logger
+            )
+            self.result_cache.load()
+
+    def _snapshot_consumers(self) -> list:
+        """スナップショットを共有するチェッカー一覧"""
+        return [
+            self.table_existence_checker,
+            self.column_consistency_checker,
+            self.foreign_key_checker,
+            self.data_type_checker,
+            self.yaml_format_checker,
+            self.constraint_checker,
+            self.multitenant_compliance_checker,
+            self.requirement_traceability_checker,
+            self.performance_impact_checker,
+        ]
+
+    def begin_run(self) -> SchemaSnapshot:
+        """
+        実行開始時にスキーマスナップショットを構築し、全チェッカーに共有する
+
+        Returns:
+            構築したスナップショット
+        """
+        # インクリメンタルモードではキャッシュミスしたテーブルのファイルのみ読み込む
+        self.set_snapshot(SchemaSnapshot.build(
+            self.config, self.logger, preload=self.result_cache is None
+        ))
+        if self.result_cache:
+            self.fingerprinter = InputFingerprinter(self.config)
+        return self.snapshot
+
+    def end_run(self) -> None:
+        """実行終了時にスナップショットを破棄する（次回実行は再読み込み）"""
+        if self.snapshot:
+            stats = self.snapshot.get_statistics()
+            self.snapshot_statistics = stats
+            self.logger.info(
+                f"  スキーマスナップショット: DDL {stats['ddl_files']}件, "
+                f"YAML {stats['yaml_files']}件, 解析 {stats['total_parses']}回"
+            )
+        self.set_snapshot(None)
+
+        if self.result_cache:
+            stats = self.result_cache.get_statistics()
+            self.logger.info(
+                f"  インクリメンタルチェック: 再利用 {stats['hits']}件, 再実行 {stats['misses']}件"
+            )
+            try:
+                self.result_cache.save()
+            except OSError as e:
+                self.logger.warning(f"チェック結果キャッシュの保存に失敗しました: {e}")
+            self.fingerprinter = None
+
+    def set_snapshot(self, snapshot: Optional[SchemaSnapshot]) -> None:
+        """スナップショットを全チェッカーに設定"""
+        self.snapshot = snapshot
+        for checker in self._snapshot_consumers():
+            checker.snapshot = snapshot
+
+    def _get_table_list(self) -> list:
+        """テーブル一覧を取得（スナップショットがあれば再利用）"""
+        if self.snapshot:
+            return self.snapshot.table_list(self.config.table_list_file)
+        return self.table_list_parser.parse_file(self.config.table_list_file)
+
+    def _run_cached(self, check_name: str, scope: str, input_hash: Callable[[], str],
+                    run_fn: Callable[[], List[CheckResult]]) -> List[CheckResult]:
+        """
+        入力ハッシュが一致すればキャッシュ済み結果を返し、それ以外は実行して登録する
+
+        Args:
+            check_name: チェック名
+            scope: キャッシュの単位（テーブル名等）
+            input_hash: 入力ハッシュを算出する関数
+            run_fn: チェック本体
+        """
+        if not self.result_cache or not self.fingerprinter:
+            return run_fn()
+
+        digest = input_hash()
+        cached = self.result_cache.get(check_name, scope, digest)
+        span = current_span()
+        if span is not None:
+            span.set_attribute("cache", "miss" if cached is None else "hit")
+        if cached is not None:
+            return cached
+
+        results = run_fn()
+        self.result_cache.put(check_name, scope, digest, results)
+        return results
+
+    def _run_per_table(self, check_name: str, table_names: List[str],
+                       run_fn: Callable[[List[str]], List[CheckResult]],
+                       input_hash: Optional[Callable[[str], str]] = None) -> List[CheckResult]:
+        """
+        テーブル単位のチェックを実行（テーブルごとにスパンを記録し、インクリメンタルモードではテーブル単位でキャッシュ）
+
+        Args:
+            check_name: チェック名
+            table_names: 対象テーブル名
+            run_fn: テーブル名リストを受け取るチェック本体
+            input_hash: テーブル名から入力ハッシュを算出する関数（省略時はテーブル単位ハッシュ）
+        """
+        if self.result_cache and self.fingerprinter:
+            input_hash = input_hash or self.fingerprinter.table_hash
+        results: List[CheckResult] = []
+        for table_name in table_names:
+            # テーブル単位のスパンはここでのみ開始する（チェック本体では開始しない）
+            with trace_span("check.table", category="table", check=check_name, table=table_name):
+                results.extend(self._run_cached(
+                    check_name, table_name,
+                    lambda: input_hash(table_name),
+                    lambda: run_fn([table_name])
+                ))
+        return results
+
+    def _layout_hash(self, *extra) -> str:
+        """テーブル横断チェック用の入力ハッシュ（DDLファイル名とCREATE TABLE名の対応を含む）"""
+        ddl_dir = Path(self.config.ddl_dir)
+        ddl_files = sorted(ddl_dir.glob("*.sql")) if ddl_dir.exists() else []
+        ddl_table_names = {
+            ddl_file.name: (self.snapshot.ddl_table_name(ddl_file) if self.snapshot
+                            else self.fingerprinter.file_hash(ddl_file))
+            for ddl_file in ddl_files
+        }
+        return self.fingerprinter.layout_hash(ddl_table_names, *extra)
 
     def _get_target_table_names(self) -> List[str]:
         """対象テーブル名を取得するヘルパーメソッド"""
-        tables = self.table_list_parser.parse_file(self.config.table_list_file)
+        tables = self._get_table_list()
         if not tables:
             self.logger.warning("テーブル一覧の解析に失敗しました")
             return []
@@ -46,16 +190,25 @@ class CheckExecutor:
 
     def execute_table_existence_check(self) -> List[CheckResult]:
         self.logger.section("1. テーブル存在確認")
-        return self.table_existence_checker.check_table_existence(
-            table_list_file=self.config.table_list_file,
-            entity_file=self.config.entity_relationships_file,
-            ddl_dir=self.config.ddl_dir,
-            table_details_dir=self.config.table_details_dir,
-            target_tables=self.check_config.target_tables
+        return self._run_cached(
+            "table_existence", "",
+            lambda: self._layout_hash(self.check_config.target_tables),
+            lambda: self.table_existence_checker.check_table_existence(
+                table_list_file=self.config.table_list_file,
+                entity_file=self.config.entity_relationships_file,
+                ddl_dir=self.config.ddl_dir,
+                table_details_dir=self.config.table_details_dir,
+                target_tables=self.check_config.target_tables
+            )
         )
 
     def execute_orphaned_files_check(self) -> List[CheckResult]:
         self.logger.section("2. 孤立ファイル検出")
+        return self._run_cached(
+            "orphaned_files", "", self._layout_hash, self._check_orphaned_files
+        )
+
+    def _check_orphaned_files(self) -> List[CheckResult]:
         orphaned_files = self.table_existence_checker.get_orphaned_files(
             table_list_file=self.config.table_list_file,
             ddl_dir=self.config.ddl_dir,
@@ -116,29 +269,35 @@ class CheckExecutor:
 
     def execute_column_consistency_check(self) -> List[CheckResult]:
         self.logger.section("4. カラム定義整合性")
-        results = []
-        tables = self.table_list_parser.parse_file(self.config.table_list_file)
+        tables = self._get_table_list()
         if not tables:
             self.logger.warning("テーブル一覧の解析に失敗しました")
-            return results
+            return []
         
         if self.check_config.target_tables:
             tables = [t for t in tables if t.table_name in self.check_config.target_tables]
         
-        for table in tables:
-            ddl_path = self.config.ddl_dir / f"{table.table_name}.sql"
-            yaml_path = self.config.table_details_dir / f"{table.table_name}_details.yaml"
+        return self._run_per_table(
+            "column_consistency",
+            [t.table_name for t in tables],
+            self._check_table_columns
+        )
+
+    def _check_table_columns(self, table_names: List[str]) -> List[CheckResult]:
+        results = []
+        for table_name in table_names:
+            ddl_path = self.config.ddl_dir / f"{table_name}.sql"
+            yaml_path = self.config.table_details_dir / f"{table_name}_details.yaml"
             
             if ddl_path.exists() and yaml_path.exists():
-                table_results = self.column_consistency_checker.check_table_column_consistency(
+                results.extend(self.column_consistency_checker.check_table_column_consistency(
                     ddl_path, yaml_path
-                )
-                results.extend(table_results)
+                ))
             else:
                 if not ddl_path.exists():
-                    self.logger.warning(f"  {table.table_name}: DDLファイルが見つかりません")
+                    self.logger.warning(f"  {table_name}: DDLファイルが見つかりません")
                 if not yaml_path.exists():
-                    self.logger.warning(f"  {table.table_name}: YAML詳細ファイルが見つかりません")
+                    self.logger.warning(f"  {table_name}: YAML詳細ファイルが見つかりません")
         return results
 
     def execute_foreign_key_check(self) -> List[CheckResult]:
@@ -147,48 +306,86 @@ class CheckExecutor:
             self.logger.warning("entity_relationships.yamlが見つかりません")
             return []
         
-        return self.foreign_key_checker.check_foreign_key_consistency(
-            entity_yaml_path=self.config.entity_relationships_file,
-            ddl_dir=self.config.ddl_dir,
-            yaml_details_dir=self.config.table_details_dir
-        )
+        def run(table_names: Optional[List[str]]) -> List[CheckResult]:
+            return self.foreign_key_checker.check_foreign_key_consistency(
+                entity_yaml_path=self.config.entity_relationships_file,
+                ddl_dir=self.config.ddl_dir,
+                yaml_details_dir=self.config.table_details_dir,
+                table_names=table_names
+            )
+
+        entity_tables = []
+        if self.snapshot:
+            entity_tables = list(
+                self.snapshot.entity_data(self.config.entity_relationships_file).get('entities') or {}
+            )
+        if not entity_tables:
+            # entity_relationships.yamlの解析エラーはテーブル単位に分割せずそのまま報告する
+            results = run(None)
+        else:
+            results = self._run_per_table(
+                "foreign_key_consistency", entity_tables, run,
+                lambda table_name: self.fingerprinter.foreign_key_hash(table_name)
+            )
+
+        stats = self.foreign_key_checker.reference_index_stats
+        if stats.lookups:
+            self.logger.info(
+                f"  参照先インデックス: 参照 {stats.lookups}回, DDL解析 {stats.parses}回 "
+                f"（{stats.parses_avoided}回の解析を省略）"
+            )
+        return results
 
     def execute_data_type_check(self) -> List[CheckResult]:
         self.logger.section("6. データ型整合性")
         table_names = self._get_target_table_names()
-        return self.data_type_checker.check_all_tables(table_names)
+        return self._run_per_table(
+            "data_type_consistency", table_names, self.data_type_checker.check_all_tables
+        )
 
     def execute_constraint_check(self) -> List[CheckResult]:
         self.logger.section("7. 制約整合性")
         table_names = self._get_target_table_names()
-        return self.constraint_checker.check_constraint_consistency(
-            ddl_dir=self.config.ddl_dir,
-            yaml_details_dir=self.config.table_details_dir,
-            table_names=table_names
+        return self._run_per_table(
+            "constraint_consistency", table_names,
+            lambda names: self.constraint_checker.check_constraint_consistency(
+                ddl_dir=self.config.ddl_dir,
+                yaml_details_dir=self.config.table_details_dir,
+                table_names=names
+            )
         )
 
     def execute_multitenant_compliance_check(self) -> List[CheckResult]:
         self.logger.section("9. マルチテナント対応")
         table_names = self._get_target_table_names()
-        return self.multitenant_compliance_checker.check_multitenant_compliance(
-            ddl_dir=self.config.ddl_dir,
-            yaml_details_dir=self.config.table_details_dir,
-            table_names=table_names
+        return self._run_per_table(
+            "multitenant_compliance", table_names,
+            lambda names: self.multitenant_compliance_checker.check_multitenant_compliance(
+                ddl_dir=self.config.ddl_dir,
+                yaml_details_dir=self.config.table_details_dir,
+                table_names=names
+            )
         )
 
     def execute_requirement_traceability_check(self) -> List[CheckResult]:
         self.logger.section("10. 要求仕様ID追跡")
         table_names = self._get_target_table_names()
-        return self.requirement_traceability_checker.check_requirement_traceability(
-            yaml_details_dir=self.config.table_details_dir,
-            table_names=table_names
+        return self._run_per_table(
+            "requirement_traceability", table_names,
+            lambda names: self.requirement_traceability_checker.check_requirement_traceability(
+                yaml_details_dir=self.config.table_details_dir,
+                table_names=names
+            )
         )
 
     def execute_performance_impact_check(self) -> List[CheckResult]:
         self.logger.section("11. パフォーマンス影響分析")
         table_names = self._get_target_table_names()
-        return self.performance_impact_checker.check_performance_impact(
-            ddl_dir=self.config.ddl_dir,
-            yaml_details_dir=self.config.table_details_dir,
-            table_names=table_names
+        return self._run_per_table(
+            "performance_impact", table_names,
+            lambda names: self.performance_impact_checker.check_performance_impact(
+                ddl_dir=self.config.ddl_dir,
+                yaml_details_dir=self.config.table_details_dir,
+                table_names=names
+            )
         )
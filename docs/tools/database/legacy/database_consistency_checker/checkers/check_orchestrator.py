@@ -1,9 +1,22 @@
-from typing import List
+from typing import Dict, List
 from core.models import CheckResult, CheckConfig, ConsistencyReport, CheckSeverity
 from core.logger import ConsistencyLogger
 from core.config import Config
 from checkers.check_executor import CheckExecutor
+from checkers.check_scheduler import CheckScheduler, CheckTask
 from core.report_builder import ReportBuilder
+from shared.monitoring.tracing import trace_span
+
+# 修正提案が結果を参照するチェック（宣言順）
+FIX_SUGGESTION_DEPENDENCIES = (
+    "table_existence",
+    "orphaned_files",
+    "yaml_format_consistency",
+    "column_consistency",
+    "foreign_key_consistency",
+    "data_type_consistency",
+    "constraint_consistency",
+)
 
 class CheckOrchestrator:
     """
@@ -16,6 +29,9 @@ class CheckOrchestrator:
         self.logger = ConsistencyLogger(verbose=check_config.verbose)
         self.executor = CheckExecutor(self.logger, config, check_config)
         self.report_builder = ReportBuilder(config)
+        # 並列実行数（1の場合は従来どおり逐次実行）
+        self.max_workers = getattr(check_config, 'max_workers', 1) or 1
+        self.scheduler = self._build_scheduler()
 
     def run_all_checks(self) -> ConsistencyReport:
         """
@@ -31,44 +47,15 @@ class CheckOrchestrator:
                 self.logger.error(f"  - {path}")
             return self.report_builder.build_empty_report()
         
-        # 出力ディレクトリの作成
-        self.config.create_output_dirs()
-        
-        all_results = []
-
-        # 1. テーブル存在確認
-        all_results.extend(self.executor.execute_table_existence_check())
-        
-        # 2. 孤立ファイル検出
-        all_results.extend(self.executor.execute_orphaned_files_check())
-        
-        # 3. YAMLフォーマット整合性
-        all_results.extend(self.executor.execute_yaml_format_check())
-        
-        # 4. カラム定義整合性
-        all_results.extend(self.executor.execute_column_consistency_check())
-        
-        # 5. 外部キー整合性
-        all_results.extend(self.executor.execute_foreign_key_check())
-        
-        # 6. データ型整合性
-        all_results.extend(self.executor.execute_data_type_check())
-        
-        # 7. 制約整合性
-        all_results.extend(self.executor.execute_constraint_check())
-        
-        # 8. 修正提案 (他のチェック結果に依存するため、最後に実行)
-        fix_suggestions_results = self._run_fix_suggestions_check(all_results)
-        all_results.extend(fix_suggestions_results)
-        
-        # 9. マルチテナント対応
-        all_results.extend(self.executor.execute_multitenant_compliance_check())
-        
-        # 10. 要求仕様ID追跡
-        all_results.extend(self.executor.execute_requirement_traceability_check())
-        
-        # 11. パフォーマンス影響分析
-        all_results.extend(self.executor.execute_performance_impact_check())
+        # 全チェックで共有するスキーマスナップショットを構築（各ファイル1回のみ解析）
+        with trace_span("consistency_check.run", category="orchestrator",
+                        checks="all", max_workers=self.max_workers) as span:
+            self.executor.begin_run()
+            try:
+                all_results = self.scheduler.run()
+            finally:
+                self.executor.end_run()
+            span.set_attribute("results", len(all_results))
         
         # レポート作成
         report = self.report_builder.build_report(all_results)
@@ -80,49 +67,57 @@ class CheckOrchestrator:
         
         return report
 
+    def _build_scheduler(self) -> CheckScheduler:
+        """チェック定義と依存関係からスケジューラーを構築"""
+        executor = self.executor
+        tasks = [
+            # 1. テーブル存在確認
+            CheckTask("table_existence", lambda deps: executor.execute_table_existence_check()),
+            # 2. 孤立ファイル検出
+            CheckTask("orphaned_files", lambda deps: executor.execute_orphaned_files_check()),
+            # 3. YAMLフォーマット整合性
+            CheckTask("yaml_format_consistency", lambda deps: executor.execute_yaml_format_check()),
+            # 4. カラム定義整合性
+            CheckTask("column_consistency", lambda deps: executor.execute_column_consistency_check()),
+            # 5. 外部キー整合性
+            CheckTask("foreign_key_consistency", lambda deps: executor.execute_foreign_key_check()),
+            # 6. データ型整合性
+            CheckTask("data_type_consistency", lambda deps: executor.execute_data_type_check()),
+            # 7. 制約整合性
+            CheckTask("constraint_consistency", lambda deps: executor.execute_constraint_check()),
+            # 8. 修正提案 (1〜7のチェック結果に依存)
+            CheckTask("fix_suggestions", self._fix_suggestions_task, depends_on=FIX_SUGGESTION_DEPENDENCIES),
+            # 9. マルチテナント対応
+            CheckTask("multitenant_compliance", lambda deps: executor.execute_multitenant_compliance_check()),
+            # 10. 要求仕様ID追跡
+            CheckTask("requirement_traceability", lambda deps: executor.execute_requirement_traceability_check()),
+            # 11. パフォーマンス影響分析
+            CheckTask("performance_impact", lambda deps: executor.execute_performance_impact_check()),
+        ]
+        return CheckScheduler(tasks, max_workers=self.max_workers, logger=self.logger)
+
+    def _fix_suggestions_task(self, dependency_results: Dict[str, List[CheckResult]]) -> List[CheckResult]:
+        """依存チェックの結果を宣言順に連結して修正提案を生成"""
+        upstream_results = []
+        for check_name in FIX_SUGGESTION_DEPENDENCIES:
+            upstream_results.extend(dependency_results.get(check_name, []))
+        return self._run_fix_suggestions_check(upstream_results)
+
     def run_specific_checks(self, check_names: List[str]) -> ConsistencyReport:
         """
         指定されたチェックのみを実行
         """
         self.logger.header(f"指定チェック実行: {', '.join(check_names)}")
         
-        all_results = []
-        
-        # チェックの実行順序は固定し、指定されたチェックのみを実行
-        if "table_existence" in check_names:
-            all_results.extend(self.executor.execute_table_existence_check())
-        
-        if "orphaned_files" in check_names:
-            all_results.extend(self.executor.execute_orphaned_files_check())
-        
-        if "yaml_format_consistency" in check_names:
-            all_results.extend(self.executor.execute_yaml_format_check())
-        
-        if "column_consistency" in check_names:
-            all_results.extend(self.executor.execute_column_consistency_check())
-        
-        if "foreign_key_consistency" in check_names:
-            all_results.extend(self.executor.execute_foreign_key_check())
-        
-        if "data_type_consistency" in check_names:
-            all_results.extend(self.executor.execute_data_type_check())
-        
-        if "constraint_consistency" in check_names:
-            all_results.extend(self.executor.execute_constraint_check())
-        
-        if "fix_suggestions" in check_names:
-            # 修正提案は他のチェック結果に依存するため、ここで生成
-            fix_suggestions_results = self._run_fix_suggestions_check(all_results)
-            all_results.extend(fix_suggestions_results)
-        
-        if "multitenant_compliance" in check_names:
-            all_results.extend(self.executor.execute_multitenant_compliance_check())
-        
-        if "requirement_traceability" in check_names:
-            all_results.extend(self.executor.execute_requirement_traceability_check())
-        
-        if "performance_impact" in check_names:
-            all_results.extend(self.executor.execute_performance_impact_check())
+        with trace_span("consistency_check.run", category="orchestrator",
+                        checks=list(check_names), max_workers=self.max_workers) as span:
+            self.executor.begin_run()
+            try:
+                # 実行順序（結果の出力順序）は固定し、指定されたチェックのみを実行
+                all_results = self.scheduler.run(check_names)
+            finally:
+                self.executor.end_run()
+            span.set_attribute("results", len(all_results))
         
         return self.report_builder.build_report(all_results)
 
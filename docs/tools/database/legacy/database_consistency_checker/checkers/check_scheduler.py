@@ -0,0 +1,189 @@
+"""
+依存関係を考慮したチェックスケジューラー
+
+チェック間の依存関係を宣言し、依存のないチェックをスレッドプールで並列実行する。
+実行完了順に関わらず、結果は宣言順に連結して返すため出力順序は決定的。
+"""
+import concurrent.futures
+import contextvars
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from core.models import CheckResult
+from core.logger import ConsistencyLogger
+from shared.monitoring.profiling import profile_stage
+from shared.monitoring.tracing import trace_span
+
+
+# 依存チェックの結果（チェック名 -> 結果リスト）
+DependencyResults = Dict[str, List[CheckResult]]
+
+
+@dataclass(frozen=True)
+class CheckTask:
+    """スケジューラーに登録するチェック定義"""
+    name: str
+    run: Callable[[DependencyResults], List[CheckResult]]
+    depends_on: Sequence[str] = field(default_factory=tuple)
+
+
+@dataclass
+class ScheduleStats:
+    """スケジュール実行統計"""
+    max_workers: int = 1
+    waves: int = 0
+    total_time: float = 0.0
+    check_times: Dict[str, float] = field(default_factory=dict)
+
+
+class CheckScheduler:
+    """
+    依存関係付きチェックスケジューラー
+
+    - 依存チェックが全て完了したチェックから順にスレッドプールへ投入
+    - 選択されなかった依存チェックは待たずに無視する（従来の run_specific_checks と同じ挙動）
+    - max_workers=1 の場合はスレッドを使わず依存順に逐次実行する
+    """
+
+    def __init__(self, tasks: Sequence[CheckTask], max_workers: int = 1,
+                 logger: Optional[ConsistencyLogger] = None):
+        """
+        スケジューラー初期化
+
+        Args:
+            tasks: チェック定義（この順序が結果の出力順序になる）
+            max_workers: 並列実行数
+            logger: ログ機能
+        """
+        self.tasks = list(tasks)
+        self.max_workers = max(1, max_workers)
+        self.logger = logger or ConsistencyLogger()
+        self.stats = ScheduleStats(max_workers=self.max_workers)
+        self._validate()
+
+    def _validate(self) -> None:
+        """未定義の依存と循環依存を検出"""
+        names = [task.name for task in self.tasks]
+        if len(set(names)) != len(names):
+            raise ValueError(f"チェック名が重複しています: {names}")
+
+        known = set(names)
+        for task in self.tasks:
+            unknown = [dep for dep in task.depends_on if dep not in known]
+            if unknown:
+                raise ValueError(f"チェック {task.name} の依存先が未定義です: {unknown}")
+
+        # 宣言順で依存先が後ろにある場合も許容するため、トポロジカル順に並べられるか確認
+        self._topological_waves(known)
+
+    def _topological_waves(self, selected: set) -> List[List[CheckTask]]:
+        """選択されたチェックを依存関係の段（wave）に分割"""
+        pending = [task for task in self.tasks if task.name in selected]
+        done: set = set()
+        waves: List[List[CheckTask]] = []
+
+        while pending:
+            ready = [
+                task for task in pending
+                if all(dep in done or dep not in selected for dep in task.depends_on)
+            ]
+            if not ready:
+                raise ValueError(
+                    f"チェックの依存関係が循環しています: {[task.name for task in pending]}"
+                )
+            waves.append(ready)
+            done.update(task.name for task in ready)
+            pending = [task for task in pending if task.name not in done]
+
+        return waves
+
+    def get_execution_plan(self, check_names: Optional[Sequence[str]] = None) -> List[List[str]]:
+        """
+        実行計画（並列実行可能なチェック名の段）を取得
+
+        Args:
+            check_names: 対象チェック名（Noneの場合は全チェック）
+
+        Returns:
+            段ごとのチェック名リスト
+        """
+        selected = self._select(check_names)
+        return [[task.name for task in wave] for wave in self._topological_waves(selected)]
+
+    def run(self, check_names: Optional[Sequence[str]] = None) -> List[CheckResult]:
+        """
+        チェックを実行
+
+        Args:
+            check_names: 対象チェック名（Noneの場合は全チェック）
+
+        Returns:
+            宣言順に連結したチェック結果
+        """
+        selected = self._select(check_names)
+        waves = self._topological_waves(selected)
+        results: DependencyResults = {}
+        start_time = time.perf_counter()
+
+        if self.max_workers == 1:
+            for wave in waves:
+                for task in wave:
+                    dependency_results = {dep: results[dep] for dep in task.depends_on if dep in results}
+                    results[task.name] = self._run_task(task, dependency_results)
+        else:
+            self._run_parallel(selected, results)
+
+        self.stats.waves = len(waves)
+        self.stats.total_time = time.perf_counter() - start_time
+
+        ordered: List[CheckResult] = []
+        for task in self.tasks:
+            if task.name in results:
+                ordered.extend(results[task.name])
+        return ordered
+
+    def _run_parallel(self, selected: set, results: DependencyResults) -> None:
+        """依存が解決したチェックから順次スレッドプールへ投入"""
+        pending = [task for task in self.tasks if task.name in selected]
+        running: Dict[concurrent.futures.Future, CheckTask] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="consistency-check"
+        ) as executor:
+            while pending or running:
+                for task in list(pending):
+                    if all(dep in results or dep not in selected for dep in task.depends_on):
+                        # 依存結果は投入時点のコピーを渡し、他スレッドの書き込みと分離する
+                        dependency_results = {dep: results[dep] for dep in task.depends_on if dep in results}
+                        # 実行中のスパンをワーカースレッドに引き継ぐ（チェックのスパンの親になる）
+                        future = executor.submit(
+                            contextvars.copy_context().run, self._run_task, task, dependency_results
+                        )
+                        running[future] = task
+                        pending.remove(task)
+
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    task = running.pop(future)
+                    results[task.name] = future.result()
+
+    def _run_task(self, task: CheckTask, dependency_results: DependencyResults) -> List[CheckResult]:
+        """単一チェックを実行し、所要時間を記録"""
+        task_start = time.perf_counter()
+        try:
+            with trace_span(f"check.{task.name}", category="check", check=task.name) as span, \
+                    profile_stage(f"check.{task.name}"):
+                results = list(task.run(dependency_results))
+                span.set_attribute("results", len(results))
+                return results
+        finally:
+            self.stats.check_times[task.name] = time.perf_counter() - task_start
+
+    def _select(self, check_names: Optional[Sequence[str]]) -> set:
+        if check_names is None:
+            return {task.name for task in self.tasks}
+        return {task.name for task in self.tasks if task.name in check_names}
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from core.models import CheckResult, CheckSeverity
 from core.logger import ConsistencyLogger
 from parsers.column_parser import ColumnParser, TableSchema, ColumnDefinition
+from core.schema_snapshot import SchemaSnapshot
 
 
 @dataclass
@@ -28,6 +29,8 @@ class ColumnConsistencyChecker:
     def __init__(self, logger: Optional[ConsistencyLogger] = None):
         self.logger = logger or ConsistencyLogger()
         self.parser = ColumnParser(logger)
+        # 実行単位で共有される解析済みスキーマ（CheckExecutorが設定）
+        self.snapshot: Optional[SchemaSnapshot] = None
     
     def check_table_column_consistency(
         self, 
@@ -38,8 +41,12 @@ class ColumnConsistencyChecker:
         results = []
         
         # DDLとYAMLを解析
-        ddl_schema = self.parser.parse_ddl_file(ddl_path)
-        yaml_schema = self.parser.parse_yaml_file(yaml_path)
+        if self.snapshot:
+            ddl_schema = self.snapshot.ddl_schema(ddl_path)
+            yaml_schema = self.snapshot.yaml_schema(yaml_path)
+        else:
+            ddl_schema = self.parser.parse_ddl_file(ddl_path)
+            yaml_schema = self.parser.parse_yaml_file(yaml_path)
         
         if not ddl_schema:
             results.append(CheckResult(
@@ -24,6 +24,8 @@ from shared.core.models import (
 from database_consistency_checker.core.config import Config
 from database_consistency_checker.yaml_format_check_enhanced import YAMLFormatCheckEnhanced
 from shared.path_resolver import PathResolver
+from shared.monitoring.profiling import profile_stage
+from shared.monitoring.tracing import trace_span
 
 class ConsistencyChecker:
     """データベース整合性チェックのメインエンジン"""
@@ -400,25 +402,31 @@ class ConsistencyChecker:
         self.logger.info("整合性チェック開始")
         
         # データ読み込み
-        self._load_table_data()
+        with trace_span("consistency_check.load", category="snapshot") as span, \
+                profile_stage("consistency_check.load"):
+            self._load_table_data()
+            span.set_attribute("tables", len(self.tables))
         
         # 各種チェックを実行
         results = []
-        
-        # テーブル存在確認
-        results.extend(self._check_table_existence())
-        
-        # YAML形式・必須セクションチェック
-        results.extend(self._check_yaml_format())
-        
-        # カラム整合性チェック
-        results.extend(self._check_column_consistency())
-        
-        # 外部キー整合性チェック
-        results.extend(self._check_foreign_keys())
-        
-        # 命名規則チェック
-        results.extend(self._check_naming_conventions())
+        checks = [
+            # テーブル存在確認
+            ("table_existence", self._check_table_existence),
+            # YAML形式・必須セクションチェック
+            ("yaml_format", self._check_yaml_format),
+            # カラム整合性チェック
+            ("column_consistency", self._check_column_consistency),
+            # 外部キー整合性チェック
+            ("foreign_key_consistency", self._check_foreign_keys),
+            # 命名規則チェック
+            ("naming_convention", self._check_naming_conventions),
+        ]
+        for check_name, run_check in checks:
+            with trace_span(f"check.{check_name}", category="check", check=check_name) as span, \
+                    profile_stage(f"check.{check_name}"):
+                check_results = run_check()
+                span.set_attribute("results", len(check_results))
+            results.extend(check_results)
         
         # サマリー集計
         summary = {
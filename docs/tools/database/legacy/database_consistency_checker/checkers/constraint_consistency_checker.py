@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from core.models import CheckResult, CheckSeverity, ConstraintDefinition, IndexDefinition
 from core.logger import ConsistencyLogger
 from parsers.column_parser import ColumnParser, TableSchema
+from core.schema_snapshot import SchemaSnapshot
 
 
 @dataclass
@@ -28,6 +29,8 @@ class ConstraintConsistencyChecker:
     def __init__(self, logger: Optional[ConsistencyLogger] = None):
         self.logger = logger or ConsistencyLogger()
         self.column_parser = ColumnParser(logger)
+        # 実行単位で共有される解析済みスキーマ（CheckExecutorが設定）
+        self.snapshot: Optional[SchemaSnapshot] = None
     
     def check_constraint_consistency(
         self,
@@ -80,8 +83,12 @@ class ConstraintConsistencyChecker:
             return results
         
         # DDLとYAMLからスキーマ情報を解析
-        ddl_schema = self.column_parser.parse_ddl_file(ddl_path)
-        yaml_schema = self.column_parser.parse_yaml_file(yaml_path)
+        if self.snapshot:
+            ddl_schema = self.snapshot.ddl_schema(ddl_path)
+            yaml_schema = self.snapshot.yaml_schema(yaml_path)
+        else:
+            ddl_schema = self.column_parser.parse_ddl_file(ddl_path)
+            yaml_schema = self.column_parser.parse_yaml_file(yaml_path)
         
         if not ddl_schema or not yaml_schema:
             return results
@@ -6,11 +6,15 @@ from typing import List, Dict, Optional, Any
 from pathlib import Path
 
 from core.models import (
-    CheckResult, CheckSeverity, ColumnDefinition, 
-    DDLTable, TableDefinition
+    CheckResult, CheckSeverity, ColumnDefinition, TableDefinition
+)
+from shared.core.models import (
+    ColumnDefinition as DDLColumnDefinition,
+    TableDefinition as DDLTableDefinition
 )
 from parsers.ddl_parser import EnhancedDDLParser
 from parsers.yaml_parser import EnhancedYAMLParser
+from core.schema_snapshot import SchemaSnapshot
 
 
 class DataTypeConsistencyChecker:
@@ -21,6 +25,8 @@ class DataTypeConsistencyChecker:
         self.logger = logging.getLogger(__name__)
         self.ddl_parser = EnhancedDDLParser(self.logger)
         self.yaml_parser = EnhancedYAMLParser(self.logger)
+        # 実行単位で共有される解析済みスキーマ（CheckExecutorが設定）
+        self.snapshot: Optional[SchemaSnapshot] = None
         
         # データ型の互換性マッピング
         self.type_compatibility = self._init_type_compatibility()
@@ -70,7 +76,10 @@ class DataTypeConsistencyChecker:
                 ))
                 return results
             
-            ddl_table = self.ddl_parser.parse_ddl_file_detailed(ddl_file)
+            if self.snapshot:
+                ddl_table = self.snapshot.ddl_table(ddl_file)
+            else:
+                ddl_table = self.ddl_parser.parse_ddl_file_detailed(ddl_file)
             if not ddl_table:
                 results.append(CheckResult(
                     check_name="data_type_consistency",
@@ -93,7 +102,10 @@ class DataTypeConsistencyChecker:
                 ))
                 return results
             
-            yaml_table = self.yaml_parser.parse_table_definition(yaml_file)
+            if self.snapshot:
+                yaml_table = self.snapshot.table_definition(yaml_file)
+            else:
+                yaml_table = self.yaml_parser.parse_table_definition(yaml_file)
             if not yaml_table:
                 results.append(CheckResult(
                     check_name="data_type_consistency",
@@ -133,7 +145,7 @@ class DataTypeConsistencyChecker:
         
         return results
     
-    def _check_column_consistency(self, ddl_table: DDLTable, yaml_table: TableDefinition) -> List[CheckResult]:
+    def _check_column_consistency(self, ddl_table: DDLTableDefinition, yaml_table: TableDefinition) -> List[CheckResult]:
         """カラム定義の整合性チェック"""
         results = []
         
@@ -174,7 +186,7 @@ class DataTypeConsistencyChecker:
         
         return results
     
-    def _compare_column_definitions(self, ddl_col: ColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> List[CheckResult]:
+    def _compare_column_definitions(self, ddl_col: DDLColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> List[CheckResult]:
         """カラム定義の詳細比較"""
         results = []
         column_name = ddl_col.name
@@ -213,16 +225,16 @@ class DataTypeConsistencyChecker:
                 message=f"カラム '{column_name}' のデータ型整合性OK",
                 details={
                     "column": column_name,
-                    "ddl_type": ddl_col.data_type,
+                    "ddl_type": ddl_col.type,
                     "yaml_type": yaml_col.data_type
                 }
             ))
         
         return results
     
-    def _compare_data_types(self, ddl_col: ColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
+    def _compare_data_types(self, ddl_col: DDLColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
         """データ型の比較"""
-        ddl_type = ddl_col.data_type.upper() if ddl_col.data_type else ''
+        ddl_type = ddl_col.type.upper() if ddl_col.type else ''
         yaml_type = yaml_col.data_type.upper() if yaml_col.data_type else ''
         
         if not ddl_type or not yaml_type:
@@ -272,7 +284,7 @@ class DataTypeConsistencyChecker:
             }
         )
     
-    def _compare_length_constraints(self, ddl_col: ColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
+    def _compare_length_constraints(self, ddl_col: DDLColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
         """長さ制約の比較"""
         ddl_length = ddl_col.length
         yaml_length = yaml_col.length
@@ -311,7 +323,7 @@ class DataTypeConsistencyChecker:
         
         return None
     
-    def _compare_null_constraints(self, ddl_col: ColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
+    def _compare_null_constraints(self, ddl_col: DDLColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
         """NULL制約の比較"""
         ddl_nullable = ddl_col.nullable
         yaml_nullable = yaml_col.nullable
@@ -332,9 +344,9 @@ class DataTypeConsistencyChecker:
         
         return None
     
-    def _compare_default_values(self, ddl_col: ColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
+    def _compare_default_values(self, ddl_col: DDLColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
         """デフォルト値の比較"""
-        ddl_default = ddl_col.default_value
+        ddl_default = ddl_col.default
         yaml_default = yaml_col.default_value
         
         # 両方ともNoneの場合は問題なし
@@ -360,7 +372,7 @@ class DataTypeConsistencyChecker:
         
         return None
     
-    def _compare_enum_values(self, ddl_col: ColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
+    def _compare_enum_values(self, ddl_col: DDLColumnDefinition, yaml_col: ColumnDefinition, table_name: str) -> Optional[CheckResult]:
         """ENUM値の比較"""
         ddl_enum = set(ddl_col.enum_values) if ddl_col.enum_values else set()
         yaml_enum = set(yaml_col.enum_values) if yaml_col.enum_values else set()
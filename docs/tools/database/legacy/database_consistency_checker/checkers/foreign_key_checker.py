@@ -10,6 +10,7 @@ from core.models import CheckResult, CheckSeverity
 from core.logger import ConsistencyLogger
 from parsers.column_parser import ColumnParser, TableSchema
 from parsers.entity_yaml_parser import EntityYamlParser
+from core.schema_snapshot import SchemaSnapshot
 
 
 @dataclass
@@ -25,6 +26,18 @@ class ForeignKeyDefinition:
     description: Optional[str] = None
 
 
+@dataclass
+class ReferenceIndexStats:
+    """参照先カラムインデックスの利用統計"""
+    lookups: int = 0
+    parses: int = 0
+
+    @property
+    def parses_avoided(self) -> int:
+        """インデックス・スナップショットにより省略できたDDL解析回数"""
+        return self.lookups - self.parses
+
+
 class ForeignKeyChecker:
     """外部キー整合性チェッカー"""
     
@@ -32,18 +45,41 @@ class ForeignKeyChecker:
         self.logger = logger or ConsistencyLogger()
         self.column_parser = ColumnParser(logger)
         self.entity_parser = EntityYamlParser(logger)
+        # 実行単位で共有される解析済みスキーマ（CheckExecutorが設定）
+        self.snapshot: Optional[SchemaSnapshot] = None
+        # 参照先テーブル名 -> カラム定義（解析失敗時はNone）。実行単位で1度だけ構築する
+        self._reference_index: Dict[str, Optional[Dict]] = {}
+        self._reference_index_owner: Optional[SchemaSnapshot] = None
+        self.reference_index_stats = ReferenceIndexStats()
     
     def check_foreign_key_consistency(
         self,
         entity_yaml_path: Path,
         ddl_dir: Path,
-        yaml_details_dir: Path
+        yaml_details_dir: Path,
+        table_names: Optional[List[str]] = None
     ) -> List[CheckResult]:
-        """外部キー整合性の包括的チェック"""
+        """
+        外部キー整合性の包括的チェック
+
+        Args:
+            entity_yaml_path: entity_relationships.yamlのパス
+            ddl_dir: DDLディレクトリ
+            yaml_details_dir: YAML詳細定義ディレクトリ
+            table_names: チェック対象テーブル名（Noneの場合はentitiesの全テーブル）
+        """
         results = []
         
+        # スナップショット（実行単位）が変わった場合、またはスナップショットなしの単独実行では
+        # 参照先インデックスを作り直す
+        if self.snapshot is None or self.snapshot is not self._reference_index_owner:
+            self.reset_reference_index()
+        
         # entity_relationships.yamlから関連情報を取得
-        entity_data = self.entity_parser.parse_file(entity_yaml_path)
+        if self.snapshot:
+            entity_data = self.snapshot.entity_data(entity_yaml_path)
+        else:
+            entity_data = self.entity_parser.parse_file(entity_yaml_path)
         if not entity_data:
             results.append(CheckResult(
                 check_name="foreign_key_consistency",
@@ -56,6 +92,8 @@ class ForeignKeyChecker:
         
         # 各テーブルの外部キー整合性をチェック
         for table_name in entity_data.get('entities', {}):
+            if table_names is not None and table_name not in table_names:
+                continue
             table_results = self._check_table_foreign_keys(
                 table_name, entity_data, ddl_dir, yaml_details_dir
             )
@@ -98,8 +136,12 @@ class ForeignKeyChecker:
             return results
         
         # DDLとYAMLから外部キー情報を解析
-        ddl_schema = self.column_parser.parse_ddl_file(ddl_path)
-        yaml_schema = self.column_parser.parse_yaml_file(yaml_path)
+        if self.snapshot:
+            ddl_schema = self.snapshot.ddl_schema(ddl_path)
+            yaml_schema = self.snapshot.yaml_schema(yaml_path)
+        else:
+            ddl_schema = self.column_parser.parse_ddl_file(ddl_path)
+            yaml_schema = self.column_parser.parse_yaml_file(yaml_path)
         
         if not ddl_schema or not yaml_schema:
             return results
@@ -378,9 +420,9 @@ class ForeignKeyChecker:
                 ))
                 continue
             
-            # 参照先テーブルのスキーマを解析
-            target_schema = self.column_parser.parse_ddl_file(target_ddl_path)
-            if not target_schema:
+            # 参照先テーブルのカラム定義をインデックスから取得
+            target_columns_index = self._get_reference_columns(target_table, target_ddl_path)
+            if target_columns_index is None:
                 results.append(CheckResult(
                     check_name="foreign_key_consistency",
                     table_name=table_name,
@@ -396,7 +438,7 @@ class ForeignKeyChecker:
             
             # 参照先カラムの存在確認
             for target_col in target_columns:
-                if target_col not in target_schema.columns:
+                if target_col not in target_columns_index:
                     results.append(CheckResult(
                         check_name="foreign_key_consistency",
                         table_name=table_name,
@@ -407,8 +449,43 @@ class ForeignKeyChecker:
                             "foreign_key_name": fk['name'],
                             "target_table": target_table,
                             "target_column": target_col,
-                            "available_columns": list(target_schema.columns.keys())
+                            "available_columns": list(target_columns_index.keys())
                         }
                     ))
         
         return results
+    
+    def _get_reference_columns(self, target_table: str, target_ddl_path: Path) -> Optional[Dict]:
+        """
+        参照先テーブルのカラム定義を取得（テーブルごとに1度だけ解析）
+        
+        Args:
+            target_table: 参照先テーブル名
+            target_ddl_path: 参照先DDLファイルのパス
+            
+        Returns:
+            カラム名 -> カラム定義（解析失敗時はNone）
+        """
+        self.reference_index_stats.lookups += 1
+        if target_table in self._reference_index:
+            return self._reference_index[target_table]
+        
+        if self.snapshot:
+            # 他のチェッカーが解析済みのスキーマはメモから返されるため、解析回数に含めない
+            parsed = not self.snapshot.is_memoized('ddl_schema', target_ddl_path)
+            target_schema = self.snapshot.ddl_schema(target_ddl_path)
+        else:
+            parsed = True
+            target_schema = self.column_parser.parse_ddl_file(target_ddl_path)
+        if parsed:
+            self.reference_index_stats.parses += 1
+        
+        columns = target_schema.columns if target_schema else None
+        self._reference_index[target_table] = columns
+        return columns
+    
+    def reset_reference_index(self) -> None:
+        """参照先カラムインデックスと統計を初期化"""
+        self._reference_index = {}
+        self._reference_index_owner = self.snapshot
+        self.reference_index_stats = ReferenceIndexStats()
@@ -2,13 +2,14 @@
 マルチテナント対応チェック
 """
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import yaml
 
 from core.models import CheckResult, CheckSeverity
 from core.logger import ConsistencyLogger
-from parsers.ddl_parser import DDLParser
+from parsers.ddl_parser import EnhancedDDLParser
 from parsers.yaml_parser import YAMLParser
+from core.schema_snapshot import SchemaSnapshot
 
 
 class MultitenantComplianceChecker:
@@ -21,8 +22,10 @@ class MultitenantComplianceChecker:
 
     def __init__(self, logger: ConsistencyLogger):
         self.logger = logger
-        self.ddl_parser = DDLParser(logger)
+        self.ddl_parser = EnhancedDDLParser(logger)
         self.yaml_parser = YAMLParser(logger)
+        # 実行単位で共有される解析済みスキーマ（CheckExecutorが設定）
+        self.snapshot: Optional[SchemaSnapshot] = None
 
     def check_multitenant_compliance(self, ddl_dir: Path, yaml_details_dir: Path, table_names: List[str]) -> List[CheckResult]:
         """
@@ -64,8 +67,13 @@ class MultitenantComplianceChecker:
                 continue
 
             # DDLとYAMLからテーブル情報をパース
-            ddl_table_info = self.ddl_parser.parse_ddl_file(ddl_path)
-            yaml_table_info = self.yaml_parser.parse_yaml_file(yaml_path)
+            if self.snapshot:
+                ddl_table_info = self.snapshot.ddl_table_info(ddl_path)
+                yaml_table_info = self.snapshot.yaml_data(yaml_path)
+            else:
+                ddl_table = self.ddl_parser.parse_ddl_file_detailed(ddl_path)
+                ddl_table_info = ddl_table.to_dict() if ddl_table else None
+                yaml_table_info = self.yaml_parser.parse_yaml_file(yaml_path)
 
             if not ddl_table_info or not yaml_table_info:
                 results.append(CheckResult(
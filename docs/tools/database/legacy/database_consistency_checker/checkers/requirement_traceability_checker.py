@@ -2,13 +2,14 @@
 要求仕様ID追跡チェック
 """
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import re
 
 from core.models import CheckResult, CheckSeverity
 from core.logger import ConsistencyLogger
 from parsers.ddl_parser import DDLParser
 from parsers.yaml_parser import YAMLParser
+from core.schema_snapshot import SchemaSnapshot
 
 
 class RequirementTraceabilityChecker:
@@ -23,6 +24,8 @@ class RequirementTraceabilityChecker:
     def __init__(self, logger: ConsistencyLogger):
         self.logger = logger
         self.yaml_parser = YAMLParser(logger)
+        # 実行単位で共有される解析済みスキーマ（CheckExecutorが設定）
+        self.snapshot: Optional[SchemaSnapshot] = None
         # 要求仕様IDの正規表現パターン: {カテゴリ}.{番号}-{サブカテゴリ}.{番号}
         # 例: PRO.1-BASE.1, TNT.1-MGMT.1
         self.requirement_id_pattern = re.compile(r"^[A-Z]{3}\.\d+-[A-Z]{3}\.\d+$")
@@ -54,7 +57,10 @@ class RequirementTraceabilityChecker:
                 ))
                 continue
 
-            yaml_table_info = self.yaml_parser.parse_yaml_file(yaml_path)
+            if self.snapshot:
+                yaml_table_info = self.snapshot.yaml_data(yaml_path)
+            else:
+                yaml_table_info = self.yaml_parser.parse_yaml_file(yaml_path)
 
             if not yaml_table_info:
                 results.append(CheckResult(
@@ -8,6 +8,7 @@ from database_consistency_checker.core.logger import ConsistencyLogger
 from database_consistency_checker.parsers.table_list_parser import TableListParser
 from database_consistency_checker.parsers.entity_yaml_parser import EntityYamlParser
 from database_consistency_checker.parsers.ddl_parser import DDLParser
+from database_consistency_checker.core.schema_snapshot import SchemaSnapshot
 
 
 class TableExistenceChecker:
@@ -24,6 +25,8 @@ class TableExistenceChecker:
         self.table_list_parser = TableListParser(logger)
         self.entity_parser = EntityYamlParser(logger)
         self.ddl_parser = DDLParser(self.logger)
+        # 実行単位で共有される解析済みスキーマ（CheckExecutorが設定）
+        self.snapshot: Optional[SchemaSnapshot] = None
     
     def check_table_existence(
         self,
@@ -95,6 +98,9 @@ class TableExistenceChecker:
             self.logger.warning(f"テーブル一覧ファイルが見つかりません: {file_path}")
             return set()
         
+        if self.snapshot:
+            return set(self.snapshot.table_names(file_path))
+        
         entries = self.table_list_parser.parse_file(file_path)
         return set(self.table_list_parser.get_table_names(entries))
     
@@ -104,7 +110,10 @@ class TableExistenceChecker:
             self.logger.warning(f"エンティティ関連ファイルが見つかりません: {file_path}")
             return set()
         
-        data = self.entity_parser.parse_file(file_path)
+        if self.snapshot:
+            data = self.snapshot.entity_data(file_path)
+        else:
+            data = self.entity_parser.parse_file(file_path)
         return set(self.entity_parser.get_entity_names(data))
     
     def _get_ddl_tables(self, ddl_dir: Path) -> Set[str]:
@@ -121,12 +130,18 @@ class TableExistenceChecker:
             if ddl_file.name in ['all_tables.sql', '------------.sql']:
                 continue
             
-            table_name = self.ddl_parser.get_table_name_from_file(ddl_file)
+            table_name = self._get_ddl_table_name(ddl_file)
             if table_name:
                 tables.add(table_name)
         
         return tables
     
+    def _get_ddl_table_name(self, ddl_file: Path) -> Optional[str]:
+        """DDLファイルのテーブル名を取得（スナップショットがあれば再利用）"""
+        if self.snapshot:
+            return self.snapshot.ddl_table_name(ddl_file)
+        return self.ddl_parser.get_table_name_from_file(ddl_file)
+    
     def _get_detail_tables(self, details_dir: Path) -> Set[str]:
         """テーブル詳細ディレクトリからテーブル名を取得"""
         if not details_dir.exists():
@@ -325,7 +340,7 @@ class TableExistenceChecker:
             if ddl_file.name in ['all_tables.sql', '------------.sql']:
                 continue
             
-            table_name = self.ddl_parser.get_table_name_from_file(ddl_file)
+            table_name = self._get_ddl_table_name(ddl_file)
             if table_name and table_name not in table_list_tables:
                 orphaned['ddl_files'].append(ddl_file.name)
         
@@ -4,8 +4,10 @@ YAMLフォーマット整合性チェッカー
 """
 import os
 import yaml
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from shared.core.models import CheckResult, CheckSeverity
+from database_consistency_checker.core.schema_snapshot import SchemaSnapshot
 
 
 class YamlFormatChecker:
@@ -62,6 +64,8 @@ class YamlFormatChecker:
         """
         self.base_dir = base_dir
         self.table_details_dir = os.path.join(base_dir, "table-details")
+        # 実行単位で共有される解析済みスキーマ（CheckExecutorが設定）
+        self.snapshot: Optional[SchemaSnapshot] = None
         
     def check_yaml_format_consistency(self, table_names: Optional[List[str]] = None) -> List[CheckResult]:
         """
@@ -121,8 +125,11 @@ class YamlFormatChecker:
         
         try:
             # YAMLファイル読み込み
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                yaml_content = yaml.safe_load(f)
+            if self.snapshot:
+                yaml_content = self.snapshot.yaml_data(Path(yaml_path))
+            else:
+                with open(yaml_path, 'r', encoding='utf-8') as f:
+                    yaml_content = yaml.safe_load(f)
                 
             if not yaml_content:
                 return [CheckResult(
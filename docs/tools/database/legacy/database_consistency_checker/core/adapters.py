@@ -107,9 +107,11 @@ class DatabaseConsistencyService:
                 
                 table_name = ddl_file.stem
                 try:
-                    ddl_content = ddl_file.read_text(encoding='utf-8')
-                    table_def = self.ddl_parser.parse_ddl(ddl_content, table_name)
-                    ddl_definitions[table_name] = table_def
+                    # 統合DDL解析エンジン経由（ファイル単位でメモ化）
+                    tables = self.ddl_parser.parse(ddl_file)
+                    if not tables:
+                        raise ValueError("CREATE TABLE文が見つかりません")
+                    ddl_definitions[table_name] = tables[0]
                     logger.debug(f"DDL定義読み込み完了: {table_name}")
                 except Exception as e:
                     logger.error(f"DDL読み込みエラー: {ddl_file} - {e}")
@@ -0,0 +1,12 @@
+"""
+データベース整合性チェックツール - 設定
+
+設定は共通ライブラリ（shared.core.config）を使用する。
+"""
+
+from shared.core.config import Config, create_check_config
+
+__all__ = [
+    'Config',
+    'create_check_config'
+]
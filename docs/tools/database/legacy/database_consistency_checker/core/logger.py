@@ -3,13 +3,80 @@
 """
 import logging
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
 class ConsistencyLogger:
     """整合性チェック用ロガー"""
     
+    def __init__(self, verbose: bool = False, name: str = "consistency_checker"):
+        """
+        ロガー初期化
+        
+        Args:
+            verbose: 詳細ログ（debug / progress）を出力するか
+            name: 出力先のロガー名
+        """
+        self.verbose = verbose
+        self.logger = logging.getLogger(name)
+        # 並列実行時も件数が崩れないようにロックで保護
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {'success': 0, 'warning': 0, 'error': 0}
+    
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] += 1
+    
+    def info(self, message: str) -> None:
+        """情報ログ"""
+        self.logger.info(message)
+    
+    def debug(self, message: str) -> None:
+        """デバッグログ（詳細モード時のみ）"""
+        if self.verbose:
+            self.logger.info(message)
+    
+    def success(self, message: str) -> None:
+        """成功ログ"""
+        self._count('success')
+        self.logger.info(f"✅ {message}")
+    
+    def warning(self, message: str) -> None:
+        """警告ログ"""
+        self._count('warning')
+        self.logger.warning(f"⚠️ {message}")
+    
+    def error(self, message: str) -> None:
+        """エラーログ"""
+        self._count('error')
+        self.logger.error(f"❌ {message}")
+    
+    def header(self, title: str) -> None:
+        """ヘッダー出力"""
+        self.logger.info("=" * 80)
+        self.logger.info(f"🔍 {title}")
+        self.logger.info("=" * 80)
+    
+    def section(self, title: str) -> None:
+        """セクション出力"""
+        self.logger.info("-" * 60)
+        self.logger.info(f"📋 {title}")
+    
+    def progress(self, current: int, total: int, message: str) -> None:
+        """進捗ログ（詳細モード時のみ）"""
+        if self.verbose:
+            self.logger.info(f"[{current}/{total}] {message}")
+    
+    def print_summary(self) -> None:
+        """ログ件数のサマリーを出力"""
+        with self._lock:
+            counts = dict(self.counts)
+        self.logger.info(
+            f"📊 成功 {counts['success']}件, 警告 {counts['warning']}件, エラー {counts['error']}件"
+        )
+    
     @staticmethod
     def setup_logger(
         name: str = "consistency_checker",
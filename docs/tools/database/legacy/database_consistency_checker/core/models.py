@@ -0,0 +1,42 @@
+"""
+データベース整合性チェックツール - データモデル
+
+データモデルは共通ライブラリ（shared.core.models）を使用する。
+修正提案のみ fixers / reporters が参照する整合性チェックツール固有の形式を定義する。
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+from shared.core.models import (
+    CheckConfig, CheckResult, CheckSeverity, ColumnDefinition, ConsistencyReport,
+    ConstraintDefinition, FixType, ForeignKeyDefinition,
+    IndexDefinition, TableDefinition
+)
+
+
+@dataclass
+class FixSuggestion:
+    """修正提案"""
+    fix_type: FixType
+    table_name: str
+    description: str
+    fix_content: str
+    file_path: str = ""
+    backup_required: bool = False
+    critical: bool = False
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+__all__ = [
+    'CheckConfig',
+    'CheckResult',
+    'CheckSeverity',
+    'ColumnDefinition',
+    'ConsistencyReport',
+    'ConstraintDefinition',
+    'FixSuggestion',
+    'FixType',
+    'ForeignKeyDefinition',
+    'IndexDefinition',
+    'TableDefinition'
+]
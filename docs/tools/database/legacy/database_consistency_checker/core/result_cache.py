@@ -0,0 +1,240 @@
+"""
+チェック結果キャッシュ - コンテンツハッシュによるインクリメンタルチェック
+
+テーブル単位の入力ファイル（YAML・DDL・定義書Markdown）のコンテンツハッシュと
+チェッカーバージョン・設定をキーにチェック結果をディスクへ保存し、
+入力が変化していないテーブルのチェックを再実行せずに結果を再利用する。
+"""
+import hashlib
+import pickle
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.models import CheckResult
+from core.logger import ConsistencyLogger
+
+
+# チェックロジックを変更した場合は更新し、既存キャッシュを無効化する
+CHECKER_VERSION = "1.0.0"
+
+# キャッシュファイル形式のバージョン
+CACHE_FORMAT_VERSION = 1
+
+# キャッシュファイル名
+CACHE_FILE_NAME = "check_results.pkl"
+
+_REFERENCES_PATTERN = re.compile(r'REFERENCES\s+(\w+)', re.IGNORECASE)
+
+# 入力ファイルが存在しない場合のハッシュ値
+_MISSING_HASH = "missing"
+
+
+class InputFingerprinter:
+    """チェック入力ファイルのコンテンツハッシュを計算（1回の実行内でメモ化）"""
+
+    def __init__(self, config):
+        """
+        初期化
+
+        Args:
+            config: ddl_dir・table_details_dir・table_list_file・
+                entity_relationships_file を持つ設定
+        """
+        self.ddl_dir = Path(config.ddl_dir)
+        self.table_details_dir = Path(config.table_details_dir)
+        self.tables_dir = Path(getattr(config, 'tables_dir', None) or self.ddl_dir.parent / "tables")
+        self.table_list_file = Path(config.table_list_file)
+        self.entity_relationships_file = Path(config.entity_relationships_file)
+        self._file_hashes: Dict[Path, str] = {}
+        self._table_hashes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def file_hash(self, path: Path) -> str:
+        """ファイル内容のSHA-256（存在しない場合は固定値）"""
+        path = Path(path)
+        with self._lock:
+            cached = self._file_hashes.get(path)
+        if cached is not None:
+            return cached
+
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        except (FileNotFoundError, IsADirectoryError):
+            digest = _MISSING_HASH
+
+        with self._lock:
+            self._file_hashes[path] = digest
+        return digest
+
+    def table_input_files(self, table_name: str) -> List[Path]:
+        """テーブル単位の入力ファイル（YAML・DDL・定義書）"""
+        files = [
+            self.ddl_dir / f"{table_name}.sql",
+            self.table_details_dir / f"{table_name}_details.yaml",
+            self.table_details_dir / f"テーブル詳細定義YAML_{table_name}.yaml",
+        ]
+        if self.tables_dir.exists():
+            files.extend(sorted(self.tables_dir.glob(f"テーブル定義書_{table_name}_*.md")))
+        return files
+
+    def table_hash(self, table_name: str) -> str:
+        """テーブル単位の入力ハッシュ"""
+        with self._lock:
+            cached = self._table_hashes.get(table_name)
+        if cached is not None:
+            return cached
+
+        digest = _combine(
+            (path.name, self.file_hash(path)) for path in self.table_input_files(table_name)
+        )
+        with self._lock:
+            self._table_hashes[table_name] = digest
+        return digest
+
+    def referenced_tables(self, table_name: str) -> List[str]:
+        """DDLのREFERENCES句から参照先テーブルを抽出"""
+        ddl_path = self.ddl_dir / f"{table_name}.sql"
+        try:
+            content = ddl_path.read_text(encoding='utf-8')
+        except (FileNotFoundError, UnicodeDecodeError):
+            return []
+        return sorted(set(_REFERENCES_PATTERN.findall(content)) - {table_name})
+
+    def foreign_key_hash(self, table_name: str) -> str:
+        """外部キーチェック用ハッシュ（自テーブル・参照先テーブル・entity_relationships）"""
+        parts = [
+            ("table", self.table_hash(table_name)),
+            ("entity", self.file_hash(self.entity_relationships_file)),
+        ]
+        parts.extend((ref, self.table_hash(ref)) for ref in self.referenced_tables(table_name))
+        return _combine(parts)
+
+    def layout_hash(self, ddl_table_names: Dict[str, Optional[str]], *extra: Any) -> str:
+        """
+        テーブル横断チェック（存在確認・孤立ファイル）用ハッシュ
+
+        Args:
+            ddl_table_names: DDLファイル名 -> CREATE TABLE のテーブル名
+            extra: キーに含める追加値（対象テーブル等）
+        """
+        yaml_names = sorted(p.name for p in self.table_details_dir.glob("*.yaml")) \
+            if self.table_details_dir.exists() else []
+        parts = [
+            ("table_list", self.file_hash(self.table_list_file)),
+            ("entity", self.file_hash(self.entity_relationships_file)),
+            ("yaml_files", "\n".join(yaml_names)),
+            ("ddl_tables", "\n".join(f"{k}={v}" for k, v in sorted(ddl_table_names.items()))),
+            ("extra", repr(extra)),
+        ]
+        return _combine(parts)
+
+
+class CheckResultCache:
+    """ディスク永続化されるチェック結果キャッシュ"""
+
+    def __init__(self, cache_dir: Path, config_fingerprint: str,
+                 logger: Optional[ConsistencyLogger] = None):
+        """
+        初期化
+
+        Args:
+            cache_dir: キャッシュディレクトリ
+            config_fingerprint: チェッカーバージョン・設定から算出した識別子
+            logger: ログ機能
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_file = self.cache_dir / CACHE_FILE_NAME
+        self.config_fingerprint = config_fingerprint
+        self.logger = logger or ConsistencyLogger.get_logger()
+        # (チェック名, スコープ) -> (入力ハッシュ, 結果)
+        self._entries: Dict[Tuple[str, str], Tuple[str, List[CheckResult]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    @staticmethod
+    def make_config_fingerprint(config, check_config) -> str:
+        """チェッカーバージョンと結果に影響する設定から識別子を算出"""
+        parts = [
+            ("checker_version", CHECKER_VERSION),
+            ("ddl_dir", str(Path(config.ddl_dir).resolve())),
+            ("table_details_dir", str(Path(config.table_details_dir).resolve())),
+            ("check_parameters", repr(sorted((getattr(check_config, 'check_parameters', None) or {}).items()))),
+        ]
+        return _combine(parts)
+
+    def load(self) -> None:
+        """キャッシュファイルを読み込む（形式・設定が異なる場合は破棄）"""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'rb') as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"チェック結果キャッシュの読み込みに失敗しました（再作成します）: {e}")
+            return
+
+        if (payload.get('format_version') != CACHE_FORMAT_VERSION
+                or payload.get('config_fingerprint') != self.config_fingerprint):
+            self.logger.info("チェッカーのバージョンまたは設定が変更されたため、キャッシュを破棄します")
+            self._dirty = True
+            return
+
+        self._entries = payload.get('entries', {})
+
+    def save(self) -> None:
+        """変更があればキャッシュファイルへ書き込む（一時ファイル経由で置換）"""
+        if not self._dirty:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'config_fingerprint': self.config_fingerprint,
+            'entries': self._entries,
+        }
+        temp_file = self.cache_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_file.replace(self.cache_file)
+        self._dirty = False
+
+    def get(self, check_name: str, scope: str, input_hash: str) -> Optional[List[CheckResult]]:
+        """入力ハッシュが一致する場合のみキャッシュ済み結果を返す"""
+        with self._lock:
+            entry = self._entries.get((check_name, scope))
+            if entry and entry[0] == input_hash:
+                self.hits += 1
+                return list(entry[1])
+            self.misses += 1
+            return None
+
+    def put(self, check_name: str, scope: str, input_hash: str, results: List[CheckResult]) -> None:
+        """チェック結果を登録"""
+        with self._lock:
+            self._entries[(check_name, scope)] = (input_hash, list(results))
+            self._dirty = True
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def get_statistics(self) -> Dict[str, int]:
+        """ヒット・ミス件数を取得"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+
+def _combine(parts: Iterable[Tuple[str, str]]) -> str:
+    """(名前, 値) の列から安定したハッシュを生成"""
+    digest = hashlib.sha256()
+    for name, value in parts:
+        digest.update(name.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(str(value).encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
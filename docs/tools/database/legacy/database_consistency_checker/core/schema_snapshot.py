@@ -0,0 +1,315 @@
+"""
+スキーマスナップショット - 1回のチェック実行で共有する解析済みスキーマ
+
+CheckOrchestratorの1回の実行につき、table-details・ddl・テーブル一覧.md・
+entity_relationships.yamlを1度だけ読み込み・解析し、全チェッカーで共有する。
+"""
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import yaml
+
+from core.logger import ConsistencyLogger
+from shared.performance.yaml_cache import YamlParseCache, get_yaml_cache
+from shared.monitoring.tracing import trace_span
+from parsers.column_parser import ColumnParser, TableSchema
+from parsers.ddl_parser import EnhancedDDLParser
+from parsers.yaml_parser import EnhancedYAMLParser
+from parsers.table_list_parser import TableListParser
+
+
+# DDLディレクトリ内で解析対象外とするファイル
+EXCLUDED_DDL_FILES = ('all_tables.sql', '------------.sql')
+
+_MISSING = object()
+
+
+class SchemaSnapshot:
+    """
+    1回のチェック実行で共有する不変のスキーマスナップショット
+
+    ファイル本文とYAMLの読み込み結果は構築時に一括で取得し、
+    各パーサー形式の解析結果（TableSchema・DDLTable・TableDefinition等）は
+    初回アクセス時に1度だけ生成してメモ化する。
+    返却されるオブジェクトは全チェッカーで共有されるため、呼び出し側で変更しないこと。
+    """
+
+    def __init__(
+        self,
+        ddl_texts: Dict[Path, str],
+        yaml_data: Dict[Path, Any],
+        logger: Optional[ConsistencyLogger] = None,
+        yaml_cache: Optional[YamlParseCache] = None
+    ):
+        """
+        スナップショット初期化（通常は build() を使用する）
+
+        Args:
+            ddl_texts: DDLファイルパス -> DDL本文
+            yaml_data: YAMLファイルパス -> safe_load結果
+            logger: ログ機能
+            yaml_cache: YAML解析結果の永続キャッシュ（Noneの場合は毎回解析）
+        """
+        self.logger = logger or ConsistencyLogger()
+        self._yaml_cache = yaml_cache
+        self._ddl_texts: Mapping[Path, str] = MappingProxyType(dict(ddl_texts))
+        self._yaml_data: Mapping[Path, Any] = MappingProxyType(dict(yaml_data))
+        self._texts: Dict[Path, Optional[str]] = {}
+        self._views: Dict[Tuple[str, Path], Any] = {}
+        self._lock = threading.RLock()
+        self._parse_counts: Dict[str, int] = {}
+
+        self._column_parser = ColumnParser(self.logger)
+        self._ddl_parser = EnhancedDDLParser(self.logger)
+        self._yaml_parser = EnhancedYAMLParser(self.logger)
+        self._table_list_parser = TableListParser(self.logger)
+
+    @classmethod
+    def build(
+        cls,
+        config,
+        logger: Optional[ConsistencyLogger] = None,
+        preload: bool = True
+    ) -> 'SchemaSnapshot':
+        """
+        設定のディレクトリ群からスナップショットを構築
+
+        Args:
+            config: ddl_dir・table_details_dir・table_list_file・
+                entity_relationships_file を持つ設定
+            logger: ログ機能
+            preload: Falseの場合はDDL・YAMLを一括で読み込まず、初回アクセス時に読み込む
+                （インクリメンタルチェックで大半のテーブルがキャッシュヒットする場合向け）
+
+        Returns:
+            構築済みスナップショット
+        """
+        logger = logger or ConsistencyLogger()
+        yaml_cache = get_yaml_cache(getattr(config, 'cache_dir', None))
+        ddl_texts: Dict[Path, str] = {}
+        yaml_data: Dict[Path, Any] = {}
+
+        with trace_span("schema_snapshot.build", category="snapshot", preload=preload) as span:
+            ddl_dir = Path(config.ddl_dir)
+            if preload and ddl_dir.exists():
+                for ddl_file in sorted(ddl_dir.glob("*.sql")):
+                    if ddl_file.name in EXCLUDED_DDL_FILES:
+                        continue
+                    text = _read_text(ddl_file, logger)
+                    if text is not None:
+                        ddl_texts[_key(ddl_file)] = text
+
+            yaml_files: List[Path] = []
+            details_dir = Path(config.table_details_dir)
+            if preload and details_dir.exists():
+                yaml_files.extend(sorted(details_dir.glob("*.yaml")))
+            entity_file = Path(config.entity_relationships_file)
+            if preload and entity_file.exists():
+                yaml_files.append(entity_file)
+
+            for yaml_file in yaml_files:
+                data = _load_yaml(yaml_file, logger, yaml_cache)
+                # 解析失敗もNoneとして記録し、チェッカー側での再解析を防ぐ
+                yaml_data[_key(yaml_file)] = None if data is _MISSING else data
+
+            snapshot = cls(ddl_texts, yaml_data, logger, yaml_cache)
+
+            # テーブル一覧はチェッカー間で最も頻繁に参照されるため事前に解析
+            snapshot.table_list(Path(config.table_list_file))
+            span.set_attributes(
+                ddl_files=len(ddl_texts), yaml_files=len(yaml_data),
+                ddl_bytes=sum(len(text) for text in ddl_texts.values())
+            )
+
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # 生データアクセス
+    # ------------------------------------------------------------------
+
+    def ddl_text(self, ddl_path: Path) -> Optional[str]:
+        """DDL本文を取得（スナップショット外のファイルは初回のみ読み込む）"""
+        key = _key(ddl_path)
+        text = self._ddl_texts.get(key)
+        if text is not None:
+            return text
+        return self._read_once(key)
+
+    def yaml_data(self, yaml_path: Path) -> Optional[Any]:
+        """YAMLのsafe_load結果を取得"""
+        key = _key(yaml_path)
+        if key in self._yaml_data:
+            return self._yaml_data[key]
+        return self._memoize('yaml', key, lambda: self._load_yaml_once(key))
+
+    # ------------------------------------------------------------------
+    # パーサー別ビュー（初回アクセス時に1度だけ解析）
+    # ------------------------------------------------------------------
+
+    def table_list(self, table_list_file: Path) -> List:
+        """テーブル一覧.mdの解析結果（TableListEntryのリスト）"""
+        key = _key(table_list_file)
+
+        def parse():
+            text = self._read_once(key)
+            if text is None:
+                return []
+            return self._table_list_parser._parse_content(text)
+
+        return self._memoize('table_list', key, parse)
+
+    def table_names(self, table_list_file: Path) -> List[str]:
+        """テーブル一覧.mdに記載されたテーブル名"""
+        return [entry.table_name for entry in self.table_list(table_list_file)]
+
+    def entity_data(self, entity_file: Path) -> Dict[str, Any]:
+        """entity_relationships.yamlの解析結果（EntityYamlParser.parse_file互換）"""
+        data = self.yaml_data(entity_file)
+        return data if isinstance(data, dict) else {}
+
+    def ddl_table_name(self, ddl_path: Path) -> Optional[str]:
+        """DDLのCREATE TABLE文からテーブル名を取得"""
+        key = _key(ddl_path)
+
+        def parse():
+            text = self.ddl_text(key)
+            return self._ddl_parser.extract_table_name(text) if text is not None else None
+
+        return self._memoize('ddl_table_name', key, parse)
+
+    def ddl_schema(self, ddl_path: Path) -> Optional[TableSchema]:
+        """ColumnParser形式のDDLスキーマ"""
+        key = _key(ddl_path)
+
+        def parse():
+            text = self.ddl_text(key)
+            if text is None:
+                return None
+            return self._column_parser._parse_ddl_content(text, key.stem, key)
+
+        return self._memoize('ddl_schema', key, parse)
+
+    def yaml_schema(self, yaml_path: Path) -> Optional[TableSchema]:
+        """ColumnParser形式のYAMLスキーマ"""
+        key = _key(yaml_path)
+
+        def parse():
+            data = self.yaml_data(key)
+            if not isinstance(data, dict):
+                return None
+            return self._column_parser._parse_yaml_content(data, key.stem)
+
+        return self._memoize('yaml_schema', key, parse)
+
+    def ddl_table(self, ddl_path: Path):
+        """EnhancedDDLParser形式の詳細DDL定義（DDLTable）"""
+        key = _key(ddl_path)
+
+        def parse():
+            text = self.ddl_text(key)
+            if text is None:
+                return None
+            return self._ddl_parser.parse_ddl_content_detailed(text, key)
+
+        return self._memoize('ddl_table', key, parse)
+
+    def ddl_table_info(self, ddl_path: Path) -> Optional[Dict[str, Any]]:
+        """辞書形式の詳細DDL定義（TableDefinition.to_dict()）"""
+        key = _key(ddl_path)
+
+        def parse():
+            table = self.ddl_table(key)
+            return table.to_dict() if table is not None else None
+
+        return self._memoize('ddl_table_info', key, parse)
+
+    def table_definition(self, yaml_path: Path):
+        """EnhancedYAMLParser形式のテーブル定義（TableDefinition）"""
+        key = _key(yaml_path)
+
+        def parse():
+            data = self.yaml_data(key)
+            if not data:
+                return None
+            return self._yaml_parser.parse_table_definition_data(data, key)
+
+        return self._memoize('table_definition', key, parse)
+
+    # ------------------------------------------------------------------
+    # 統計
+    # ------------------------------------------------------------------
+
+    def is_memoized(self, view: str, path: Path) -> bool:
+        """ビュー×ファイルの解析結果が生成済みかどうか"""
+        return (view, _key(path)) in self._views
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """読み込み・解析回数の統計を取得"""
+        with self._lock:
+            return {
+                'ddl_files': len(self._ddl_texts),
+                'yaml_files': len(self._yaml_data),
+                'parse_counts': dict(self._parse_counts),
+                'total_parses': sum(self._parse_counts.values()),
+            }
+
+    # ------------------------------------------------------------------
+    # 内部処理
+    # ------------------------------------------------------------------
+
+    def _memoize(self, view: str, key: Path, factory: Callable[[], Any]) -> Any:
+        """ビュー×ファイル単位で解析結果をメモ化"""
+        cache_key = (view, key)
+        value = self._views.get(cache_key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            value = self._views.get(cache_key, _MISSING)
+            if value is _MISSING:
+                with trace_span(f"snapshot.{view}", category="parser", file=str(key)):
+                    value = factory()
+                self._views[cache_key] = value
+                self._parse_counts[view] = self._parse_counts.get(view, 0) + 1
+        return value
+
+    def _read_once(self, key: Path) -> Optional[str]:
+        """スナップショット構築時に含まれなかったファイルを1度だけ読み込む"""
+        with self._lock:
+            if key not in self._texts:
+                self._texts[key] = _read_text(key, self.logger) if key.exists() else None
+            return self._texts[key]
+
+    def _load_yaml_once(self, key: Path) -> Optional[Any]:
+        if not key.exists():
+            return None
+        data = _load_yaml(key, self.logger, self._yaml_cache)
+        return None if data is _MISSING else data
+
+
+def _key(path: Path) -> Path:
+    """パスの表記揺れを吸収したキャッシュキー"""
+    return Path(path).resolve()
+
+
+def _read_text(path: Path, logger: ConsistencyLogger) -> Optional[str]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception as e:
+        logger.error(f"ファイル読み込みエラー: {path} - {e}")
+        return None
+
+
+def _load_yaml(path: Path, logger: ConsistencyLogger,
+               yaml_cache: Optional[YamlParseCache] = None) -> Any:
+    try:
+        if yaml_cache is not None:
+            return yaml_cache.load(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+    except Exception as e:
+        logger.error(f"YAMLファイル解析エラー: {path} - {e}")
+        return _MISSING
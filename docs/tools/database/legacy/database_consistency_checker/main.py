@@ -6,6 +6,7 @@
 実装者: AI駆動開発チーム
 """
 import argparse
+import atexit
 import sys
 from pathlib import Path
 from typing import List, Optional
@@ -15,9 +16,16 @@ from shared.core.config import get_config, create_check_config
 from shared.core.logger import get_logger, get_performance_logger, setup_logging
 from shared.core.models import CheckResult, CheckSeverity, ConsistencyReport
 from shared.utils.file_utils import get_file_manager
+from shared.monitoring.profiling import add_profile_arguments, profile_command
+from shared.monitoring.tracing import enable_tracing, export_chrome_trace, trace_span
+
+# チェッカー群は整合性チェックツール配下の core / checkers / parsers を直接参照する
+_package_dir = Path(__file__).parent
+if str(_package_dir) not in sys.path:
+    sys.path.insert(0, str(_package_dir))
 
 # ツール固有のインポート
-from database_consistency_checker.checkers.consistency_checker import ConsistencyChecker
+from checkers.check_orchestrator import CheckOrchestrator
 from database_consistency_checker.reporters.console_reporter import ConsoleReporter
 from database_consistency_checker.reporters.markdown_reporter import MarkdownReporter
 from database_consistency_checker.reporters.json_reporter import JsonReporter
@@ -48,6 +56,9 @@ def create_argument_parser() -> argparse.ArgumentParser:
   # 詳細ログ付きでチェック
   python -m database_consistency_checker --verbose
 
+  # テーブル・チェック・解析ごとの所要時間をトレース（chrome://tracing / Perfetto で表示）
+  python -m database_consistency_checker --trace trace.json
+
 利用可能なチェック:
   - table_existence: テーブル存在確認
   - orphaned_files: 孤立ファイル検出
@@ -130,6 +141,28 @@ def create_argument_parser() -> argparse.ArgumentParser:
         help="詳細ログを出力"
     )
     
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="依存関係のないチェックの並列実行数（デフォルト: 1 = 逐次実行）"
+    )
+    
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="入力ファイルが変化していないテーブルは前回のチェック結果を再利用"
+    )
+    
+    parser.add_argument(
+        "--trace",
+        type=str,
+        metavar="FILE",
+        help="スパントレースを Chrome trace-event 形式のJSONで出力"
+    )
+    
+    add_profile_arguments(parser)
+    
     # レポート管理オプション
     parser.add_argument(
         "--report-dir",
@@ -198,6 +231,19 @@ def main():
     parser = create_argument_parser()
     args = parser.parse_args()
     
+    # トレースは終了コードによらず終了時に出力する
+    if args.trace:
+        enable_tracing()
+        atexit.register(export_chrome_trace, args.trace)
+    
+    # プロファイルは sys.exit による終了時も出力する
+    command = "generate-sample-data" if args.generate_sample_data else "check"
+    with profile_command(args, command):
+        run(args)
+
+
+def run(args):
+    """コマンドを実行"""
     # ログ設定の初期化
     logger = get_logger("consistency_checker")
     perf_logger = get_performance_logger("consistency_checker")
@@ -210,7 +256,16 @@ def main():
         check_config = create_check_config(
             enabled_checks=args.checks or [],
             output_format=args.output_format,
-            verbose=args.verbose
+            verbose=args.verbose,
+            max_workers=args.jobs,
+            incremental=args.incremental,
+            target_tables=args.tables,
+            output_file=args.output_file,
+            report_dir=args.report_dir,
+            report_prefix=args.report_prefix,
+            auto_cleanup=not args.no_cleanup,
+            keep_reports=args.keep_reports,
+            max_reports=args.max_reports
         )
         
         logger.log_tool_start("consistency_checker", 
@@ -224,7 +279,7 @@ def main():
     
     # チェッカーの初期化
     try:
-        checker = ConsistencyChecker(config, check_config)
+        checker = CheckOrchestrator(config, check_config)
     except Exception as e:
         logger.error(f"チェッカー初期化エラー: {e}")
         sys.exit(1)
@@ -282,10 +337,12 @@ def main():
     
     # 通常のチェック実行
     try:
-        if args.checks:
-            report = checker.run_specific_checks(args.checks)
-        else:
-            report = checker.run_all_checks()
+        with trace_span("consistency_checker.main", category="cli",
+                        checks=args.checks or "all", tables=args.tables or "all"):
+            if args.checks:
+                report = checker.run_specific_checks(args.checks)
+            else:
+                report = checker.run_all_checks()
     except Exception as e:
         print(f"❌ チェック実行エラー: {e}", file=sys.stderr)
         if args.verbose:
@@ -2,13 +2,14 @@
 カラム定義解析パーサー
 DDLファイルとYAMLファイルからカラム定義を抽出・解析する
 """
-import re
 import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 
 from core.logger import ConsistencyLogger
+from shared.core.models import TableDefinition as SharedTableDefinition
+from shared.parsers.ddl_engine import load_ddl_tables, parse_ddl_tables
 
 
 @dataclass
@@ -102,193 +103,86 @@ class ColumnParser:
     def parse_ddl_file(self, ddl_path: Path) -> Optional[TableSchema]:
         """DDLファイルからテーブルスキーマを解析"""
         try:
-            with open(ddl_path, 'r', encoding='utf-8') as f:
-                ddl_content = f.read()
-            
-            return self._parse_ddl_content(ddl_content, ddl_path.stem)
+            tables = load_ddl_tables(ddl_path)
+            return self._schema_from_tables(tables, ddl_path.stem)
         
         except Exception as e:
             self.logger.error(f"DDLファイル解析エラー: {ddl_path}: {e}")
             return None
     
-    def _parse_ddl_content(self, ddl_content: str, table_name: str) -> TableSchema:
-        """DDL内容からテーブルスキーマを解析"""
-        schema = TableSchema(table_name=table_name)
+    def _parse_ddl_content(self, ddl_content: str, table_name: str,
+                           ddl_path: Optional[Path] = None) -> TableSchema:
+        """
+        DDL内容からテーブルスキーマを解析
         
-        # CREATE TABLE文を抽出
-        create_table_match = re.search(
-            r'CREATE\s+TABLE\s+(\w+)\s*\((.*?)\)\s*(?:ENGINE|;)',
-            ddl_content,
-            re.IGNORECASE | re.DOTALL
-        )
+        ddl_path を指定した場合は統合DDL解析エンジンのファイル単位キャッシュを共有する。
+        """
+        if ddl_path is not None:
+            tables = load_ddl_tables(ddl_path, ddl_content)
+        else:
+            tables = parse_ddl_tables(ddl_content)
+        return self._schema_from_tables(tables, table_name)
+    
+    def _schema_from_tables(self, tables: List[SharedTableDefinition], table_name: str) -> TableSchema:
+        """統合DDL解析エンジンの結果（最初のCREATE TABLE文）をTableSchemaに変換"""
+        schema = TableSchema(table_name=table_name)
         
-        if not create_table_match:
+        if not tables:
             self.logger.warning(f"CREATE TABLE文が見つかりません: {table_name}")
             return schema
         
-        table_def = create_table_match.group(2)
-        
-        # カラム定義を解析
-        self._parse_ddl_columns(table_def, schema)
-        
-        # インデックスを解析
-        self._parse_ddl_indexes(ddl_content, schema)
-        
-        # 外部キー制約を解析
-        self._parse_ddl_foreign_keys(ddl_content, schema)
-        
-        # その他の制約を解析
-        self._parse_ddl_constraints(ddl_content, schema)
-        
-        return schema
-    
-    def _parse_ddl_columns(self, table_def: str, schema: TableSchema):
-        """DDLのカラム定義を解析"""
-        # カラム定義の正規表現パターン
-        column_pattern = r'(\w+)\s+([A-Z]+(?:\([^)]+\))?)\s*([^,]*?)(?:COMMENT\s+[\'"]([^\'"]*)[\'"]\s*)?(?:,|$)'
+        table_def = tables[0]
         
-        for match in re.finditer(column_pattern, table_def, re.IGNORECASE):
-            column_name = match.group(1).strip()
-            data_type_full = match.group(2).strip()
-            modifiers = match.group(3).strip() if match.group(3) else ""
-            comment = match.group(4).strip() if match.group(4) else None
-            
-            # データ型と長さを解析
-            data_type, length, precision, scale = self._parse_data_type(data_type_full)
-            
-            # カラム修飾子を解析
-            nullable = "NOT NULL" not in modifiers.upper()
-            unique = "UNIQUE" in modifiers.upper()
-            primary_key = "PRIMARY KEY" in modifiers.upper()
-            
-            # デフォルト値を抽出
-            default_match = re.search(r'DEFAULT\s+([\'"]?[^,\s]+[\'"]?)', modifiers, re.IGNORECASE)
-            default_value = default_match.group(1).strip('\'"') if default_match else None
-            
-            # ENUM値を抽出
-            enum_values = []
-            if data_type.upper() == "ENUM":
-                enum_match = re.search(r'ENUM\s*\(([^)]+)\)', data_type_full, re.IGNORECASE)
-                if enum_match:
-                    enum_str = enum_match.group(1)
-                    enum_values = [v.strip('\'"') for v in enum_str.split(',')]
-            
-            column = ColumnDefinition(
-                name=column_name,
-                data_type=data_type,
-                length=length,
-                precision=precision,
-                scale=scale,
-                nullable=nullable,
-                unique=unique,
-                primary_key=primary_key,
-                default_value=default_value,
-                comment=comment,
-                enum_values=enum_values
+        # カラム定義
+        for col in table_def.columns:
+            schema.columns[col.name] = ColumnDefinition(
+                name=col.name,
+                data_type=col.type,
+                length=col.length,
+                precision=col.precision,
+                scale=col.scale,
+                nullable=col.nullable,
+                unique=col.unique,
+                primary_key=col.primary_key,
+                default_value=col.default,
+                comment=col.comment,
+                enum_values=list(col.enum_values or [])
             )
-            
-            schema.columns[column_name] = column
-            
-            if primary_key:
-                schema.primary_keys.append(column_name)
-    
-    def _parse_data_type(self, data_type_full: str) -> tuple:
-        """データ型文字列を解析"""
-        # ENUM型の場合
-        if data_type_full.upper().startswith('ENUM'):
-            return 'ENUM', None, None, None
-        
-        # 長さ指定がある場合
-        type_match = re.match(r'([A-Z]+)\s*\(([^)]+)\)', data_type_full, re.IGNORECASE)
-        if type_match:
-            data_type = type_match.group(1).upper()
-            params = type_match.group(2).strip()
-            
-            # DECIMAL(10,2)のような場合
-            if ',' in params:
-                parts = params.split(',')
-                precision = int(parts[0].strip())
-                scale = int(parts[1].strip())
-                return data_type, None, precision, scale
-            else:
-                # VARCHAR(100)のような場合
-                length = int(params)
-                return data_type, length, None, None
-        
-        # 長さ指定がない場合
-        return data_type_full.upper(), None, None, None
-    
-    def _parse_ddl_indexes(self, ddl_content: str, schema: TableSchema):
-        """DDLのインデックス定義を解析"""
-        index_pattern = r'CREATE\s+(UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+\w+\s*\(([^)]+)\)'
-        
-        for match in re.finditer(index_pattern, ddl_content, re.IGNORECASE):
-            unique = bool(match.group(1))
-            index_name = match.group(2)
-            columns_str = match.group(3)
-            columns = [col.strip() for col in columns_str.split(',')]
-            
-            index_def = {
-                'name': index_name,
-                'columns': columns,
-                'unique': unique
-            }
-            
-            schema.indexes.append(index_def)
-            
-            # UNIQUE制約として記録
-            if unique:
-                schema.unique_constraints.append(columns)
-    
-    def _parse_ddl_foreign_keys(self, ddl_content: str, schema: TableSchema):
-        """DDLの外部キー制約を解析"""
-        fk_pattern = r'ADD\s+CONSTRAINT\s+(\w+)\s+FOREIGN\s+KEY\s*\(([^)]+)\)\s+REFERENCES\s+(\w+)\s*\(([^)]+)\)(?:\s+ON\s+UPDATE\s+(\w+))?(?:\s+ON\s+DELETE\s+(\w+))?'
+            if col.primary_key:
+                schema.primary_keys.append(col.name)
         
-        for match in re.finditer(fk_pattern, ddl_content, re.IGNORECASE):
-            constraint_name = match.group(1)
-            source_columns = [col.strip() for col in match.group(2).split(',')]
-            target_table = match.group(3)
-            target_columns = [col.strip() for col in match.group(4).split(',')]
-            on_update = match.group(5) if match.group(5) else 'RESTRICT'
-            on_delete = match.group(6) if match.group(6) else 'RESTRICT'
-            
-            fk_def = {
-                'name': constraint_name,
-                'columns': source_columns,
-                'reference_table': target_table,
-                'reference_columns': target_columns,
-                'on_update': on_update,
-                'on_delete': on_delete
-            }
-            
-            schema.foreign_keys.append(fk_def)
-    
-    def _parse_ddl_constraints(self, ddl_content: str, schema: TableSchema):
-        """DDLのその他の制約を解析"""
-        # CHECK制約
-        check_pattern = r'ADD\s+CONSTRAINT\s+(\w+)\s+CHECK\s*\(([^)]+)\)'
+        # インデックス（UNIQUEインデックスはUNIQUE制約としても記録）
+        for index in table_def.indexes:
+            schema.indexes.append({
+                'name': index.name,
+                'columns': list(index.columns),
+                'unique': index.unique
+            })
+            if index.unique:
+                schema.unique_constraints.append(list(index.columns))
         
-        for match in re.finditer(check_pattern, ddl_content, re.IGNORECASE):
-            constraint_name = match.group(1)
-            condition = match.group(2)
-            
-            check_def = {
-                'name': constraint_name,
-                'condition': condition
-            }
-            
-            schema.check_constraints.append(check_def)
+        # 外部キー制約
+        for fk in table_def.foreign_keys:
+            schema.foreign_keys.append({
+                'name': fk.name,
+                'columns': list(fk.columns),
+                'reference_table': fk.references_table,
+                'reference_columns': list(fk.references_columns or []),
+                'on_update': fk.on_update,
+                'on_delete': fk.on_delete
+            })
         
-        # UNIQUE制約
-        unique_pattern = r'ADD\s+CONSTRAINT\s+(\w+)\s+UNIQUE\s*\(([^)]*)\)'
+        # CHECK・UNIQUE制約
+        for constraint in table_def.constraints:
+            if constraint.type == 'CHECK':
+                schema.check_constraints.append({
+                    'name': constraint.name,
+                    'condition': constraint.condition
+                })
+            elif constraint.type == 'UNIQUE' and constraint.columns:
+                schema.unique_constraints.append(list(constraint.columns))
         
-        for match in re.finditer(unique_pattern, ddl_content, re.IGNORECASE):
-            constraint_name = match.group(1)
-            columns_str = match.group(2)
-            
-            if columns_str.strip():  # 空でない場合のみ
-                columns = [col.strip() for col in columns_str.split(',')]
-                schema.unique_constraints.append(columns)
+        return schema
     
     def parse_yaml_file(self, yaml_path: Path) -> Optional[TableSchema]:
         """YAMLファイルからテーブルスキーマを解析"""
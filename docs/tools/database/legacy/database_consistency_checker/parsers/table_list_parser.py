@@ -3,7 +3,7 @@
 """
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from shared.core.models import TableListEntry
 from database_consistency_checker.core.logger import ConsistencyLogger
 
@@ -60,14 +60,16 @@ class TableListParser:
         lines = content.split('\n')
         in_table = False
         header_found = False
+        name_index, description_index = 0, 1
         
         for line in lines:
             line = line.strip()
             
-            # テーブルの開始を検出
+            # テーブルの開始を検出（テーブル名・論理名の列位置を記録）
             if '|' in line and ('テーブル名' in line or 'Table' in line):
                 in_table = True
                 header_found = True
+                name_index, description_index = self._find_columns(self._split_row(line))
                 continue
             
             # ヘッダー区切り行をスキップ
@@ -76,7 +78,7 @@ class TableListParser:
             
             # テーブル行を解析
             if in_table and line.startswith('|') and line.endswith('|'):
-                entry = self._parse_table_row(line)
+                entry = self._parse_table_row(line, name_index, description_index)
                 if entry:
                     entries.append(entry)
             elif in_table and not line:
@@ -86,39 +88,66 @@ class TableListParser:
         
         return entries
     
-    def _parse_table_row(self, line: str) -> Optional[TableListEntry]:
+    @staticmethod
+    def _split_row(line: str) -> List[str]:
+        """マークダウンテーブル行をセルに分割"""
+        parts = [part.strip() for part in line.split('|')]
+        
+        # 最初と最後の空要素を除去
+        if parts and not parts[0]:
+            parts = parts[1:]
+        if parts and not parts[-1]:
+            parts = parts[:-1]
+        return parts
+    
+    @staticmethod
+    def _find_columns(headers: List[str]) -> Tuple[int, int]:
+        """
+        ヘッダー行からテーブル名・論理名の列位置を取得
+        
+        Args:
+            headers: ヘッダーセル
+            
+        Returns:
+            (テーブル名の列, 論理名の列)。見つからない場合は先頭2列
+        """
+        name_index = next(
+            (i for i, h in enumerate(headers) if h in ('テーブル名', 'Table Name', 'Table')), 0
+        )
+        description_index = next(
+            (i for i, h in enumerate(headers) if h in ('論理名', '説明', 'Description')), name_index + 1
+        )
+        return name_index, description_index
+    
+    def _parse_table_row(self, line: str, name_index: int = 0,
+                         description_index: int = 1) -> Optional[TableListEntry]:
         """
         テーブル行を解析
         
         Args:
             line: テーブル行
+            name_index: テーブル名の列位置
+            description_index: 論理名の列位置
             
         Returns:
             テーブル一覧エントリ
         """
         try:
-            # パイプで分割
-            parts = [part.strip() for part in line.split('|')]
-            
-            # 最初と最後の空要素を除去
-            if parts and not parts[0]:
-                parts = parts[1:]
-            if parts and not parts[-1]:
-                parts = parts[:-1]
+            parts = self._split_row(line)
             
-            if len(parts) < 2:
+            if len(parts) <= name_index:
                 return None
             
-            table_name = parts[0].strip()
-            description = parts[1].strip() if len(parts) > 1 else ""
+            table_name = parts[name_index]
+            description = parts[description_index] if len(parts) > description_index else ""
             
             # テーブル名が空の場合はスキップ
             if not table_name or table_name in ['テーブル名', 'Table Name', 'Table']:
                 return None
             
             return TableListEntry(
-                table_name=table_name,
-                description=description
+                name=table_name,
+                logical_name=description
             )
             
         except Exception as e:
@@ -80,16 +80,22 @@ class EnhancedYAMLParser(YAMLParser):
     
     def parse_table_definition(self, file_path: Path) -> Optional[TableDefinition]:
         """テーブル定義の詳細解析"""
+        yaml_data = self.parse_yaml_file(file_path)
+        if not yaml_data:
+            return None
+        
+        return self.parse_table_definition_data(yaml_data, file_path)
+    
+    def parse_table_definition_data(self, yaml_data: Dict[str, Any], source: Any = None) -> Optional[TableDefinition]:
+        """読み込み済みYAMLデータからテーブル定義を解析"""
         try:
-            yaml_data = self.parse_yaml_file(file_path)
-            if not yaml_data:
-                return None
-            
             # TableDefinitionオブジェクトを作成
             table_def = TableDefinition(
-                table_name=yaml_data.get('table_name', ''),
+                name=yaml_data.get('table_name', ''),
                 logical_name=yaml_data.get('logical_name', ''),
                 category=yaml_data.get('category', ''),
+                priority=yaml_data.get('priority', ''),
+                requirement_id=yaml_data.get('requirement_id', ''),
                 overview=yaml_data.get('overview', '')
             )
             
@@ -124,7 +130,7 @@ class EnhancedYAMLParser(YAMLParser):
             return table_def
             
         except Exception as e:
-            self.logger.error(f"テーブル定義解析エラー: {file_path} - {e}")
+            self.logger.error(f"テーブル定義解析エラー: {source} - {e}")
             return None
     
     def _parse_business_columns(self, columns_data: List[Dict[str, Any]]) -> List[ColumnDefinition]:
@@ -135,9 +141,10 @@ class EnhancedYAMLParser(YAMLParser):
             try:
                 column = ColumnDefinition(
                     name=col_data.get('name', ''),
-                    logical_name=col_data.get('logical', ''),
+                    type=col_data.get('type', ''),
                     comment=col_data.get('description', '')
                 )
+                column.logical_name = col_data.get('logical', '')
                 
                 # データ型を正規化
                 raw_type = col_data.get('type', '').upper()
@@ -161,7 +168,8 @@ class EnhancedYAMLParser(YAMLParser):
                     column.enum_values = col_data['enum_values']
                 
                 # デフォルト値
-                if 'default' in col_data:
+                column.default_value = None
+                if col_data.get('default') is not None:
                     column.default_value = str(col_data['default'])
                 
                 columns.append(column)
@@ -182,7 +190,7 @@ class EnhancedYAMLParser(YAMLParser):
                     name=idx_data.get('name', ''),
                     columns=idx_data.get('columns', []),
                     unique=idx_data.get('unique', False),
-                    description=idx_data.get('description', '')
+                    comment=idx_data.get('description', '')
                 )
                 indexes.append(index)
                 
@@ -200,12 +208,13 @@ class EnhancedYAMLParser(YAMLParser):
             try:
                 foreign_key = ForeignKeyDefinition(
                     name=fk.get('name', ''),
+                    columns=[],
                     column=fk.get('column', ''),
                     reference_table=fk.get('reference_table', ''),
                     reference_column=fk.get('reference_column', ''),
                     on_update=fk.get('on_update', 'CASCADE'),
                     on_delete=fk.get('on_delete', 'RESTRICT'),
-                    description=fk.get('description', '')
+                    comment=fk.get('description', '')
                 )
                 foreign_keys.append(foreign_key)
                 
@@ -226,7 +235,7 @@ class EnhancedYAMLParser(YAMLParser):
                     type=const_data.get('type', ''),
                     columns=const_data.get('columns', []),
                     condition=const_data.get('condition', ''),
-                    description=const_data.get('description', '')
+                    comment=const_data.get('description', '')
                 )
                 constraints.append(constraint)
                 
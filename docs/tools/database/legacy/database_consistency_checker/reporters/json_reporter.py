@@ -13,7 +13,8 @@ if str(_tools_dir) not in sys.path:
     sys.path.insert(0, str(_tools_dir))
 
 # 絶対インポートを使用
-from shared.core.models import ConsistencyReport, CheckResult, CheckSeverity, FixSuggestion
+from shared.core.models import ConsistencyReport, CheckResult, CheckSeverity
+from database_consistency_checker.core.models import FixSuggestion
 from database_consistency_checker.core.check_definitions import get_japanese_check_name
 
 
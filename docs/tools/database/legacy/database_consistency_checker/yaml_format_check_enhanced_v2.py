@@ -32,6 +32,19 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 import re
 
+_tools_dir = Path(__file__).parent.parent
+if str(_tools_dir) not in sys.path:
+    sys.path.insert(0, str(_tools_dir))
+
+try:
+    # 解析済みYAMLの共有ディスクキャッシュ（他ツールと共用）
+    from shared.performance.yaml_cache import cached_yaml_load
+except ImportError:
+    cached_yaml_load = None
+
+# テーブル詳細定義YAMLのファイル名（現行形式 → 旧形式の順に探索）
+TABLE_DETAILS_FILE_PATTERNS = ("テーブル詳細定義YAML_{table}.yaml", "{table}_details.yaml")
+
 
 @dataclass
 class ValidationError:
@@ -162,6 +175,29 @@ class YAMLFormatValidatorV2:
         # テンプレートから標準順序を読み込み
         self.template_order = self._load_template_order()
     
+    def find_yaml_file(self, table_name: str) -> str:
+        """テーブル詳細定義YAMLのパス（存在しない場合は旧形式のパス）"""
+        for pattern in TABLE_DETAILS_FILE_PATTERNS:
+            yaml_file_path = os.path.join(self.table_details_dir, pattern.format(table=table_name))
+            if os.path.exists(yaml_file_path):
+                return yaml_file_path
+        return yaml_file_path
+    
+    def list_tables(self) -> List[str]:
+        """テーブル詳細定義YAMLが存在するテーブル名の一覧（テンプレートを除く）"""
+        tables = []
+        if not os.path.exists(self.table_details_dir):
+            return tables
+        file_names = sorted(os.listdir(self.table_details_dir))
+        for pattern in TABLE_DETAILS_FILE_PATTERNS:
+            prefix, suffix = pattern.split("{table}")
+            for file_name in file_names:
+                if file_name.startswith(prefix) and file_name.endswith(suffix) and not file_name.startswith('_'):
+                    table_name = file_name[len(prefix):-len(suffix)]
+                    if table_name not in ("MST_TEMPLATE", "TEMPLATE") and table_name not in tables:
+                        tables.append(table_name)
+        return tables
+    
     def _setup_logging(self):
         """ログ設定のセットアップ"""
         if not self.logger.handlers:
@@ -219,7 +255,7 @@ class YAMLFormatValidatorV2:
         
         try:
             # ファイル存在チェック
-            yaml_file_path = os.path.join(self.table_details_dir, f"{table_name}_details.yaml")
+            yaml_file_path = self.find_yaml_file(table_name)
             result['file_path'] = yaml_file_path
             
             if not os.path.exists(yaml_file_path):
@@ -246,7 +282,10 @@ class YAMLFormatValidatorV2:
             
             # YAML解析チェック
             try:
-                yaml_data = yaml.safe_load(yaml_content)
+                if cached_yaml_load is not None:
+                    yaml_data = cached_yaml_load(yaml_file_path, yaml_content)
+                else:
+                    yaml_data = yaml.safe_load(yaml_content)
                 
                 if yaml_data is None:
                     error = ValidationError(
@@ -675,12 +714,7 @@ class YAMLFormatCheckEnhancedV2:
                     result['summary_suggestions'].extend([f"{table_name}: {suggestion}" for suggestion in table_result.get('suggestions', [])])
             else:
                 # 全テーブルの検証
-                yaml_files = []
-                if os.path.exists(self.yaml_validator.table_details_dir):
-                    for file_name in os.listdir(self.yaml_validator.table_details_dir):
-                        if file_name.endswith('_details.yaml') and not file_name.startswith('_'):
-                            table_name = file_name.replace('_details.yaml', '')
-                            yaml_files.append(table_name)
+                yaml_files = self.yaml_validator.list_tables()
                 
                 if not yaml_files:
                     return {
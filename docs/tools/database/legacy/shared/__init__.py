@@ -34,25 +34,16 @@ from .core.models import (
     IndexInfo,
     ForeignKeyInfo,
     ValidationResult,
-    ProcessingResult,
-    FileProcessingResult
+    ProcessingResult
 )
 
 # ユーティリティ
 from .utils.file_utils import (
     ensure_directory,
-    backup_file,
-    safe_write_file,
-    get_file_hash,
-    find_files_by_pattern,
-    copy_file_with_backup,
     FileManager
 )
 from .utils.validation import (
-    validate_yaml_file,
-    validate_file_exists,
-    validate_directory_structure,
-    ValidationEngine
+    validate_yaml_file
 )
 
 # パフォーマンス
@@ -68,11 +59,17 @@ from .performance.parallel_processor import (
 from .performance.cache_manager import (
     CacheManager,
     LRUCache,
+    StripedLRUCache,
     FileCache,
     ResultCache,
     get_cache_manager,
     cached_file_content,
-    cached_result
+    cached_result,
+    TieredCache,
+    DiskCache,
+    get_tiered_cache,
+    cached,
+    file_key
 )
 
 # 監視・メトリクス
@@ -90,6 +87,22 @@ from .monitoring.metrics_collector import (
     start_system_monitoring,
     export_metrics
 )
+from .monitoring.tracing import (
+    Span,
+    Tracer,
+    get_tracer,
+    enable_tracing,
+    trace_span,
+    traced,
+    current_span,
+    export_chrome_trace
+)
+from .monitoring.profiling import (
+    CommandProfiler,
+    add_profile_arguments,
+    profile_command,
+    profile_stage
+)
 
 # パーサー
 from .parsers.base_parser import BaseParser
@@ -144,7 +157,7 @@ def get_library_info() -> dict:
             'core': ['config', 'logger', 'exceptions', 'models'],
             'utils': ['file_utils', 'validation'],
             'performance': ['parallel_processor', 'cache_manager'],
-            'monitoring': ['metrics_collector']
+            'monitoring': ['metrics_collector', 'tracing', 'profiling']
         }
     }
 
@@ -202,20 +215,11 @@ __all__ = [
     'ForeignKeyInfo',
     'ValidationResult',
     'ProcessingResult',
-    'FileProcessingResult',
     
     # ユーティリティ
     'ensure_directory',
-    'backup_file',
-    'safe_write_file',
-    'get_file_hash',
-    'find_files_by_pattern',
-    'copy_file_with_backup',
     'FileManager',
     'validate_yaml_file',
-    'validate_file_exists',
-    'validate_directory_structure',
-    'ValidationEngine',
     
     # パフォーマンス
     'ParallelProcessor',
@@ -226,9 +230,15 @@ __all__ = [
     'process_files_sync',
     'CacheManager',
     'LRUCache',
+    'StripedLRUCache',
     'FileCache',
     'ResultCache',
     'get_cache_manager',
+    'TieredCache',
+    'DiskCache',
+    'get_tiered_cache',
+    'cached',
+    'file_key',
     'cached_file_content',
     'cached_result',
     
@@ -245,6 +255,18 @@ __all__ = [
     'time_function',
     'start_system_monitoring',
     'export_metrics',
+    'Span',
+    'Tracer',
+    'get_tracer',
+    'enable_tracing',
+    'trace_span',
+    'traced',
+    'current_span',
+    'export_chrome_trace',
+    'CommandProfiler',
+    'add_profile_arguments',
+    'profile_command',
+    'profile_stage',
     
     # パーサー・ジェネレーター
     'BaseParser',
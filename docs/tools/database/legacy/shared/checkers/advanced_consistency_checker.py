@@ -8,10 +8,12 @@
 """
 
 import re
+from pathlib import Path
 from typing import Dict, List, Set, Optional, Any
 from dataclasses import dataclass
 
 from .base_checker import BaseChecker, CheckResult as BaseCheckResult
+from ..parsers.ddl_engine import load_ddl_tables, format_column_type
 from ..core.models import TableDefinition, ColumnDefinition, CheckResult, CheckStatus, CheckResultSummary
 from ..core.config import DatabaseToolsConfig
 
@@ -649,12 +651,8 @@ class AdvancedConsistencyChecker(BaseChecker):
                 with open(yaml_path, 'r', encoding='utf-8') as f:
                     yaml_data = yaml.safe_load(f)
                 
-                # DDLファイルも読み込んで比較
-                with open(ddl_path, 'r', encoding='utf-8') as f:
-                    ddl_content = f.read()
-                
-                # カラム定義の整合性チェック
-                column_errors = self._check_column_consistency(table_name, yaml_data, ddl_content)
+                # カラム定義の整合性チェック（DDLは統合DDL解析エンジンで解析）
+                column_errors = self._check_column_consistency(table_name, yaml_data, ddl_path)
                 errors.extend(column_errors)
                 
                 # 外部キー整合性チェック
@@ -892,14 +890,14 @@ class AdvancedConsistencyChecker(BaseChecker):
         
         return warnings
     
-    def _check_column_consistency(self, table_name: str, yaml_data: dict, ddl_content: str) -> List[CheckResult]:
+    def _check_column_consistency(self, table_name: str, yaml_data: dict, ddl_path: Path) -> List[CheckResult]:
         """カラム定義の整合性チェック"""
         errors = []
         
         yaml_columns = yaml_data.get('columns', [])
         
-        # DDLからカラム情報を抽出（簡略化）
-        ddl_columns = self._parse_ddl_columns(ddl_content)
+        # DDLからカラム情報を抽出
+        ddl_columns = self._parse_ddl_columns(ddl_path)
         
         for yaml_col in yaml_columns:
             col_name = yaml_col.get('name')
@@ -936,41 +934,19 @@ class AdvancedConsistencyChecker(BaseChecker):
         
         return errors
     
-    def _parse_ddl_columns(self, ddl_content: str) -> Dict[str, Dict[str, Any]]:
-        """DDLからカラム情報を抽出"""
-        columns = {}
-        
-        # CREATE TABLE文を抽出
-        create_match = re.search(r'CREATE TABLE\s+\w+\s*\((.*?)\);', ddl_content, re.DOTALL | re.IGNORECASE)
-        if not create_match:
-            return columns
-        
-        table_def = create_match.group(1)
+    def _parse_ddl_columns(self, ddl_path: Path) -> Dict[str, Dict[str, Any]]:
+        """DDLからカラム情報を抽出（型は長さ・精度付きの表記、例: VARCHAR(50)）"""
+        tables = load_ddl_tables(ddl_path)
+        if not tables:
+            return {}
         
-        # カラム定義を行ごとに分割
-        lines = [line.strip() for line in table_def.split('\n') if line.strip()]
-        
-        for line in lines:
-            # 制約行やコメント行をスキップ
-            if (line.upper().startswith(('UNIQUE', 'PRIMARY KEY', 'FOREIGN KEY', 'CONSTRAINT', '--')) or
-                'REFERENCES' in line.upper()):
-                continue
-            
-            # カラム定義を解析
-            parts = line.rstrip(',').split()
-            if len(parts) >= 2:
-                col_name = parts[0].strip()
-                col_type = parts[1].strip()
-                
-                # NULL制約をチェック
-                nullable = 'NOT NULL' not in line.upper()
-                
-                columns[col_name] = {
-                    'type': col_type,
-                    'nullable': nullable
-                }
-        
-        return columns
+        return {
+            column.name: {
+                'type': format_column_type(column),
+                'nullable': column.nullable
+            }
+            for column in tables[0].columns
+        }
     
     def _check_foreign_key_consistency(self, table_name: str, yaml_data: dict) -> List[CheckResult]:
         """外部キー整合性チェック"""
@@ -39,6 +39,7 @@ class PathConfig:
     reports_dir: Path = field(default_factory=Path)
     backup_dir: Path = field(default_factory=Path)
     temp_dir: Path = field(default_factory=Path)
+    cache_dir: Path = field(default_factory=Path)
     
     def __post_init__(self):
         """パスの初期化"""
@@ -54,6 +55,8 @@ class PathConfig:
             self.backup_dir = self.base_dir / "docs/design/database/backups"
         if not self.temp_dir:
             self.temp_dir = self.base_dir / "temp"
+        if not self.cache_dir:
+            self.cache_dir = self.base_dir / ".cache"
 
 
 @dataclass
@@ -102,6 +105,9 @@ class ValidationConfig:
 class Config:
     """統合設定クラス"""
     
+    # チェック・生成の対象外とするテンプレートテーブル
+    default_excluded_tables = ("MST_TEMPLATE", "TEMPLATE")
+    
     def __init__(self, base_dir: Optional[str] = None, config_file: Optional[str] = None):
         """設定初期化"""
         self.base_dir = Path(base_dir) if base_dir else self._detect_base_dir()
@@ -128,9 +134,15 @@ class Config:
     def _detect_base_dir(self) -> Path:
         """ベースディレクトリの自動検出"""
         current = Path.cwd()
+        candidates = [current] + list(current.parents)
+        
+        # テーブル一覧.md を持つ設計ディレクトリを優先（ツール配下の出力先と区別する）
+        for parent in candidates:
+            if (parent / "docs/design/database/テーブル一覧.md").exists():
+                return parent
         
         # skill-report-webディレクトリを探す
-        for parent in [current] + list(current.parents):
+        for parent in candidates:
             if (parent / "docs/design/database").exists():
                 return parent
         
@@ -238,6 +250,53 @@ class Config:
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def design_dir(self) -> Path:
+        """データベース設計ディレクトリ"""
+        return self.base_dir / "docs/design/database"
+    
+    def _design_path(self, configured: Path, name: str) -> Path:
+        """設定ファイルで指定されていればそのパス、なければ設計ディレクトリ配下"""
+        return configured if configured != Path() else self.design_dir / name
+    
+    @property
+    def table_details_dir(self) -> Path:
+        return self._design_path(self.paths.table_details_dir, "table-details")
+    
+    @property
+    def ddl_dir(self) -> Path:
+        return self._design_path(self.paths.ddl_dir, "ddl")
+    
+    @property
+    def tables_dir(self) -> Path:
+        return self._design_path(self.paths.tables_dir, "tables")
+    
+    @property
+    def data_dir(self) -> Path:
+        return self.design_dir / "data"
+    
+    @property
+    def table_list_file(self) -> Path:
+        return self.design_dir / "テーブル一覧.md"
+    
+    @property
+    def entity_relationships_file(self) -> Path:
+        return self.design_dir / "entity_relationships.yaml"
+    
+    @property
+    def cache_dir(self) -> Path:
+        return self.paths.cache_dir if self.paths.cache_dir != Path() else self.base_dir / ".cache"
+    
+    def validate_paths(self) -> List[Path]:
+        """
+        整合性チェックに必要なファイル/ディレクトリの存在確認
+        
+        Returns:
+            見つからないパスのリスト
+        """
+        required = [self.table_list_file, self.ddl_dir, self.table_details_dir]
+        return [path for path in required if not path.exists()]
+    
     def get_backup_path(self, original_file: Path) -> Path:
         """バックアップファイルパスを生成"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -269,7 +328,8 @@ class Config:
                 'tables_dir': str(self.paths.tables_dir),
                 'reports_dir': str(self.paths.reports_dir),
                 'backup_dir': str(self.paths.backup_dir),
-                'temp_dir': str(self.paths.temp_dir)
+                'temp_dir': str(self.paths.temp_dir),
+                'cache_dir': str(self.paths.cache_dir)
             },
             'logging': {
                 'level': self.logging.level,
@@ -325,6 +385,10 @@ class Config:
             raise RuntimeError(f"設定ファイル保存エラー: {e}")
 
 
+# 旧名（checkers / adapters が参照）
+DatabaseToolsConfig = Config
+
+
 # グローバルインスタンス
 _config_instance: Optional[Config] = None
 
@@ -349,5 +413,15 @@ def create_check_config(**kwargs) -> 'CheckConfig':
         check_parameters=kwargs.get('check_parameters', {}),
         output_format=kwargs.get('output_format', 'console'),
         verbose=kwargs.get('verbose', False),
-        fail_fast=kwargs.get('fail_fast', False)
+        fail_fast=kwargs.get('fail_fast', False),
+        max_workers=kwargs.get('max_workers', 1),
+        incremental=kwargs.get('incremental', False),
+        target_tables=kwargs.get('target_tables') or [],
+        excluded_tables=kwargs.get('excluded_tables') or [],
+        output_file=kwargs.get('output_file'),
+        report_dir=kwargs.get('report_dir'),
+        report_prefix=kwargs.get('report_prefix'),
+        auto_cleanup=kwargs.get('auto_cleanup', config.tool.auto_cleanup),
+        keep_reports=kwargs.get('keep_reports', config.tool.keep_reports),
+        max_reports=kwargs.get('max_reports', config.tool.max_reports)
     )
@@ -194,6 +194,16 @@ class GenerationError(DatabaseToolsError):
             self.details['target_file'] = str(target_file)
 
 
+class ConversionError(DatabaseToolsError):
+    """アダプターのデータ変換エラー"""
+    pass
+
+
+class DataTransformError(ConversionError):
+    """YAML・DDL・TableDefinition 間の変換エラー"""
+    pass
+
+
 class ParsingError(DatabaseToolsError):
     """解析エラー"""
     
@@ -218,6 +228,11 @@ class ParsingError(DatabaseToolsError):
             self.details['line_number'] = line_number
 
 
+class PerformanceError(DatabaseToolsError):
+    """並列処理・パフォーマンス関連エラー"""
+    pass
+
+
 class ToolExecutionError(DatabaseToolsError):
     """ツール実行エラー"""
     
@@ -896,6 +896,17 @@ class CheckConfig:
     output_format: str = "json"
     verbose: bool = False
     fail_fast: bool = False
+    max_workers: int = 1  # チェックの並列実行数（1の場合は逐次実行）
+    incremental: bool = False  # 入力が変化していないテーブルのチェック結果をキャッシュから再利用
+    target_tables: List[str] = field(default_factory=list)
+    excluded_tables: List[str] = field(default_factory=list)
+    # レポート出力（main.py の --output-file / --report-* に対応）
+    output_file: Optional[str] = None
+    report_dir: Optional[str] = None
+    report_prefix: Optional[str] = None
+    auto_cleanup: bool = True
+    keep_reports: int = 30
+    max_reports: int = 100
     
     def is_check_enabled(self, check_name: str) -> bool:
         """チェックが有効かどうか判定"""
@@ -906,6 +917,19 @@ class CheckConfig:
         return True
 
 
+@dataclass
+class FileMetadata:
+    """ファイルメタデータ"""
+    path: str
+    name: str
+    size: int = 0
+    created_at: Optional[datetime] = None
+    modified_at: Optional[datetime] = None
+    exists: bool = True
+    is_file: bool = True
+    is_directory: bool = False
+
+
 @dataclass
 class TableListEntry:
     """テーブルリストエントリ（database_consistency_checker互換性）"""
@@ -918,6 +942,16 @@ class TableListEntry:
     ddl_file: Optional[str] = None
     definition_file: Optional[str] = None
     
+    @property
+    def table_name(self) -> str:
+        """テーブル名（旧属性名）"""
+        return self.name
+    
+    @property
+    def description(self) -> str:
+        """論理名（旧属性名）"""
+        return self.logical_name
+    
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
         return {
@@ -932,6 +966,28 @@ class TableListEntry:
         }
 
 
+@dataclass
+class EntityRelationship:
+    """エンティティ関連（database_consistency_checker互換性）"""
+    source: str
+    target: str
+    type: str = ""
+    cardinality: str = ""
+    foreign_key: str = ""
+    description: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換"""
+        return {
+            'source': self.source,
+            'target': self.target,
+            'type': self.type,
+            'cardinality': self.cardinality,
+            'foreign_key': self.foreign_key,
+            'description': self.description
+        }
+
+
 # ユーティリティ関数
 def create_check_result(
     check_name: str,
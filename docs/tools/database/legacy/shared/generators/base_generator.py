@@ -19,6 +19,11 @@ from ..core.exceptions import GenerationError
 logger = get_logger(__name__)
 
 
+def table_trace_attributes(generator: Any, table_def: TableDefinition, *args, **kwargs) -> Dict[str, Any]:
+    """テーブル定義を受け取る生成メソッドのスパン属性"""
+    return {'table': getattr(table_def, 'table_name', '')}
+
+
 class BaseGenerator(ABC):
     """ジェネレーターベースクラス"""
     
@@ -37,9 +42,18 @@ class BaseGenerator(ABC):
         """出力ファイル拡張子を取得（サブクラスで実装）"""
         pass
     
-    def _handle_generation_error(self, error: Exception, table_name: str) -> GenerationError:
-        """生成エラーの統一処理"""
-        error_msg = f"生成エラー: {table_name} - {str(error)}"
+    def _log_generation_start(self, table_def: TableDefinition):
+        """生成開始ログ"""
+        self.logger.debug(f"生成開始: {getattr(table_def, 'table_name', table_def)}")
+    
+    def _log_generation_complete(self, table_def: TableDefinition):
+        """生成完了ログ"""
+        self.logger.debug(f"生成完了: {getattr(table_def, 'table_name', table_def)}")
+    
+    def _handle_generation_error(self, error: Exception, table: Any, label: str = "生成エラー") -> GenerationError:
+        """生成エラーの統一処理（table はテーブル名または TableDefinition）"""
+        table_name = getattr(table, 'table_name', table)
+        error_msg = f"{label}: {table_name} - {str(error)}"
         self.logger.error(error_msg)
         return GenerationError(error_msg)
     
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime
 
 from ..core.models import TableDefinition, ColumnDefinition, IndexDefinition, ForeignKeyDefinition
+from ..monitoring.tracing import traced
+from .base_generator import table_trace_attributes
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,7 @@ class DDLGenerator:
         """
         self.config = config or {}
     
+    @traced(category="generator", attributes=table_trace_attributes)
     def generate(self, table_definition: TableDefinition) -> str:
         """
         TableDefinitionからDDLを生成
@@ -0,0 +1,604 @@
+"""
+合成設計書ジェネレーター
+
+任意のテーブル数の設計書一式を、ツールが読み込む形式で生成する（スケール試験用）。
+  - table-details/テーブル詳細定義YAML_*.yaml
+  - ddl/*.sql
+  - tables/テーブル定義書_*.md
+  - テーブル一覧.md
+  - entity_relationships.yaml
+
+カラム数・外部キーの密度・循環参照・サンプルデータ件数・意図的な不整合の割合を指定できる。
+出力は seed が同じなら同一になり、注入した循環参照・不整合はマニフェスト（.design_corpus.json）に記録する。
+
+要求仕様ID: PLT.1-WEB.1 (システム基盤要件)
+"""
+
+import json
+import random
+import shutil
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+# プロジェクトルートからの設計書ディレクトリ
+DESIGN_SUBDIR = Path("docs/design/database")
+# 生成条件と注入内容を記録するマニフェスト（プロジェクトルート直下）
+MANIFEST_FILE = ".design_corpus.json"
+
+# カテゴリとテーブル名のプレフィックス（出現比率の重み）
+CATEGORIES = (
+    ("MST", "マスタ系", 4),
+    ("TRN", "トランザクション系", 3),
+    ("HIS", "履歴系", 2),
+    ("SYS", "システム系", 1),
+    ("WRK", "ワーク系", 1),
+)
+
+# 不整合の種類（対応する整合性チェック）
+#   missing_ddl        : DDLファイルを出力しない（table_existence）
+#   missing_definition : テーブル定義書を出力しない（table_existence）
+#   unlisted_table     : テーブル一覧.md に記載しない（table_existence）
+#   ddl_column_missing : DDLからカラムを1つ除く（column_consistency）
+#   ddl_type_mismatch  : DDLのカラム型をYAMLと変える（data_type_consistency）
+#   dangling_foreign_key: 存在しないテーブルへの外部キーを追加（foreign_key_consistency）
+INCONSISTENCY_KINDS = (
+    "missing_ddl",
+    "missing_definition",
+    "unlisted_table",
+    "ddl_column_missing",
+    "ddl_type_mismatch",
+    "dangling_foreign_key",
+)
+
+# 業務カラムの候補（名前, 論理名, 型, 長さ, ENUM値）
+_COLUMN_TEMPLATES = (
+    ("code", "コード", "VARCHAR", 20, None),
+    ("name", "名称", "VARCHAR", 100, None),
+    ("description", "説明", "TEXT", None, None),
+    ("status", "状態", "ENUM", None, ["ACTIVE", "INACTIVE", "SUSPENDED"]),
+    ("amount", "金額", "DECIMAL", "10,2", None),
+    ("quantity", "数量", "INTEGER", None, None),
+    ("sort_order", "表示順序", "INTEGER", None, None),
+    ("is_enabled", "有効フラグ", "BOOLEAN", None, None),
+    ("start_date", "開始日", "DATE", None, None),
+    ("processed_at", "処理日時", "TIMESTAMP", None, None),
+    ("remarks", "備考", "VARCHAR", 500, None),
+)
+
+_TABLE_LIST_HEADER = (
+    "テーブルID", "カテゴリ", "テーブル名", "論理名", "主な利用機能カテゴリ", "主な利用API ID", "主な利用バッチID",
+    "優先度", "初期データ件数", "月間増加件数", "年間増加件数", "5年後想定件数", "SELECT応答時間", "INSERT応答時間",
+    "UPDATE応答時間", "DELETE応答時間", "個人情報含有", "機密情報レベル", "暗号化要否", "アーカイブ条件", "備考・関連画面例",
+)
+
+_MARKDOWN_SAMPLE_ROWS = 10
+_GENERATED_DATE = "2025-06-01"
+
+
+@dataclass
+class CorpusSpec:
+    """合成設計書の生成条件"""
+    tables: int = 50
+    min_columns: int = 8                # 1テーブルのカラム数（共通カラム・外部キーを含む）
+    max_columns: int = 20
+    fk_density: float = 1.0             # 1テーブルあたりの外部キー数の平均（参照先は先に生成したテーブル）
+    cycles: int = 0                     # 注入する循環参照の数
+    cycle_length: int = 3               # 循環参照に含めるテーブル数（1 は自己参照）
+    sample_rows: int = 3                # sample_data の件数
+    inconsistency_rate: float = 0.0     # 不整合を注入するテーブルの割合
+    inconsistency_kinds: List[str] = field(default_factory=lambda: list(INCONSISTENCY_KINDS))
+    seed: int = 0
+
+    def validate(self):
+        """生成条件を検証"""
+        if self.tables < 1:
+            raise ValueError(f"テーブル数は1以上を指定してください: {self.tables}")
+        if self.min_columns < 5 or self.max_columns < self.min_columns:
+            raise ValueError(f"カラム数の範囲が不正です: {self.min_columns}-{self.max_columns}（最小5）")
+        if self.fk_density < 0 or not 0 <= self.inconsistency_rate <= 1:
+            raise ValueError("fk_density は0以上、inconsistency_rate は0〜1で指定してください")
+        if self.cycles and not 1 <= self.cycle_length <= self.tables:
+            raise ValueError(f"循環参照のテーブル数が不正です: {self.cycle_length}")
+        unknown = set(self.inconsistency_kinds) - set(INCONSISTENCY_KINDS)
+        if unknown or not self.inconsistency_kinds:
+            raise ValueError(f"未対応の不整合: {', '.join(sorted(unknown)) or '（指定なし）'}")
+
+
+def design_dir(root: Union[str, Path]) -> Path:
+    """合成設計書の設計書ディレクトリ"""
+    return Path(root) / DESIGN_SUBDIR
+
+
+def load_manifest(root: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """マニフェストを読み込む（存在しない場合は None）"""
+    manifest_file = Path(root) / MANIFEST_FILE
+    if not manifest_file.exists():
+        return None
+    with open(manifest_file, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class DesignCorpusGenerator:
+    """合成設計書ジェネレーター"""
+
+    def __init__(self, spec: Optional[CorpusSpec] = None):
+        self.spec = spec or CorpusSpec()
+        self.spec.validate()
+        self._cycles: List[List[str]] = []
+
+    def generate(self, root: Union[str, Path], reuse: bool = True) -> Dict[str, Any]:
+        """
+        root 配下に設計書一式を生成
+
+        Args:
+            root: プロジェクトルート（設計書は root/docs/design/database に出力）
+            reuse: 同じ生成条件のマニフェストがあれば生成を省略する
+
+        Returns:
+            マニフェスト（生成条件・テーブル名・循環参照・注入した不整合）
+        """
+        root = Path(root)
+        spec_dict = asdict(self.spec)
+        existing = load_manifest(root) if reuse else None
+        if existing is not None and existing.get("spec") == spec_dict:
+            return existing
+
+        tables = self._build_tables()
+        base = design_dir(root)
+        shutil.rmtree(base, ignore_errors=True)
+        for sub_dir in ("table-details", "ddl", "tables"):
+            (base / sub_dir).mkdir(parents=True)
+
+        inconsistencies = {}
+        for table in tables:
+            kind = table["inconsistency"]
+            if kind:
+                inconsistencies[table["table_name"]] = kind
+            with open(base / "table-details" / f"テーブル詳細定義YAML_{table['table_name']}.yaml",
+                      "w", encoding="utf-8") as f:
+                yaml.dump(table["yaml"], f, Dumper=_YamlDumper, allow_unicode=True, sort_keys=False)
+            if kind != "missing_ddl":
+                (base / "ddl" / f"{table['table_name']}.sql").write_text(
+                    render_ddl(table["yaml"], table["ddl_overrides"]), encoding="utf-8")
+            if kind != "missing_definition":
+                (base / "tables" / f"テーブル定義書_{table['table_name']}_{table['yaml']['logical_name']}.md").write_text(
+                    render_definition(table["yaml"]), encoding="utf-8")
+
+        (base / "テーブル一覧.md").write_text(
+            render_table_list([table for table in tables if table["inconsistency"] != "unlisted_table"]),
+            encoding="utf-8")
+        with open(base / "entity_relationships.yaml", "w", encoding="utf-8") as f:
+            yaml.dump(build_entity_relationships(tables), f, Dumper=_YamlDumper, allow_unicode=True, sort_keys=False)
+
+        manifest = {
+            "spec": spec_dict,
+            "tables": [table["table_name"] for table in tables],
+            "foreign_keys": sum(len(table["yaml"]["foreign_keys"]) for table in tables),
+            "cycles": self._cycles,
+            "inconsistencies": inconsistencies,
+        }
+        root.mkdir(parents=True, exist_ok=True)
+        with open(root / MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return manifest
+
+    def _build_tables(self) -> List[Dict[str, Any]]:
+        spec = self.spec
+        rng = random.Random(spec.seed)
+        weights = [weight for _, _, weight in CATEGORIES]
+        names = []
+        for index in range(spec.tables):
+            prefix, category, _ = rng.choices(CATEGORIES, weights)[0]
+            names.append((f"{prefix}_Entity{index + 1:05d}", f"合成エンティティ{index + 1:05d}", category))
+
+        # 参照先は先に生成したテーブル（非循環）。循環参照は後から逆向きの外部キーを追加する
+        references: List[List[Tuple[int, bool]]] = [[] for _ in names]
+        for index in range(1, len(names)):
+            count = int(spec.fk_density) + (rng.random() < spec.fk_density % 1)
+            for target in rng.sample(range(index), min(count, index)):
+                references[index].append((target, False))
+
+        self._cycles = []
+        for _ in range(spec.cycles):
+            members = sorted(rng.sample(range(len(names)), spec.cycle_length))
+            # members[k] -> members[k-1] の連鎖と、先頭から末尾への外部キーで循環させる
+            for k in range(1, len(members)):
+                if all(target != members[k - 1] for target, _ in references[members[k]]):
+                    references[members[k]].append((members[k - 1], True))
+            references[members[0]].append((members[-1], True))
+            self._cycles.append([names[member][0] for member in members])
+
+        inconsistent = set()
+        if spec.inconsistency_rate:
+            inconsistent = set(rng.sample(range(len(names)), round(len(names) * spec.inconsistency_rate)))
+
+        tables = []
+        for index, (table_name, logical_name, category) in enumerate(names):
+            kind = rng.choice(spec.inconsistency_kinds) if index in inconsistent else None
+            fk_targets = [(names[target][0], nullable) for target, nullable in references[index]]
+            tables.append(self._build_table(rng, table_name, logical_name, category, fk_targets, kind))
+        return tables
+
+    def _build_table(self, rng: random.Random, table_name: str, logical_name: str, category: str,
+                     fk_targets: List[Tuple[str, bool]], kind: Optional[str]) -> Dict[str, Any]:
+        spec = self.spec
+        if kind == "dangling_foreign_key":
+            fk_targets = fk_targets + [(f"{table_name.split('_')[0]}_Missing{table_name[-5:]}", True)]
+
+        columns = [
+            _column("id", "プライマリキー（UUID）", "VARCHAR", 50, nullable=False, unique=True),
+            _column("tenant_id", "テナントID（マルチテナント対応）", "VARCHAR", 50, nullable=False),
+        ]
+        foreign_keys = []
+        fk_columns = {}
+        for target, nullable in fk_targets:
+            column_name = f"{target.split('_', 1)[1].lower()}_id"
+            if column_name in fk_columns or target == table_name:
+                column_name = f"{'parent' if target == table_name else 'ref'}_{column_name}"
+            if column_name in fk_columns:
+                continue
+            fk_columns[column_name] = target
+            columns.append(_column(column_name, f"{target}への参照", "VARCHAR", 50, nullable=nullable))
+            foreign_keys.append({
+                "name": f"fk_{table_name.lower()}_{column_name}",
+                "columns": [column_name],
+                "references": {"table": target, "columns": ["id"]},
+                "on_update": "CASCADE",
+                "on_delete": "SET NULL" if nullable else "CASCADE",
+                "comment": "外部キー制約",
+            })
+
+        business_count = max(0, rng.randint(spec.min_columns, spec.max_columns) - len(columns) - 3)
+        for position in range(business_count):
+            name, logical, column_type, length, enum_values = _COLUMN_TEMPLATES[position % len(_COLUMN_TEMPLATES)]
+            if position >= len(_COLUMN_TEMPLATES):
+                name = f"{name}_{position // len(_COLUMN_TEMPLATES) + 1}"
+                logical = f"{logical}{position // len(_COLUMN_TEMPLATES) + 1}"
+            column = _column(name, logical, column_type, length, nullable=True)
+            if enum_values:
+                column["enum_values"] = list(enum_values)
+            columns.append(column)
+
+        columns.extend([
+            _column("is_deleted", "論理削除フラグ", "BOOLEAN", None, nullable=False, default=False),
+            _column("created_at", "作成日時", "TIMESTAMP", None, nullable=False, default="CURRENT_TIMESTAMP"),
+            _column("updated_at", "更新日時", "TIMESTAMP", None, nullable=False, default="CURRENT_TIMESTAMP"),
+        ])
+
+        indexes = [{"name": f"idx_{table_name.lower()}_tenant_id", "columns": ["tenant_id"], "unique": False,
+                    "description": "テナント別検索用"}]
+        indexes.extend({"name": f"idx_{table_name.lower()}_{column_name}", "columns": [column_name], "unique": False,
+                        "description": f"{target}参照用"} for column_name, target in fk_columns.items())
+
+        sample_data = []
+        for row in range(1, spec.sample_rows + 1):
+            record = {"id": _row_id(table_name, row), "tenant_id": "TENANT001"}
+            for column_name, target in fk_columns.items():
+                record[column_name] = _row_id(target, (row - 1) % max(spec.sample_rows, 1) + 1)
+            for column in columns[2 + len(fk_columns):-3]:
+                record[column["name"]] = _sample_value(column, row)
+            record["is_deleted"] = False
+            sample_data.append(record)
+
+        yaml_data = {
+            "table_name": table_name,
+            "logical_name": logical_name,
+            "category": category,
+            "revision_history": [{"version": "1.0.0", "date": _GENERATED_DATE, "author": "合成設計書ジェネレーター",
+                                  "changes": "初版作成"}],
+            "overview": (f"{table_name}（{logical_name}）は、スケール試験用に生成した{category}のテーブルです。\n"
+                         f"外部キー {len(foreign_keys)} 件、カラム {len(columns)} 件で構成されます。\n"),
+            "columns": columns,
+            "indexes": indexes,
+            "constraints": [{"name": f"uk_{table_name.lower()}_id", "type": "UNIQUE", "columns": ["id"],
+                             "description": "id一意制約"}],
+            "foreign_keys": foreign_keys,
+            "sample_data": sample_data,
+            "notes": ["スケール試験用の合成テーブル", "テナントごとにデータを分離", "論理削除で履歴を保持"],
+            "rules": ["主キーの一意性は必須で変更不可", "外部キー制約による参照整合性の保証",
+                      "論理削除による履歴データの保持"],
+        }
+
+        ddl_overrides: Dict[str, Optional[str]] = {}
+        business_columns = columns[2 + len(fk_columns):-3]
+        if kind == "ddl_column_missing":
+            ddl_overrides[(business_columns or columns[2:])[-1]["name"]] = None
+        elif kind == "ddl_type_mismatch":
+            column = (business_columns or columns)[0]
+            ddl_overrides[column["name"]] = "BIGINT" if column["type"] != "BIGINT" else "TEXT"
+        return {"table_name": table_name, "yaml": yaml_data, "ddl_overrides": ddl_overrides, "inconsistency": kind}
+
+
+def _column(name: str, logical: str, column_type: str, length: Any, nullable: bool,
+            unique: bool = False, default: Any = None) -> Dict[str, Any]:
+    column = {"name": name, "logical": logical, "type": column_type, "length": length, "null": nullable,
+              "unique": unique, "encrypted": False, "description": logical}
+    if default is not None:
+        column["default"] = default
+    return column
+
+
+def _row_id(table_name: str, row: int) -> str:
+    return f"{table_name}-{row:06d}"
+
+
+def _sample_value(column: Dict[str, Any], row: int) -> Any:
+    column_type = column["type"]
+    if column_type == "ENUM":
+        return column["enum_values"][row % len(column["enum_values"])]
+    if column_type in ("INTEGER", "BIGINT"):
+        return row
+    if column_type == "DECIMAL":
+        return round(row * 100.5, 2)
+    if column_type == "BOOLEAN":
+        return row % 2 == 0
+    if column_type == "DATE":
+        return f"2025-01-{row % 28 + 1:02d}"
+    if column_type == "TIMESTAMP":
+        return f"2025-01-{row % 28 + 1:02d} 09:00:00"
+    return f"{column['logical']}{row}"
+
+
+def _sql_type(column: Dict[str, Any]) -> str:
+    column_type = column["type"]
+    if column_type == "ENUM":
+        return "ENUM(" + ", ".join(f"'{value}'" for value in column["enum_values"]) + ")"
+    if column.get("length") is not None:
+        return f"{column_type}({column['length']})"
+    return column_type
+
+
+def _sql_default(value: Any) -> str:
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if value == "CURRENT_TIMESTAMP" or isinstance(value, (int, float)):
+        return str(value)
+    return f"'{value}'"
+
+
+def render_ddl(yaml_data: Dict[str, Any], overrides: Optional[Dict[str, Optional[str]]] = None) -> str:
+    """
+    DDL（CREATE TABLE文）を生成
+
+    Args:
+        yaml_data: テーブル詳細定義
+        overrides: カラム名 → DDL上の型（None はカラムを出力しない）
+    """
+    overrides = overrides or {}
+    table_name = yaml_data["table_name"]
+    lines = [
+        "-- ============================================",
+        f"-- テーブル: {table_name}",
+        f"-- 論理名: {yaml_data['logical_name']}",
+        f"-- 説明: {yaml_data['overview'].strip()}",
+        f"-- 作成日: {_GENERATED_DATE} 00:00:00",
+        "-- ============================================",
+        "",
+        f"DROP TABLE IF EXISTS {table_name};",
+        "",
+        f"CREATE TABLE {table_name} (",
+    ]
+    column_lines = []
+    for column in yaml_data["columns"]:
+        sql_type = overrides.get(column["name"], _sql_type(column))
+        if sql_type is None:
+            continue
+        parts = [column["name"], sql_type]
+        if not column["null"]:
+            parts.append("NOT NULL")
+        if "default" in column:
+            parts.append(f"DEFAULT {_sql_default(column['default'])}")
+        parts.append(f"COMMENT '{column['logical']}'")
+        column_lines.append("    " + " ".join(parts))
+    lines.append(",\n".join(column_lines))
+    lines.append(") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;")
+
+    lines.extend(["", "-- インデックス作成"])
+    for index in yaml_data["indexes"]:
+        unique = "UNIQUE " if index["unique"] else ""
+        lines.append(f"CREATE {unique}INDEX {index['name']} ON {table_name} ({', '.join(index['columns'])});")
+
+    if yaml_data["foreign_keys"]:
+        lines.extend(["", "-- 外部キー制約"])
+        for fk in yaml_data["foreign_keys"]:
+            lines.append(
+                f"ALTER TABLE {table_name} ADD CONSTRAINT {fk['name']} FOREIGN KEY ({', '.join(fk['columns'])}) "
+                f"REFERENCES {fk['references']['table']}({', '.join(fk['references']['columns'])}) "
+                f"ON UPDATE {fk['on_update']} ON DELETE {fk['on_delete']};"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def render_definition(yaml_data: Dict[str, Any]) -> str:
+    """テーブル定義書（Markdown）を生成"""
+    lines = [
+        f"# テーブル定義書: {yaml_data['table_name']}",
+        "",
+        "## 基本情報",
+        "",
+        "| 項目 | 値 |",
+        "|------|-----|",
+        f"| テーブル名 | {yaml_data['table_name']} |",
+        f"| 論理名 | {yaml_data['logical_name']} |",
+        f"| カテゴリ | {yaml_data['category']} |",
+        f"| 生成日時 | {_GENERATED_DATE} 00:00:00 |",
+        "",
+        "## 概要",
+        "",
+        yaml_data["overview"].strip(),
+        "",
+        "## カラム定義",
+        "",
+        "| カラム名 | 論理名 | データ型 | 長さ | NULL | デフォルト | 説明 |",
+        "|----------|--------|----------|------|------|------------|------|",
+    ]
+    for column in yaml_data["columns"]:
+        length = "" if column.get("length") is None else column["length"]
+        default = column.get("default", "")
+        lines.append(f"| {column['name']} | {column['logical']} | {column['type']} | {length} | "
+                     f"{'○' if column['null'] else '×'} | {default} | {column['description']} |")
+
+    lines.extend(["", "## インデックス", "",
+                  "| インデックス名 | カラム | ユニーク | 説明 |",
+                  "|----------------|--------|----------|------|"])
+    for index in yaml_data["indexes"]:
+        lines.append(f"| {index['name']} | {', '.join(index['columns'])} | {'○' if index['unique'] else '×'} | "
+                     f"{index['description']} |")
+
+    lines.extend(["", "## 外部キー", "",
+                  "| 制約名 | カラム | 参照テーブル | 参照カラム | 更新時 | 削除時 | 説明 |",
+                  "|--------|--------|--------------|------------|--------|--------|------|"])
+    for fk in yaml_data["foreign_keys"]:
+        lines.append(f"| {fk['name']} | {', '.join(fk['columns'])} | {fk['references']['table']} | "
+                     f"{', '.join(fk['references']['columns'])} | {fk['on_update']} | {fk['on_delete']} | "
+                     f"{fk['comment']} |")
+
+    lines.extend(["", "## 制約", "",
+                  "| 制約名 | 種別 | 条件 | 説明 |",
+                  "|--------|------|------|------|"])
+    for constraint in yaml_data["constraints"]:
+        lines.append(f"| {constraint['name']} | {constraint['type']} |  | {constraint['description']} |")
+
+    sample_data = yaml_data["sample_data"][:_MARKDOWN_SAMPLE_ROWS]
+    if sample_data:
+        keys = list(sample_data[0])
+        lines.extend(["", "## サンプルデータ", "",
+                      "| " + " | ".join(keys) + " |",
+                      "|" + "------|" * len(keys)])
+        for record in sample_data:
+            lines.append("| " + " | ".join(str(record[key]) for key in keys) + " |")
+
+    lines.extend(["", "## 特記事項", ""] + [f"- {note}" for note in yaml_data["notes"]])
+    lines.extend(["", "## 業務ルール", ""] + [f"- {rule}" for rule in yaml_data["rules"]])
+    lines.extend(["", "## 改版履歴", "",
+                  "| バージョン | 更新日 | 更新者 | 変更内容 |",
+                  "|------------|--------|--------|----------|"])
+    for revision in yaml_data["revision_history"]:
+        lines.append(f"| {revision['version']} | {revision['date']} | {revision['author']} | {revision['changes']} |")
+    return "\n".join(lines) + "\n"
+
+
+def render_table_list(tables: List[Dict[str, Any]]) -> str:
+    """テーブル一覧（Markdown）を生成"""
+    width = max(3, len(str(len(tables))))
+    lines = [
+        "# テーブル一覧",
+        "",
+        "スケール試験用に生成した合成テーブルの一覧です。",
+        "",
+        "| " + " | ".join(_TABLE_LIST_HEADER) + " |",
+        "|" + "|".join("-" * (len(header) + 2) for header in _TABLE_LIST_HEADER) + "|",
+    ]
+    for number, table in enumerate(tables, 1):
+        yaml_data = table["yaml"]
+        rows = len(yaml_data["sample_data"])
+        cells = [f"TBL-{number:0{width}d}", yaml_data["category"], yaml_data["table_name"], yaml_data["logical_name"],
+                 "スケール試験", "-", "-", "中", f"{rows}件", "0件", "0件", f"{rows}件",
+                 "10ms以内", "30ms以内", "30ms以内", "50ms以内", "なし", "低", "不要", "-", "-"]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def build_entity_relationships(tables: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """エンティティ関連定義（entity_relationships.yaml の内容）を生成"""
+    entities = {}
+    relationships = []
+    for table in tables:
+        yaml_data = table["yaml"]
+        fk_columns = {fk["columns"][0] for fk in yaml_data["foreign_keys"]}
+        key_columns = [{"name": "id", "logical": "プライマリキー", "type": "VARCHAR(50)", "is_pk": True}]
+        for column in yaml_data["columns"]:
+            if column["name"] in fk_columns:
+                key_columns.append({"name": column["name"], "logical": column["logical"],
+                                    "type": _sql_type(column), "is_fk": True})
+        entities[yaml_data["table_name"]] = {
+            "logical_name": yaml_data["logical_name"],
+            "category": yaml_data["category"],
+            "primary_key": "id",
+            "key_columns": key_columns,
+        }
+        for fk in yaml_data["foreign_keys"]:
+            relationships.append({
+                "source": yaml_data["table_name"],
+                "target": fk["references"]["table"],
+                "type": "many_to_one",
+                "cardinality": "}o--||",
+                "foreign_key": fk["columns"][0],
+                "description": f"{yaml_data['logical_name']}は{fk['references']['table']}を参照する",
+            })
+    return {
+        "metadata": {
+            "version": "1.0.0",
+            "created_date": _GENERATED_DATE,
+            "description": "スケール試験用の合成エンティティ関連定義",
+            "total_tables": len(entities),
+        },
+        "entities": entities,
+        "relationships": relationships,
+        "related_entity_config": {"default_depth": 2, "max_entities": 8, "custom_settings": {}},
+    }
+
+
+def generate_corpus(root: Union[str, Path], spec: Optional[CorpusSpec] = None, reuse: bool = True,
+                    **overrides: Any) -> Dict[str, Any]:
+    """合成設計書を生成（便利関数。overrides は CorpusSpec のフィールド）"""
+    spec = spec or CorpusSpec()
+    if overrides:
+        spec = CorpusSpec(**{**asdict(spec), **overrides})
+    return DesignCorpusGenerator(spec).generate(root, reuse=reuse)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """メイン関数"""
+    import argparse
+
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(description="合成設計書ジェネレーター（スケール試験用）")
+    parser.add_argument("root", help="出力先のプロジェクトルート（設計書は docs/design/database に出力）")
+    parser.add_argument("--tables", type=int, default=defaults.tables, help="テーブル数")
+    parser.add_argument("--columns", type=int, nargs=2, metavar=("MIN", "MAX"),
+                        default=[defaults.min_columns, defaults.max_columns], help="1テーブルのカラム数の範囲")
+    parser.add_argument("--fk-density", type=float, default=defaults.fk_density,
+                        help="1テーブルあたりの外部キー数の平均")
+    parser.add_argument("--cycles", type=int, default=defaults.cycles, help="注入する循環参照の数")
+    parser.add_argument("--cycle-length", type=int, default=defaults.cycle_length, help="循環参照のテーブル数")
+    parser.add_argument("--sample-rows", type=int, default=defaults.sample_rows, help="sample_data の件数")
+    parser.add_argument("--inconsistency-rate", type=float, default=defaults.inconsistency_rate,
+                        help="不整合を注入するテーブルの割合（0〜1）")
+    parser.add_argument("--inconsistency-kinds", nargs="+", choices=INCONSISTENCY_KINDS,
+                        default=list(INCONSISTENCY_KINDS), help="注入する不整合の種類")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="乱数シード")
+    parser.add_argument("--force", action="store_true", help="同じ生成条件でも作り直す")
+    args = parser.parse_args(argv)
+
+    spec = CorpusSpec(
+        tables=args.tables, min_columns=args.columns[0], max_columns=args.columns[1], fk_density=args.fk_density,
+        cycles=args.cycles, cycle_length=args.cycle_length, sample_rows=args.sample_rows,
+        inconsistency_rate=args.inconsistency_rate, inconsistency_kinds=args.inconsistency_kinds, seed=args.seed,
+    )
+    try:
+        start = datetime.now()
+        manifest = DesignCorpusGenerator(spec).generate(args.root, reuse=not args.force)
+    except ValueError as e:
+        print(f"エラー: {e}", file=sys.stderr)
+        return 1
+
+    print(f"テーブル数: {len(manifest['tables'])}  外部キー: {manifest['foreign_keys']}  "
+          f"循環参照: {len(manifest['cycles'])}  不整合: {len(manifest['inconsistencies'])}  "
+          f"({(datetime.now() - start).total_seconds():.1f}s)")
+    print(f"出力先: {design_dir(args.root)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime
 
 from ..core.models import TableDefinition, ColumnDefinition, IndexDefinition, ForeignKeyDefinition
+from ..monitoring.tracing import traced
+from .base_generator import table_trace_attributes
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,7 @@ class MarkdownGenerator:
         """初期化"""
         pass
     
+    @traced(category="generator", attributes=table_trace_attributes)
     def generate(self, table_definition: TableDefinition) -> str:
         """
         TableDefinitionからMarkdownを生成
@@ -22,26 +22,60 @@ import sys
 import yaml
 import glob
 import uuid
-from typing import Dict, List, Any, Optional, Tuple, Set
+import random
+from typing import Dict, List, Any, Iterator, Optional, Tuple, Set
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
 from .base_generator import BaseGenerator
+from .sql_batch import (
+    DEFAULT_BATCH_SIZE, INSERT_MODES, SqlRow, open_sql_output, render_statements, validate_mode, write_statements
+)
+from .sql_codecs import ValueCodec, compile_codecs
 from ..core.models import TableDefinition
 from ..core.exceptions import GenerationError
+from ..monitoring.tracing import trace_span
+from ..utils.graph_utils import strongly_connected_components, describe_cycle, topological_levels
+from ..utils.random_streams import SeedSequence
 
 # プロジェクトルートディレクトリを取得
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "../../../../../.."))
 TABLE_DETAILS_DIR = os.path.join(PROJECT_ROOT, "docs/design/database/table-details")
 
+# テーブル詳細定義YAMLのファイル名（現行形式 → 旧形式の順に探索）
+TABLE_DETAILS_FILE_PATTERNS = ("テーブル詳細定義YAML_{table}.yaml", "{table}_details.yaml")
+
+
+def find_table_details_file(table_name: str, details_dir: str = TABLE_DETAILS_DIR) -> Optional[str]:
+    """テーブル詳細定義YAMLのパスを取得（存在しない場合はNone）"""
+    for pattern in TABLE_DETAILS_FILE_PATTERNS:
+        yaml_file = os.path.join(details_dir, pattern.format(table=table_name))
+        if os.path.exists(yaml_file):
+            return yaml_file
+    return None
+
+
+def list_table_details_tables(details_dir: str = TABLE_DETAILS_DIR) -> List[str]:
+    """テーブル詳細定義YAMLが存在するテーブル名の一覧（テンプレートを除く）"""
+    tables = []
+    for pattern in TABLE_DETAILS_FILE_PATTERNS:
+        prefix, suffix = pattern.split("{table}")
+        for yaml_file in sorted(glob.glob(os.path.join(details_dir, f"{prefix}*{suffix}"))):
+            table_name = os.path.basename(yaml_file)[len(prefix):-len(suffix)]
+            if table_name not in ("MST_TEMPLATE", "TEMPLATE") and table_name not in tables:
+                tables.append(table_name)
+    return tables
+
 
 class TableDependencyResolver:
     """テーブル依存関係解決クラス"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, table_details_dir: str = TABLE_DETAILS_DIR):
         self.verbose = verbose
+        self.table_details_dir = table_details_dir
         self.dependencies = {}  # table_name -> [referenced_tables]
         self.tables_data = {}   # table_name -> yaml_data
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -49,11 +83,11 @@ class TableDependencyResolver:
     def load_table_dependencies(self, table_names: List[str]) -> bool:
         """テーブルの依存関係を読み込み"""
         for table_name in table_names:
-            yaml_file = os.path.join(TABLE_DETAILS_DIR, f"{table_name}_details.yaml")
+            yaml_file = find_table_details_file(table_name, self.table_details_dir)
             
-            if not os.path.exists(yaml_file):
+            if yaml_file is None:
                 if self.verbose:
-                    self.logger.warning(f"ファイル {yaml_file} が存在しません")
+                    self.logger.warning(f"テーブル {table_name} のYAMLファイルが存在しません")
                 continue
             
             yaml_data = self._load_yaml_file(yaml_file)
@@ -79,49 +113,50 @@ class TableDependencyResolver:
         
         return True
     
+    def get_strongly_connected_components(self, table_names: List[str]) -> List[List[str]]:
+        """依存グラフの強連結成分を取得（参照先テーブルを含む成分が先）"""
+        available_tables = [t for t in table_names if t in self.tables_data]
+        graph = {table: self.dependencies.get(table, []) for table in available_tables}
+        return strongly_connected_components(graph)
+    
     def resolve_execution_order(self, table_names: List[str]) -> List[str]:
-        """実行順序を解決（トポロジカルソート）"""
-        # 利用可能なテーブルのみを対象とする
+        """実行順序を解決（強連結成分の逆トポロジカル順）"""
         available_tables = [t for t in table_names if t in self.tables_data]
         
         if not available_tables:
             return []
         
-        # トポロジカルソート実装
-        visited = set()
-        temp_visited = set()
+        graph = {table: self.dependencies.get(table, []) for table in available_tables}
         result = []
         
-        def visit(table: str):
-            if table in temp_visited:
-                # 循環依存を検出
-                if self.verbose:
-                    self.logger.warning(f"循環依存を検出: {table}")
-                return
-            
-            if table in visited:
-                return
-            
-            temp_visited.add(table)
-            
-            # 依存テーブルを先に処理
-            for dep_table in self.dependencies.get(table, []):
-                if dep_table in available_tables:
-                    visit(dep_table)
-            
-            temp_visited.remove(table)
-            visited.add(table)
-            result.append(table)
-        
-        for table in available_tables:
-            if table not in visited:
-                visit(table)
+        for component in strongly_connected_components(graph):
+            cycle = describe_cycle(component, graph)
+            if cycle and self.verbose:
+                # 循環依存を検出（成分内の順序はテーブル指定順）
+                self.logger.warning(f"循環依存を検出: {cycle}")
+            result.extend(component)
         
         if self.verbose:
             self.logger.info(f"実行順序: {result}")
         
         return result
     
+    def resolve_execution_levels(self, table_names: List[str]) -> List[List[str]]:
+        """実行順序をレベル単位で解決
+        
+        各レベルのテーブルはそれより前のレベルのテーブルのみを参照するため、並列に生成できる。
+        循環依存のテーブルは同じレベルにまとめる。レベルを順に連結したものも有効な実行順序となる。
+        """
+        available_tables = [t for t in table_names if t in self.tables_data]
+        graph = {table: self.dependencies.get(table, []) for table in available_tables}
+        levels = topological_levels(graph)
+        
+        if self.verbose:
+            for i, level in enumerate(levels):
+                self.logger.info(f"レベル {i}: {level}")
+        
+        return levels
+    
     def _load_yaml_file(self, file_path: str) -> Dict[str, Any]:
         """YAMLファイルを読み込む"""
         try:
@@ -136,8 +171,11 @@ class TableDependencyResolver:
 class EnhancedSQLGenerator:
     """改良版SQL生成クラス"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, seed: Optional[int] = None):
         self.verbose = verbose
+        self.seed = seed
+        # テーブルごとの乱数ストリームはマスターシードから SeedSequence で派生
+        self.seed_sequence = SeedSequence(seed) if seed is not None else None
         self.logger = logging.getLogger(self.__class__.__name__)
     
     def format_value_for_sql(self, value: Any, col_type: str, col_name: str = "") -> str:
@@ -205,42 +243,77 @@ class EnhancedSQLGenerator:
     
     def generate_insert_statements(self, table_name: str, yaml_data: Dict[str, Any]) -> Tuple[List[str], List[str]]:
         """テーブルのINSERT文を生成（改良版）"""
-        insert_statements = []
+        return self.generate_statements(table_name, yaml_data, mode='insert')
+    
+    def generate_statements(self, table_name: str, yaml_data: Dict[str, Any], mode: str = 'insert',
+                            batch_size: int = DEFAULT_BATCH_SIZE) -> Tuple[List[str], List[str]]:
+        """テーブルのサンプルデータSQLを出力形式に応じて生成
+        
+        Args:
+            table_name: テーブル名
+            yaml_data: テーブル詳細定義YAML
+            mode: 出力形式（insert / multi_insert / on_conflict / copy / copy_csv）
+            batch_size: 1文あたりの行数（multi_insert / on_conflict）
+            
+        Returns:
+            Tuple[List[str], List[str]]: (SQL文リスト, エラーリスト)
+        """
+        rows, errors = self.generate_sql_rows(table_name, yaml_data)
+        return render_statements(table_name, rows, mode, batch_size), errors
+    
+    def generate_sql_rows(self, table_name: str, yaml_data: Dict[str, Any]) -> Tuple[List[SqlRow], List[str]]:
+        """sample_dataの各レコードを (カラム名リスト, SQLリテラルのリスト) に変換"""
         errors = []
+        rows = list(self.iter_sql_rows(table_name, yaml_data, errors))
+        return rows, errors
+    
+    def iter_sql_rows(self, table_name: str, yaml_data: Dict[str, Any],
+                      errors: List[str]) -> Iterator[SqlRow]:
+        """sample_dataの各レコードを順に (カラム名リスト, SQLリテラルのリスト) に変換
         
+        Args:
+            table_name: テーブル名
+            yaml_data: テーブル詳細定義YAML
+            errors: エラーの追加先
+        """
         # sample_dataの存在確認
         if 'sample_data' not in yaml_data:
             errors.append(f"sample_dataセクションが存在しません")
-            return [], errors
+            return
         
         sample_data = yaml_data['sample_data']
         if not isinstance(sample_data, list) or len(sample_data) == 0:
             errors.append(f"sample_dataが空です")
-            return [], errors
+            return
         
         # カラム定義の取得
-        column_info = self._extract_column_info(yaml_data)
+        column_info = self.extract_column_info(yaml_data)
         if not column_info:
             errors.append(f"カラム定義が存在しません")
-            return [], errors
+            return
+        
+        # カラムごとのエンコーダー（データ型の判定はテーブルごとに1回）
+        codecs = self.compile_codecs(column_info)
         
-        # 各レコードのINSERT文生成
+        # シード指定時はIDをテーブルごとの乱数列から生成（生成順・並列度に依存しない）
+        id_rng = self.seed_sequence.child(table_name).random() if self.seed_sequence is not None else None
+        
+        # 各レコードの値を生成
         for i, record in enumerate(sample_data):
             if not isinstance(record, dict):
                 errors.append(f"sample_data[{i}]が辞書形式ではありません")
                 continue
             
             try:
-                insert_sql = self._generate_single_insert(table_name, record, column_info)
-                if insert_sql:
-                    insert_statements.append(insert_sql)
+                row = self._build_row(table_name, record, column_info, codecs, id_rng)
             except Exception as e:
                 errors.append(f"sample_data[{i}]のINSERT文生成に失敗: {str(e)}")
-        
-        return insert_statements, errors
+                continue
+            if row[0]:
+                yield row
     
-    def _extract_column_info(self, yaml_data: Dict[str, Any]) -> Dict[str, str]:
-        """カラム情報を抽出"""
+    def extract_column_info(self, yaml_data: Dict[str, Any]) -> Dict[str, str]:
+        """テーブル詳細定義YAMLのカラム名 -> データ型（共通カラムを含む）を抽出"""
         column_info = {}
         
         # columns形式の処理
@@ -278,6 +351,23 @@ class EnhancedSQLGenerator:
     
     def _generate_single_insert(self, table_name: str, record: Dict[str, Any], column_info: Dict[str, str]) -> str:
         """単一レコードのINSERT文を生成"""
+        columns_list, values_list = self._build_row(table_name, record, column_info)
+        
+        if columns_list and values_list:
+            columns_str = ', '.join(columns_list)
+            values_str = ', '.join(values_list)
+            return f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str});"
+        
+        return ""
+    
+    def compile_codecs(self, column_info: Dict[str, str]) -> Dict[str, ValueCodec]:
+        """カラム名 -> データ型 から、format_value_for_sql と同じ出力のエンコーダーを作成"""
+        return compile_codecs(column_info, self.logger if self.verbose else None)
+    
+    def _build_row(self, table_name: str, record: Dict[str, Any], column_info: Dict[str, str],
+                   codecs: Optional[Dict[str, ValueCodec]] = None,
+                   id_rng: Optional[random.Random] = None) -> SqlRow:
+        """単一レコードのカラム名リストとSQLリテラルのリストを生成"""
         columns_list = []
         values_list = []
         
@@ -285,28 +375,29 @@ class EnhancedSQLGenerator:
         for col_name, value in record.items():
             if col_name in column_info:
                 columns_list.append(col_name)
-                col_type = column_info[col_name]
-                formatted_value = self.format_value_for_sql(value, col_type, col_name)
+                if codecs is not None:
+                    formatted_value = codecs[col_name](value)
+                else:
+                    formatted_value = self.format_value_for_sql(value, column_info[col_name], col_name)
                 values_list.append(formatted_value)
         
         # 共通カラムのデフォルト値を追加（sample_dataに含まれていない場合）
-        self._add_default_values(record, columns_list, values_list, column_info, table_name)
+        self._add_default_values(record, columns_list, values_list, column_info, table_name, id_rng)
         
-        if columns_list and values_list:
-            columns_str = ', '.join(columns_list)
-            values_str = ', '.join(values_list)
-            return f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str});"
-        
-        return ""
+        return columns_list, values_list
     
     def _add_default_values(self, record: Dict[str, Any], columns_list: List[str], 
-                          values_list: List[str], column_info: Dict[str, str], table_name: str):
+                          values_list: List[str], column_info: Dict[str, str], table_name: str,
+                          id_rng: Optional[random.Random] = None):
         """デフォルト値を追加"""
         # ID生成
         if 'id' not in record and 'id' in column_info:
             columns_list.append('id')
             table_prefix = table_name[:3].lower()
-            short_uuid = str(uuid.uuid4())[:8]
+            if id_rng is not None:
+                short_uuid = str(uuid.UUID(int=id_rng.getrandbits(128), version=4))[:8]
+            else:
+                short_uuid = str(uuid.uuid4())[:8]
             generated_id = f"{table_prefix}_{short_uuid}"
             values_list.append(f"'{generated_id}'")
         
@@ -325,14 +416,58 @@ class EnhancedSQLGenerator:
             values_list.append('FALSE')
 
 
+def write_table_sample_sql(table_name: str, yaml_data: Dict[str, Any], output_dir: str,
+                           insert_mode: str = 'insert', batch_size: int = DEFAULT_BATCH_SIZE,
+                           compress: bool = False, seed: Optional[int] = None, verbose: bool = False
+                           ) -> Tuple[str, Optional[Dict[str, Any]], List[str]]:
+    """1テーブルのサンプルデータSQLをファイルに逐次出力（プロセスプールからも呼び出す）
+    
+    Returns:
+        Tuple: (テーブル名, 出力結果（レコードがない場合はNone）, エラーリスト)
+    """
+    errors = []
+    with trace_span("sample_data.table", category="generator", table=table_name, mode=insert_mode) as span:
+        rows = EnhancedSQLGenerator(verbose, seed).iter_sql_rows(table_name, yaml_data, errors)
+        f, output_path = open_sql_output(Path(output_dir) / f"{table_name}_sample_data.sql", compress)
+        with f:
+            f.write(f"-- サンプルデータ {insert_mode}: {table_name}\n")
+            f.write(f"-- 生成日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write("BEGIN;\n\n")
+            record_count, statement_count = write_statements(f, table_name, rows, insert_mode, batch_size)
+            f.write("\nCOMMIT;\n\n")
+            f.write(f"-- {table_name} サンプルデータ終了（レコード数: {record_count}）\n")
+        
+        if record_count == 0:
+            output_path.unlink()
+            return table_name, None, errors
+        
+        output_bytes = output_path.stat().st_size
+        span.set_attributes(records=record_count, file=str(output_path), bytes=output_bytes)
+    
+    return table_name, {
+        'records': record_count,
+        'statements': statement_count,
+        'file': str(output_path),
+        'bytes': output_bytes
+    }, errors
+
+
+def _write_table_sample_sql_task(task: tuple) -> Tuple[str, Optional[Dict[str, Any]], List[str]]:
+    return write_table_sample_sql(*task)
+
+
 class SampleDataGenerator(BaseGenerator):
     """YAMLベースサンプルデータ生成クラス（BaseGenerator準拠）"""
     
     def __init__(self, config=None):
         super().__init__(config)
-        self.verbose = self.config.get('verbose', False)
-        self.dependency_resolver = TableDependencyResolver(self.verbose)
-        self.sql_generator = EnhancedSQLGenerator(self.verbose)
+        self.verbose = self._config_option('verbose', False)
+        self.insert_mode = validate_mode(self._config_option('insert_mode', 'insert'))
+        self.batch_size = self._config_option('batch_size', DEFAULT_BATCH_SIZE)
+        self.workers = self._config_option('workers', 1)
+        self.table_details_dir = str(self._config_option('table_details_dir', TABLE_DETAILS_DIR))
+        self.dependency_resolver = TableDependencyResolver(self.verbose, self.table_details_dir)
+        self.sql_generator = EnhancedSQLGenerator(self.verbose, self._config_option('seed', None))
     
     def generate(self, table_def: TableDefinition, output_path: Optional[str] = None) -> str:
         """
@@ -349,30 +484,29 @@ class SampleDataGenerator(BaseGenerator):
             self._log_generation_start(table_def)
             
             # YAMLファイルからデータを読み込み
-            yaml_file = os.path.join(TABLE_DETAILS_DIR, f"{table_def.table_name}_details.yaml")
+            yaml_file = find_table_details_file(table_def.table_name, self.table_details_dir)
             
-            if not os.path.exists(yaml_file):
-                raise GenerationError(f"YAMLファイルが存在しません: {yaml_file}")
+            if yaml_file is None:
+                raise GenerationError(f"YAMLファイルが存在しません: {table_def.table_name}")
             
             yaml_data = self._load_yaml_file(yaml_file)
             if not yaml_data:
                 raise GenerationError(f"YAMLファイルの読み込みに失敗しました: {yaml_file}")
             
             # INSERT文生成
-            insert_statements, errors = self.sql_generator.generate_insert_statements(
-                table_def.table_name, yaml_data
-            )
+            rows, errors = self.sql_generator.generate_sql_rows(table_def.table_name, yaml_data)
             
             if errors:
                 error_msg = f"INSERT文生成エラー: {'; '.join(errors)}"
                 raise GenerationError(error_msg)
             
-            if not insert_statements:
+            if not rows:
                 self.logger.warning(f"テーブル {table_def.table_name}: INSERT文が生成されませんでした")
                 return self._generate_empty_sql(table_def.table_name)
             
             # SQL文を組み立て
-            sql_content = self._build_sql_content(table_def.table_name, insert_statements)
+            insert_statements = render_statements(table_def.table_name, rows, self.insert_mode, self.batch_size)
+            sql_content = self._build_sql_content(table_def.table_name, insert_statements, len(rows))
             
             self._log_generation_complete(table_def)
             return sql_content
@@ -380,10 +514,20 @@ class SampleDataGenerator(BaseGenerator):
         except Exception as e:
             raise self._handle_generation_error(e, table_def, "サンプルデータ生成")
     
-    def get_file_extension(self) -> str:
-        """ファイル拡張子を取得"""
+    def _config_option(self, key: str, default: Any) -> Any:
+        """設定値を取得（dict形式・Config形式の両方に対応）"""
+        if isinstance(self.config, dict):
+            return self.config.get(key, default)
+        return getattr(self.config, key, default)
+    
+    def get_output_extension(self) -> str:
+        """出力ファイル拡張子を取得"""
         return '.sql'
     
+    def get_file_extension(self) -> str:
+        """ファイル拡張子を取得（従来互換）"""
+        return self.get_output_extension()
+    
     def generate_sample_data_sql(self, tables: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         複数テーブルのサンプルデータINSERT文を生成（従来互換）
@@ -439,22 +583,25 @@ class SampleDataGenerator(BaseGenerator):
                     continue
                 
                 # INSERT文生成
-                insert_statements, errors = self.sql_generator.generate_insert_statements(table_name, yaml_data)
+                with trace_span("sample_data.table", category="generator", table=table_name) as span:
+                    rows, errors = self.sql_generator.generate_sql_rows(table_name, yaml_data)
+                    span.set_attribute("records", len(rows))
                 
                 if errors:
                     results['errors'].extend([f"{table_name}: {error}" for error in errors])
                     continue
                 
-                if insert_statements:
+                if rows:
+                    insert_statements = render_statements(table_name, rows, self.insert_mode, self.batch_size)
                     results['generated_tables'] += 1
-                    results['total_records'] += len(insert_statements)
+                    results['total_records'] += len(rows)
                     results['tables'][table_name] = {
-                        'records': len(insert_statements),
+                        'records': len(rows),
                         'statements': insert_statements
                     }
                     
                     if self.verbose:
-                        self.logger.info(f"テーブル {table_name}: {len(insert_statements)}件のINSERT文を生成")
+                        self.logger.info(f"テーブル {table_name}: {len(rows)}件のINSERT文を生成")
             
             # 結果サマリー
             if results['errors']:
@@ -470,6 +617,106 @@ class SampleDataGenerator(BaseGenerator):
         
         return results
     
+    def write_sample_data_sql(self, output_dir: Path, tables: Optional[List[str]] = None,
+                              compress: bool = False, workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        複数テーブルのサンプルデータSQLをテーブルごとのファイルに逐次出力
+        
+        generate_sample_data_sql と異なりSQL文を保持せず、行の生成・エンコード・書き込みを
+        1行（複数行INSERT・COPYの場合は1文）ずつ行うため、メモリ使用量はデータ量に依存しない。
+        
+        Args:
+            output_dir: 出力ディレクトリ（{テーブル名}_sample_data.sql[.gz] を出力）
+            tables: 対象テーブルリスト（Noneの場合は全テーブル）
+            compress: gzip圧縮して出力する
+            workers: 並列プロセス数（Noneの場合は設定値。2以上で依存レベルごとに並列生成）
+            
+        Returns:
+            Dict[str, Any]: 生成結果（件数・出力先のみ）
+        """
+        results = {
+            'success': True,
+            'total_tables': 0,
+            'generated_tables': 0,
+            'total_records': 0,
+            'total_bytes': 0,
+            'execution_order': [],
+            'execution_levels': [],
+            'tables': {},
+            'errors': [],
+            'warnings': []
+        }
+        
+        try:
+            table_list = tables or self._get_all_tables()
+            results['total_tables'] = len(table_list)
+            
+            if not self.dependency_resolver.load_table_dependencies(table_list):
+                results['errors'].append("依存関係の読み込みに失敗しました")
+                results['success'] = False
+                return results
+            
+            execution_order = self.dependency_resolver.resolve_execution_order(table_list)
+            results['execution_order'] = execution_order
+            
+            levels = self.dependency_resolver.resolve_execution_levels(table_list)
+            results['execution_levels'] = levels
+            
+            tasks = []
+            for level in levels:
+                level_tasks = []
+                for table_name in level:
+                    yaml_data = self.dependency_resolver.tables_data.get(table_name)
+                    if not yaml_data:
+                        results['errors'].append(f"テーブル {table_name}: YAMLデータが見つかりません")
+                        continue
+                    level_tasks.append((table_name, yaml_data, str(output_dir), self.insert_mode,
+                                        self.batch_size, compress, self.sql_generator.seed, self.verbose))
+                tasks.append(level_tasks)
+            
+            for table_name, info, errors in self._run_table_tasks(tasks, workers or self.workers):
+                if errors:
+                    results['errors'].extend([f"{table_name}: {error}" for error in errors])
+                if info is None:
+                    continue
+                
+                results['generated_tables'] += 1
+                results['total_records'] += info['records']
+                results['total_bytes'] += info['bytes']
+                results['tables'][table_name] = info
+                
+                if self.verbose:
+                    self.logger.info(f"テーブル {table_name}: {info['records']}件を出力 -> {info['file']}")
+            
+            if results['errors']:
+                results['success'] = False
+            
+            if self.verbose:
+                self._print_summary(results)
+            
+        except Exception as e:
+            results['success'] = False
+            results['errors'].append(f"サンプルデータ生成エラー: {str(e)}")
+            self.logger.error(f"サンプルデータ生成エラー: {e}")
+        
+        return results
+    
+    def _run_table_tasks(self, levels: List[List[tuple]], workers: int) -> Iterator[Tuple[str, Optional[Dict[str, Any]], List[str]]]:
+        """テーブル単位の出力をレベル順に実行（workers が2以上の場合はレベル内をプロセス並列）
+        
+        結果はレベル順・レベル内のテーブル順に返すため、並列度によらず集計結果は同じになる。
+        """
+        if workers <= 1:
+            for level in levels:
+                for task in level:
+                    yield write_table_sample_sql(*task)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for level in levels:
+                # 次のレベルは参照先テーブルの出力がすべて完了してから開始する
+                yield from list(executor.map(_write_table_sample_sql_task, level))
+    
     def _load_yaml_file(self, file_path: str) -> Dict[str, Any]:
         """YAMLファイルを読み込む"""
         try:
@@ -481,20 +728,17 @@ class SampleDataGenerator(BaseGenerator):
     
     def _get_all_tables(self) -> List[str]:
         """全テーブル名を取得"""
-        yaml_files = glob.glob(os.path.join(TABLE_DETAILS_DIR, "*_details.yaml"))
-        table_list = []
-        for yaml_file in yaml_files:
-            table_name = os.path.basename(yaml_file).replace("_details.yaml", "")
-            if table_name != "MST_TEMPLATE":
-                table_list.append(table_name)
-        return table_list
-    
-    def _build_sql_content(self, table_name: str, insert_statements: List[str]) -> str:
+        return list_table_details_tables(self.table_details_dir)
+    
+    def _build_sql_content(self, table_name: str, insert_statements: List[str],
+                           record_count: Optional[int] = None) -> str:
         """SQL内容を構築"""
+        if record_count is None:
+            record_count = len(insert_statements)
         lines = []
         lines.append(f"-- サンプルデータ INSERT文: {table_name}")
         lines.append(f"-- 生成日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"-- レコード数: {len(insert_statements)}")
+        lines.append(f"-- レコード数: {record_count}")
         lines.append("")
         lines.append("BEGIN;")
         lines.append("")
@@ -546,13 +790,24 @@ def main():
     parser.add_argument('--tables', help='カンマ区切りのテーブル名リスト')
     parser.add_argument('--verbose', action='store_true', help='詳細なログを出力')
     parser.add_argument('--output-format', choices=['sql', 'json'], default='sql', help='出力形式')
+    parser.add_argument('--output-dir', help='テーブルごとのSQLファイルに逐次出力するディレクトリ')
+    parser.add_argument('--gzip', action='store_true', help='出力ファイルをgzip圧縮（--output-dir 指定時）')
+    parser.add_argument('--insert-mode', choices=INSERT_MODES, default='insert', help='SQLの出力形式')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='複数行INSERTの1文あたりの行数')
+    parser.add_argument('--workers', type=int, default=1, help='並列プロセス数（--output-dir 指定時、依存レベルごとに並列生成）')
+    parser.add_argument('--seed', type=int, help='IDを生成する乱数のシード（指定時は出力が再現可能）')
     args = parser.parse_args()
     
     tables = args.tables.split(',') if args.tables else None
-    config = {'verbose': args.verbose}
+    config = {'verbose': args.verbose, 'insert_mode': args.insert_mode, 'batch_size': args.batch_size,
+              'seed': args.seed}
     
     generator = SampleDataGenerator(config)
-    result = generator.generate_sample_data_sql(tables)
+    if args.output_dir:
+        result = generator.write_sample_data_sql(Path(args.output_dir), tables, compress=args.gzip,
+                                                 workers=args.workers)
+    else:
+        result = generator.generate_sample_data_sql(tables)
     
     if args.output_format == 'json':
         import json
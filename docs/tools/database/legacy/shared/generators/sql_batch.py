@@ -0,0 +1,250 @@
+"""
+サンプルデータSQLの出力形式
+1行1文のINSERTに加え、複数行INSERT・ON CONFLICT DO NOTHING・COPY FROM STDIN で出力する
+
+要求仕様ID: PLT.1-WEB.1 (システム基盤要件)
+"""
+
+import gzip
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# 出力形式
+#   insert       : 1行1文の INSERT（従来形式）
+#   multi_insert : batch_size 行ごとの複数行 INSERT
+#   on_conflict  : 複数行 INSERT ... ON CONFLICT DO NOTHING（PostgreSQL / SQLite 3.24+）
+#   copy         : COPY ... FROM STDIN（テキスト形式、PostgreSQL）
+#   copy_csv     : COPY ... FROM STDIN WITH (FORMAT csv)（PostgreSQL）
+INSERT_MODES = ('insert', 'multi_insert', 'on_conflict', 'copy', 'copy_csv')
+COPY_MODES = ('copy', 'copy_csv')
+DEFAULT_BATCH_SIZE = 1000
+
+# ストリーミング出力時のCOPYブロックあたりの行数（1ブロック分のみメモリに保持する）
+STREAM_COPY_BATCH_SIZE = 50000
+
+# gzip圧縮レベル（速度優先: 大量データSQLで レベル1 は約100MB/s・圧縮率約25%、レベル6 は約25MB/s・約18%）
+GZIP_COMPRESS_LEVEL = 1
+
+# 1行分の出力値（カラム名リスト, SQLリテラルのリスト）
+SqlRow = Tuple[Sequence[str], Sequence[str]]
+
+_COPY_TEXT_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+_CSV_QUOTE_CHARS = (',', '"', '\n', '\r', '\\')
+
+
+def validate_mode(mode: str) -> str:
+    """出力形式を検証"""
+    if mode not in INSERT_MODES:
+        raise ValueError(f"未対応の出力形式: {mode}（{', '.join(INSERT_MODES)}）")
+    return mode
+
+
+def sql_literal_to_text(literal: str, now: str) -> Optional[str]:
+    """SQLリテラルをCOPY用の値に変換（NULLはNone）
+
+    INSERT文と同じ値をCOPYで投入するため、format_value_for_sql の出力・サンプルデータSQLの値から変換する。
+    CURRENT_TIMESTAMP / NOW() は生成時刻に置き換える（キーワードの大文字・小文字は区別しない）。
+    """
+    if literal[:1] == "'" and literal[-1:] == "'" and len(literal) >= 2:
+        return literal[1:-1].replace("''", "'")
+    upper = literal.upper()
+    if upper == 'NULL':
+        return None
+    if upper == 'TRUE':
+        return 't'
+    if upper == 'FALSE':
+        return 'f'
+    if upper in ('CURRENT_TIMESTAMP', 'NOW()'):
+        return now
+    return literal
+
+
+def _copy_text_field(value: Optional[str]) -> str:
+    if value is None:
+        return '\\N'
+    # エスケープ対象の文字を含む値のみ変換する（translate は文字数に比例して遅い）
+    if '\\' in value or '\t' in value or '\n' in value or '\r' in value:
+        return value.translate(_COPY_TEXT_ESCAPES)
+    return value
+
+
+def _copy_csv_field(value: Optional[str]) -> str:
+    # NULLは引用符なしの空文字、空文字列は "" として区別する
+    if value is None:
+        return ''
+    if value == '' or any(char in value for char in _CSV_QUOTE_CHARS):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def copy_field_codec(codec: Callable[[Any], str], csv_format: bool = False,
+                     now: Optional[str] = None) -> Callable[[Any], str]:
+    """値 -> COPYのフィールド（codec のSQLリテラルを render_copy と同じ規則で変換）"""
+    now = now or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    field = _copy_csv_field if csv_format else _copy_text_field
+
+    def encode(value: Any) -> str:
+        return field(sql_literal_to_text(codec(value), now))
+    return encode
+
+
+def group_rows(rows: Iterable[SqlRow], batch_size: Optional[int]) -> Iterator[Tuple[Sequence[str], List[Sequence[str]]]]:
+    """カラム構成が同じ連続行を batch_size 行ずつまとめる（None は上限なし）"""
+    columns: Optional[Tuple[str, ...]] = None
+    batch: List[Sequence[str]] = []
+    for row_columns, values in rows:
+        row_columns = tuple(row_columns)
+        if batch and (row_columns != columns or (batch_size and len(batch) >= batch_size)):
+            yield columns, batch
+            batch = []
+        columns = row_columns
+        batch.append(values)
+    if batch:
+        yield columns, batch
+
+
+def render_multi_insert(table_name: str, columns: Sequence[str], value_rows: Sequence[Sequence[str]],
+                        on_conflict: bool = False) -> str:
+    """複数行INSERT文を生成"""
+    values = ',\n'.join(f"({', '.join(values)})" for values in value_rows)
+    suffix = '\nON CONFLICT DO NOTHING' if on_conflict else ''
+    return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES\n{values}{suffix};"
+
+
+def _copy_header(table_name: str, columns: Sequence[str], csv_format: bool) -> str:
+    if csv_format:
+        return f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv);"
+    return f"COPY {table_name} ({', '.join(columns)}) FROM STDIN;"
+
+
+def render_copy(table_name: str, columns: Sequence[str], value_rows: Sequence[Sequence[str]],
+                csv_format: bool = False, now: Optional[str] = None) -> str:
+    """COPY ... FROM STDIN ブロックを生成（psql でそのまま実行可能）"""
+    now = now or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    header = _copy_header(table_name, columns, csv_format)
+    if csv_format:
+        separator, field = ',', _copy_csv_field
+    else:
+        separator, field = '\t', _copy_text_field
+
+    lines = [header]
+    lines.extend(
+        separator.join(field(sql_literal_to_text(literal, now)) for literal in values)
+        for values in value_rows
+    )
+    lines.append('\\.')
+    return '\n'.join(lines)
+
+
+def iter_statements(table_name: str, rows: Iterable[SqlRow], mode: str = 'insert',
+                    batch_size: int = DEFAULT_BATCH_SIZE,
+                    copy_batch_size: Optional[int] = None) -> Iterator[str]:
+    """出力形式に応じたSQL文を順に生成（rows を順に消費し、1文分の行のみ保持する）
+
+    Args:
+        table_name: テーブル名
+        rows: (カラム名リスト, SQLリテラルのリスト) の反復
+        mode: 出力形式（INSERT_MODES）
+        batch_size: 1文あたりの行数（multi_insert / on_conflict）
+        copy_batch_size: COPYブロックあたりの行数（None は上限なし）
+
+    Yields:
+        str: SQL文（COPYの場合はデータ行を含むブロック）
+    """
+    validate_mode(mode)
+    if mode == 'insert':
+        for columns, values in rows:
+            yield f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(values)});"
+    elif mode in COPY_MODES:
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        for columns, batch in group_rows(rows, copy_batch_size):
+            yield render_copy(table_name, columns, batch, csv_format=(mode == 'copy_csv'), now=now)
+    else:
+        for columns, batch in group_rows(rows, max(1, batch_size)):
+            yield render_multi_insert(table_name, columns, batch, on_conflict=(mode == 'on_conflict'))
+
+
+def render_statements(table_name: str, rows: Iterable[SqlRow], mode: str = 'insert',
+                      batch_size: int = DEFAULT_BATCH_SIZE) -> List[str]:
+    """出力形式に応じたSQL文のリストを生成（COPYはカラム構成ごとに1ブロック）"""
+    return list(iter_statements(table_name, rows, mode, batch_size))
+
+
+def open_sql_output(path: Path, compress: bool = False) -> Tuple[IO[str], Path]:
+    """SQL出力ファイルを開く（compress=True の場合は .gz を付けて gzip で書き込む）
+
+    Returns:
+        Tuple[IO[str], Path]: (テキストファイル, 実際の出力パス)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compress:
+        path = path.with_name(path.name + '.gz')
+        return gzip.open(path, 'wt', encoding='utf-8', newline='', compresslevel=GZIP_COMPRESS_LEVEL), path
+    return open(path, 'w', encoding='utf-8', newline=''), path
+
+
+class CountingRows:
+    """行の反復をそのまま渡しながら件数を数える"""
+
+    def __init__(self, rows: Iterable[SqlRow]):
+        self._rows = rows
+        self.count = 0
+
+    def __iter__(self) -> Iterator[SqlRow]:
+        for row in self._rows:
+            self.count += 1
+            yield row
+
+
+def write_copy_columns(f: IO[str], table_name: str, columns: Sequence[str],
+                       column_chunks: Iterable[Sequence[Sequence[str]]], csv_format: bool = False,
+                       copy_batch_size: int = STREAM_COPY_BATCH_SIZE) -> Tuple[int, int]:
+    """カラム単位で変換済みのCOPYフィールドを書き込む（write_statements の copy / copy_csv と同じ出力）
+
+    Args:
+        column_chunks: チャンクごとのカラム別フィールドリスト（copy_field_codec で変換した値）
+        copy_batch_size: COPYブロックあたりの行数
+
+    Returns:
+        Tuple[int, int]: (行数, COPYブロック数)
+    """
+    header = _copy_header(table_name, columns, csv_format) + '\n'
+    separator = ',' if csv_format else '\t'
+    row_count = block_count = block_rows = 0
+    for chunk in column_chunks:
+        lines = list(map(separator.join, zip(*chunk)))
+        position = 0
+        while position < len(lines):
+            if block_rows == 0:
+                f.write(header)
+                block_count += 1
+            take = min(len(lines) - position, copy_batch_size - block_rows)
+            f.write('\n'.join(lines[position:position + take]))
+            f.write('\n')
+            position += take
+            block_rows += take
+            if block_rows >= copy_batch_size:
+                f.write('\\.\n')
+                block_rows = 0
+        row_count += len(lines)
+    if block_rows:
+        f.write('\\.\n')
+    return row_count, block_count
+
+
+def write_statements(f: IO[str], table_name: str, rows: Iterable[SqlRow], mode: str = 'insert',
+                     batch_size: int = DEFAULT_BATCH_SIZE) -> Tuple[int, int]:
+    """SQL文を生成しながらファイルに書き込む
+
+    Returns:
+        Tuple[int, int]: (行数, 文の数)
+    """
+    counted = CountingRows(rows)
+    statement_count = 0
+    for statement in iter_statements(table_name, counted, mode, batch_size, STREAM_COPY_BATCH_SIZE):
+        f.write(statement)
+        f.write('\n')
+        statement_count += 1
+    return counted.count, statement_count
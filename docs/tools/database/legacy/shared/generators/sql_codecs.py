@@ -0,0 +1,144 @@
+"""
+SQL値エンコーダー（カラム単位の事前コンパイル）
+
+EnhancedSQLGenerator.format_value_for_sql は値ごとにデータ型文字列を判定するため、
+大量データではデータ型の判定が値の整形より高コストになる。
+テーブルのカラム構成からデータ型ごとのエンコーダーを一度だけ作成し、行・カラム単位で適用する。
+出力は format_value_for_sql と完全に一致させること。
+
+要求仕様ID: PLT.1-WEB.1 (システム基盤要件)
+"""
+
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+# 値 -> SQLリテラル
+ValueCodec = Callable[[Any], str]
+
+# データ型の分類（format_value_for_sql の判定順）
+STRING_TYPES = ('VARCHAR', 'TEXT', 'CHAR', 'STRING')
+INTEGER_TYPES = ('INT', 'BIGINT', 'SMALLINT', 'SERIAL')
+DECIMAL_TYPES = ('DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL')
+TEMPORAL_TYPES = ('DATE', 'DATETIME', 'TIMESTAMP', 'TIME')
+
+_TRUE_STRINGS = frozenset(['true', 't', '1', 'yes', 'y'])
+
+
+@lru_cache(maxsize=None)
+def classify_sql_type(col_type: str) -> str:
+    """データ型をエンコーダーの種類に分類
+
+    Returns:
+        str: 'string' / 'integer' / 'decimal' / 'boolean' / 'temporal' / 'json' / 'uuid' / 'other'
+    """
+    col_type_upper = col_type.upper()
+    if any(t in col_type_upper for t in STRING_TYPES):
+        return 'string'
+    if any(t in col_type_upper for t in INTEGER_TYPES):
+        return 'integer'
+    if any(t in col_type_upper for t in DECIMAL_TYPES):
+        return 'decimal'
+    if 'BOOLEAN' in col_type_upper or 'BOOL' in col_type_upper:
+        return 'boolean'
+    if any(t in col_type_upper for t in TEMPORAL_TYPES):
+        return 'temporal'
+    if 'JSON' in col_type_upper:
+        return 'json'
+    if 'UUID' in col_type_upper:
+        return 'uuid'
+    return 'other'
+
+
+def _encode_string(value: Any) -> str:
+    if value is None or value == "null":
+        return "NULL"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _encode_quoted(value: Any) -> str:
+    # 日付・時刻型・UUID型はエスケープせずに囲む（format_value_for_sql と同じ）
+    if value is None or value == "null":
+        return "NULL"
+    return f"'{value}'"
+
+
+def _encode_boolean(value: Any) -> str:
+    if value is None or value == "null":
+        return "NULL"
+    if value is True:
+        return 'TRUE'
+    if value is False:
+        return 'FALSE'
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, str):
+        return 'TRUE' if value.lower() in _TRUE_STRINGS else 'FALSE'
+    return 'TRUE' if value else 'FALSE'
+
+
+def _encode_json(value: Any) -> str:
+    if value is None or value == "null":
+        return "NULL"
+    if isinstance(value, (dict, list)):
+        return "'" + json.dumps(value, ensure_ascii=False).replace("'", "''") + "'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _numeric_codec(convert: Callable[[Any], Any], label: str, col_name: str,
+                   logger: Optional[logging.Logger]) -> ValueCodec:
+    def encode(value: Any) -> str:
+        if value is None or value == "null":
+            return "NULL"
+        try:
+            return str(convert(value))
+        except (ValueError, TypeError):
+            if logger is not None:
+                logger.warning(f"カラム {col_name}: {label}変換失敗 '{value}' -> NULL")
+            return "NULL"
+    return encode
+
+
+_SIMPLE_CODECS: Dict[str, ValueCodec] = {
+    'string': _encode_string,
+    'boolean': _encode_boolean,
+    'temporal': _encode_quoted,
+    'json': _encode_json,
+    'uuid': _encode_quoted,
+    'other': _encode_string,
+}
+
+
+def compile_codec(col_type: str, col_name: str = "", logger: Optional[logging.Logger] = None) -> ValueCodec:
+    """データ型のエンコーダーを作成
+
+    Args:
+        col_type: データ型（例: VARCHAR(50), INTEGER）
+        col_name: カラム名（変換失敗時の警告用）
+        logger: 変換失敗時の警告出力先（None の場合は出力しない）
+    """
+    kind = classify_sql_type(col_type)
+    if kind == 'integer':
+        return _numeric_codec(int, '整数', col_name, logger)
+    if kind == 'decimal':
+        return _numeric_codec(float, '数値', col_name, logger)
+    return _SIMPLE_CODECS[kind]
+
+
+def compile_codecs(column_types: Dict[str, str], logger: Optional[logging.Logger] = None) -> Dict[str, ValueCodec]:
+    """テーブルのカラム構成（カラム名 -> データ型）からエンコーダーを作成"""
+    return {
+        col_name: compile_codec(col_type, col_name, logger)
+        for col_name, col_type in column_types.items()
+    }
+
+
+def encode_row(codecs: Sequence[ValueCodec], values: Iterable[Any]) -> List[str]:
+    """1行分の値をエンコード（行単位）"""
+    return [codec(value) for codec, value in zip(codecs, values)]
+
+
+def encode_columns(codecs: Sequence[ValueCodec], columns: Sequence[Sequence[Any]]) -> List[List[str]]:
+    """カラムごとの値リストをエンコード（カラム単位）"""
+    return [list(map(codec, values)) for codec, values in zip(codecs, columns)]
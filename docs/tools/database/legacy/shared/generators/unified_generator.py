@@ -17,7 +17,7 @@ from ..core.models import TableDefinition, GenerationResult, ColumnDefinition
 from ..core.config import Config
 from ..core.logger import get_logger
 from ..core.exceptions import GenerationError
-from ..utils.file_utils import FileUtils
+from ..utils.file_utils import FileManager
 
 logger = get_logger(__name__)
 
@@ -28,7 +28,7 @@ class UnifiedGenerator(BaseGenerator):
     def __init__(self, config: Optional[Config] = None):
         """初期化"""
         super().__init__(config)
-        self.file_utils = FileUtils(config)
+        self.file_utils = FileManager(backup_enabled=False)
         self.generators = {
             'ddl': self._generate_ddl,
             'markdown': self._generate_markdown,
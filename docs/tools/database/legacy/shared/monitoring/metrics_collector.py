@@ -7,13 +7,16 @@
 実装者: AI駆動開発チーム
 """
 
+import itertools
+import math
+import sys
 import time
 import threading
+from array import array
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from datetime import datetime
 import json
 import statistics
 
@@ -22,6 +25,18 @@ from ..core.config import get_config
 
 logger = get_logger(__name__)
 
+# 分位点スケッチの相対誤差（推定値は真の値の ±1% 以内）
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# 0 とみなす絶対値（これより小さい値は対数バケットに入れない）
+_MIN_INDEXABLE_VALUE = sys.float_info.min
+
+# 集計に含める分位点
+_SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
+_ceil = math.ceil
+_log = math.log
+
 
 @dataclass
 class MetricPoint:
@@ -72,26 +87,246 @@ class MetricSummary:
             self.p99 = statistics.quantiles(sorted_values, n=100)[98]  # 99th percentile
 
 
+class QuantileSketch:
+    """分位点スケッチ（DDSketch 方式の対数バケットヒストグラム、マージ可能）
+    
+    値 v を log_γ(v) の切り上げのバケットで数え、分位点はバケットの代表値で推定する
+    （γ = (1 + α) / (1 - α)、推定値の相対誤差は α 以下）。
+    バケット数は値の範囲の対数にのみ依存するため、件数によらずメモリと読み出しコストは一定。
+    同じ相対誤差のスケッチ同士は merge で合算できる（プロセスごとの集計の統合など）。
+    """
+    
+    __slots__ = ('relative_accuracy', 'count', 'zero_count', '_gamma', '_multiplier', '_positive', '_negative')
+    
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """
+        分位点スケッチ初期化
+        
+        Args:
+            relative_accuracy: 推定値の相対誤差（0 < α < 1）
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy は 0 より大きく 1 より小さい値を指定してください: {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.count = 0
+        self.zero_count = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+    
+    def add(self, value: float):
+        """値を追加"""
+        self.count += 1
+        if value > _MIN_INDEXABLE_VALUE:
+            key = math.ceil(math.log(value) * self._multiplier)
+            self._positive[key] = self._positive.get(key, 0) + 1
+        elif value < -_MIN_INDEXABLE_VALUE:
+            key = math.ceil(math.log(-value) * self._multiplier)
+            self._negative[key] = self._negative.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+    
+    def merge(self, other: 'QuantileSketch'):
+        """別のスケッチを合算"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("相対誤差の異なるスケッチはマージできません")
+        for buckets, other_buckets in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in other_buckets.items():
+                buckets[key] = buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+    
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """複数の分位点（0〜1）を推定（バケットを1回走査）"""
+        qs = list(qs)
+        results = [0.0] * len(qs)
+        if self.count == 0:
+            return results
+        
+        # 小さい値から順に (代表値, 件数) を並べる
+        buckets = [(-self._bucket_value(key), self._negative[key]) for key in sorted(self._negative, reverse=True)]
+        if self.zero_count:
+            buckets.append((0.0, self.zero_count))
+        buckets.extend((self._bucket_value(key), self._positive[key]) for key in sorted(self._positive))
+        
+        order = sorted(range(len(qs)), key=qs.__getitem__)
+        position = 0
+        seen = buckets[0][1]
+        for i in order:
+            rank = min(max(qs[i], 0.0), 1.0) * (self.count - 1)
+            while seen <= rank and position < len(buckets) - 1:
+                position += 1
+                seen += buckets[position][1]
+            results[i] = buckets[position][0]
+        return results
+    
+    def quantile(self, q: float) -> float:
+        """分位点（0〜1）を推定"""
+        return self.quantiles((q,))[0]
+    
+    def _bucket_value(self, key: int) -> float:
+        # バケット (γ^(key-1), γ^key] の代表値（相対誤差が最小となる点）
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+
+class TagTable:
+    """タグの組み合わせの共有（同じ組み合わせは同じIDと辞書を使う）"""
+    
+    def __init__(self):
+        self._ids: Dict[Tuple, int] = {(): 0}
+        self.tag_sets: List[Dict[str, str]] = [{}]
+        # 直前の組み合わせ（同じタグでの連続した記録は辞書の比較だけで済ませる）
+        self._last_tags: Dict[str, str] = {}
+        self._last_id = 0
+    
+    def intern(self, tags: Optional[Dict[str, str]]) -> int:
+        """タグのIDを取得（新しい組み合わせは登録する）"""
+        if not tags:
+            return 0
+        if tags == self._last_tags:
+            return self._last_id
+        self._last_tags = dict(tags)
+        self._last_id = self._lookup(tags)
+        return self._last_id
+    
+    def _lookup(self, tags: Dict[str, str]) -> int:
+        key = tuple(tags.items())
+        try:
+            tag_id = self._ids.get(key)
+        except TypeError:
+            # ハッシュ化できない値は文字列として扱う
+            key = tuple((name, str(value)) for name, value in key)
+            tag_id = self._ids.get(key)
+        if tag_id is None:
+            # 指定順が異なる同じ組み合わせも同じIDにする
+            canonical = tuple(sorted(key))
+            tag_id = self._ids.get(canonical)
+            if tag_id is None:
+                tag_id = len(self.tag_sets)
+                self.tag_sets.append(dict(canonical))
+                self._ids[canonical] = tag_id
+            self._ids[key] = tag_id
+        return tag_id
+
+
+class MetricSeries:
+    """1メトリクスのリングバッファ（単調時刻・値・タグID の配列）と集計
+    
+    配列は max_points まで追記し、以降は古いポイントから上書きする
+    （記録のないメトリクスに max_points 分のメモリを確保しない）。
+    件数・合計・最小・最大・分位点スケッチは上書きされたポイントも含めて集計する。
+    """
+    
+    __slots__ = ('capacity', 'timestamps', 'values', 'tag_ids', 'next_index',
+                 'count', 'sum', 'min', 'max', 'sketch', '_quantiles')
+    
+    def __init__(self, capacity: int, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.capacity = max(1, capacity)
+        self.timestamps = array('d')
+        self.values = array('d')
+        self.tag_ids = array('l')
+        self.next_index = 0
+        self.sketch = QuantileSketch(relative_accuracy)
+        self._reset_stats()
+    
+    def _reset_stats(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.sketch = QuantileSketch(self.sketch.relative_accuracy)
+        self._quantiles = None
+    
+    def append(self, timestamp: float, value: float, tag_id: int = 0):
+        """ポイントを追加（容量に達した後は最も古いポイントを上書き）"""
+        if len(self.values) < self.capacity:
+            self.timestamps.append(timestamp)
+            self.values.append(value)
+            self.tag_ids.append(tag_id)
+        else:
+            i = self.next_index
+            self.timestamps[i] = timestamp
+            self.values[i] = value
+            self.tag_ids[i] = tag_id
+            self.next_index = i + 1 if i + 1 < self.capacity else 0
+        
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        sketch = self.sketch
+        if value > _MIN_INDEXABLE_VALUE:
+            # 記録のたびに呼ばれるため、正の値（所要時間など）は QuantileSketch.add を展開して数える
+            sketch.count += 1
+            buckets = sketch._positive
+            key = _ceil(_log(value) * sketch._multiplier)
+            buckets[key] = buckets.get(key, 0) + 1
+        else:
+            sketch.add(value)
+        self._quantiles = None
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def ordered_indexes(self) -> Iterable[int]:
+        """保持中のポイントの添字（古い順）"""
+        return itertools.chain(range(self.next_index, len(self.values)), range(self.next_index))
+    
+    def quantiles(self) -> List[float]:
+        """p50 / p95 / p99（次の追加まで結果を再利用）"""
+        if self._quantiles is None:
+            # 推定値は実際の最小・最大の範囲に収める
+            self._quantiles = [
+                min(max(value, self.min), self.max) for value in self.sketch.quantiles(_SUMMARY_QUANTILES)
+            ]
+        return self._quantiles
+    
+    def clear(self):
+        """全ポイントと集計を削除"""
+        del self.timestamps[:], self.values[:], self.tag_ids[:]
+        self.next_index = 0
+        self._reset_stats()
+    
+    def drop_older_than(self, cutoff: float):
+        """cutoff（単調時刻）より古いポイントを削除し、残ったポイントから集計を作り直す"""
+        kept = [i for i in self.ordered_indexes() if self.timestamps[i] >= cutoff]
+        timestamps = array('d', (self.timestamps[i] for i in kept))
+        values = array('d', (self.values[i] for i in kept))
+        tag_ids = array('l', (self.tag_ids[i] for i in kept))
+        self.clear()
+        for timestamp, value, tag_id in zip(timestamps, values, tag_ids):
+            self.append(timestamp, value, tag_id)
+
+
 class MetricsCollector:
-    """メトリクス収集器"""
+    """メトリクス収集器
     
-    def __init__(self, max_points: int = 10000, retention_hours: int = 24):
+    メトリクスごとに (単調時刻, 値, タグID) を配列のリングバッファで保持し、
+    パーセンタイルは分位点スケッチから求めます（記録ごとのオブジェクト生成・集計時のソートなし）。
+    """
+    
+    def __init__(self, max_points: int = 10000, retention_hours: int = 24,
+                 relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
         """
         メトリクス収集器初期化
         
         Args:
             max_points: 最大保持ポイント数
             retention_hours: 保持時間（時間）
+            relative_accuracy: パーセンタイルの相対誤差
         """
         self.max_points = max_points
         self.retention_hours = retention_hours
+        self.relative_accuracy = relative_accuracy
         
         # メトリクスデータ
-        self._metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_points))
-        self._lock = threading.RLock()
-        
-        # 集計データ
-        self._summaries: Dict[str, MetricSummary] = defaultdict(MetricSummary)
+        self._metrics: Dict[str, MetricSeries] = {}
+        self._tags = TagTable()
+        # 記録のたびに取得するため、再入可能でない軽量なロックを使う
+        self._lock = threading.Lock()
         
         # クリーンアップタイマー
         self._cleanup_timer = None
@@ -113,15 +348,12 @@ class MetricsCollector:
             value: 値
             tags: タグ
         """
+        timestamp = time.monotonic()
         with self._lock:
-            point = MetricPoint(
-                timestamp=datetime.now(),
-                value=value,
-                tags=tags or {}
-            )
-            
-            self._metrics[metric_name].append(point)
-            self._summaries[metric_name].update(value)
+            series = self._metrics.get(metric_name)
+            if series is None:
+                series = self._metrics[metric_name] = MetricSeries(self.max_points, self.relative_accuracy)
+            series.append(timestamp, value, self._tags.intern(tags) if tags else 0)
     
     def record_timing(self, metric_name: str, duration: float, tags: Optional[Dict[str, str]] = None):
         """タイミングメトリクスを記録"""
@@ -138,31 +370,34 @@ class MetricsCollector:
     def get_metrics(self, metric_name: str) -> List[MetricPoint]:
         """メトリクス取得"""
         with self._lock:
-            return list(self._metrics.get(metric_name, []))
+            series = self._metrics.get(metric_name)
+            return self._to_points(series) if series is not None else []
     
     def get_summary(self, metric_name: str) -> MetricSummary:
         """メトリクス集計取得"""
         with self._lock:
-            summary = self._summaries.get(metric_name, MetricSummary())
-            
-            # パーセンタイル計算
-            if metric_name in self._metrics:
-                values = [point.value for point in self._metrics[metric_name]]
-                summary.calculate_percentiles(values)
-            
-            return summary
+            return self._summarize(self._metrics.get(metric_name))
+    
+    def get_sketch(self, metric_name: str) -> QuantileSketch:
+        """メトリクスの分位点スケッチを取得（他の収集器のスケッチとマージ可能なコピー）"""
+        with self._lock:
+            sketch = QuantileSketch(self.relative_accuracy)
+            series = self._metrics.get(metric_name)
+            if series is not None:
+                sketch.merge(series.sketch)
+            return sketch
     
     def get_all_metrics(self) -> Dict[str, List[MetricPoint]]:
         """全メトリクス取得"""
         with self._lock:
-            return {name: list(points) for name, points in self._metrics.items()}
+            return {name: self._to_points(series) for name, series in self._metrics.items()}
     
     def get_all_summaries(self) -> Dict[str, MetricSummary]:
         """全メトリクス集計取得"""
         with self._lock:
             summaries = {}
-            for name in self._metrics.keys():
-                summaries[name] = self.get_summary(name)
+            for name, series in self._metrics.items():
+                summaries[name] = self._summarize(series)
             return summaries
     
     def clear_metrics(self, metric_name: Optional[str] = None):
@@ -171,33 +406,55 @@ class MetricsCollector:
             if metric_name:
                 if metric_name in self._metrics:
                     self._metrics[metric_name].clear()
-                if metric_name in self._summaries:
-                    self._summaries[metric_name] = MetricSummary()
             else:
                 self._metrics.clear()
-                self._summaries.clear()
+    
+    @staticmethod
+    def _summarize(series: Optional[MetricSeries]) -> MetricSummary:
+        """リングバッファの集計とスケッチから MetricSummary を作成"""
+        if series is None or series.count == 0:
+            return MetricSummary()
+        
+        summary = MetricSummary(
+            count=series.count,
+            sum=series.sum,
+            min=series.min,
+            max=series.max,
+            avg=series.sum / series.count
+        )
+        
+        # パーセンタイル（スケッチから取得）
+        p50, p95, p99 = series.quantiles()
+        summary.p50 = p50
+        if series.count >= 20:  # 十分なデータがある場合のみ
+            summary.p95 = p95
+            summary.p99 = p99
+        
+        return summary
+    
+    def _to_points(self, series: MetricSeries) -> List[MetricPoint]:
+        """リングバッファのポイントを古い順の MetricPoint に変換"""
+        # 単調時刻を現在時刻との差から日時に換算する
+        offset = time.time() - time.monotonic()
+        tag_sets = self._tags.tag_sets
+        return [
+            MetricPoint(
+                timestamp=datetime.fromtimestamp(offset + series.timestamps[i]),
+                value=series.values[i],
+                tags=dict(tag_sets[series.tag_ids[i]])
+            )
+            for i in series.ordered_indexes()
+        ]
     
     def _cleanup_old_metrics(self):
         """古いメトリクスのクリーンアップ"""
-        cutoff_time = datetime.now() - timedelta(hours=self.retention_hours)
+        cutoff = time.monotonic() - self.retention_hours * 3600
         
         with self._lock:
-            for metric_name, points in self._metrics.items():
-                # 古いポイントを削除
-                while points and points[0].timestamp < cutoff_time:
-                    points.popleft()
-                
-                # 集計を再計算
-                if points:
-                    summary = MetricSummary()
-                    values = []
-                    for point in points:
-                        summary.update(point.value)
-                        values.append(point.value)
-                    summary.calculate_percentiles(values)
-                    self._summaries[metric_name] = summary
-                else:
-                    self._summaries[metric_name] = MetricSummary()
+            for series in self._metrics.values():
+                # 古いポイントを削除し、集計を再計算
+                if len(series) and series.timestamps[series.next_index] < cutoff:
+                    series.drop_older_than(cutoff)
     
     def _start_cleanup_timer(self):
         """クリーンアップタイマー開始"""
@@ -224,11 +481,12 @@ class MetricsCollector:
         
         with self._lock:
             # メトリクスデータ
-            for name, points in self._metrics.items():
-                data['metrics'][name] = [point.to_dict() for point in points]
+            for name, series in self._metrics.items():
+                data['metrics'][name] = [point.to_dict() for point in self._to_points(series)]
             
             # 集計データ
-            for name, summary in self._summaries.items():
+            for name, series in self._metrics.items():
+                summary = self._summarize(series)
                 data['summaries'][name] = {
                     'count': summary.count,
                     'sum': summary.sum,
@@ -264,29 +522,29 @@ class PerformanceMonitor:
             collector: メトリクス収集器
         """
         self.collector = collector or MetricsCollector()
-        self._active_timers: Dict[str, float] = {}
+        # タイマーID -> (操作名, 開始時刻)
+        self._active_timers: Dict[str, Tuple[str, float]] = {}
+        self._timer_ids = itertools.count()
         self._lock = threading.RLock()
     
     def start_timer(self, operation: str) -> str:
         """タイマー開始"""
-        timer_id = f"{operation}_{threading.current_thread().ident}_{time.time()}"
+        timer_id = f"{operation}_{threading.current_thread().ident}_{next(self._timer_ids)}"
         
         with self._lock:
-            self._active_timers[timer_id] = time.time()
+            self._active_timers[timer_id] = (operation, time.perf_counter())
         
         return timer_id
     
     def end_timer(self, timer_id: str, tags: Optional[Dict[str, str]] = None):
         """タイマー終了"""
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         with self._lock:
             if timer_id in self._active_timers:
-                start_time = self._active_timers.pop(timer_id)
+                operation, start_time = self._active_timers.pop(timer_id)
                 duration = end_time - start_time
                 
-                # 操作名を抽出
-                operation = timer_id.split('_')[0]
                 self.collector.record_timing(operation, duration, tags)
                 
                 return duration
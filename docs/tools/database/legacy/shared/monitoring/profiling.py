@@ -0,0 +1,452 @@
+"""
+CLI プロファイリング
+各ツールのトップレベルコマンドを cProfile で計測し、以下を出力する
+
+- <コマンド>_<日時>.pstats     : pstats / snakeviz などで読み込める統計
+- <コマンド>_<日時>.collapsed  : flamegraph.pl / speedscope などで読み込める collapsed stack 形式
+- 累積時間の上位 N 関数（標準エラー出力）
+
+cProfile はスレッドごとに計測するため、計測中に開始したスレッド（--jobs > 1 の CheckScheduler の
+ワーカーなど）には threading.setprofile でスレッド別のプロファイラを割り当て、報告時にメインスレッドの
+統計と合算する（--jobs は変更しない）。累積時間はスレッドごとの合計なので、並列実行時は実時間を超える。
+ProcessPoolExecutor の子プロセスは計測対象外。
+
+--profile-memory を指定すると tracemalloc を有効にし、ステージ（チェック単位など）ごとの
+ピークメモリと増加量の多い割り当て箇所を報告する（<コマンド>_<日時>.memory.txt にも出力）
+
+使い方:
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    with profile_command(args, args.command):
+        ...
+
+    with profile_stage(f"check.{name}"):  # メモリプロファイル無効時は何もしない
+        ...
+
+要求仕様ID: PLT.1-WEB.1 (システム基盤要件)
+"""
+
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+# --profile の出力先を省略した場合のディレクトリ
+DEFAULT_PROFILE_DIR = 'profiles'
+
+# 表示する上位関数の数
+DEFAULT_PROFILE_TOP = 20
+
+# collapsed stack の最大の深さ
+MAX_STACK_DEPTH = 64
+
+# collapsed stack に出力する最小の割合（総時間に対する比率、これ未満の経路は省略）
+MIN_STACK_FRACTION = 1e-4
+
+# ステージごとに報告する割り当て箇所の数
+MEMORY_TOP_SITES = 5
+
+# メモリスナップショットから除外するフレーム
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+# 実行中のプロファイラ（profile_stage から参照）
+_active_profiler: Optional['CommandProfiler'] = None
+
+FuncKey = Tuple[str, int, str]
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """--profile / --profile-top / --profile-memory オプションを追加"""
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=DEFAULT_PROFILE_DIR,
+        metavar='DIR',
+        help=f'cProfile で計測し .pstats と collapsed stack を出力（デフォルト: {DEFAULT_PROFILE_DIR}）'
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=DEFAULT_PROFILE_TOP,
+        metavar='N',
+        help=f'累積時間の上位に表示する関数の数（デフォルト: {DEFAULT_PROFILE_TOP}）'
+    )
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='tracemalloc でステージごとのピークメモリを計測'
+    )
+
+
+class MemoryStage:
+    """ステージのメモリ計測結果"""
+
+    __slots__ = ('name', 'start_bytes', 'end_bytes', 'peak_bytes', 'duration',
+                 'top_sites', '_snapshot', '_snapshot_bytes', '_start')
+
+    def __init__(self, name: str, start_bytes: int):
+        self.name = name
+        self.start_bytes = start_bytes
+        self.end_bytes = start_bytes
+        self.peak_bytes = start_bytes
+        self.duration = 0.0
+        self.top_sites: List[str] = []
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._snapshot_bytes = 0
+        self._start = time.perf_counter()
+
+    @property
+    def peak_increase(self) -> int:
+        """開始時点からのピーク増加量（バイト）"""
+        return self.peak_bytes - self.start_bytes
+
+    @property
+    def net_increase(self) -> int:
+        """終了時点で残っている増加量（バイト）"""
+        return self.end_bytes - self.start_bytes
+
+
+class CommandProfiler:
+    """トップレベルコマンドのプロファイラ（with 文で使用）"""
+
+    def __init__(self, command: str, output_dir: Optional[str] = DEFAULT_PROFILE_DIR,
+                 top: int = DEFAULT_PROFILE_TOP, cpu: bool = True, memory: bool = False,
+                 stream: Optional[TextIO] = None):
+        """
+        プロファイラ初期化
+
+        Args:
+            command: コマンド名（出力ファイル名に使用）
+            output_dir: 出力ディレクトリ（None の場合はファイルを出力しない）
+            top: 表示する上位関数の数
+            cpu: cProfile で計測するか
+            memory: tracemalloc でステージごとのメモリを計測するか
+            stream: 報告の出力先（デフォルト: 標準エラー出力）
+        """
+        self.command = command
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.top = top
+        self.memory = memory
+        self.stream = stream
+        self.profile = cProfile.Profile() if cpu else None
+        # スレッドID → プロファイラ（計測中に開始したスレッドの分を含む）
+        self._profiles: Dict[int, cProfile.Profile] = {}
+        self.stages: List[MemoryStage] = []
+        self.output_files: List[Path] = []
+        self._open_stages: List[MemoryStage] = []
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+        self._previous: Optional[CommandProfiler] = None
+
+    def __enter__(self) -> 'CommandProfiler':
+        global _active_profiler
+        self._previous = _active_profiler
+        _active_profiler = self
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.profile is not None:
+            self._profiles[threading.get_ident()] = self.profile
+            threading.setprofile(self._profile_thread)
+            self.profile.enable()
+        if self.memory:
+            self._begin_stage(self.command)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        global _active_profiler
+        if self.memory:
+            self._end_stage(self._open_stages[0])
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        if self.profile is not None:
+            self.profile.disable()
+            threading.setprofile(None)
+        _active_profiler = self._previous
+        self.report()
+        return False
+
+    def stage(self, name: str) -> '_StageContext':
+        """メモリ計測ステージを作成（with 文で使用）"""
+        return _StageContext(self, name)
+
+    def _begin_stage(self, name: str) -> MemoryStage:
+        self._pause_cpu()
+        try:
+            with self._lock:
+                # reset_peak の前に、それまでのピークを実行中の外側ステージへ反映する
+                before, peak = tracemalloc.get_traced_memory()
+                for stage in self._open_stages:
+                    stage.peak_bytes = max(stage.peak_bytes, peak)
+                snapshot = _take_snapshot()
+                current = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                stage = MemoryStage(name, current)
+                stage._snapshot = snapshot
+                # ステージ中に保持するスナップショット自体の大きさ（外側ステージのピークからは除く）
+                stage._snapshot_bytes = current - before
+                self._open_stages.append(stage)
+                return stage
+        finally:
+            self._resume_cpu()
+
+    def _end_stage(self, stage: MemoryStage):
+        self._pause_cpu()
+        try:
+            with self._lock:
+                current, peak = tracemalloc.get_traced_memory()
+                stage.duration = time.perf_counter() - stage._start
+                stage.end_bytes = current
+                stage.peak_bytes = max(stage.peak_bytes, peak)
+                self._open_stages.remove(stage)
+                for outer in self._open_stages:
+                    outer.peak_bytes = max(outer.peak_bytes, stage.peak_bytes - stage._snapshot_bytes)
+            snapshot = _take_snapshot()
+            stage.top_sites = [
+                str(diff) for diff in snapshot.compare_to(stage._snapshot, 'lineno')[:MEMORY_TOP_SITES]
+                if diff.size_diff > 0
+            ]
+            stage._snapshot = None
+            with self._lock:
+                self.stages.append(stage)
+        finally:
+            self._resume_cpu()
+
+    def _profile_thread(self, frame, event, arg):
+        # 計測中に開始したスレッドの最初のイベントで、そのスレッド用のプロファイラに切り替える
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles[threading.get_ident()] = profile
+        profile.enable()
+
+    def _pause_cpu(self):
+        # スナップショット取得の時間を cProfile の結果に含めない
+        profile = self._profiles.get(threading.get_ident())
+        if profile is not None:
+            profile.disable()
+
+    def _resume_cpu(self):
+        profile = self._profiles.get(threading.get_ident())
+        if profile is not None:
+            profile.enable()
+
+    def cpu_stats(self, stream: Optional[TextIO] = None) -> pstats.Stats:
+        """全スレッドの統計を合算した pstats.Stats"""
+        with self._lock:
+            profiles = [profile for profile in self._profiles.values() if profile is not self.profile]
+        stats = pstats.Stats(self.profile, stream=stream)
+        if profiles:
+            stats.add(*profiles)
+        return stats
+
+    def top_functions(self) -> str:
+        """累積時間の上位関数（pstats の表形式）"""
+        buffer = io.StringIO()
+        stats = self.cpu_stats(stream=buffer)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        return buffer.getvalue()
+
+    def collapsed_stacks(self) -> Dict[str, int]:
+        """collapsed stack 形式（"呼び出し元;…;関数" → 自己時間[μs]）"""
+        return collapse_stats(self.cpu_stats().stats)
+
+    def memory_report(self) -> str:
+        """ステージごとのピークメモリ（開始順）"""
+        stages = sorted(self.stages, key=lambda stage: stage._start)
+        lines = [f"{'stage':<40} {'peak MB':>10} {'net MB':>10} {'time s':>9}"]
+        for stage in stages:
+            lines.append(f"{stage.name:<40} {stage.peak_increase / 1024 / 1024:10.2f} "
+                         f"{stage.net_increase / 1024 / 1024:10.2f} {stage.duration:9.3f}")
+        for stage in stages:
+            if stage.top_sites:
+                lines.append('')
+                lines.append(f"[{stage.name}] 増加量の多い割り当て箇所")
+                lines.extend(f"  {site}" for site in stage.top_sites)
+        return '\n'.join(lines) + '\n'
+
+    def report(self):
+        """結果をファイルに出力し、上位関数・メモリを表示"""
+        stream = self.stream or sys.stderr
+        base = self._output_base()
+        if self.profile is not None:
+            top_functions = self.top_functions()
+            if base is not None:
+                pstats_path = base.with_suffix('.pstats')
+                self.cpu_stats().dump_stats(str(pstats_path))
+                collapsed_path = base.with_suffix('.collapsed')
+                write_collapsed(self.collapsed_stacks(), collapsed_path)
+                self.output_files.extend([pstats_path, collapsed_path])
+            print(f"\n=== プロファイル: {self.command}（累積時間 上位{self.top}件） ===", file=stream)
+            print(top_functions, file=stream)
+        if self.memory:
+            memory_report = self.memory_report()
+            if base is not None:
+                memory_path = base.with_suffix('.memory.txt')
+                memory_path.write_text(memory_report, encoding='utf-8')
+                self.output_files.append(memory_path)
+            print(f"\n=== メモリプロファイル: {self.command} ===", file=stream)
+            print(memory_report, file=stream)
+        for path in self.output_files:
+            print(f"📁 プロファイル出力: {path}", file=stream)
+
+    def _output_base(self) -> Optional[Path]:
+        if self.output_dir is None:
+            return None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in self.command)
+        return self.output_dir / f"{name}_{timestamp}_{os.getpid()}"
+
+
+class _StageContext:
+    """メモリ計測ステージ"""
+
+    __slots__ = ('_profiler', '_name', '_stage')
+
+    def __init__(self, profiler: CommandProfiler, name: str):
+        self._profiler = profiler
+        self._name = name
+        self._stage = None
+
+    def __enter__(self) -> '_StageContext':
+        self._stage = self._profiler._begin_stage(self._name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self._profiler._end_stage(self._stage)
+        return False
+
+
+class _NoopContext:
+    """プロファイル無効時のコンテキスト（何もしない）"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NoopContext':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+
+_NOOP_CONTEXT = _NoopContext()
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+def _frame_name(func: FuncKey) -> str:
+    file_name, line, name = func
+    if file_name == '~' and line == 0:
+        # 組み込み関数（例: "<built-in method builtins.len>"）
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(file_name)}:{line})"
+    return label.replace(';', ':')
+
+
+def collapse_stats(stats: Dict[FuncKey, Tuple[Any, ...]],
+                   max_depth: int = MAX_STACK_DEPTH,
+                   min_fraction: float = MIN_STACK_FRACTION) -> Dict[str, int]:
+    """
+    pstats の統計を collapsed stack 形式に変換
+
+    cProfile は呼び出し元→関数の辺ごとの時間しか持たないため、ルートから辺をたどり、
+    関数の累積時間を呼び出し元ごとの比率で配分して経路ごとの自己時間を推定する
+
+    Args:
+        stats: pstats.Stats.stats（関数 → (cc, nc, tt, ct, callers)）
+        max_depth: スタックの最大の深さ
+        min_fraction: 出力する最小の割合（総時間に対する比率）
+
+    Returns:
+        "ルート;…;関数" → 自己時間（マイクロ秒）
+    """
+    callees: Dict[FuncKey, List[Tuple[FuncKey, float]]] = defaultdict(list)
+    roots = []
+    for func, (_, _, _, _, callers) in stats.items():
+        known_callers = [caller for caller in callers if caller in stats and caller != func]
+        if not known_callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            if caller in stats and caller != func:
+                callees[caller].append((func, edge[3]))
+
+    total = sum(stats[root][3] for root in roots)
+    threshold = total * min_fraction
+    collapsed: Dict[str, float] = defaultdict(float)
+
+    def walk(func: FuncKey, time_on_path: float, stack: List[FuncKey], names: List[str]):
+        cumulative = stats[func][3]
+        ratio = time_on_path / cumulative if cumulative > 0 else 0.0
+        names.append(_frame_name(func))
+        stack.append(func)
+        self_time = stats[func][2] * ratio
+        if self_time > 0:
+            collapsed[';'.join(names)] += self_time
+        if len(stack) < max_depth:
+            for callee, edge_time in callees.get(func, ()):
+                child_time = edge_time * ratio
+                # 再帰呼び出し（経路上に既にある関数）は自己時間として親に含める
+                if child_time < threshold or callee in stack:
+                    continue
+                walk(callee, child_time, stack, names)
+        stack.pop()
+        names.pop()
+
+    for root in roots:
+        if stats[root][3] >= threshold:
+            walk(root, stats[root][3], [], [])
+
+    return {stack: int(round(seconds * 1e6)) for stack, seconds in collapsed.items()
+            if seconds * 1e6 >= 1}
+
+
+def write_collapsed(collapsed: Dict[str, int], file_path: Path) -> Path:
+    """collapsed stack 形式（1行に "スタック 値"）で出力"""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for stack, value in sorted(collapsed.items()):
+            f.write(f"{stack} {value}\n")
+    return file_path
+
+
+def profile_command(args: argparse.Namespace, command: Optional[str]):
+    """
+    コマンドライン引数に従ってコマンドをプロファイル（with 文で使用）
+
+    --profile / --profile-memory のどちらも指定されていない場合は何もしない
+    """
+    output_dir = getattr(args, 'profile', None)
+    memory = getattr(args, 'profile_memory', False)
+    if not output_dir and not memory:
+        return _NOOP_CONTEXT
+    return CommandProfiler(
+        command or 'main',
+        output_dir=output_dir or DEFAULT_PROFILE_DIR,
+        top=getattr(args, 'profile_top', DEFAULT_PROFILE_TOP),
+        cpu=bool(output_dir),
+        memory=memory,
+    )
+
+
+def profile_stage(name: str):
+    """メモリ計測ステージ（--profile-memory 実行中以外は何もしない）"""
+    profiler = _active_profiler
+    if profiler is None or not profiler.memory:
+        return _NOOP_CONTEXT
+    return profiler.stage(name)
@@ -0,0 +1,286 @@
+"""
+スパントレーシング
+処理単位（スパン）の親子関係と属性（テーブル名・ファイル・読み込みバイト数など）を記録し、
+Chrome trace-event 形式の JSON（chrome://tracing / Perfetto で表示可能）で出力する
+
+- 親スパンは contextvars で管理する（スレッドプールへは contextvars.copy_context() で引き継ぐ）
+- 無効時（デフォルト）の span() は共有の何もしないスパンを返すため、常時組み込んでおける
+- 環境変数 DB_TOOLS_TRACE に出力先を指定すると、有効化してプロセス終了時に出力する
+
+使い方:
+    with trace_span("ddl.parse", category="parser", file=str(path)) as span:
+        ...
+        span.set_attribute("bytes", len(content))
+
+    @traced("check.column_consistency", category="check")
+    def run(...):
+        ...
+
+    get_tracer().export_chrome_trace("trace.json")
+
+要求仕様ID: PLT.1-WEB.1 (システム基盤要件)
+"""
+
+import atexit
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# 有効化と出力先を指定する環境変数（例: DB_TOOLS_TRACE=trace.json）
+TRACE_ENV_VAR = 'DB_TOOLS_TRACE'
+
+# 保持するスパン数の上限（超えた分は記録せず dropped に数える）
+DEFAULT_MAX_SPANS = 1000000
+
+# 実行中のスパン（子スパンの親になる）
+_current_span: 'contextvars.ContextVar[Optional[Span]]' = contextvars.ContextVar(
+    'db_tools_current_span', default=None
+)
+
+
+class Span:
+    """スパン（with 文で開始・終了する）"""
+
+    __slots__ = ('name', 'category', 'attributes', 'span_id', 'parent_id', 'thread_id',
+                 'start_ns', 'end_ns', '_tracer', '_token')
+
+    def __init__(self, tracer: 'Tracer', name: str, category: str = '',
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.category = category
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.span_id = 0
+        self.parent_id = 0
+        self.thread_id = 0
+        self.start_ns = 0
+        self.end_ns = 0
+        self._tracer = tracer
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        """属性を設定"""
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any):
+        """複数の属性を設定"""
+        self.attributes.update(attributes)
+
+    @property
+    def duration(self) -> float:
+        """所要時間（秒）"""
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def __enter__(self) -> 'Span':
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent is not None else 0
+        self.span_id = self._tracer._next_id()
+        self.thread_id = self._tracer._register_thread()
+        self._token = _current_span.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.end_ns = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        self._token = None
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        self._tracer._finish(self)
+        return False
+
+
+class _NoopSpan:
+    """トレーシング無効時のスパン（何も記録しない）"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, **attributes: Any):
+        pass
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """スパンの記録と Chrome trace-event 形式への出力"""
+
+    def __init__(self, enabled: bool = False, max_spans: int = DEFAULT_MAX_SPANS):
+        """
+        トレーサー初期化
+
+        Args:
+            enabled: 記録を有効にするか
+            max_spans: 保持するスパン数の上限
+        """
+        self.enabled = enabled
+        self.max_spans = max_spans
+        self.dropped = 0
+        self._spans: List[Span] = []
+        self._thread_names: Dict[int, str] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    def span(self, name: str, category: str = '', **attributes: Any) -> Union[Span, _NoopSpan]:
+        """
+        スパンを作成（with 文で使用）
+
+        Args:
+            name: スパン名（例: "ddl.parse"）
+            category: 分類（例: "parser", "check", "generator"）
+            **attributes: 属性（テーブル名・ファイルなど）
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, category, attributes)
+
+    def traced(self, name: Optional[str] = None, category: str = '',
+               attributes: Optional[Callable[..., Dict[str, Any]]] = None):
+        """
+        関数をスパンで囲むデコレータ
+
+        Args:
+            name: スパン名（省略時は関数の修飾名）
+            category: 分類
+            attributes: 呼び出し引数から属性を作る関数（有効時のみ呼び出す）
+        """
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                span_attributes = attributes(*args, **kwargs) if attributes else {}
+                with Span(self, span_name, category, span_attributes):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def spans(self) -> List[Span]:
+        """終了したスパン（終了順）"""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """記録したスパンを削除"""
+        with self._lock:
+            self._spans.clear()
+            self.dropped = 0
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace-event 形式（完了イベント "X"）に変換"""
+        pid = os.getpid()
+        with self._lock:
+            spans = sorted(self._spans, key=lambda span: span.start_ns)
+            thread_names = dict(self._thread_names)
+
+        events: List[Dict[str, Any]] = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}}
+            for tid, thread_name in thread_names.items()
+        ]
+        for span in spans:
+            args = dict(span.attributes)
+            args['span_id'] = span.span_id
+            if span.parent_id:
+                args['parent_id'] = span.parent_id
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': (span.start_ns - self._origin_ns) / 1000,
+                'dur': (span.end_ns - span.start_ns) / 1000,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': args,
+            })
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'dropped_spans': self.dropped},
+        }
+
+    def export_chrome_trace(self, file_path: Union[str, Path]) -> Path:
+        """Chrome trace-event 形式の JSON を出力"""
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            # 属性の値は JSON に変換できない場合は文字列にする
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
+        return path
+
+    def _next_id(self) -> int:
+        return next(self._ids)
+
+    def _register_thread(self) -> int:
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        return thread_id
+
+    def _finish(self, span: Span):
+        with self._lock:
+            if len(self._spans) < self.max_spans:
+                self._spans.append(span)
+            else:
+                self.dropped += 1
+
+
+# グローバルインスタンス
+_trace_output = os.environ.get(TRACE_ENV_VAR)
+_tracer = Tracer(enabled=bool(_trace_output))
+
+
+def _export_on_exit():
+    if _tracer.spans():
+        _tracer.export_chrome_trace(_trace_output)
+
+
+if _trace_output:
+    atexit.register(_export_on_exit)
+
+
+def get_tracer() -> Tracer:
+    """グローバルトレーサー取得"""
+    return _tracer
+
+
+def enable_tracing(enabled: bool = True):
+    """トレーシングの有効・無効を切り替え"""
+    _tracer.enabled = enabled
+
+
+def trace_span(name: str, category: str = '', **attributes: Any) -> Union[Span, _NoopSpan]:
+    """スパンを作成（便利関数）"""
+    return _tracer.span(name, category, **attributes)
+
+
+def traced(name: Optional[str] = None, category: str = '',
+           attributes: Optional[Callable[..., Dict[str, Any]]] = None):
+    """関数をスパンで囲むデコレータ（便利関数）"""
+    return _tracer.traced(name, category, attributes)
+
+
+def current_span() -> Optional[Span]:
+    """実行中のスパン（トレーシング無効時・スパン外では None）"""
+    return _current_span.get()
+
+
+def export_chrome_trace(file_path: Union[str, Path]) -> Path:
+    """Chrome trace-event 形式の JSON を出力（便利関数）"""
+    return _tracer.export_chrome_trace(file_path)
@@ -9,8 +9,12 @@ YAML・DDL・定義書の統一解析機能
 
 from .unified_parser import UnifiedParser
 from .base_parser import BaseParser
+from .ddl_engine import parse_ddl_tables, load_ddl_tables, get_ddl_cache
 
 __all__ = [
     'UnifiedParser',
-    'BaseParser'
+    'BaseParser',
+    'parse_ddl_tables',
+    'load_ddl_tables',
+    'get_ddl_cache'
 ]
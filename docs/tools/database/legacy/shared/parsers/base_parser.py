@@ -19,6 +19,13 @@ from ..core.exceptions import ParsingError
 logger = get_logger(__name__)
 
 
+def source_trace_attributes(parser: 'BaseParser', source: Any) -> Dict[str, Any]:
+    """parse() のスパン属性（ファイルパスはそのまま、文字列は長さのみ）"""
+    if isinstance(source, Path) or (isinstance(source, str) and '\n' not in source and len(source) <= 260):
+        return {'file': str(source)}
+    return {'bytes': len(str(source))}
+
+
 class BaseParser(ABC):
     """パーサーベースクラス"""
     
@@ -26,20 +33,54 @@ class BaseParser(ABC):
         """初期化"""
         self.config = config or Config()
         self.logger = get_logger(self.__class__.__name__)
+        self._validation_enabled = True
+        self._strict_mode = False
     
     @abstractmethod
     def parse(self, source: Path) -> TableDefinition:
         """解析実行（サブクラスで実装）"""
         pass
     
-    @abstractmethod
-    def validate(self, source: Path) -> List[CheckResult]:
-        """バリデーション実行（サブクラスで実装）"""
-        pass
+    def validate(self, result: TableDefinition) -> List[CheckResult]:
+        """共通のバリデーション（サブクラスは結果に固有の検証を追加する）"""
+        results = []
+        if not result.columns:
+            results.append(self._create_error_result("カラムが定義されていません", result.table_name))
+        return results
+    
+    def set_validation_enabled(self, enabled: bool):
+        """解析後のバリデーション有無を設定"""
+        self._validation_enabled = enabled
+    
+    def set_strict_mode(self, strict: bool):
+        """バリデーションエラー時に例外とするかを設定"""
+        self._strict_mode = strict
+    
+    def _log_parsing_start(self, source: Any):
+        """解析開始ログ"""
+        self.logger.debug(f"解析開始: {self._describe_source(source)}")
+    
+    def _log_parsing_complete(self, source: Any, count: int):
+        """解析完了ログ"""
+        self.logger.debug(f"解析完了: {self._describe_source(source)} ({count}件)")
     
-    def _handle_parsing_error(self, error: Exception, source: Path) -> ParsingError:
+    def _log_validation_results(self, results: List[CheckResult]):
+        """バリデーション結果ログ"""
+        for result in results:
+            self.logger.warning(f"検証: {result.message}")
+    
+    @staticmethod
+    def _describe_source(source: Any) -> str:
+        """ログ用のソース表記（文字列ソースは長さのみ）"""
+        if isinstance(source, Path) or (isinstance(source, str) and '\n' not in source and len(source) < 260):
+            return str(source)
+        return f"<{len(str(source))} chars>"
+    
+    def _handle_parsing_error(self, error: Exception, source: Any, prefix: str = "解析エラー") -> ParsingError:
         """解析エラーの統一処理"""
-        error_msg = f"解析エラー: {source} - {str(error)}"
+        if isinstance(error, ParsingError):
+            return error
+        error_msg = f"{prefix}: {self._describe_source(source)} - {str(error)}"
         self.logger.error(error_msg)
         return ParsingError(error_msg)
     
@@ -97,3 +138,25 @@ class BaseParser(ABC):
         if not extensions:
             return True
         return file_path.suffix.lower() in extensions
+
+
+class ParserFactory:
+    """拡張子ごとのパーサー登録・生成"""
+    
+    _parsers: Dict[str, type] = {}
+    
+    @classmethod
+    def register_parser(cls, extension: str, parser_class: type):
+        """パーサーを登録"""
+        cls._parsers[extension.lower()] = parser_class
+    
+    @classmethod
+    def get_parser(cls, file_path: Path, config: Optional[Config] = None) -> Optional[BaseParser]:
+        """ファイル拡張子に対応するパーサーを生成（未登録の場合はNone）"""
+        parser_class = cls._parsers.get(Path(file_path).suffix.lower())
+        return parser_class(config) if parser_class else None
+    
+    @classmethod
+    def get_supported_extensions(cls) -> List[str]:
+        """登録済みの拡張子"""
+        return list(cls._parsers)
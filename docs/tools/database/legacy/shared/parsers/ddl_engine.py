@@ -0,0 +1,546 @@
+"""
+統合DDL解析エンジン
+CREATE TABLE・CREATE INDEX・ALTER TABLE文を1回の走査で解析し、
+共通モデル（TableDefinition）を返す。全てのDDLパーサー・チェッカーはこのエンジンを経由する。
+
+ファイル単位の解析結果は (パス, 更新時刻, サイズ) をキーにメモ化されるため、
+同じDDLファイルを複数のチェッカーが参照しても解析は1回で済む。
+
+要求仕様ID: PLT.1-WEB.1 (システム基盤要件)
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from ..core.models import (
+    TableDefinition, ColumnDefinition, IndexDefinition,
+    ForeignKeyDefinition, ConstraintDefinition
+)
+from ..monitoring.tracing import trace_span
+
+
+# ----------------------------------------------------------------------
+# 正規表現（モジュール読み込み時に1度だけコンパイル）
+# ----------------------------------------------------------------------
+
+_IDENT = r'[`"\[]?(\w+)[`"\]]?'
+_FK_ACTION = r'(?:SET\s+NULL|SET\s+DEFAULT|NO\s+ACTION|CASCADE|RESTRICT)'
+
+# テーブル名抽出
+TABLE_NAME_PATTERN = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?[`"\[]?(\w+)', re.IGNORECASE)
+
+# DDL文の種別ごとのパターン（結合して1回の走査で全種別を検出する）
+_STATEMENT_PATTERNS = (
+    ('create_table',
+     r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?[`"\[]?(?P<table_name>\w+)[`"\]]?\s*\('),
+    ('index',
+     r'CREATE\s+(?P<index_unique>UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?[`"\[]?(?P<index_name>\w+)[`"\]]?\s+'
+     r'ON\s+[`"\[]?(?P<index_table>\w+)[`"\]]?\s*(?:USING\s+(?P<index_type>\w+)\s*)?'
+     r'\(\s*(?P<index_columns>[^)]+)\s*\)\s*(?:COMMENT\s+[\'"](?P<index_comment>[^\'"]*)[\'"])?'),
+    ('alter_constraint',
+     r'ALTER\s+TABLE\s+(?:ONLY\s+)?[`"\[]?(?P<alter_table>\w+)[`"\]]?\s+ADD\s+'),
+)
+STATEMENT_PATTERN = re.compile(
+    '|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in _STATEMENT_PATTERNS),
+    re.IGNORECASE
+)
+
+# 制約定義（CREATE TABLE本文の制約行・ALTER TABLE ADD 以降の両方に使用）
+_CONSTRAINT_NAME = re.compile(r'CONSTRAINT\s+' + _IDENT + r'\s*', re.IGNORECASE)
+_PRIMARY_KEY_CLAUSE = re.compile(r'PRIMARY\s+KEY\s*\(([^)]+)\)', re.IGNORECASE)
+_FOREIGN_KEY_CLAUSE = re.compile(
+    r'FOREIGN\s+KEY\s*(?:' + _IDENT + r'\s*)?\(([^)]+)\)\s*REFERENCES\s+' + _IDENT +
+    r'\s*\(([^)]+)\)(?P<actions>(?:\s+ON\s+(?:UPDATE|DELETE)\s+' + _FK_ACTION + r')*)',
+    re.IGNORECASE
+)
+_UNIQUE_CLAUSE = re.compile(r'UNIQUE(?:\s+(?:KEY|INDEX))?\s*(?:' + _IDENT + r'\s*)?\(([^)]+)\)', re.IGNORECASE)
+_INDEX_CLAUSE = re.compile(r'(UNIQUE\s+)?(?:KEY|INDEX)\s+' + _IDENT + r'\s*\(([^)]+)\)', re.IGNORECASE)
+_CHECK_CLAUSE = re.compile(r'CHECK\s*\(', re.IGNORECASE)
+_FK_ACTION_PATTERN = re.compile(r'ON\s+(UPDATE|DELETE)\s+(' + _FK_ACTION + r')', re.IGNORECASE)
+
+# 制約行の先頭キーワード（カラム定義と区別する。check_status 等の同じ接頭辞のカラム名は除外）
+_CONSTRAINT_START = re.compile(
+    r'(?:CONSTRAINT|PRIMARY\s+KEY|FOREIGN\s+KEY|UNIQUE|CHECK|INDEX|KEY)(?=[\s(])', re.IGNORECASE
+)
+
+# カラム定義
+_COLUMN_HEAD = re.compile(r'[`"\[]?(\w+)[`"\]]?\s+(\w+(?:\s+PRECISION|\s+VARYING)?)(?:\s*\(([^)]*)\))?', re.IGNORECASE)
+_COMMENT_CLAUSE = re.compile(r'COMMENT\s+(?:\'([^\']*)\'|"([^"]*)")', re.IGNORECASE)
+_NOT_NULL = re.compile(r'\bNOT\s+NULL\b', re.IGNORECASE)
+_PRIMARY_KEY = re.compile(r'\bPRIMARY\s+KEY\b', re.IGNORECASE)
+_UNIQUE = re.compile(r'\bUNIQUE\b', re.IGNORECASE)
+_AUTO_INCREMENT = re.compile(r'\bAUTO_INCREMENT\b', re.IGNORECASE)
+_DEFAULT = re.compile(r'\bDEFAULT\s+(\'(?:[^\']|\'\')*\'|"[^"]*"|\w+\s*\([^)]*\)|[^\s,]+)', re.IGNORECASE)
+_INLINE_REFERENCES = re.compile(
+    r'\bREFERENCES\s+' + _IDENT + r'\s*\(([^)]+)\)(?P<actions>(?:\s+ON\s+(?:UPDATE|DELETE)\s+' + _FK_ACTION + r')*)',
+    re.IGNORECASE
+)
+_QUOTED_VALUE = re.compile(r"'((?:[^']|'')*)'")
+
+# テーブルオプション・ヘッダーコメント
+_ENGINE_OPTION = re.compile(r'ENGINE\s*=\s*(\w+)', re.IGNORECASE)
+_CHARSET_OPTION = re.compile(r'(?:DEFAULT\s+)?CHARSET\s*=\s*(\w+)', re.IGNORECASE)
+_COLLATE_OPTION = re.compile(r'COLLATE\s*=\s*(\w+)', re.IGNORECASE)
+_TABLE_COMMENT_OPTION = re.compile(r'COMMENT\s*=?\s*[\'"]([^\'"]*)[\'"]', re.IGNORECASE)
+_LOGICAL_NAME_COMMENT = re.compile(r'^--\s*論理名\s*[:：]\s*(.+?)\s*$', re.MULTILINE)
+
+# 括弧・引用符・カンマの位置（本文分割・対応括弧の検索用）
+_STRUCTURE_CHARS = re.compile(r'[(),\'"]')
+
+# 長さではなく精度・スケールを持つデータ型
+_PRECISION_SCALE_TYPES = frozenset(['DECIMAL', 'NUMERIC', 'FLOAT', 'DOUBLE', 'REAL'])
+_VALUE_LIST_TYPES = frozenset(['ENUM', 'SET'])
+_SERIAL_TYPES = frozenset(['SERIAL', 'BIGSERIAL', 'SMALLSERIAL'])
+
+# テーブル名プレフィックス -> カテゴリ
+_CATEGORY_PREFIXES = (
+    ('MST_', 'マスタ系'),
+    ('TRN_', 'トランザクション系'),
+    ('HIS_', '履歴系'),
+    ('SYS_', 'システム系'),
+    ('WRK_', 'ワーク系'),
+    ('IF_', 'インターフェイス系'),
+)
+
+
+# ----------------------------------------------------------------------
+# 走査ユーティリティ
+# ----------------------------------------------------------------------
+
+def split_top_level(section: str) -> List[str]:
+    """括弧・引用符の外側にあるカンマで分割（空要素は除外）"""
+    parts = []
+    start = 0
+    depth = 0
+    quote_char = None
+
+    for match in _STRUCTURE_CHARS.finditer(section):
+        char = match.group()
+        pos = match.start()
+        if char in ("'", '"'):
+            if pos > 0 and section[pos - 1] == '\\':
+                continue
+            if quote_char is None:
+                quote_char = char
+            elif char == quote_char:
+                quote_char = None
+            continue
+        if quote_char is not None:
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif depth == 0:
+            part = section[start:pos].strip()
+            if part:
+                parts.append(part)
+            start = pos + 1
+
+    tail = section[start:].strip()
+    if tail:
+        parts.append(tail)
+    return parts
+
+
+def find_closing_paren(content: str, open_pos: int) -> int:
+    """open_pos の '(' に対応する ')' の位置（引用符内は無視、見つからない場合は-1）"""
+    depth = 0
+    quote_char = None
+
+    for match in _STRUCTURE_CHARS.finditer(content, open_pos):
+        char = match.group()
+        pos = match.start()
+        if char in ("'", '"'):
+            if pos > 0 and content[pos - 1] == '\\':
+                continue
+            if quote_char is None:
+                quote_char = char
+            elif char == quote_char:
+                quote_char = None
+            continue
+        if quote_char is not None:
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return pos
+    return -1
+
+
+def iter_ddl_statements(content: str) -> Iterator[Tuple[str, 're.Match']]:
+    """
+    DDL本文を1回走査し、(種別, マッチ) を出現順に返す
+
+    種別は create_table・index・alter_constraint のいずれか。
+    create_table は本文の '(' までにマッチし、本文（対応する ')' まで）は読み飛ばす。
+    """
+    pos = 0
+    while True:
+        match = STATEMENT_PATTERN.search(content, pos)
+        if not match:
+            return
+        kind = match.lastgroup
+        yield kind, match
+        pos = match.end()
+        if kind == 'create_table':
+            end_pos = find_closing_paren(content, match.end() - 1)
+            if end_pos != -1:
+                pos = end_pos + 1
+
+
+def _split_names(text: str) -> List[str]:
+    return [name.strip().strip('`"[]') for name in text.split(',') if name.strip()]
+
+
+def _fk_actions(actions: Optional[str]) -> Dict[str, str]:
+    result = {'UPDATE': 'RESTRICT', 'DELETE': 'RESTRICT'}
+    for match in _FK_ACTION_PATTERN.finditer(actions or ''):
+        result[match.group(1).upper()] = re.sub(r'\s+', ' ', match.group(2).upper())
+    return result
+
+
+def infer_table_category(table_name: str) -> str:
+    """テーブル名のプレフィックスからカテゴリを推測"""
+    for prefix, category in _CATEGORY_PREFIXES:
+        if table_name.startswith(prefix):
+            return category
+    return '未分類'
+
+
+def format_column_type(column: ColumnDefinition) -> str:
+    """カラムのデータ型を長さ・精度付きの文字列に整形（例: VARCHAR(50), DECIMAL(10,2)）"""
+    if column.enum_values:
+        values = ','.join(f"'{value}'" for value in column.enum_values)
+        return f"{column.type}({values})"
+    if column.length is not None:
+        return f"{column.type}({column.length})"
+    if column.precision is not None and column.scale is not None:
+        return f"{column.type}({column.precision},{column.scale})"
+    if column.precision is not None:
+        return f"{column.type}({column.precision})"
+    return column.type
+
+
+# ----------------------------------------------------------------------
+# 解析本体
+# ----------------------------------------------------------------------
+
+def parse_ddl_tables(content: str) -> List[TableDefinition]:
+    """
+    DDL文字列を解析してテーブル定義のリストを返す
+
+    CREATE INDEX・ALTER TABLE ADD CONSTRAINT 文は対象テーブルの定義に紐づける
+    （対象テーブルが同じDDL内にない場合は無視する）。
+
+    Args:
+        content: DDL文字列
+
+    Returns:
+        CREATE TABLE文の出現順のテーブル定義
+    """
+    tables: Dict[str, TableDefinition] = {}
+    header_match = _LOGICAL_NAME_COMMENT.search(content)
+    logical_name = header_match.group(1) if header_match else None
+
+    for kind, match in iter_ddl_statements(content):
+        if kind == 'create_table':
+            table_def = _parse_create_table(content, match, logical_name if not tables else None)
+            if table_def and table_def.table_name not in tables:
+                tables[table_def.table_name] = table_def
+        elif kind == 'index':
+            table_def = tables.get(match.group('index_table'))
+            if table_def:
+                table_def.indexes.append(IndexDefinition(
+                    name=match.group('index_name'),
+                    columns=_split_names(match.group('index_columns')),
+                    unique=bool(match.group('index_unique')),
+                    comment=match.group('index_comment') or '',
+                    type=(match.group('index_type') or 'btree').lower()
+                ))
+        elif kind == 'alter_constraint':
+            table_def = tables.get(match.group('alter_table'))
+            if table_def:
+                _apply_constraint(content, match.end(), table_def)
+
+    return list(tables.values())
+
+
+def _parse_create_table(content: str, match: 're.Match',
+                        logical_name: Optional[str]) -> Optional[TableDefinition]:
+    """CREATE TABLE文（カラム定義・テーブル制約・テーブルオプション）を解析"""
+    table_name = match.group('table_name')
+    open_pos = match.end() - 1
+    close_pos = find_closing_paren(content, open_pos)
+    if close_pos == -1:
+        return None
+
+    semicolon_pos = content.find(';', close_pos + 1)
+    options = content[close_pos + 1:semicolon_pos if semicolon_pos != -1 else len(content)]
+
+    table_def = TableDefinition(
+        name=table_name,
+        table_name=table_name,
+        logical_name=logical_name or table_name,
+        category=infer_table_category(table_name),
+        priority='',
+        requirement_id=''
+    )
+    comment_match = _TABLE_COMMENT_OPTION.search(options)
+    if comment_match:
+        table_def.comment = comment_match.group(1)
+        table_def.description = table_def.comment
+    for key, pattern in (('engine', _ENGINE_OPTION), ('charset', _CHARSET_OPTION),
+                         ('collation', _COLLATE_OPTION)):
+        option_match = pattern.search(options)
+        if option_match:
+            table_def.metadata[key] = option_match.group(1)
+
+    for item in split_top_level(content[open_pos + 1:close_pos]):
+        # 行コメントを除去（カラム定義の前に書かれたコメント行）
+        lines = [line for line in item.splitlines() if not line.strip().startswith('--')]
+        item = '\n'.join(lines).strip()
+        if not item:
+            continue
+        if _CONSTRAINT_START.match(item):
+            _apply_constraint(item, 0, table_def)
+            continue
+        column = _parse_column(item, table_def)
+        if column:
+            table_def.columns.append(column)
+
+    return table_def
+
+
+def _parse_column(text: str, table_def: TableDefinition) -> Optional[ColumnDefinition]:
+    """単一カラム定義を解析（インラインREFERENCESは外部キーとして登録）"""
+    head = _COLUMN_HEAD.match(text)
+    if not head:
+        return None
+
+    base_type = re.sub(r'\s+', ' ', head.group(2).upper())
+    params = head.group(3)
+    rest = text[head.end():]
+
+    # フラグ判定はコメント文字列を除いた部分で行う
+    comment_match = _COMMENT_CLAUSE.search(rest)
+    comment = None
+    if comment_match:
+        comment = comment_match.group(1) if comment_match.group(1) is not None else comment_match.group(2)
+        rest = rest[:comment_match.start()] + rest[comment_match.end():]
+
+    column = ColumnDefinition(
+        name=head.group(1),
+        type=base_type,
+        nullable=not _NOT_NULL.search(rest),
+        primary_key=bool(_PRIMARY_KEY.search(rest)),
+        unique=bool(_UNIQUE.search(rest)),
+        comment=comment,
+        auto_increment=bool(_AUTO_INCREMENT.search(rest)) or base_type in _SERIAL_TYPES,
+    )
+
+    if params is not None:
+        if base_type in _VALUE_LIST_TYPES:
+            column.enum_values = [value.replace("''", "'") for value in _QUOTED_VALUE.findall(params)]
+        else:
+            numbers = [part.strip() for part in params.split(',')]
+            if base_type in _PRECISION_SCALE_TYPES and len(numbers) == 2 and all(n.isdigit() for n in numbers):
+                column.precision = int(numbers[0])
+                column.scale = int(numbers[1])
+            elif len(numbers) == 1 and numbers[0].isdigit():
+                column.length = int(numbers[0])
+
+    default_match = _DEFAULT.search(rest)
+    if default_match:
+        default_value = default_match.group(1)
+        if len(default_value) >= 2 and default_value[0] == default_value[-1] and default_value[0] in ("'", '"'):
+            default_value = default_value[1:-1]
+        column.default = default_value
+
+    check_match = _CHECK_CLAUSE.search(rest)
+    if check_match:
+        close_pos = find_closing_paren(rest, check_match.end() - 1)
+        if close_pos != -1:
+            column.check_constraint = rest[check_match.end():close_pos].strip()
+
+    references_match = _INLINE_REFERENCES.search(rest)
+    if references_match:
+        actions = _fk_actions(references_match.group('actions'))
+        table_def.foreign_keys.append(ForeignKeyDefinition(
+            name='',
+            columns=[column.name],
+            references_table=references_match.group(1),
+            references_columns=_split_names(references_match.group(2)),
+            on_update=actions['UPDATE'],
+            on_delete=actions['DELETE']
+        ))
+
+    return column
+
+
+def _apply_constraint(text: str, pos: int, table_def: TableDefinition) -> None:
+    """
+    制約定義（CREATE TABLE本文の制約行、またはALTER TABLE ADD 以降）をテーブル定義に反映
+
+    Args:
+        text: 制約定義を含む文字列
+        pos: 制約定義の開始位置
+        table_def: 反映先テーブル定義
+    """
+    constraint_name = ''
+    name_match = _CONSTRAINT_NAME.match(text, pos)
+    if name_match:
+        constraint_name = name_match.group(1)
+        pos = name_match.end()
+
+    primary_match = _PRIMARY_KEY_CLAUSE.match(text, pos)
+    if primary_match:
+        primary_columns = set(_split_names(primary_match.group(1)))
+        for column in table_def.columns:
+            if column.name in primary_columns:
+                column.primary_key = True
+                column.nullable = False
+        return
+
+    fk_match = _FOREIGN_KEY_CLAUSE.match(text, pos)
+    if fk_match:
+        actions = _fk_actions(fk_match.group('actions'))
+        table_def.foreign_keys.append(ForeignKeyDefinition(
+            name=constraint_name or fk_match.group(1) or '',
+            columns=_split_names(fk_match.group(2)),
+            references_table=fk_match.group(3),
+            references_columns=_split_names(fk_match.group(4)),
+            on_update=actions['UPDATE'],
+            on_delete=actions['DELETE']
+        ))
+        return
+
+    check_match = _CHECK_CLAUSE.match(text, pos)
+    if check_match:
+        close_pos = find_closing_paren(text, check_match.end() - 1)
+        if close_pos != -1:
+            table_def.constraints.append(ConstraintDefinition(
+                name=constraint_name,
+                type='CHECK',
+                condition=text[check_match.end():close_pos].strip()
+            ))
+        return
+
+    unique_match = _UNIQUE_CLAUSE.match(text, pos)
+    if unique_match:
+        table_def.constraints.append(ConstraintDefinition(
+            name=constraint_name or unique_match.group(1) or '',
+            type='UNIQUE',
+            columns=_split_names(unique_match.group(2))
+        ))
+        return
+
+    index_match = _INDEX_CLAUSE.match(text, pos)
+    if index_match:
+        table_def.indexes.append(IndexDefinition(
+            name=index_match.group(2),
+            columns=_split_names(index_match.group(3)),
+            unique=bool(index_match.group(1))
+        ))
+
+
+# ----------------------------------------------------------------------
+# ファイル単位のメモ化
+# ----------------------------------------------------------------------
+
+CacheKey = Tuple[str, int, int]
+
+
+class DDLParseCache:
+    """
+    DDLファイルの解析結果キャッシュ（キー: パス・更新時刻・サイズ）
+
+    返却するテーブル定義は全ての呼び出し元で共有されるため、呼び出し側で変更しないこと
+    （変更が必要な場合は copy.deepcopy を使用する）。
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        初期化
+
+        Args:
+            max_entries: 保持するファイル数の上限（超えた場合は最も古いものから破棄）
+        """
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[CacheKey, List[TableDefinition]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(path: Path) -> CacheKey:
+        """ファイルのキャッシュキーを作成（ファイルが存在しない場合は FileNotFoundError）"""
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        return (str(resolved), stat.st_mtime_ns, stat.st_size)
+
+    def get_tables(self, path: Union[str, Path], content: Optional[str] = None) -> List[TableDefinition]:
+        """
+        DDLファイルの解析結果を取得（未解析・更新済みの場合のみ解析）
+
+        Args:
+            path: DDLファイルパス
+            content: 読み込み済みのファイル内容（指定時は再読み込みしない）
+
+        Returns:
+            テーブル定義のリスト
+        """
+        key = self.make_key(Path(path))
+        with trace_span("ddl.parse", category="parser", file=key[0]) as span:
+            with self._lock:
+                entry = self._entries.get(key[0])
+                if entry and entry[0] == key:
+                    self._entries.move_to_end(key[0])
+                    self.hits += 1
+                    span.set_attribute("cache", "hit")
+                    return list(entry[1])
+                self.misses += 1
+
+            if content is None:
+                with open(key[0], 'r', encoding='utf-8') as f:
+                    content = f.read()
+            tables = parse_ddl_tables(content)
+            span.set_attributes(cache="miss", bytes=key[2], tables=[table.table_name for table in tables])
+
+        with self._lock:
+            self._entries[key[0]] = (key, tables)
+            self._entries.move_to_end(key[0])
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return list(tables)
+
+    def clear(self) -> None:
+        """キャッシュと統計を初期化"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_statistics(self) -> Dict[str, int]:
+        """ヒット・ミス件数を取得"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+
+# プロセス内で共有するキャッシュ
+_default_cache = DDLParseCache()
+
+
+def load_ddl_tables(path: Union[str, Path], content: Optional[str] = None) -> List[TableDefinition]:
+    """DDLファイルを解析（プロセス内で共有するキャッシュを使用）"""
+    return _default_cache.get_tables(path, content)
+
+
+def get_ddl_cache() -> DDLParseCache:
+    """プロセス内で共有するDDL解析キャッシュを取得"""
+    return _default_cache
@@ -12,15 +12,23 @@ from pathlib import Path
 import yaml
 import re
 
+from . import ddl_engine
 from .base_parser import BaseParser
+from .ddl_engine import load_ddl_tables
+from ..core import models
+from ..performance.yaml_cache import cached_yaml_load
+from ..performance.cache_manager import cached, file_key, source_fingerprint
 from ..core.models import TableDefinition, CheckResult, ColumnDefinition, IndexDefinition, ForeignKeyDefinition
 from ..core.config import Config
 from ..core.logger import get_logger
 from ..core.exceptions import ParsingError, ValidationError
-from ..utils.file_utils import FileUtils
+from ..utils.file_utils import FileManager
 
 logger = get_logger(__name__)
 
+# 解析結果キャッシュのバージョン（解析ロジック・モデル定義のソースが変わると旧結果を再利用しない）
+PARSED_TABLES_VERSION = source_fingerprint(__file__, ddl_engine.__file__, models.__file__)
+
 
 class UnifiedParser(BaseParser):
     """統合パーサー - YAML・DDL・定義書の統一解析"""
@@ -28,7 +36,7 @@ class UnifiedParser(BaseParser):
     def __init__(self, config: Optional[Config] = None):
         """初期化"""
         super().__init__(config)
-        self.file_utils = FileUtils(config)
+        self.file_utils = FileManager(backup_enabled=False)
         self.supported_formats = {
             '.yaml': self._parse_yaml,
             '.yml': self._parse_yaml,
@@ -36,8 +44,16 @@ class UnifiedParser(BaseParser):
             '.md': self._parse_markdown
         }
     
+    @cached(namespace='parsed_tables', key=lambda self, source: file_key(source),
+            version=PARSED_TABLES_VERSION)
     def parse(self, source: Path) -> TableDefinition:
-        """統合解析実行"""
+        """
+        統合解析実行
+
+        解析結果は2層キャッシュ（名前空間: parsed_tables）に保存され、
+        ファイルまたは解析コード（PARSED_TABLES_VERSION）が変更されるまでCLI実行をまたいで再利用される。
+        返却値は変更しないこと。
+        """
         try:
             self._validate_file_exists(source)
             self._validate_file_readable(source)
@@ -94,8 +110,7 @@ class UnifiedParser(BaseParser):
     def _parse_yaml(self, yaml_path: Path) -> TableDefinition:
         """YAML形式の解析"""
         try:
-            with open(yaml_path, 'r', encoding=self.config.tool.encoding) as f:
-                data = yaml.safe_load(f)
+            data = cached_yaml_load(yaml_path)
             
             if not data:
                 raise ParsingError("YAMLファイルが空です")
@@ -143,43 +158,16 @@ class UnifiedParser(BaseParser):
             raise ParsingError(f"YAML処理エラー: {e}")
     
     def _parse_ddl(self, ddl_path: Path) -> TableDefinition:
-        """DDL形式の解析"""
+        """DDL形式の解析（統合DDL解析エンジンを使用）"""
         try:
-            with open(ddl_path, 'r', encoding=self.config.tool.encoding) as f:
-                ddl_content = f.read()
-            
-            # CREATE TABLE文の抽出
-            create_table_pattern = r'CREATE\s+TABLE\s+(\w+)\s*\((.*?)\);'
-            match = re.search(create_table_pattern, ddl_content, re.DOTALL | re.IGNORECASE)
-            
-            if not match:
-                raise ParsingError("CREATE TABLE文が見つかりません")
-            
-            table_name = match.group(1)
-            columns_section = match.group(2)
-            
-            # TableDefinition作成
-            table_def = TableDefinition(
-                table_name=table_name,
-                logical_name=table_name,  # DDLからは論理名を取得できないため物理名を使用
-                category='',
-                priority='中',
-                requirement_id='',
-                comment=f'DDLから生成: {table_name}'
-            )
-            
-            # カラム定義の解析
-            columns = self._parse_columns_from_ddl(columns_section)
-            table_def.columns.extend(columns)
-            
-            # インデックス定義の解析
-            indexes = self._parse_indexes_from_ddl(ddl_content, table_name)
-            table_def.indexes.extend(indexes)
-            
-            return table_def
-            
+            tables = load_ddl_tables(ddl_path)
         except Exception as e:
             raise ParsingError(f"DDL処理エラー: {e}")
+        
+        if not tables:
+            raise ParsingError("CREATE TABLE文が見つかりません")
+        
+        return tables[0]
     
     def _parse_markdown(self, md_path: Path) -> TableDefinition:
         """Markdown形式の解析"""
@@ -243,62 +231,12 @@ class UnifiedParser(BaseParser):
             comment=fk_data.get('comment', '')
         )
     
-    def _parse_columns_from_ddl(self, columns_section: str) -> List[ColumnDefinition]:
-        """DDLからカラム定義を解析"""
-        columns = []
-        
-        # カラム定義の正規表現パターン
-        column_pattern = r'(\w+)\s+([^,\n]+?)(?:,|\s*$)'
-        matches = re.findall(column_pattern, columns_section, re.MULTILINE)
-        
-        for name, definition in matches:
-            # 基本的なカラム情報を抽出
-            data_type = definition.strip().split()[0]
-            nullable = 'NOT NULL' not in definition.upper()
-            primary_key = 'PRIMARY KEY' in definition.upper()
-            unique = 'UNIQUE' in definition.upper()
-            
-            column = ColumnDefinition(
-                name=name,
-                data_type=data_type,
-                nullable=nullable,
-                primary_key=primary_key,
-                unique=unique,
-                comment=f'DDLから生成: {name}'
-            )
-            columns.append(column)
-        
-        return columns
-    
-    def _parse_indexes_from_ddl(self, ddl_content: str, table_name: str) -> List[IndexDefinition]:
-        """DDLからインデックス定義を解析"""
-        indexes = []
-        
-        # CREATE INDEX文の抽出
-        index_pattern = r'CREATE\s+(?:UNIQUE\s+)?INDEX\s+(\w+)\s+ON\s+' + table_name + r'\s*\((.*?)\);'
-        matches = re.findall(index_pattern, ddl_content, re.IGNORECASE)
-        
-        for name, columns_str in matches:
-            columns = [col.strip() for col in columns_str.split(',')]
-            unique = 'UNIQUE' in ddl_content.upper()
-            
-            index = IndexDefinition(
-                name=name,
-                columns=columns,
-                unique=unique,
-                comment=f'DDLから生成: {name}'
-            )
-            indexes.append(index)
-        
-        return indexes
-    
     def _validate_yaml(self, yaml_path: Path) -> List[CheckResult]:
         """YAML形式のバリデーション"""
         results = []
         
         try:
-            with open(yaml_path, 'r', encoding=self.config.tool.encoding) as f:
-                data = yaml.safe_load(f)
+            data = cached_yaml_load(yaml_path)
             
             # 必須セクションチェック
             required_sections = ['revision_history', 'overview', 'notes', 'rules']
@@ -11,8 +11,10 @@ import yaml
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-from .base_parser import BaseParser
-from ..core.models import TableDefinition, ColumnDefinition, IndexDefinition, ForeignKeyDefinition
+from .base_parser import BaseParser, source_trace_attributes
+from ..performance.yaml_cache import cached_yaml_load, safe_load
+from ..core.models import TableDefinition, ColumnDefinition, IndexDefinition, ForeignKeyDefinition, CheckSeverity
+from ..monitoring.tracing import traced
 from ..core.exceptions import ParsingError, ValidationError
 
 
@@ -24,6 +26,7 @@ class YamlParser(BaseParser):
         self._required_fields = ['table_name', 'logical_name', 'columns']
         self._optional_fields = ['category', 'priority', 'requirement_id', 'indexes', 'foreign_keys', 'constraints']
     
+    @traced(category="parser", attributes=source_trace_attributes)
     def parse(self, source: Any) -> TableDefinition:
         """
         YAML詳細定義ファイルを解析
@@ -55,7 +58,7 @@ class YamlParser(BaseParser):
                 self._log_validation_results(validation_results)
                 
                 # エラーがある場合は例外発生
-                error_results = [r for r in validation_results if r.status == "error"]
+                error_results = [r for r in validation_results if r.severity == CheckSeverity.ERROR]
                 if error_results and self._strict_mode:
                     error_messages = [r.message for r in error_results]
                     raise ValidationError(
@@ -79,11 +82,10 @@ class YamlParser(BaseParser):
             if not file_path.exists():
                 raise ParsingError(f"YAMLファイルが見つかりません: {file_path}")
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return cached_yaml_load(file_path)
         else:
             # 文字列の場合
-            return yaml.safe_load(str(source))
+            return safe_load(str(source))
     
     def _validate_required_fields(self, yaml_data: Dict[str, Any], source: Any):
         """必須フィールドの検証"""
@@ -224,9 +226,9 @@ class YamlParser(BaseParser):
         # テーブル命名規則の検証
         if not table.name.isupper():
             results.append(CheckResult(
-                check_type="yaml_validation",
+                check_name="yaml_validation",
                 table_name=table.name,
-                status="warning",
+                severity="warning",
                 message="テーブル名は大文字で記述することを推奨します",
                 details={"table": table.name}
             ))
@@ -235,9 +237,9 @@ class YamlParser(BaseParser):
         valid_prefixes = ['MST_', 'TRN_', 'HIS_', 'SYS_', 'WRK_', 'IF_']
         if not any(table.name.startswith(prefix) for prefix in valid_prefixes):
             results.append(CheckResult(
-                check_type="yaml_validation",
+                check_name="yaml_validation",
                 table_name=table.name,
-                status="warning",
+                severity="warning",
                 message=f"テーブル名は適切なプレフィックス ({', '.join(valid_prefixes)}) で始めることを推奨します",
                 details={"table": table.name, "valid_prefixes": valid_prefixes}
             ))
@@ -245,9 +247,9 @@ class YamlParser(BaseParser):
         # 要求仕様IDの検証
         if not table.requirement_id:
             results.append(CheckResult(
-                check_type="yaml_validation",
+                check_name="yaml_validation",
                 table_name=table.name,
-                status="warning",
+                severity="warning",
                 message="要求仕様IDが設定されていません",
                 details={"table": table.name}
             ))
@@ -256,9 +258,9 @@ class YamlParser(BaseParser):
         for column in table.columns:
             if not column.requirement_id:
                 results.append(CheckResult(
-                    check_type="yaml_validation",
+                    check_name="yaml_validation",
                     table_name=table.name,
-                    status="info",
+                    severity="info",
                     message="カラムに要求仕様IDが設定されていません",
                     details={"table": table.name, "column": column.name}
                 ))
@@ -124,6 +124,17 @@ class PathResolver:
         """
         database_dir = PathResolver.get_database_dir()
         return database_dir / "data"
+    
+    @staticmethod
+    def get_cache_dir() -> Path:
+        """
+        ツール共有キャッシュディレクトリを取得
+        
+        Returns:
+            Path: プロジェクトルートの .cache（見つからない場合はカレントディレクトリの .cache）
+        """
+        project_root = PathResolver.get_project_root()
+        return (project_root or Path.cwd()) / ".cache"
 
 
 def setup_import_paths():
@@ -11,41 +11,77 @@ import time
 import hashlib
 import pickle
 import json
+import sys
+import sqlite3
+import functools
 from pathlib import Path
 from typing import Any, Optional, Dict, List, Union, Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 import threading
 from collections import OrderedDict
-import weakref
 
 from ..core.logger import get_logger
-from ..core.exceptions import CacheError
 from ..core.config import get_config
+from ..path_resolver import PathResolver
+from ..monitoring.metrics_collector import MetricsCollector, get_metrics_collector
 
 logger = get_logger(__name__)
 
+# 値のサイズ（バイト）を推定する関数
+SizeEstimator = Callable[[Any], int]
+
+# ディスクキャッシュ（2層キャッシュのディスク層）のファイル名
+RESULT_CACHE_FILE = 'results.sqlite3'
+
+
+def estimate_size(value: Any) -> int:
+    """
+    値のサイズを簡易推定（デフォルトの推定関数）
+
+    sys.getsizeof による浅いサイズに、コンテナの場合は直下の要素の浅いサイズを加算する。
+    要素数に比例するコストで済み、値全体を直列化しない。
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += sys.getsizeof(k) + sys.getsizeof(v)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += sys.getsizeof(item)
+    return size
+
+
+def estimate_size_pickle(value: Any) -> int:
+    """値のサイズを pickle 化後のバイト数で計算（正確だが値全体を直列化する）"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        # pickle化できない場合は簡易推定
+        return estimate_size(value)
+
 
 @dataclass
 class CacheEntry:
-    """キャッシュエントリ"""
+    """キャッシュエントリ（時刻は time.monotonic() の値）"""
     key: str
     value: Any
-    created_at: datetime
-    accessed_at: datetime
+    created_at: float
+    accessed_at: float
     access_count: int = 0
     ttl: Optional[float] = None  # seconds
     size: int = 0
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """有効期限チェック"""
         if self.ttl is None:
             return False
-        return (datetime.now() - self.created_at).total_seconds() > self.ttl
+        if now is None:
+            now = time.monotonic()
+        return now - self.created_at > self.ttl
     
-    def touch(self):
+    def touch(self, now: Optional[float] = None):
         """アクセス時刻更新"""
-        self.accessed_at = datetime.now()
+        self.accessed_at = time.monotonic() if now is None else now
         self.access_count += 1
 
 
@@ -71,13 +107,19 @@ class CacheStats:
 
 
 class LRUCache:
-    """LRU（Least Recently Used）キャッシュ"""
+    """
+    LRU（Least Recently Used）キャッシュ
+
+    合計サイズ・エントリ数は追加・削除時に差分で更新するため、get/put は O(1)。
+    有効期限は time.monotonic() で判定する（システム時刻の変更の影響を受けない）。
+    """
     
     def __init__(
         self, 
         max_size: int = 1000,
         max_memory: int = 100 * 1024 * 1024,  # 100MB
-        default_ttl: Optional[float] = None
+        default_ttl: Optional[float] = None,
+        size_estimator: Optional[SizeEstimator] = None
     ):
         """
         LRUキャッシュ初期化
@@ -86,16 +128,21 @@ class LRUCache:
             max_size: 最大エントリ数
             max_memory: 最大メモリ使用量（バイト）
             default_ttl: デフォルトTTL（秒）
+            size_estimator: 値のサイズ推定関数（省略時は estimate_size）
         """
         self.max_size = max_size
         self.max_memory = max_memory
         self.default_ttl = default_ttl
+        self.size_estimator = size_estimator or estimate_size
         
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = threading.RLock()
         self._stats = CacheStats()
         
-        logger.info(f"LRUキャッシュ初期化: max_size={max_size}, max_memory={max_memory}B")
+        logger.debug(f"LRUキャッシュ初期化: max_size={max_size}, max_memory={max_memory}B")
+    
+    def __len__(self) -> int:
+        return len(self._cache)
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -108,23 +155,23 @@ class LRUCache:
             Optional[Any]: キャッシュされた値
         """
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 self._stats.misses += 1
                 return None
             
-            entry = self._cache[key]
+            now = time.monotonic()
             
             # 有効期限チェック
-            if entry.is_expired():
-                del self._cache[key]
+            if entry.is_expired(now):
+                self._remove(key)
                 self._stats.misses += 1
                 self._stats.evictions += 1
-                self._update_stats()
                 return None
             
             # LRU更新（最後に移動）
             self._cache.move_to_end(key)
-            entry.touch()
+            entry.touch(now)
             
             self._stats.hits += 1
             return entry.value
@@ -139,48 +186,45 @@ class LRUCache:
             ttl: TTL（秒）
             
         Returns:
-            bool: 成功フラグ
+            bool: 成功フラグ（値が max_memory を超える場合は保存しない）
         """
         try:
-            # 値のサイズ計算
-            size = self._calculate_size(value)
-            
-            with self._lock:
-                now = datetime.now()
-                
-                # 既存エントリの更新
-                if key in self._cache:
-                    old_entry = self._cache[key]
-                    self._stats.total_size -= old_entry.size
-                
-                # 新しいエントリ作成
-                entry = CacheEntry(
-                    key=key,
-                    value=value,
-                    created_at=now,
-                    accessed_at=now,
-                    ttl=ttl or self.default_ttl,
-                    size=size
-                )
-                
-                # メモリ制限チェック
-                if self._stats.total_size + size > self.max_memory:
-                    self._evict_by_memory(size)
-                
-                # サイズ制限チェック
-                if len(self._cache) >= self.max_size:
-                    self._evict_by_size()
-                
-                # エントリ追加
-                self._cache[key] = entry
-                self._cache.move_to_end(key)
-                
-                self._update_stats()
-                return True
-                
+            # 値のサイズ計算（ロック外で実施）
+            size = self.size_estimator(value)
         except Exception as e:
             logger.error(f"キャッシュ保存エラー: {e}")
             return False
+        
+        if size > self.max_memory:
+            logger.debug(f"キャッシュ上限を超えるため保存しません: {key} ({size}B)")
+            with self._lock:
+                self._remove(key)
+            return False
+        
+        with self._lock:
+            now = time.monotonic()
+            
+            # 既存エントリは置き換えるため先に取り除く
+            self._remove(key)
+            
+            # 制限チェック（古いエントリから退避）
+            if self._stats.total_size + size > self.max_memory:
+                self._evict_by_memory(size)
+            if len(self._cache) >= self.max_size:
+                self._evict_by_size()
+            
+            # エントリ追加（末尾 = 最新）
+            self._cache[key] = CacheEntry(
+                key=key,
+                value=value,
+                created_at=now,
+                accessed_at=now,
+                ttl=ttl if ttl is not None else self.default_ttl,
+                size=size
+            )
+            self._stats.total_size += size
+            self._stats.entry_count = len(self._cache)
+            return True
     
     def delete(self, key: str) -> bool:
         """
@@ -193,11 +237,7 @@ class LRUCache:
             bool: 削除成功フラグ
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                self._update_stats()
-                return True
-            return False
+            return self._remove(key)
     
     def clear(self):
         """キャッシュをクリア"""
@@ -205,45 +245,31 @@ class LRUCache:
             self._cache.clear()
             self._stats = CacheStats()
     
+    def _remove(self, key: str) -> bool:
+        """エントリを削除して統計を差分更新（ロック取得済みで呼び出す）"""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._stats.total_size -= entry.size
+        self._stats.entry_count = len(self._cache)
+        return True
+    
+    def _evict_oldest(self):
+        """最も古いエントリを削除"""
+        _, oldest_entry = self._cache.popitem(last=False)
+        self._stats.total_size -= oldest_entry.size
+        self._stats.entry_count = len(self._cache)
+        self._stats.evictions += 1
+    
     def _evict_by_size(self):
         """サイズ制限による退避"""
-        while len(self._cache) >= self.max_size:
-            # 最も古いエントリを削除
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-            self._stats.evictions += 1
+        while self._cache and len(self._cache) >= self.max_size:
+            self._evict_oldest()
     
     def _evict_by_memory(self, required_size: int):
         """メモリ制限による退避"""
-        while (self._stats.total_size + required_size > self.max_memory and 
-               len(self._cache) > 0):
-            # 最も古いエントリを削除
-            oldest_key = next(iter(self._cache))
-            oldest_entry = self._cache[oldest_key]
-            self._stats.total_size -= oldest_entry.size
-            del self._cache[oldest_key]
-            self._stats.evictions += 1
-    
-    def _calculate_size(self, value: Any) -> int:
-        """値のサイズを計算"""
-        try:
-            return len(pickle.dumps(value))
-        except Exception:
-            # pickle化できない場合は推定サイズ
-            if isinstance(value, str):
-                return len(value.encode('utf-8'))
-            elif isinstance(value, (list, tuple)):
-                return sum(self._calculate_size(item) for item in value)
-            elif isinstance(value, dict):
-                return sum(self._calculate_size(k) + self._calculate_size(v) 
-                          for k, v in value.items())
-            else:
-                return 1024  # デフォルト1KB
-    
-    def _update_stats(self):
-        """統計更新"""
-        self._stats.entry_count = len(self._cache)
-        self._stats.total_size = sum(entry.size for entry in self._cache.values())
+        while self._cache and self._stats.total_size + required_size > self.max_memory:
+            self._evict_oldest()
     
     def get_stats(self) -> CacheStats:
         """統計取得"""
@@ -253,15 +279,14 @@ class LRUCache:
     def cleanup_expired(self) -> int:
         """期限切れエントリのクリーンアップ"""
         with self._lock:
+            now = time.monotonic()
             expired_keys = [
                 key for key, entry in self._cache.items()
-                if entry.is_expired()
+                if entry.is_expired(now)
             ]
             
             for key in expired_keys:
-                del self._cache[key]
-            
-            self._update_stats()
+                self._remove(key)
             
             if expired_keys:
                 logger.debug(f"期限切れエントリを削除: {len(expired_keys)}個")
@@ -269,6 +294,87 @@ class LRUCache:
             return len(expired_keys)
 
 
+class StripedLRUCache:
+    """
+    ロックストライプ方式のLRUキャッシュ（スレッドプールからの並行アクセス用）
+
+    キーのハッシュ値で複数の LRUCache（ストライプ）に振り分け、ロック競合を減らす。
+    LRU順序・容量制限はストライプ単位で管理する（全体では近似LRU）。
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_memory: int = 100 * 1024 * 1024,  # 100MB
+        default_ttl: Optional[float] = None,
+        size_estimator: Optional[SizeEstimator] = None,
+        stripes: int = 16
+    ):
+        """
+        初期化
+        
+        Args:
+            max_size: 最大エントリ数（全ストライプ合計）
+            max_memory: 最大メモリ使用量（バイト、全ストライプ合計）
+            default_ttl: デフォルトTTL（秒）
+            size_estimator: 値のサイズ推定関数（省略時は estimate_size）
+            stripes: ストライプ数
+        """
+        if stripes < 1:
+            raise ValueError(f"stripes は1以上を指定してください: {stripes}")
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.default_ttl = default_ttl
+        self._stripes = [
+            LRUCache(
+                max_size=max(1, -(-max_size // stripes)),
+                max_memory=max(1, -(-max_memory // stripes)),
+                default_ttl=default_ttl,
+                size_estimator=size_estimator
+            )
+            for _ in range(stripes)
+        ]
+    
+    def __len__(self) -> int:
+        return sum(len(stripe) for stripe in self._stripes)
+    
+    def _stripe(self, key: str) -> LRUCache:
+        return self._stripes[hash(key) % len(self._stripes)]
+    
+    def get(self, key: str) -> Optional[Any]:
+        """キャッシュから値を取得"""
+        return self._stripe(key).get(key)
+    
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """キャッシュに値を保存"""
+        return self._stripe(key).put(key, value, ttl)
+    
+    def delete(self, key: str) -> bool:
+        """キャッシュから削除"""
+        return self._stripe(key).delete(key)
+    
+    def clear(self):
+        """キャッシュをクリア"""
+        for stripe in self._stripes:
+            stripe.clear()
+    
+    def get_stats(self) -> CacheStats:
+        """統計取得（全ストライプの合計）"""
+        total = CacheStats()
+        for stripe in self._stripes:
+            stats = stripe.get_stats()
+            total.hits += stats.hits
+            total.misses += stats.misses
+            total.evictions += stats.evictions
+            total.total_size += stats.total_size
+            total.entry_count += stats.entry_count
+        return total
+    
+    def cleanup_expired(self) -> int:
+        """期限切れエントリのクリーンアップ"""
+        return sum(stripe.cleanup_expired() for stripe in self._stripes)
+
+
 class FileCache(LRUCache):
     """ファイル内容専用キャッシュ"""
     
@@ -373,6 +479,339 @@ class ResultCache:
             logger.debug(f"パターンマッチで削除: {pattern} -> {len(keys_to_delete)}個")
 
 
+class DiskCache:
+    """
+    SQLiteによるディスクキャッシュ（CLI実行をまたいで結果を保持する）
+
+    値は pickle 化して保存し、名前空間単位で無効化できる。
+    合計サイズが上限を超えた場合は最終利用時刻の古いものから削除する（LRU）。
+    合計サイズは meta テーブルの1行にトリガーで保持し、保存のたびに全件を集計しない
+    （複数プロセスが同じファイルを更新しても一致する）。
+    有効期限はプロセスをまたいで判定するため、システム時刻（time.time()）で管理する。
+    """
+    
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " namespace TEXT NOT NULL,"
+        " key TEXT NOT NULL,"
+        " value BLOB NOT NULL,"
+        " size INTEGER NOT NULL,"
+        " expires_at REAL,"
+        " accessed_at REAL NOT NULL,"
+        " PRIMARY KEY (namespace, key))",
+        "CREATE INDEX IF NOT EXISTS idx_entries_accessed_at ON entries (accessed_at)",
+        "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+        # 既存のキャッシュファイルは作成時点の合計から開始する
+        "INSERT OR IGNORE INTO meta (name, value)"
+        " SELECT 'total_size', coalesce(sum(size), 0) FROM entries",
+        "CREATE TRIGGER IF NOT EXISTS entries_size_insert AFTER INSERT ON entries BEGIN"
+        " UPDATE meta SET value = value + new.size WHERE name = 'total_size'; END",
+        "CREATE TRIGGER IF NOT EXISTS entries_size_update AFTER UPDATE OF size ON entries BEGIN"
+        " UPDATE meta SET value = value - old.size + new.size WHERE name = 'total_size'; END",
+        "CREATE TRIGGER IF NOT EXISTS entries_size_delete AFTER DELETE ON entries BEGIN"
+        " UPDATE meta SET value = value - old.size WHERE name = 'total_size'; END",
+    )
+    
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        max_bytes: int = 512 * 1024 * 1024  # 512MB
+    ):
+        """
+        初期化
+        
+        Args:
+            db_path: SQLiteファイルパス
+            max_bytes: 保存する値の合計サイズ上限（バイト）
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """値を取得（存在しない・期限切れ・読み込み失敗の場合はNone）"""
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?",
+                    (namespace, key)
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                now = time.time()
+                value, expires_at = row
+                if expires_at is not None and expires_at < now:
+                    conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                    return None
+                
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, namespace, key)
+                )
+                return pickle.loads(value)
+            except Exception as e:
+                logger.warning(f"ディスクキャッシュ読み込みエラー ({namespace}:{key}): {e}")
+                return None
+    
+    def put(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """値を保存（pickle化できない値・上限を超える値は保存しない）"""
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"ディスクキャッシュに保存できない値です ({namespace}:{key}): {e}")
+            return False
+        if len(payload) > self.max_bytes:
+            return False
+        
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                # INSERT OR REPLACE は置換時に削除トリガーが動かないため UPSERT で更新する
+                conn.execute(
+                    "INSERT INTO entries (namespace, key, value, size, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value,"
+                    " size = excluded.size, expires_at = excluded.expires_at,"
+                    " accessed_at = excluded.accessed_at",
+                    (namespace, key, payload, len(payload),
+                     now + ttl if ttl is not None else None, now)
+                )
+                self._evict(conn)
+                return True
+            except Exception as e:
+                logger.warning(f"ディスクキャッシュ書き込みエラー ({namespace}:{key}): {e}")
+                return False
+    
+    def delete(self, namespace: str, key: str) -> bool:
+        """値を削除"""
+        return self._execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key)) > 0
+    
+    def invalidate_namespace(self, namespace: str) -> int:
+        """名前空間内の全エントリを削除"""
+        return self._execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+    
+    def cleanup_expired(self) -> int:
+        """期限切れエントリを削除"""
+        return self._execute(
+            "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+        )
+    
+    def clear(self) -> int:
+        """全エントリを削除"""
+        return self._execute("DELETE FROM entries", ())
+    
+    def total_size(self) -> int:
+        """保存している値の合計サイズ（バイト）"""
+        with self._lock:
+            try:
+                return self._connect().execute(
+                    "SELECT value FROM meta WHERE name = 'total_size'"
+                ).fetchone()[0]
+            except Exception as e:
+                logger.warning(f"ディスクキャッシュ操作エラー: {e}")
+                return 0
+    
+    def close(self):
+        """接続を閉じる"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """接続を取得（初回のみ作成）"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+            # 複数プロセスからの同時利用に備えてWALモードを使用
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # 合計サイズの初期化とトリガー作成の間に他プロセスが書き込まないよう1トランザクションで作成
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in self._SCHEMA:
+                    conn.execute(statement)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+    
+    def _execute(self, sql: str, params: tuple) -> int:
+        """更新系SQLを実行して影響行数を返す（失敗時は0）"""
+        with self._lock:
+            try:
+                return self._connect().execute(sql, params).rowcount
+            except Exception as e:
+                logger.warning(f"ディスクキャッシュ操作エラー: {e}")
+                return 0
+    
+    def _evict(self, conn: sqlite3.Connection):
+        """合計サイズが上限を超えた分を最終利用時刻の古いものから削除"""
+        total = conn.execute("SELECT value FROM meta WHERE name = 'total_size'").fetchone()[0]
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        
+        victims = []
+        for rowid, size in conn.execute("SELECT rowid, size FROM entries ORDER BY accessed_at"):
+            victims.append((rowid,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM entries WHERE rowid = ?", victims)
+        logger.debug(f"ディスクキャッシュ退避: {len(victims)}件")
+
+
+@dataclass
+class NamespaceStats:
+    """名前空間ごとのキャッシュ統計"""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    
+    @property
+    def hits(self) -> int:
+        """ヒット数（メモリ + ディスク）"""
+        return self.memory_hits + self.disk_hits
+    
+    @property
+    def hit_rate(self) -> float:
+        """ヒット率"""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class TieredCache:
+    """
+    メモリ（LRUCache）+ ディスク（DiskCache）の2層キャッシュ
+
+    メモリ層は名前空間ごとの LRUCache で、ディスク層でヒットした値はメモリ層に昇格する。
+    メモリ層の値は呼び出し元間で共有されるため、取得した値は変更しないこと。
+    名前空間ごとのヒット・ミス数は MetricsCollector にカウンターとして記録する
+    （cache.<名前空間>.hits / cache.<名前空間>.misses、ヒットは tier タグ付き）。
+    """
+    
+    def __init__(
+        self,
+        disk_cache: Optional[DiskCache] = None,
+        memory_max_size: int = 1000,
+        memory_max_memory: int = 50 * 1024 * 1024,  # 50MB
+        metrics_collector: Optional[MetricsCollector] = None
+    ):
+        """
+        初期化
+        
+        Args:
+            disk_cache: ディスク層（Noneの場合はメモリ層のみ）
+            memory_max_size: 名前空間ごとのメモリ層の最大エントリ数
+            memory_max_memory: 名前空間ごとのメモリ層の最大メモリ使用量（バイト）
+            metrics_collector: ヒット・ミス数の記録先
+        """
+        self.disk_cache = disk_cache
+        self.memory_max_size = memory_max_size
+        self.memory_max_memory = memory_max_memory
+        self.metrics_collector = metrics_collector
+        self._memory: Dict[str, LRUCache] = {}
+        self._stats: Dict[str, NamespaceStats] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """値を取得（メモリ層 → ディスク層の順に参照）"""
+        memory = self._memory_tier(namespace)
+        value = memory.get(key)
+        if value is not None:
+            self._count(namespace, 'memory_hits', 'hits', 'memory')
+            return value
+        
+        if self.disk_cache is not None:
+            value = self.disk_cache.get(namespace, key)
+            if value is not None:
+                memory.put(key, value)
+                self._count(namespace, 'disk_hits', 'hits', 'disk')
+                return value
+        
+        self._count(namespace, 'misses', 'misses')
+        return None
+    
+    def put(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """値を両方の層に保存"""
+        stored = self._memory_tier(namespace).put(key, value, ttl)
+        if self.disk_cache is not None:
+            stored = self.disk_cache.put(namespace, key, value, ttl) or stored
+        return stored
+    
+    def delete(self, namespace: str, key: str) -> bool:
+        """値を両方の層から削除"""
+        deleted = self._memory_tier(namespace).delete(key)
+        if self.disk_cache is not None:
+            deleted = self.disk_cache.delete(namespace, key) or deleted
+        return deleted
+    
+    def invalidate_namespace(self, namespace: str):
+        """名前空間の全エントリを両方の層から削除"""
+        with self._lock:
+            memory = self._memory.pop(namespace, None)
+        if memory is not None:
+            memory.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate_namespace(namespace)
+        logger.debug(f"キャッシュ名前空間を無効化: {namespace}")
+    
+    def clear(self):
+        """全エントリと統計を削除"""
+        with self._lock:
+            self._memory.clear()
+            self._stats.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
+    
+    def cleanup_expired(self) -> int:
+        """期限切れエントリのクリーンアップ"""
+        with self._lock:
+            memories = list(self._memory.values())
+        cleaned = sum(memory.cleanup_expired() for memory in memories)
+        if self.disk_cache is not None:
+            cleaned += self.disk_cache.cleanup_expired()
+        return cleaned
+    
+    def get_stats(self) -> Dict[str, NamespaceStats]:
+        """名前空間ごとの統計取得"""
+        with self._lock:
+            return {
+                namespace: NamespaceStats(stats.memory_hits, stats.disk_hits, stats.misses)
+                for namespace, stats in self._stats.items()
+            }
+    
+    def _memory_tier(self, namespace: str) -> LRUCache:
+        memory = self._memory.get(namespace)
+        if memory is None:
+            with self._lock:
+                memory = self._memory.get(namespace)
+                if memory is None:
+                    memory = LRUCache(max_size=self.memory_max_size, max_memory=self.memory_max_memory)
+                    self._memory[namespace] = memory
+        return memory
+    
+    def _count(self, namespace: str, field_name: str, metric: str, tier: Optional[str] = None):
+        with self._lock:
+            stats = self._stats.get(namespace)
+            if stats is None:
+                stats = self._stats[namespace] = NamespaceStats()
+            setattr(stats, field_name, getattr(stats, field_name) + 1)
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_counter(
+                f"cache.{namespace}.{metric}", 1, {'tier': tier} if tier else None
+            )
+
+
 class CacheManager:
     """統合キャッシュマネージャー"""
     
@@ -413,6 +852,8 @@ class CacheManager:
                 total_cleaned += self.file_cache.cleanup_expired()
                 total_cleaned += self.result_cache._cache.cleanup_expired()
                 total_cleaned += self.validation_cache._cache.cleanup_expired()
+                if _tiered_cache is not None:
+                    total_cleaned += _tiered_cache.cleanup_expired()
                 
                 if total_cleaned > 0:
                     logger.info(f"期限切れキャッシュクリーンアップ: {total_cleaned}個")
@@ -488,6 +929,8 @@ class CacheManager:
         self.file_cache.clear()
         self.result_cache._cache.clear()
         self.validation_cache._cache.clear()
+        if _tiered_cache is not None:
+            _tiered_cache.clear()
         logger.info("全キャッシュを無効化しました")
     
     def get_stats(self) -> Dict[str, CacheStats]:
@@ -506,6 +949,8 @@ class CacheManager:
 
 # グローバルインスタンス
 _cache_manager: Optional[CacheManager] = None
+_tiered_cache: Optional[TieredCache] = None
+_tiered_cache_lock = threading.Lock()
 
 
 def get_cache_manager() -> CacheManager:
@@ -540,3 +985,101 @@ def cached_result(
     cache_manager.cache_processing_result(operation, params, result, ttl)
     
     return result
+
+
+def get_tiered_cache() -> TieredCache:
+    """
+    グローバル2層キャッシュ取得
+
+    ディスク層は <プロジェクトルート>/.cache/results.sqlite3 に保存する。
+    """
+    global _tiered_cache
+    if _tiered_cache is None:
+        with _tiered_cache_lock:
+            if _tiered_cache is None:
+                _tiered_cache = TieredCache(
+                    disk_cache=DiskCache(PathResolver.get_cache_dir() / RESULT_CACHE_FILE),
+                    metrics_collector=get_metrics_collector()
+                )
+    return _tiered_cache
+
+
+def file_key(path: Union[str, Path]) -> str:
+    """ファイルの内容が変わるとキーが変わるよう (パス, 更新時刻, サイズ) からキーを作成"""
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return f"{resolved}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def source_fingerprint(*paths: Union[str, Path]) -> str:
+    """
+    ソースファイルの内容から識別子を作成（cached の version に指定する）
+
+    解析ロジックや保存する値のクラス定義が変わると識別子が変わり、
+    旧バージョンのコードで作成したディスクキャッシュを再利用しない。
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _default_key(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """引数の repr からキーを作成（repr がプロセスをまたいで安定する引数のみ対象）"""
+    key_data = repr((func.__module__, func.__qualname__, args, sorted(kwargs.items())))
+    return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+
+
+def cached(
+    namespace: str,
+    key: Optional[Callable[..., str]] = None,
+    ttl: Optional[float] = None,
+    cache: Optional[TieredCache] = None,
+    version: Optional[str] = None
+):
+    """
+    関数の結果を2層キャッシュに保存するデコレータ
+
+    Args:
+        namespace: キャッシュ名前空間（無効化・統計の単位）
+        key: 関数と同じ引数を受け取りキャッシュキーを返す関数。
+            省略時は引数の repr から作成するため、パスやオブジェクトを受け取る関数では
+            file_key 等で内容を反映したキーを指定すること
+        ttl: TTL（秒）
+        cache: 使用するキャッシュ（省略時は get_tiered_cache()）
+        version: キーに含めるコードのバージョン。ディスク層の値はプロセスをまたいで残るため、
+            結果がファイル以外（解析ロジック等）にも依存する場合は source_fingerprint 等を指定する
+
+    Noneを返した呼び出しはキャッシュしない。
+    デコレートした関数の invalidate() で名前空間を無効化できる。
+
+    使用例:
+        @cached(namespace='parsed_tables', key=lambda self, path: file_key(path),
+                version=source_fingerprint(__file__))
+        def parse(self, path): ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                cache_key = key(*args, **kwargs) if key else _default_key(func, args, kwargs)
+                if version is not None:
+                    cache_key = f"{version}:{cache_key}"
+            except OSError:
+                # キーを作成できない場合（ファイルが存在しない等）はキャッシュせずに実行
+                return func(*args, **kwargs)
+            
+            target = cache or get_tiered_cache()
+            
+            result = target.get(namespace, cache_key)
+            if result is not None:
+                return result
+            
+            result = func(*args, **kwargs)
+            if result is not None:
+                target.put(namespace, cache_key, result, ttl)
+            return result
+        
+        wrapper.invalidate = lambda: (cache or get_tiered_cache()).invalidate_namespace(namespace)
+        return wrapper
+    return decorator
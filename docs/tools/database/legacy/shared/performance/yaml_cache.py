@@ -0,0 +1,302 @@
+"""
+YAML解析結果の永続キャッシュ
+テーブル詳細定義YAMLの safe_load 結果をディスクにバイナリ形式（pickle）で保存し、
+ツール・プロセスをまたいで再利用する
+
+キャッシュエントリはファイルパスごとに1ファイル（<プロジェクトルート>/.cache/yaml/<パスのハッシュ>.pkl）で、
+(パス, 更新時刻, サイズ) が一致すればYAMLを読まずに返す。
+更新時刻のみ変わった場合（git checkout 等）は内容のSHA-256が一致すれば再利用する。
+エントリ数・合計サイズの上限を超えた場合は最終利用時刻の古いものから削除する（LRU）。
+
+libyaml が利用可能な場合は C実装の CSafeLoader で解析する。
+
+要求仕様ID: PLT.1-WEB.1 (システム基盤要件)
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import yaml
+
+from ..path_resolver import PathResolver
+from ..monitoring.tracing import trace_span
+
+
+# libyaml（C実装）が利用可能ならそちらを使用
+SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+HAS_LIBYAML = SAFE_LOADER is not yaml.SafeLoader
+
+# キャッシュエントリ形式のバージョン（形式を変更した場合は更新し、既存エントリを無効化する）
+CACHE_FORMAT_VERSION = 1
+
+# キャッシュディレクトリ内のサブディレクトリ名
+CACHE_SUBDIR = 'yaml'
+
+_ENTRY_SUFFIX = '.pkl'
+
+
+def safe_load(stream: Any) -> Any:
+    """yaml.safe_load 互換（libyaml が利用可能な場合は CSafeLoader を使用）"""
+    return yaml.load(stream, Loader=SAFE_LOADER)
+
+
+class YamlParseCache:
+    """
+    YAML解析結果のディスクキャッシュ
+
+    返却値は毎回キャッシュファイルから復元した新しいオブジェクトのため、
+    呼び出し側で変更してもキャッシュには影響しない。
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_entries: int = 4096,
+        max_bytes: int = 256 * 1024 * 1024  # 256MB
+    ):
+        """
+        初期化
+
+        Args:
+            cache_dir: キャッシュディレクトリ（例: <base_dir>/.cache/yaml）
+            max_entries: 保持するエントリ数の上限
+            max_bytes: キャッシュファイル合計サイズの上限（バイト）
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # エントリ数・合計サイズ（初回書き込み時にディレクトリを走査して初期化）
+        self._entry_count: Optional[int] = None
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, path: Union[str, Path], content: Optional[str] = None) -> Any:
+        """
+        YAMLファイルを解析（キャッシュが有効な場合は解析しない）
+
+        Args:
+            path: YAMLファイルパス
+            content: 読み込み済みのファイル内容（指定時は再読み込みしない）
+
+        Returns:
+            safe_load の結果
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+            yaml.YAMLError: YAML構文エラー（エラーはキャッシュしない）
+        """
+        resolved = Path(path).resolve()
+        with trace_span("yaml.load", category="parser", file=str(resolved)) as span:
+            stat = resolved.stat()
+            entry_file = self._entry_path(resolved)
+            entry = self._read_entry(entry_file, str(resolved))
+
+            if entry is not None and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                self._touch(entry_file)
+                self._count('hits')
+                span.set_attribute("cache", "hit")
+                return entry['data']
+
+            raw = content.encode('utf-8') if content is not None else resolved.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            span.set_attribute("bytes", len(raw))
+
+            if entry is not None and entry['sha256'] == digest:
+                # 内容は同じで更新時刻のみ変わった場合は、メタデータを更新して再利用
+                data = entry['data']
+                self._write_entry(entry_file, str(resolved), stat, digest, data)
+                self._count('hits')
+                span.set_attribute("cache", "rehash")
+                return data
+
+            self._count('misses')
+            span.set_attribute("cache", "miss")
+            data = safe_load(content if content is not None else raw.decode('utf-8'))
+            self._write_entry(entry_file, str(resolved), stat, digest, data)
+            return data
+
+    def clear(self) -> None:
+        """全エントリと統計を削除"""
+        with self._lock:
+            if self.cache_dir.exists():
+                for entry_file in self.cache_dir.glob(f'*{_ENTRY_SUFFIX}'):
+                    _unlink(entry_file)
+            self._entry_count = 0
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """ヒット・ミス・退避件数を取得"""
+        self._ensure_counted()
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': self._entry_count,
+                'total_bytes': self._total_bytes,
+                'libyaml': HAS_LIBYAML,
+            }
+
+    # ------------------------------------------------------------------
+    # 内部処理
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, resolved: Path) -> Path:
+        name = hashlib.sha1(str(resolved).encode('utf-8')).hexdigest()
+        return self.cache_dir / f'{name}{_ENTRY_SUFFIX}'
+
+    def _read_entry(self, entry_file: Path, source: str) -> Optional[Dict[str, Any]]:
+        """キャッシュエントリを読み込む（存在しない・破損・形式違いの場合はNone）"""
+        try:
+            with open(entry_file, 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 書き込み途中で中断された等の破損エントリは無視して再作成する
+            return None
+
+        if (not isinstance(entry, dict)
+                or entry.get('format_version') != CACHE_FORMAT_VERSION
+                or entry.get('path') != source):
+            return None
+        return entry
+
+    def _write_entry(self, entry_file: Path, source: str, stat: os.stat_result,
+                     digest: str, data: Any) -> None:
+        """キャッシュエントリを書き込む（一時ファイル経由で置換）"""
+        payload = pickle.dumps({
+            'format_version': CACHE_FORMAT_VERSION,
+            'path': source,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'data': data,
+        }, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_counted()
+        try:
+            old_size = entry_file.stat().st_size
+        except FileNotFoundError:
+            old_size = None
+
+        temp_file = entry_file.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
+            temp_file.replace(entry_file)
+        except OSError:
+            # キャッシュの書き込み失敗は解析結果に影響させない
+            _unlink(temp_file)
+            return
+
+        with self._lock:
+            if old_size is None:
+                self._entry_count += 1
+            else:
+                self._total_bytes -= old_size
+            self._total_bytes += len(payload)
+            over_limit = self._entry_count > self.max_entries or self._total_bytes > self.max_bytes
+        if over_limit:
+            self._evict()
+
+    def _ensure_counted(self) -> None:
+        """エントリ数・合計サイズを初期化（プロセス内で1回だけディレクトリを走査）"""
+        with self._lock:
+            if self._entry_count is not None:
+                return
+            count = 0
+            total = 0
+            for entry_file in self.cache_dir.glob(f'*{_ENTRY_SUFFIX}'):
+                try:
+                    total += entry_file.stat().st_size
+                    count += 1
+                except FileNotFoundError:
+                    continue
+            self._entry_count = count
+            self._total_bytes = total
+
+    def _evict(self) -> None:
+        """最終利用時刻の古いエントリから上限内に収まるまで削除"""
+        with self._lock:
+            entries = []
+            for entry_file in self.cache_dir.glob(f'*{_ENTRY_SUFFIX}'):
+                try:
+                    stat = entry_file.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry_file))
+            entries.sort()
+
+            count = len(entries)
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry_file in entries:
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                if _unlink(entry_file):
+                    count -= 1
+                    total -= size
+                    self.evictions += 1
+
+            self._entry_count = count
+            self._total_bytes = total
+
+    def _touch(self, entry_file: Path) -> None:
+        """エントリの最終利用時刻を更新（LRU判定用）"""
+        try:
+            os.utime(entry_file)
+        except OSError:
+            pass
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+def _unlink(path: Path) -> bool:
+    try:
+        path.unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+
+# プロセス内で共有するキャッシュ（キャッシュディレクトリごと）
+_yaml_caches: Dict[Path, YamlParseCache] = {}
+_yaml_caches_lock = threading.Lock()
+
+
+def get_yaml_cache(cache_dir: Optional[Union[str, Path]] = None) -> YamlParseCache:
+    """
+    共有YAMLキャッシュを取得
+
+    Args:
+        cache_dir: キャッシュのルートディレクトリ（省略時はプロジェクトルートの .cache、
+            プロジェクトルートが見つからない場合はカレントディレクトリの .cache）。
+            エントリは <cache_dir>/yaml に保存される
+    """
+    root = Path(cache_dir) if cache_dir else PathResolver.get_cache_dir()
+    key = (root / CACHE_SUBDIR).resolve()
+    with _yaml_caches_lock:
+        cache = _yaml_caches.get(key)
+        if cache is None:
+            cache = YamlParseCache(key)
+            _yaml_caches[key] = cache
+        return cache
+
+
+def cached_yaml_load(path: Union[str, Path], content: Optional[str] = None,
+                     cache_dir: Optional[Union[str, Path]] = None) -> Any:
+    """YAMLファイルを解析（共有ディスクキャッシュ付き）"""
+    return get_yaml_cache(cache_dir).load(path, content)
@@ -0,0 +1,190 @@
+"""
+グラフユーティリティ
+テーブル間の外部キー依存グラフに対する強連結成分分解・循環検出
+
+要求仕様ID: PLT.1-WEB.1 (システム基盤要件)
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional
+
+
+# 依存グラフ（ノード -> 依存先ノードの列）
+DependencyGraph = Mapping[str, Iterable[str]]
+
+
+def strongly_connected_components(graph: DependencyGraph) -> List[List[str]]:
+    """
+    Tarjanのアルゴリズムで強連結成分を求める（O(V+E)、非再帰実装）
+
+    グラフのキーに含まれないノードへの辺は無視する。
+    成分は依存先が先に来る順序（逆トポロジカル順）で返すため、
+    外部キーの参照先テーブルから順にデータを投入する用途にそのまま利用できる。
+
+    Args:
+        graph: ノード -> 依存先ノード
+
+    Returns:
+        強連結成分のリスト（各成分内のノードはグラフのキー順）
+    """
+    order = {node: position for position, node in enumerate(graph)}
+    edges: Dict[str, List[str]] = {
+        node: [dep for dep in graph[node] if dep in order] for node in graph
+    }
+
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Dict[str, bool] = {}
+    stack: List[str] = []
+    components: List[List[str]] = []
+    counter = 0
+
+    for root in graph:
+        if root in index:
+            continue
+
+        # (ノード, 次に辿る辺の位置) の明示スタックで再帰を展開する
+        work = [(root, 0)]
+        while work:
+            node, edge_pos = work.pop()
+            if edge_pos == 0:
+                index[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+
+            node_edges = edges[node]
+            descended = False
+            while edge_pos < len(node_edges):
+                dep = node_edges[edge_pos]
+                edge_pos += 1
+                if dep not in index:
+                    work.append((node, edge_pos))
+                    work.append((dep, 0))
+                    descended = True
+                    break
+                if on_stack.get(dep):
+                    lowlink[node] = min(lowlink[node], index[dep])
+            if descended:
+                continue
+
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                component.sort(key=order.__getitem__)
+                components.append(component)
+
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+    return components
+
+
+def is_cyclic_component(component: List[str], graph: DependencyGraph) -> bool:
+    """強連結成分が循環を含むか（2ノード以上、または自己参照）"""
+    if len(component) > 1:
+        return True
+    node = component[0]
+    return node in graph[node]
+
+
+def find_cycle(component: List[str], graph: DependencyGraph) -> Optional[List[str]]:
+    """
+    強連結成分内の循環経路を1つ求める（成分のサイズに対して線形）
+
+    成分内に複数の循環があっても、先頭ノードを通る最短の循環を1つだけ返す。
+    循環に関与する全ノードは成分自体が持つため、報告には describe_cycle を使う。
+
+    Args:
+        component: 強連結成分
+        graph: ノード -> 依存先ノード
+
+    Returns:
+        先頭ノードに戻る経路（例: [A, B, A]）。循環がない場合はNone
+    """
+    if not is_cyclic_component(component, graph):
+        return None
+
+    start = component[0]
+    if start in graph[start]:
+        return [start, start]
+
+    members = set(component)
+    parents: Dict[str, str] = {}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for dep in graph[node]:
+            if dep not in members:
+                continue
+            if dep == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return path + [start]
+            if dep not in parents:
+                parents[dep] = node
+                queue.append(dep)
+    return None
+
+
+def describe_cycle(component: List[str], graph: DependencyGraph) -> Optional[str]:
+    """
+    強連結成分の循環を報告用の文字列にする
+
+    find_cycle の経路に含まれないノードが成分にある場合は、成分の全ノードを併記する
+    （例: "A -> B -> A（循環成分: A, B, C）"）。
+
+    Args:
+        component: 強連結成分
+        graph: ノード -> 依存先ノード
+
+    Returns:
+        循環の説明。循環がない場合はNone
+    """
+    cycle = find_cycle(component, graph)
+    if cycle is None:
+        return None
+    description = " -> ".join(cycle)
+    if len(set(cycle)) < len(component):
+        description += f"（循環成分: {', '.join(component)}）"
+    return description
+
+
+def topological_levels(graph: DependencyGraph) -> List[List[str]]:
+    """
+    依存グラフをトポロジカルなレベルに分割する（O(V+E)）
+
+    各レベルのノードはそれより前のレベルのノードにのみ依存するため、
+    同じレベルのノードは互いに独立して処理できる。
+    循環を含む強連結成分は同じレベルにまとめる（成分内の順序は維持）。
+
+    Args:
+        graph: ノード -> 依存先ノード
+
+    Returns:
+        レベルのリスト（各レベル内のノードは strongly_connected_components の順）
+    """
+    levels: List[List[str]] = []
+    level_of: Dict[str, int] = {}
+    for component in strongly_connected_components(graph):
+        members = set(component)
+        # 依存先の成分は必ず先に処理済み（逆トポロジカル順）
+        level = 1 + max(
+            (level_of[dep] for node in component for dep in graph[node]
+             if dep in level_of and dep not in members),
+            default=-1
+        )
+        for node in component:
+            level_of[node] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].extend(component)
+    return levels
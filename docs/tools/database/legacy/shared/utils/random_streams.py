@@ -0,0 +1,61 @@
+"""
+乱数ストリームユーティリティ
+マスターシードからテーブル名・カラム名・チャンク番号ごとに独立した乱数ストリームを派生する
+
+要求仕様ID: PLT.2-DB.1, PLT.2-TOOL.1
+"""
+
+import hashlib
+import random
+import secrets
+from typing import List, Optional, Tuple, Union
+
+
+# ストリームのキー（テーブル名・チャンク番号など）
+StreamKey = Union[int, str]
+
+
+class SeedSequence:
+    """乱数ストリームの派生（NumPy の SeedSequence 相当、外部依存なし）
+
+    マスターシード（entropy）とキーの列（spawn_key）のハッシュから独立した乱数ストリームを作ります。
+    child('MST_Employee').child(3) のようにテーブル名・チャンク番号から派生するため、
+    派生の順序やプロセス数に関係なく、同じキーからは常に同じ乱数列が得られます。
+    """
+
+    def __init__(self, entropy: Optional[int] = None, spawn_key: Tuple[StreamKey, ...] = ()):
+        """初期化
+
+        Args:
+            entropy (Optional[int]): マスターシード（省略時はOSの乱数から決定）
+            spawn_key (Tuple): 派生元からのキーの列
+        """
+        self.entropy = secrets.randbits(128) if entropy is None else entropy
+        self.spawn_key = tuple(spawn_key)
+        self.n_children_spawned = 0
+
+    def child(self, *keys: StreamKey) -> 'SeedSequence':
+        """キーから子ストリームを派生（同じキーからは常に同じストリーム）"""
+        return SeedSequence(self.entropy, self.spawn_key + keys)
+
+    def spawn(self, n_children: int) -> List['SeedSequence']:
+        """連番の子ストリームを n_children 個派生（NumPy の SeedSequence.spawn と同じ使い方）"""
+        start = self.n_children_spawned
+        self.n_children_spawned += n_children
+        return [self.child(i) for i in range(start, start + n_children)]
+
+    def generate_state(self) -> int:
+        """ストリームの128bitの状態（entropy と spawn_key から決定、PYTHONHASHSEED に依存しない）"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(self.entropy).encode('ascii'))
+        for key in self.spawn_key:
+            # 型名を含めて 1 と '1' を区別する
+            digest.update(f"\x00{type(key).__name__}:{key}".encode('utf-8'))
+        return int.from_bytes(digest.digest(), 'little')
+
+    def random(self) -> random.Random:
+        """このストリームの乱数生成器"""
+        return random.Random(self.generate_state())
+
+    def __repr__(self) -> str:
+        return f"SeedSequence(entropy={self.entropy}, spawn_key={self.spawn_key})"
@@ -22,15 +22,14 @@ from shared.core.models import (
     IndexDefinition,
     ForeignKeyDefinition,
     GenerationResult,
-    GenerationStatus,
-    create_table_definition_from_yaml
+    GenerationStatus
 )
 
 # 統合パーサーのインポート
 from shared.parsers.yaml_parser import YamlParser
 
 # 統合ジェネレーターのインポート
-from shared.generators.ddl_generator import DdlGenerator
+from shared.generators.ddl_generator import DDLGenerator
 from shared.generators.markdown_generator import MarkdownGenerator
 from shared.generators.sample_data_generator import SampleDataGenerator
 
@@ -44,17 +43,22 @@ class TableGeneratorService:
     統合データモデルとジェネレーターを使用してテーブル関連ファイルを生成
     """
     
-    def __init__(self):
+    def __init__(self, sample_data_options: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            sample_data_options: サンプルデータ生成設定（insert_mode, batch_size）
+        """
         self.yaml_parser = YamlParser()
-        self.ddl_generator = DdlGenerator()
+        # 定義の検証は validate_table_definition で行う
+        self.yaml_parser.set_validation_enabled(False)
+        self.ddl_generator = DDLGenerator()
         self.markdown_generator = MarkdownGenerator()
-        self.sample_data_generator = SampleDataGenerator()
+        self.sample_data_generator = SampleDataGenerator(sample_data_options or {})
     
     def load_table_definition_from_yaml(self, yaml_file: Path) -> TableDefinition:
         """YAMLファイルから統合テーブル定義を読み込み"""
         try:
-            yaml_data = self.yaml_parser.parse_file(yaml_file)
-            return create_table_definition_from_yaml(yaml_data)
+            return self.yaml_parser.parse(yaml_file)
         except Exception as e:
             logger.error(f"YAML読み込みエラー: {yaml_file} - {e}")
             raise
@@ -5,13 +5,16 @@
 
 YAML定義されたサンプルデータを基本とし、
 必要に応じて基本的なダミーデータを生成する機能を提供します。
+乱数はマスターシードからテーブル・チャンクごとに派生した独立したストリームで生成します。
 
 対応要求仕様ID: PLT.2-DB.1, PLT.2-TOOL.1
 """
 
 import random
 import datetime
-from typing import Any, List, Dict, Optional
+from array import array
+from functools import lru_cache
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 
 import sys
 from pathlib import Path
@@ -20,6 +23,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.core.logger import DatabaseToolsLogger, get_logger
+from shared.utils.random_streams import SeedSequence, StreamKey
 
 
 class JapaneseSkillProvider:
@@ -60,49 +64,100 @@ class JapaneseSkillProvider:
     first_names = ['太郎', '花子', '次郎', '美咲', '健太', '由美', '翔太', '愛子', '大輔', '恵子']
     
     @classmethod
-    def random_choice(cls, choices):
-        """リストからランダムに選択"""
-        return random.choice(choices)
+    def random_choice(cls, choices, rng: Optional[random.Random] = None):
+        """リストからランダムに選択（rng 省略時は random モジュールの共有状態を使用）"""
+        return (rng or random).choice(choices)
     
     @classmethod
-    def department_name(cls) -> str:
+    def department_name(cls, rng: Optional[random.Random] = None) -> str:
         """部署名を生成"""
-        return cls.random_choice(cls.departments)
+        return cls.random_choice(cls.departments, rng)
     
     @classmethod
-    def skill_category(cls) -> str:
+    def skill_category(cls, rng: Optional[random.Random] = None) -> str:
         """スキルカテゴリを生成"""
-        return cls.random_choice(cls.skill_categories)
+        return cls.random_choice(cls.skill_categories, rng)
     
     @classmethod
-    def programming_language(cls) -> str:
+    def programming_language(cls, rng: Optional[random.Random] = None) -> str:
         """プログラミング言語を生成"""
-        return cls.random_choice(cls.programming_languages)
+        return cls.random_choice(cls.programming_languages, rng)
     
     @classmethod
-    def framework(cls) -> str:
+    def framework(cls, rng: Optional[random.Random] = None) -> str:
         """フレームワークを生成"""
-        return cls.random_choice(cls.frameworks)
+        return cls.random_choice(cls.frameworks, rng)
     
     @classmethod
-    def database(cls) -> str:
+    def database(cls, rng: Optional[random.Random] = None) -> str:
         """データベースを生成"""
-        return cls.random_choice(cls.databases)
+        return cls.random_choice(cls.databases, rng)
     
     @classmethod
-    def japanese_name(cls) -> str:
+    def japanese_name(cls, rng: Optional[random.Random] = None) -> str:
         """日本人名を生成"""
-        return f"{cls.random_choice(cls.last_names)} {cls.random_choice(cls.first_names)}"
+        return f"{cls.random_choice(cls.last_names, rng)} {cls.random_choice(cls.first_names, rng)}"
     
     @classmethod
-    def employee_code(cls) -> str:
+    def employee_code(cls, rng: Optional[random.Random] = None) -> str:
         """従業員コードを生成"""
-        return f"EMP{random.randint(1000, 9999)}"
+        return f"EMP{(rng or random).randint(1000, 9999)}"
     
     @classmethod
-    def skill_code(cls) -> str:
+    def skill_code(cls, rng: Optional[random.Random] = None) -> str:
         """スキルコードを生成"""
-        return f"SKL{random.randint(100, 999)}"
+        return f"SKL{(rng or random).randint(100, 999)}"
+
+
+# 一括生成で1回に抽選する乱数のビット数（64bit整数を count 個まとめて getrandbits で生成）
+_WORD_BITS = 64
+
+# 一括生成（generate_many）で対応するデータタイプ
+BULK_DATA_TYPES = ('integer', 'decimal', 'boolean', 'choice', 'date', 'datetime')
+
+def random_words(rng: random.Random, count: int) -> array:
+    """64bitの一様乱数を count 個生成（getrandbits 1回で生成し、値ごとの関数呼び出しを行わない）"""
+    words = array('Q')
+    if count <= 0:
+        return words
+    words.frombytes(rng.getrandbits(_WORD_BITS * count).to_bytes(8 * count, 'little'))
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words
+
+
+def draw_integers(rng: random.Random, low: int, high: int, count: int) -> List[int]:
+    """low 以上 high 以下の整数を count 個抽選
+
+    乱数 w を (w * 範囲) >> 64 で範囲に写像する（偏りは 範囲 / 2^64 以下）。
+    """
+    span = high - low + 1
+    return [low + (word * span >> _WORD_BITS) for word in random_words(rng, count)]
+
+
+def draw_choices(rng: random.Random, pool: Sequence[Any], count: int) -> List[Any]:
+    """pool から重複ありで count 個抽選"""
+    size = len(pool)
+    return [pool[word * size >> _WORD_BITS] for word in random_words(rng, count)]
+
+
+def draw_booleans(rng: random.Random, chance: float, count: int) -> List[bool]:
+    """確率 chance（0〜1）で True となる値を count 個抽選"""
+    threshold = int(chance * (1 << _WORD_BITS))
+    return [word < threshold for word in random_words(rng, count)]
+
+
+@lru_cache(maxsize=64)
+def date_pool(reference_date: datetime.date, days: int) -> Tuple[datetime.date, ...]:
+    """基準日から days 日前までの日付の候補（基準日・日数ごとにメモ化し、チャンク間で共有）"""
+    return tuple(reference_date - datetime.timedelta(days=offset) for offset in range(days + 1))
+
+
+@lru_cache(maxsize=64)
+def datetime_pool(reference_date: datetime.date, hours: int) -> Tuple[datetime.datetime, ...]:
+    """基準日の0時から hours 時間前までの日時の候補（基準日・時間数ごとにメモ化し、チャンク間で共有）"""
+    midnight = datetime.datetime.combine(reference_date, datetime.time())
+    return tuple(midnight - datetime.timedelta(hours=offset) for offset in range(hours + 1))
 
 
 class BasicDataUtils:
@@ -111,23 +166,97 @@ class BasicDataUtils:
     YAML定義されたサンプルデータを基本とし、
     必要に応じて基本的なダミーデータを生成します。
     外部ライブラリに依存しない軽量な実装です。
+    
+    乱数は random モジュールの共有状態ではなくインスタンスごとのストリーム（self.rng）から生成します。
+    spawn(テーブル名, チャンク番号) で派生したインスタンスはマスターシードとキーのみから決まるため、
+    チャンクをどのプロセスで生成しても同じ値になります。
     """
     
-    def __init__(self, seed: Optional[int] = None, logger: DatabaseToolsLogger = None):
+    def __init__(self, seed: Optional[int] = None, logger: DatabaseToolsLogger = None,
+                 seed_sequence: Optional[SeedSequence] = None,
+                 reference_date: Optional[datetime.date] = None):
         """初期化
         
         Args:
-            seed (Optional[int]): 乱数シード
+            seed (Optional[int]): 乱数シード（マスターシード）
             logger (DatabaseToolsLogger, optional): ログ出力インスタンス
+            seed_sequence (SeedSequence, optional): 乱数ストリーム（spawn で指定、seed より優先）
+            reference_date (datetime.date, optional): 一括生成する日付・日時の基準日（省略時は当日）
         """
         self.logger = logger or get_logger(__name__)
         self.provider = JapaneseSkillProvider()
+        self.reference_date = reference_date or datetime.date.today()
         
-        self.logger.info("基本データ生成ユーティリティを初期化しました（外部依存なし）")
+        if seed_sequence is None:
+            self.logger.info("基本データ生成ユーティリティを初期化しました（外部依存なし）")
+            seed_sequence = SeedSequence(seed)
         
         # シード設定
-        if seed is not None:
-            random.seed(seed)
+        self.seed_sequence = seed_sequence
+        self.rng = seed_sequence.random()
+    
+    def spawn(self, *keys: StreamKey) -> 'BasicDataUtils':
+        """キー（テーブル名・チャンク番号など）から独立した乱数ストリームのインスタンスを派生
+        
+        Args:
+            *keys: ストリームのキー（例: spawn('MST_Employee', 3)）
+            
+        Returns:
+            BasicDataUtils: 派生したストリームで生成するインスタンス（基準日は引き継ぐ）
+        """
+        return BasicDataUtils(logger=self.logger, seed_sequence=self.seed_sequence.child(*keys),
+                              reference_date=self.reference_date)
+    
+    def generate_many(self, data_type: str, count: int, **kwargs) -> List[Any]:
+        """データタイプに応じて count 件をまとめて生成
+        
+        BULK_DATA_TYPES は乱数を一括で抽選して値に写像します（値ごとに乱数生成器を呼び出さない）。
+        それ以外のデータタイプは generate_by_type を count 回呼び出します。
+        
+        Args:
+            data_type (str): データタイプ
+            count (int): 件数
+            **kwargs: 追加パラメータ
+                integer : min_value, max_value
+                decimal : min_value, max_value, decimals（小数点以下の桁数、既定2）
+                boolean : chance_of_getting_true（%）
+                choice  : choices（候補値のリスト）
+                date    : days（基準日から遡る最大日数、既定365）
+                datetime: hours（基準日0時から遡る最大時間、既定8760）
+            
+        Returns:
+            List[Any]: 生成されたデータ
+        """
+        if data_type not in BULK_DATA_TYPES:
+            return [self.generate_by_type(data_type, **kwargs) for _ in range(count)]
+        
+        rng = self.rng
+        if data_type == 'integer':
+            return draw_integers(rng, kwargs.get('min_value', 1), kwargs.get('max_value', 100), count)
+        if data_type == 'decimal':
+            # 小数点以下の桁数の整数として抽選してから割る
+            scale = 10 ** kwargs.get('decimals', 2)
+            low = round(kwargs.get('min_value', 0) * scale)
+            high = round(kwargs.get('max_value', 100) * scale)
+            return [value / scale for value in draw_integers(rng, low, high, count)]
+        if data_type == 'boolean':
+            return draw_booleans(rng, kwargs.get('chance_of_getting_true', 50) / 100, count)
+        if data_type == 'choice':
+            return draw_choices(rng, list(kwargs['choices']), count)
+        if data_type == 'date':
+            # 候補の日付（メモ化済み）から添字を抽選する
+            return draw_choices(rng, date_pool(self.reference_date, kwargs.get('days', 365)), count)
+        
+        return draw_choices(rng, datetime_pool(self.reference_date, kwargs.get('hours', 8760)), count)
+    
+    def generate_chunk(self, table_name: str, chunk_index: int, data_type: str, count: int,
+                       **kwargs) -> List[Any]:
+        """テーブル・チャンク番号ごとのストリームから count 件を生成
+        
+        チャンクごとに独立したストリームを使うため、チャンクを任意の順序・プロセスで生成しても
+        マスターシードが同じであれば結果は同じになります。
+        """
+        return self.spawn(table_name, chunk_index).generate_many(data_type, count, **kwargs)
     
     def generate_by_type(self, data_type: str, **kwargs) -> Any:
         """データタイプに応じてデータを生成
@@ -149,67 +278,68 @@ class BasicDataUtils:
     def _generate_basic_data(self, data_type: str, **kwargs) -> Any:
         """Faker非依存でデータを生成"""
         if data_type == 'name':
-            return self.provider.japanese_name()
+            return self.provider.japanese_name(self.rng)
         elif data_type == 'email':
-            name = self.provider.japanese_name().replace(' ', '').lower()
+            name = self.provider.japanese_name(self.rng).replace(' ', '').lower()
             return f"{name}@example.com"
         elif data_type == 'phone':
-            return f"090-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}"
+            return f"090-{self.rng.randint(1000, 9999)}-{self.rng.randint(1000, 9999)}"
         elif data_type == 'address':
-            return f"東京都渋谷区{random.randint(1, 99)}-{random.randint(1, 99)}-{random.randint(1, 99)}"
+            return f"東京都渋谷区{self.rng.randint(1, 99)}-{self.rng.randint(1, 99)}-{self.rng.randint(1, 99)}"
         elif data_type == 'company':
-            return f"株式会社{random.choice(['テスト', 'サンプル', 'デモ', 'テック'])}"
+            return f"株式会社{self.rng.choice(['テスト', 'サンプル', 'デモ', 'テック'])}"
         elif data_type == 'text':
             return "サンプルテキストです。"
         elif data_type == 'word':
-            return random.choice(['テスト', 'サンプル', 'デモ', 'データ'])
+            return self.rng.choice(['テスト', 'サンプル', 'デモ', 'データ'])
         elif data_type == 'sentence':
             return "これはサンプルの文章です。"
         elif data_type == 'date':
             today = datetime.date.today()
-            days_ago = random.randint(0, 365)
+            days_ago = self.rng.randint(0, 365)
             return today - datetime.timedelta(days=days_ago)
         elif data_type == 'datetime':
             now = datetime.datetime.now()
-            hours_ago = random.randint(0, 8760)  # 1年分の時間
+            hours_ago = self.rng.randint(0, 8760)  # 1年分の時間
             return now - datetime.timedelta(hours=hours_ago)
         elif data_type == 'integer':
             min_val = kwargs.get('min_value', 1)
             max_val = kwargs.get('max_value', 100)
-            return random.randint(min_val, max_val)
+            return self.rng.randint(min_val, max_val)
         elif data_type == 'boolean':
             chance = kwargs.get('chance_of_getting_true', 50)
-            return random.randint(1, 100) <= chance
+            return self.rng.randint(1, 100) <= chance
         elif data_type == 'uuid':
             import uuid
-            return str(uuid.uuid4())
+            return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
         else:
             return self._generate_custom_data(data_type, **kwargs)
     
     def _generate_custom_data(self, data_type: str, **kwargs) -> Any:
         """カスタムデータタイプの生成"""
         if data_type == 'department':
-            return self.provider.department_name()
+            return self.provider.department_name(self.rng)
         elif data_type == 'skill':
-            return self.provider.programming_language()
+            return self.provider.programming_language(self.rng)
         elif data_type == 'employee_code':
-            return self.provider.employee_code()
+            return self.provider.employee_code(self.rng)
         elif data_type == 'skill_code':
-            return self.provider.skill_code()
+            return self.provider.skill_code(self.rng)
         else:
             return self._fallback_data(data_type)
     
     def _fallback_data(self, data_type: str) -> str:
         """フォールバックデータ"""
-        return f"sample_{data_type}_{random.randint(1, 999)}"
+        return f"sample_{data_type}_{self.rng.randint(1, 999)}"
     
     def set_seed(self, seed: int):
-        """乱数シードを設定
+        """乱数シードを設定（このインスタンスのストリームを作り直す。random モジュールの状態は変更しない）
         
         Args:
             seed (int): 乱数シード
         """
-        random.seed(seed)
+        self.seed_sequence = SeedSequence(seed)
+        self.rng = self.seed_sequence.random()
         self.logger.info(f"乱数シードを設定しました: {seed}")
     
     def get_locale_info(self) -> Dict[str, Any]:
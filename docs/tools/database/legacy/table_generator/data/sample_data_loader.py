@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+テーブル生成ツール - サンプルデータ一括投入
+
+テーブル詳細定義YAMLの sample_data、または docs/design/database/data/*_sample_data.sql を読み込み、
+ローカルの SQLite / PostgreSQL に直接一括投入します（seed.ts・Node.js を経由しません）。
+テスト用にサンプルデータ入りのスキーマを短時間で用意するためのツールです。
+
+- スキーマはYAMLのカラム定義から作成します（主キーと、投入対象テーブルの主キーを参照する外部キーのみ）
+- 外部キーの依存順にテーブルを投入します
+- batch_size 行ごとに1トランザクションで投入し、バッチの投入中は外部キー制約を検査しません
+  - SQLite: PRAGMA foreign_keys = OFF でバッチを投入します
+  - PostgreSQL: SET LOCAL session_replication_role = replica でバッチを投入します
+- 全テーブルの投入後に外部キー制約の違反件数を検査します
+  （sample_data は参照先と一致しない値を含むため、違反は投入エラーにせず件数を報告します）
+- SQLite は executemany、PostgreSQL は COPY FROM STDIN（psycopg2）で投入します
+- --dsn を指定すると PostgreSQL、省略時は SQLite（--database、既定はインメモリ）に投入します
+
+使用例:
+    python -m table_generator.data.sample_data_loader --database /tmp/sample.sqlite3
+    python -m table_generator.data.sample_data_loader --source sql --dsn "dbname=skill_test user=postgres" --reset
+
+対応要求仕様ID: PLT.1-DB.1, PLT.2-TOOL.1
+"""
+
+import io
+import os
+import re
+import sqlite3
+import sys
+import time
+import types
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# パッケージのパスを追加
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from shared.core.logger import DatabaseToolsLogger, get_logger
+from shared.generators.sample_data_generator import (
+    PROJECT_ROOT, EnhancedSQLGenerator, TableDependencyResolver, list_table_details_tables
+)
+from shared.generators.sql_batch import DEFAULT_BATCH_SIZE, SqlRow, group_rows, render_copy
+
+# scripts/sql_values_tokenizer.py（sql-to-seed*.py と共通のトークナイザー）
+sys.path.append(os.path.join(PROJECT_ROOT, "scripts"))
+try:
+    from sql_values_tokenizer import iter_file_rows
+except ImportError:
+    iter_file_rows = None
+
+
+# 読み込み元
+#   yaml : テーブル詳細定義YAMLの sample_data（EnhancedSQLGenerator と同じ値）
+#   sql  : docs/design/database/data/{テーブル名}_sample_data.sql
+SOURCES = ('yaml', 'sql')
+SAMPLE_DATA_DIR = os.path.join(PROJECT_ROOT, "docs/design/database/data")
+
+_NUMBER_PATTERN = re.compile(r'^-?\d+(\.\d+)?([eE][-+]?\d+)?$')
+
+
+def sql_literal_to_param(literal: str, now: str) -> Any:
+    """SQLリテラルを executemany のパラメータに変換（NULL は None）
+
+    CURRENT_TIMESTAMP / NOW() は投入時刻に置き換える。
+    """
+    if literal[:1] == "'" and literal[-1:] == "'" and len(literal) >= 2:
+        return literal[1:-1].replace("''", "'")
+    upper = literal.upper()
+    if upper == 'NULL':
+        return None
+    if upper == 'TRUE':
+        return True
+    if upper == 'FALSE':
+        return False
+    if upper in ('CURRENT_TIMESTAMP', 'NOW()'):
+        return now
+    match = _NUMBER_PATTERN.match(literal)
+    if match:
+        return float(literal) if match.group(1) or match.group(2) else int(literal)
+    return literal
+
+
+@dataclass
+class TableSchema:
+    """投入先に作成するテーブル定義"""
+    table_name: str
+    columns: Dict[str, str]  # カラム名 -> データ型（YAMLの型）
+    primary_key: List[str] = field(default_factory=list)
+    # (カラム名リスト, 参照先テーブル名, 参照先カラム名リスト)
+    foreign_keys: List[Tuple[List[str], str, List[str]]] = field(default_factory=list)
+
+
+class SqliteLoadTarget:
+    """SQLite投入先（executemany）"""
+
+    name = 'sqlite'
+
+    def __init__(self, database: str = ':memory:'):
+        """初期化
+
+        Args:
+            database (str): データベースファイルのパス（':memory:' はインメモリ）
+        """
+        self.database = database
+        self.conn = sqlite3.connect(database, isolation_level=None)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if database != ':memory:':
+            self.conn.execute("PRAGMA journal_mode = WAL")
+
+    def create_tables(self, schemas: List[TableSchema], reset: bool = False) -> None:
+        if reset:
+            for schema in reversed(schemas):
+                self.conn.execute(f"DROP TABLE IF EXISTS {schema.table_name}")
+        for schema in schemas:
+            definitions = [f"{name} {self.column_type(col_type)}" for name, col_type in schema.columns.items()]
+            if schema.primary_key:
+                definitions.append(f"PRIMARY KEY ({', '.join(schema.primary_key)})")
+            definitions.extend(
+                f"FOREIGN KEY ({', '.join(columns)}) REFERENCES {ref_table} ({', '.join(ref_columns)})"
+                for columns, ref_table, ref_columns in schema.foreign_keys
+            )
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {schema.table_name} ({', '.join(definitions)})")
+
+    @staticmethod
+    def column_type(col_type: str) -> str:
+        """YAMLの型をSQLiteの型に変換（型名から型親和性が決まるため、ENUM・SERIAL以外はそのまま）"""
+        if col_type.startswith('ENUM'):
+            return 'TEXT'
+        if col_type.startswith('SERIAL'):
+            return 'INTEGER'
+        return col_type
+
+    def load_batch(self, table_name: str, columns: Sequence[str], value_rows: List[Sequence[str]],
+                   now: str) -> None:
+        """1バッチを1トランザクションで投入（PRAGMA foreign_keys はトランザクション外でのみ変更可能）"""
+        statement = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        self.conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            self.conn.execute("BEGIN")
+            try:
+                self.conn.executemany(
+                    statement, [[sql_literal_to_param(literal, now) for literal in values] for values in value_rows]
+                )
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+        finally:
+            self.conn.execute("PRAGMA foreign_keys = ON")
+
+    def foreign_key_violations(self) -> Dict[str, int]:
+        """外部キー制約の違反件数（テーブルごと）"""
+        violations: Dict[str, int] = {}
+        for table_name, *_ in self.conn.execute("PRAGMA foreign_key_check"):
+            violations[table_name] = violations.get(table_name, 0) + 1
+        return violations
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class PostgresLoadTarget:
+    """PostgreSQL投入先（psycopg2 の COPY FROM STDIN）"""
+
+    name = 'postgresql'
+
+    def __init__(self, dsn: str, psycopg2: types.ModuleType):
+        """初期化
+
+        Args:
+            dsn (str): 接続文字列
+            psycopg2 (module): psycopg2 モジュール（任意依存のため呼び出し側で読み込む）
+        """
+        self.conn = psycopg2.connect(dsn)
+        self.schemas: List[TableSchema] = []
+
+    def create_tables(self, schemas: List[TableSchema], reset: bool = False) -> None:
+        self.schemas = schemas
+        with self.conn.cursor() as cursor:
+            if reset:
+                for schema in reversed(schemas):
+                    cursor.execute(f"DROP TABLE IF EXISTS {schema.table_name} CASCADE")
+            for schema in schemas:
+                definitions = [f"{name} {self.column_type(col_type)}" for name, col_type in schema.columns.items()]
+                if schema.primary_key:
+                    definitions.append(f"PRIMARY KEY ({', '.join(schema.primary_key)})")
+                cursor.execute(f"CREATE TABLE IF NOT EXISTS {schema.table_name} ({', '.join(definitions)})")
+            # 外部キーは全テーブルの作成後に追加する（循環参照に対応）
+            for schema in schemas:
+                for i, (columns, ref_table, ref_columns) in enumerate(schema.foreign_keys):
+                    constraint = f"fk_{schema.table_name}_{i}".lower()
+                    cursor.execute(f"ALTER TABLE {schema.table_name} DROP CONSTRAINT IF EXISTS {constraint}")
+                    cursor.execute(
+                        f"ALTER TABLE {schema.table_name} ADD CONSTRAINT {constraint} "
+                        f"FOREIGN KEY ({', '.join(columns)}) REFERENCES {ref_table} ({', '.join(ref_columns)})"
+                    )
+        self.conn.commit()
+
+    @staticmethod
+    def column_type(col_type: str) -> str:
+        """YAMLの型をPostgreSQLの型に変換"""
+        if col_type.startswith('ENUM'):
+            return 'TEXT'
+        return col_type
+
+    def load_batch(self, table_name: str, columns: Sequence[str], value_rows: List[Sequence[str]],
+                   now: str) -> None:
+        """1バッチを1トランザクションで投入
+
+        session_replication_role = replica の間は外部キー制約のトリガーが動作しない
+        （SET LOCAL のためトランザクション終了時に元に戻る。スーパーユーザー権限が必要）。
+        """
+        header, _, data = render_copy(table_name, columns, value_rows, now=now).partition("\n")
+        try:
+            with self.conn.cursor() as cursor:
+                cursor.execute("SET LOCAL session_replication_role = replica")
+                cursor.copy_expert(header.rstrip(";"), io.StringIO(data[:-len("\\.")]))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def foreign_key_violations(self) -> Dict[str, int]:
+        """外部キー制約の違反件数（テーブルごと）"""
+        violations: Dict[str, int] = {}
+        with self.conn.cursor() as cursor:
+            for schema in self.schemas:
+                for columns, ref_table, ref_columns in schema.foreign_keys:
+                    match = ' AND '.join(f"p.{ref} = c.{col}" for col, ref in zip(columns, ref_columns))
+                    not_null = ' AND '.join(f"c.{col} IS NOT NULL" for col in columns)
+                    cursor.execute(
+                        f"SELECT COUNT(*) FROM {schema.table_name} c WHERE {not_null} "
+                        f"AND NOT EXISTS (SELECT 1 FROM {ref_table} p WHERE {match})"
+                    )
+                    count = cursor.fetchone()[0]
+                    if count:
+                        violations[schema.table_name] = violations.get(schema.table_name, 0) + count
+        self.conn.rollback()
+        return violations
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class SampleDataLoader:
+    """サンプルデータ一括投入
+
+    テーブルの作成から外部キーの依存順の投入までを行います。
+    """
+
+    def __init__(
+        self,
+        target,
+        source: str = 'yaml',
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        sql_dir: str = SAMPLE_DATA_DIR,
+        seed: Optional[int] = None,
+        resolver: Optional[TableDependencyResolver] = None,
+        logger: DatabaseToolsLogger = None
+    ):
+        """初期化
+
+        Args:
+            target: 投入先（SqliteLoadTarget / PostgresLoadTarget）
+            source (str): 読み込み元（'yaml' または 'sql'）
+            batch_size (int): 1トランザクションあたりの行数
+            sql_dir (str): source='sql' の場合のサンプルデータSQLのディレクトリ
+            seed (int, optional): source='yaml' の場合のID生成シード
+            resolver (TableDependencyResolver, optional): YAML読み込み・依存関係解決
+            logger (DatabaseToolsLogger, optional): ログ出力インスタンス
+        """
+        if source not in SOURCES:
+            raise ValueError(f"未対応の読み込み元: {source}（{', '.join(SOURCES)}）")
+        if source == 'sql' and iter_file_rows is None:
+            raise ImportError("scripts/sql_values_tokenizer.py を読み込めません")
+        self.target = target
+        self.source = source
+        self.batch_size = max(1, batch_size)
+        self.sql_dir = Path(sql_dir)
+        self.resolver = resolver or TableDependencyResolver()
+        self.logger = logger or get_logger(__name__)
+        self.sql_generator = EnhancedSQLGenerator(seed=seed)
+
+    def load(self, tables: Optional[List[str]] = None, reset: bool = False) -> Dict[str, Any]:
+        """テーブルを作成し、サンプルデータを依存順に投入
+
+        Args:
+            tables (List[str], optional): 投入対象テーブル（省略時はテーブル詳細定義YAMLの全テーブル）
+            reset (bool): 既存のテーブルを削除してから作成する
+
+        Returns:
+            Dict[str, Any]: 投入結果（テーブルごとの件数・処理時間・rows/s、外部キー違反件数）
+        """
+        if tables is None:
+            tables = list_table_details_tables(self.resolver.table_details_dir)
+        self.resolver.load_table_dependencies(tables)
+        order = self.resolver.resolve_execution_order(tables)
+        schemas = self.build_schemas(order)
+        self.target.create_tables(schemas, reset)
+
+        results = {
+            'success': True,
+            'target': self.target.name,
+            'source': self.source,
+            'total_rows': 0,
+            'execution_order': order,
+            'tables': {},
+            'errors': {},
+            'foreign_key_violations': {}
+        }
+        started = time.perf_counter()
+        for schema in schemas:
+            errors: List[str] = []
+            try:
+                info = self.load_table(schema, errors)
+            except Exception as e:
+                errors.append(f"投入に失敗: {e}")
+                info = None
+            if errors:
+                results['errors'][schema.table_name] = errors
+            if info is None:
+                results['success'] = False
+                continue
+            results['tables'][schema.table_name] = info
+            results['total_rows'] += info['rows']
+
+        results['seconds'] = time.perf_counter() - started
+        results['foreign_key_violations'] = self.target.foreign_key_violations()
+        for table_name, count in results['foreign_key_violations'].items():
+            self.logger.warning(f"{table_name}: 外部キー制約の違反 {count}件")
+        return results
+
+    def load_table(self, schema: TableSchema, errors: List[str]) -> Dict[str, Any]:
+        """1テーブルをバッチごとに投入
+
+        Returns:
+            Dict[str, Any]: 投入結果（件数・バッチ数・処理時間・rows/s）
+        """
+        table_name = schema.table_name
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        row_count = 0
+        batch_count = 0
+        started = time.perf_counter()
+        for columns, value_rows in group_rows(self.iter_rows(table_name, errors), self.batch_size):
+            self.target.load_batch(table_name, columns, value_rows, now)
+            row_count += len(value_rows)
+            batch_count += 1
+        elapsed = time.perf_counter() - started
+
+        self.logger.info(f"{table_name}: {row_count}件を投入 ({elapsed:.3f}秒)")
+        return {
+            'rows': row_count,
+            'batches': batch_count,
+            'seconds': elapsed,
+            'rows_per_second': row_count / elapsed if elapsed > 0 else 0.0
+        }
+
+    def iter_rows(self, table_name: str, errors: List[str]) -> Iterator[SqlRow]:
+        """読み込み元から (カラム名リスト, SQLリテラルのリスト) を順に返す"""
+        if self.source == 'yaml':
+            yield from self.sql_generator.iter_sql_rows(table_name, self.resolver.tables_data[table_name], errors)
+            return
+
+        sql_file = self.sql_dir / f"{table_name}_sample_data.sql"
+        if not sql_file.exists():
+            errors.append(f"サンプルデータSQLが存在しません: {sql_file}")
+            return
+        for row_table, columns, values in iter_file_rows(sql_file):
+            if row_table == table_name:
+                yield columns, values
+
+    def build_schemas(self, order: List[str]) -> List[TableSchema]:
+        """テーブル詳細定義YAMLから投入先のテーブル定義を作成（依存順）"""
+        schemas = {}
+        for table_name in order:
+            yaml_data = self.resolver.tables_data[table_name]
+            # iter_sql_rows が補う共通カラム（id・created_at など）を含める
+            columns = self.sql_generator.extract_column_info(yaml_data)
+            primary_key = [
+                col['name'] for col in (yaml_data.get('columns') or []) + (yaml_data.get('business_columns') or [])
+                if isinstance(col, dict) and col.get('primary_key') and col.get('name') in columns
+            ]
+            if not primary_key and 'id' in columns:
+                primary_key = ['id']
+            schemas[table_name] = TableSchema(table_name, columns, primary_key)
+
+        for schema in schemas.values():
+            for fk in self.resolver.tables_data[schema.table_name].get('foreign_keys') or []:
+                if not isinstance(fk, dict) or not isinstance(fk.get('references'), dict):
+                    continue
+                ref_table = fk['references'].get('table')
+                ref_columns = list(fk['references'].get('columns') or [])
+                columns = list(fk.get('columns') or [])
+                # 参照先が投入対象の主キーの場合のみ作成（PostgreSQLでは一意な参照先が必要）
+                if ref_table in schemas and ref_columns == schemas[ref_table].primary_key \
+                        and columns and all(col in schema.columns for col in columns):
+                    schema.foreign_keys.append((columns, ref_table, ref_columns))
+        return list(schemas.values())
+
+
+def main():
+    """メイン関数"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='サンプルデータ一括投入（SQLite / PostgreSQL）')
+    parser.add_argument('--source', choices=SOURCES, default='yaml',
+                        help='読み込み元（yaml: テーブル詳細定義YAMLの sample_data、sql: data/*_sample_data.sql）')
+    parser.add_argument('--database', default=':memory:', help='SQLiteのデータベースファイル（既定: インメモリ）')
+    parser.add_argument('--dsn', help='PostgreSQL接続文字列（指定時は psycopg2 で PostgreSQL に投入）')
+    parser.add_argument('--tables', help='投入対象テーブル（カンマ区切り、省略時は全テーブル）')
+    parser.add_argument('--sql-dir', default=SAMPLE_DATA_DIR, help='サンプルデータSQLのディレクトリ（--source sql）')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='1トランザクションあたりの行数')
+    parser.add_argument('--seed', type=int, help='IDの生成シード（--source yaml）')
+    parser.add_argument('--reset', action='store_true', help='既存のテーブルを削除してから作成')
+    args = parser.parse_args()
+
+    if args.dsn:
+        try:
+            import psycopg2
+        except ImportError:
+            print("psycopg2 がインストールされていません（pip install psycopg2-binary）")
+            return 1
+        target = PostgresLoadTarget(args.dsn, psycopg2)
+    else:
+        target = SqliteLoadTarget(args.database)
+
+    tables = [name.strip() for name in args.tables.split(',')] if args.tables else None
+    try:
+        loader = SampleDataLoader(target, args.source, args.batch_size, args.sql_dir, args.seed)
+        result = loader.load(tables, reset=args.reset)
+    finally:
+        target.close()
+
+    for table_name, info in result['tables'].items():
+        print(f"{table_name}: {info['rows']:,}件 {info['rows_per_second']:,.0f} rows/s")
+    for table_name, errors in result['errors'].items():
+        for error in errors:
+            print(f"{table_name}: {error}")
+    violations = result['foreign_key_violations']
+    if violations:
+        print(f"外部キー制約の違反: {sum(violations.values()):,}件（{len(violations)}テーブル）")
+    print(f"合計: {result['total_rows']:,}件 ({result['seconds']:.2f}秒, {result['target']})")
+    return 0 if result['success'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
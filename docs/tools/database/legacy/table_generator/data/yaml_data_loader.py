@@ -22,6 +22,10 @@ from shared.core.models import (
 )
 from table_generator.utils.yaml_loader import YamlLoader
 from shared.utils.file_utils import FileManager as FileUtils
+from shared.performance.yaml_cache import cached_yaml_load
+from shared.utils.graph_utils import (
+    strongly_connected_components, describe_cycle
+)
 
 
 class YamlDataLoader:
@@ -66,7 +70,7 @@ class YamlDataLoader:
                 return None
             
             # YAMLファイルを読み込み
-            yaml_data = self.yaml_loader.load_yaml_file(yaml_file)
+            yaml_data = cached_yaml_load(yaml_file)
             if not yaml_data:
                 self.logger.error(f"YAML定義の読み込みに失敗: {yaml_file}")
                 return None
@@ -437,43 +441,53 @@ class YamlDataLoader:
         
         return True
     
-    def _check_circular_references(self, table_definitions: Dict[str, TableDefinition]) -> List[str]:
-        """循環参照のチェック
+    def get_dependency_graph(self, table_definitions: Dict[str, TableDefinition]) -> Dict[str, List[str]]:
+        """外部キー依存グラフを取得
         
         Args:
             table_definitions (Dict[str, TableDefinition]): テーブル定義辞書
             
         Returns:
-            List[str]: 循環参照のパスリスト
+            Dict[str, List[str]]: テーブル名 -> 参照先テーブル名リスト
         """
-        circular_refs = []
+        return {
+            table_name: [fk.reference_table for fk in (table_def.foreign_keys or [])]
+            for table_name, table_def in table_definitions.items()
+        }
+    
+    def get_strongly_connected_components(self, table_definitions: Dict[str, TableDefinition]) -> List[List[str]]:
+        """外部キー依存グラフの強連結成分を取得
         
-        def find_path(current_table: str, target_table: str, path: List[str]) -> bool:
-            if current_table == target_table and len(path) > 1:
-                return True
-            
-            if current_table in path:
-                return False
-            
-            if current_table not in table_definitions:
-                return False
-            
-            table_def = table_definitions[current_table]
-            if not table_def.foreign_keys:
-                return False
-            
-            new_path = path + [current_table]
+        参照先テーブルを含む成分が先に並ぶため、サンプルデータ生成の投入順序としてそのまま利用できる。
+        2テーブル以上の成分、または自己参照を持つ成分が循環参照となる。
+        
+        Args:
+            table_definitions (Dict[str, TableDefinition]): テーブル定義辞書
             
-            for fk in table_def.foreign_keys:
-                if find_path(fk.reference_table, target_table, new_path):
-                    return True
+        Returns:
+            List[List[str]]: 強連結成分のリスト
+        """
+        return strongly_connected_components(self.get_dependency_graph(table_definitions))
+    
+    def _check_circular_references(self, table_definitions: Dict[str, TableDefinition]) -> List[str]:
+        """循環参照のチェック
+        
+        強連結成分分解により循環（自己参照を含む）をO(V+E)で検出します。
+        循環を含む強連結成分ごとに1件報告し、代表の循環経路に含まれないテーブルは成分として併記します。
+        
+        Args:
+            table_definitions (Dict[str, TableDefinition]): テーブル定義辞書
             
-            return False
+        Returns:
+            List[str]: 循環参照のリスト（例: "A -> B -> A", "A -> B -> A（循環成分: A, B, C）"）
+        """
+        graph = self.get_dependency_graph(table_definitions)
+        circular_refs = []
         
-        # 各テーブルから自分自身への循環参照をチェック
-        for table_name in table_definitions.keys():
-            if find_path(table_name, table_name, []):
-                circular_refs.append(table_name)
+        for component in strongly_connected_components(graph):
+            description = describe_cycle(component, graph)
+            if description:
+                circular_refs.append(description)
         
         return circular_refs
     
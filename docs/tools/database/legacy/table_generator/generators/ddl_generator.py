@@ -17,6 +17,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.core.logger import DatabaseToolsLogger, get_logger
 from shared.core.models import TableDefinition, ColumnDefinition, IndexDefinition, ForeignKeyDefinition
+from shared.generators.base_generator import table_trace_attributes
+from shared.monitoring.tracing import traced
 from table_generator.utils.sql_utils import SqlUtils
 
 
@@ -38,6 +40,7 @@ class DDLGenerator:
         
         self.logger.info("DDLGenerator が初期化されました")
     
+    @traced(category="generator", attributes=table_trace_attributes)
     def generate_table_ddl(self, table_def: TableDefinition, 
                           charset: str = 'utf8mb4', 
                           collation: str = 'utf8mb4_unicode_ci') -> str:
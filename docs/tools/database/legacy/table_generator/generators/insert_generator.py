@@ -18,6 +18,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.core.logger import DatabaseToolsLogger, get_logger
 from shared.core.models import TableDefinition, ColumnDefinition
+from shared.generators.base_generator import table_trace_attributes
+from shared.generators.sql_batch import DEFAULT_BATCH_SIZE, render_statements, validate_mode
+from shared.monitoring.tracing import traced
 
 
 class InsertGenerator:
@@ -26,14 +29,21 @@ class InsertGenerator:
     テーブル定義とサンプルデータからINSERT文を生成します。
     """
     
-    def __init__(self, logger: DatabaseToolsLogger = None):
+    def __init__(self, logger: DatabaseToolsLogger = None, insert_mode: Optional[str] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
         """初期化
         
         Args:
             logger (DatabaseToolsLogger, optional): ログ出力インスタンス
+            insert_mode (str, optional): 出力形式（insert / multi_insert / on_conflict / copy / copy_csv）。
+                未指定の場合は全行を1つのINSERT文に整形して出力
+            batch_size (int): 複数行INSERTの1文あたりの行数
         """
         self.logger = logger or get_logger()
+        self.insert_mode = validate_mode(insert_mode) if insert_mode else None
+        self.batch_size = batch_size
     
+    @traced(category="generator", attributes=table_trace_attributes)
     def generate_insert_sql(self, table_def: TableDefinition) -> str:
         """INSERT文を生成
         
@@ -59,6 +69,10 @@ class InsertGenerator:
             all_columns = self._get_all_columns(table_def)
             column_names = [col.name for col in all_columns]
             
+            if self.insert_mode:
+                lines.extend(self._generate_mode_statements(table_def, all_columns))
+                return "\n".join(lines)
+            
             # INSERT文のヘッダー
             lines.append(f"INSERT INTO {table_def.table_name} (")
             
@@ -109,6 +123,29 @@ class InsertGenerator:
             self.logger.error(f"INSERT文生成でエラー: {str(e)}")
             return self._generate_error_comment(table_def, str(e))
     
+    def _generate_mode_statements(self, table_def: TableDefinition,
+                                  all_columns: List[ColumnDefinition]) -> List[str]:
+        """出力形式（insert_mode）に応じたSQL文を生成
+        
+        Args:
+            table_def (TableDefinition): テーブル定義
+            all_columns (List[ColumnDefinition]): 全カラムリスト
+            
+        Returns:
+            List[str]: SQL文の行リスト
+        """
+        column_names = [col.name for col in all_columns]
+        rows = [
+            (column_names, [self._format_column_value(col, sample_row.get(col.name)) for col in all_columns])
+            for sample_row in table_def.sample_data
+        ]
+        
+        lines = []
+        for statement in render_statements(table_def.table_name, rows, self.insert_mode, self.batch_size):
+            lines.append(statement)
+            lines.append("")
+        return lines
+    
     def _get_all_columns(self, table_def: TableDefinition) -> List[ColumnDefinition]:
         """全カラム（業務カラム + 共通カラム）を取得
         
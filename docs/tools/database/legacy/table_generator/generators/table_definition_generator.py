@@ -18,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from shared.core.logger import DatabaseToolsLogger, get_logger
 from shared.core.config import DatabaseToolsConfig
 from shared.core.models import TableDefinition, GenerationResult, ProcessingResult, BusinessColumnDefinition
+from shared.monitoring.tracing import trace_span
 from table_generator.utils.yaml_loader import YamlLoader
 from shared.utils.file_utils import FileManager as FileUtils
 from table_generator.utils.sql_utils import SqlUtils
@@ -93,9 +94,10 @@ class TableDefinitionGenerator:
                 
                 try:
                     # テーブル定義を生成
-                    table_result = self._process_table(
-                        table_name, table_info, output_dir, dry_run
-                    )
+                    with trace_span("table_generator.table", category="generator", table=table_name):
+                        table_result = self._process_table(
+                            table_name, table_info, output_dir, dry_run
+                        )
                     
                     if table_result.success:
                         result.processed_files.extend(table_result.processed_files)
@@ -15,6 +15,8 @@ from typing import List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared.core.logger import get_logger
+from shared.generators.sql_batch import INSERT_MODES, DEFAULT_BATCH_SIZE
+from shared.monitoring.profiling import add_profile_arguments, profile_command
 from table_generator.core import Logger
 from table_generator.core import Adapters
 
@@ -49,21 +51,43 @@ def parse_arguments():
         help="ドライラン実行（ファイル出力なし）"
     )
     
+    parser.add_argument(
+        "--insert-mode",
+        choices=INSERT_MODES,
+        default="insert",
+        help="サンプルデータSQLの出力形式（デフォルト: insert）"
+    )
+    
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"複数行INSERTの1文あたりの行数（デフォルト: {DEFAULT_BATCH_SIZE}）"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="詳細ログ出力"
     )
     
+    add_profile_arguments(parser)
+    
     return parser.parse_args()
 
 
 def main():
     """メイン実行関数"""
+    # 引数解析
+    args = parse_arguments()
+    
+    with profile_command(args, "generate"):
+        return run(args)
+
+
+def run(args):
+    """テーブル生成を実行"""
     try:
-        # 引数解析
-        args = parse_arguments()
-        
         # ログ設定
         logger = Logger(enable_color=True)
         if args.verbose:
@@ -73,7 +97,7 @@ def main():
         base_dir = Path(__file__).parent.parent.parent
         
         # テーブル生成サービスを初期化
-        service = Adapters()
+        service = Adapters({'insert_mode': args.insert_mode, 'batch_size': args.batch_size})
         
         # 出力ディレクトリを設定
         output_dirs = {
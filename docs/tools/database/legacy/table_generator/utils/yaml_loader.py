@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+YAMLローダー
+
+テーブル詳細定義YAMLの読み込み・TableDefinition への変換と、
+テーブル一覧.md からのテーブル名取得を行います。
+読み込み・変換は shared の YAML キャッシュ / YamlParser に委譲します。
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from shared.core.logger import DatabaseToolsLogger, get_logger
+from shared.core.models import TableDefinition
+from shared.parsers.yaml_parser import YamlParser
+from shared.performance.yaml_cache import cached_yaml_load
+
+
+class YamlLoader:
+    """YAMLローダークラス"""
+
+    def __init__(self, logger: Optional[DatabaseToolsLogger] = None):
+        self.logger = logger or get_logger(__name__)
+        self.parser = YamlParser()
+
+    def load_yaml_file(self, yaml_file: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """YAMLファイルを読み込み（失敗時はNone）"""
+        try:
+            return cached_yaml_load(Path(yaml_file))
+        except Exception as e:
+            self.logger.error(f"YAMLファイル読み込みエラー: {yaml_file} - {e}")
+            return None
+
+    def parse_table_definition(self, yaml_data: Dict[str, Any]) -> Optional[TableDefinition]:
+        """YAMLデータを TableDefinition に変換（失敗時はNone）"""
+        try:
+            return self.parser._build_table_definition(yaml_data)
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.error(f"テーブル定義の変換エラー: {e}")
+            return None
+
+    def get_table_list_from_markdown(self, table_list_file: Union[str, Path]) -> List[str]:
+        """テーブル一覧.md の「| TBL-xxx | カテゴリ | テーブル名 | ...」行からテーブル名を取得"""
+        tables = []
+        with open(table_list_file, encoding='utf-8') as f:
+            for line in f:
+                if not line.startswith('| TBL-'):
+                    continue
+                cells = line.split('|')
+                if len(cells) > 3 and cells[3].strip():
+                    tables.append(cells[3].strip())
+        return tables
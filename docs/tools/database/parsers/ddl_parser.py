@@ -2,33 +2,29 @@
 DDL統一パーサー
 
 DDL（SQL）ファイルの解析と検証を行う
+解析処理は統合DDL解析エンジン（legacy/shared/parsers/ddl_engine.py）に委譲する
 """
 
-import re
+import sys
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from .base_parser import BaseParser
 from ..core import ValidationResult, ParseError
 
+# 統合DDL解析エンジン（legacy/shared）のパス解決
+_legacy_dir = Path(__file__).parent.parent / "legacy"
+if str(_legacy_dir) not in sys.path:
+    sys.path.insert(0, str(_legacy_dir))
+
+from shared.parsers.ddl_engine import load_ddl_tables, parse_ddl_tables, format_column_type
+
 
 class DdlParser(BaseParser):
     """DDL専用パーサー"""
     
     def __init__(self):
         super().__init__("ddl")
-        self.table_pattern = re.compile(
-            r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?([^\s(]+)\s*\(',
-            re.IGNORECASE | re.MULTILINE
-        )
-        self.column_pattern = re.compile(
-            r'^\s*([^\s]+)\s+([^\s,]+)(?:\s*\([^)]+\))?\s*(.*?)(?:,\s*$|$)',
-            re.MULTILINE
-        )
-        self.constraint_pattern = re.compile(
-            r'(?:CONSTRAINT\s+([^\s]+)\s+)?(PRIMARY\s+KEY|FOREIGN\s+KEY|UNIQUE|CHECK)\s*\([^)]+\)',
-            re.IGNORECASE
-        )
     
     def get_supported_extensions(self) -> List[str]:
         """サポートする拡張子"""
@@ -58,7 +54,7 @@ class DdlParser(BaseParser):
                 raise ParseError(f"DDLファイルが空です: {file_path}", file_path)
             
             # テーブル定義を抽出
-            tables = self._extract_tables(content)
+            tables = self._extract_tables(content, file_path)
             
             if not tables:
                 raise ParseError(f"テーブル定義が見つかりません: {file_path}", file_path)
@@ -110,143 +106,57 @@ class DdlParser(BaseParser):
         
         return result
     
-    def _extract_tables(self, content: str) -> List[Dict[str, Any]]:
-        """DDLからテーブル定義を抽出"""
-        tables = []
-        
-        # CREATE TABLE文を検索
-        table_matches = self.table_pattern.finditer(content)
-        
-        for match in table_matches:
-            table_name = match.group(1).strip('`"[]')
-            start_pos = match.start()
-            
-            # テーブル定義の終了位置を検索
-            paren_count = 0
-            end_pos = start_pos
-            in_table_def = False
-            
-            for i, char in enumerate(content[start_pos:], start_pos):
-                if char == '(':
-                    paren_count += 1
-                    in_table_def = True
-                elif char == ')':
-                    paren_count -= 1
-                    if paren_count == 0 and in_table_def:
-                        end_pos = i + 1
-                        break
-            
-            if end_pos > start_pos:
-                table_def = content[start_pos:end_pos]
-                table_info = self._parse_table_definition(table_name, table_def)
-                tables.append(table_info)
-        
-        return tables
+    def _extract_tables(self, content: str, file_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """DDLからテーブル定義を抽出（統合DDL解析エンジンの結果を辞書形式に変換）"""
+        if file_path is not None:
+            table_definitions = load_ddl_tables(file_path, content)
+        else:
+            table_definitions = parse_ddl_tables(content)
+        
+        return [self._table_to_dict(table_def) for table_def in table_definitions]
     
-    def _parse_table_definition(self, table_name: str, table_def: str) -> Dict[str, Any]:
-        """個別のテーブル定義を解析"""
-        # カラム定義部分を抽出
-        paren_start = table_def.find('(')
-        paren_end = table_def.rfind(')')
-        
-        if paren_start == -1 or paren_end == -1:
-            return {
-                'name': table_name,
-                'columns': [],
-                'constraints': [],
-                'definition': table_def
+    def _table_to_dict(self, table_def) -> Dict[str, Any]:
+        """テーブル定義（TableDefinition）を辞書形式に変換"""
+        columns = [
+            {
+                'name': column.name,
+                'type': format_column_type(column),
+                'nullable': column.nullable,
+                'primary_key': column.primary_key,
+                'unique': column.unique,
+                'default': column.default
             }
+            for column in table_def.columns
+        ]
         
-        columns_section = table_def[paren_start + 1:paren_end]
-        
-        # カラムと制約を分離
-        columns = []
         constraints = []
-        
-        lines = [line.strip() for line in columns_section.split('\n') if line.strip()]
-        
-        for line in lines:
-            line = line.rstrip(',')
-            
-            # 制約かカラムかを判定
-            if self._is_constraint_line(line):
-                constraint_info = self._parse_constraint(line)
-                if constraint_info:
-                    constraints.append(constraint_info)
-            else:
-                column_info = self._parse_column(line)
-                if column_info:
-                    columns.append(column_info)
+        primary_columns = [column.name for column in table_def.columns if column.primary_key]
+        if primary_columns:
+            constraints.append({'name': None, 'type': 'PRIMARY_KEY', 'columns': primary_columns})
+        for fk in table_def.foreign_keys:
+            constraints.append({
+                'name': fk.name or None,
+                'type': 'FOREIGN_KEY',
+                'columns': list(fk.columns),
+                'references_table': fk.references_table,
+                'references_columns': list(fk.references_columns or [])
+            })
+        for constraint in table_def.constraints:
+            constraints.append({
+                'name': constraint.name or None,
+                'type': constraint.type,
+                'columns': list(constraint.columns),
+                'condition': constraint.condition
+            })
         
         return {
-            'name': table_name,
+            'name': table_def.table_name,
             'columns': columns,
             'constraints': constraints,
-            'definition': table_def
-        }
-    
-    def _is_constraint_line(self, line: str) -> bool:
-        """行が制約定義かどうかを判定"""
-        constraint_keywords = [
-            'PRIMARY KEY', 'FOREIGN KEY', 'UNIQUE', 'CHECK', 'CONSTRAINT'
-        ]
-        line_upper = line.upper()
-        return any(keyword in line_upper for keyword in constraint_keywords)
-    
-    def _parse_column(self, line: str) -> Optional[Dict[str, Any]]:
-        """カラム定義を解析"""
-        # 基本的なカラム定義のパターンマッチング
-        parts = line.split()
-        if len(parts) < 2:
-            return None
-        
-        column_name = parts[0].strip('`"[]')
-        data_type = parts[1]
-        
-        # 属性を解析
-        line_upper = line.upper()
-        nullable = 'NOT NULL' not in line_upper
-        primary_key = 'PRIMARY KEY' in line_upper
-        unique = 'UNIQUE' in line_upper
-        
-        # デフォルト値を抽出
-        default_match = re.search(r'DEFAULT\s+([^,\s]+)', line, re.IGNORECASE)
-        default_value = default_match.group(1) if default_match else None
-        
-        return {
-            'name': column_name,
-            'type': data_type,
-            'nullable': nullable,
-            'primary_key': primary_key,
-            'unique': unique,
-            'default': default_value
-        }
-    
-    def _parse_constraint(self, line: str) -> Optional[Dict[str, Any]]:
-        """制約定義を解析"""
-        line_upper = line.upper()
-        
-        constraint_type = None
-        if 'PRIMARY KEY' in line_upper:
-            constraint_type = 'PRIMARY_KEY'
-        elif 'FOREIGN KEY' in line_upper:
-            constraint_type = 'FOREIGN_KEY'
-        elif 'UNIQUE' in line_upper:
-            constraint_type = 'UNIQUE'
-        elif 'CHECK' in line_upper:
-            constraint_type = 'CHECK'
-        
-        if not constraint_type:
-            return None
-        
-        # 制約名を抽出
-        name_match = re.search(r'CONSTRAINT\s+([^\s]+)', line, re.IGNORECASE)
-        constraint_name = name_match.group(1) if name_match else None
-        
-        return {
-            'name': constraint_name,
-            'type': constraint_type,
-            'definition': line
+            'indexes': [
+                {'name': index.name, 'columns': list(index.columns), 'unique': index.unique}
+                for index in table_def.indexes
+            ]
         }
     
     def _validate_table(self, table: Dict[str, Any], index: int, result: ValidationResult) -> None:
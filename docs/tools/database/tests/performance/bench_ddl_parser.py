@@ -0,0 +1,144 @@
+"""
+DDLパーサー マイクロベンチマーク
+
+docs/design/database/ddl/*.sql を対象に統合DDL解析エンジン（shared.parsers.ddl_engine）の
+解析時間を測定する。各ツールの DDL パーサーはこのエンジンに委譲しているため、エンジン単体を測定する。
+
+- parse  : parse_ddl_tables（メモ化なし）
+- cached : DDLParseCache.get_tables（2回目以降はメモ化された結果を返す）
+
+--baseline-ref を指定すると、そのgitリビジョンの ddl_engine.py を読み込んで同条件で比較し、
+解析結果が一致することも確認する（ddl_engine.py が存在するリビジョンのみ指定可）。
+
+使用例:
+    python tests/performance/bench_ddl_parser.py
+    python tests/performance/bench_ddl_parser.py --baseline-ref HEAD~1 --repeat 50
+"""
+
+import argparse
+import importlib
+import statistics
+import subprocess
+import sys
+import time
+import types
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parents[2]
+LEGACY_DIR = TOOLS_DIR / "legacy"
+ENGINE_PATH = LEGACY_DIR / "shared" / "parsers" / "ddl_engine.py"
+PROJECT_ROOT = TOOLS_DIR.parents[2]
+DEFAULT_DDL_DIR = PROJECT_ROOT / "docs/design/database/ddl"
+EXCLUDED_DDL_FILES = ('all_tables.sql', '------------.sql')
+SNAPSHOT_IGNORED_FIELDS = ('created_at', 'updated_at')
+
+sys.path.insert(0, str(LEGACY_DIR))
+
+
+def load_current_engine() -> types.ModuleType:
+    """作業ツリーの ddl_engine.py を読み込む"""
+    return importlib.import_module("shared.parsers.ddl_engine")
+
+
+def load_baseline_engine(ref: str) -> types.ModuleType:
+    """指定gitリビジョンの ddl_engine.py を shared.parsers 配下の別モジュールとして読み込む"""
+    relative_path = ENGINE_PATH.relative_to(PROJECT_ROOT).as_posix()
+    source = subprocess.run(
+        ["git", "show", f"{ref}:{relative_path}"],
+        cwd=PROJECT_ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    importlib.import_module("shared.parsers")
+    # 相対インポート（..core.models など）を解決できるよう shared.parsers パッケージに属させる
+    module = types.ModuleType("shared.parsers._baseline_ddl_engine")
+    module.__file__ = f"{ref}:{relative_path}"
+    module.__package__ = "shared.parsers"
+    exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
+
+
+def measure(parse: Callable[[str], Any], texts: List[str], repeat: int) -> List[float]:
+    """全ファイルの解析時間（秒）を repeat 回測定"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            parse(text)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def measure_cached(engine: types.ModuleType, files: List[Path], texts: List[str], repeat: int) -> List[float]:
+    """DDLParseCache 経由の解析時間（初回で全ファイルをメモ化し、以降はヒット）"""
+    cache = engine.DDLParseCache()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path, text in zip(files, texts):
+            cache.get_tables(path, text)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _snapshot(value: Any) -> Any:
+    """解析結果を比較用の素朴な構造に変換（生成時刻は解析結果ではないため除外）"""
+    if isinstance(value, list):
+        return [_snapshot(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "__dict__"):
+        return {key: _snapshot(item) for key, item in vars(value).items()
+                if key not in SNAPSHOT_IGNORED_FIELDS}
+    return value
+
+
+def compare_results(baseline: types.ModuleType, current: types.ModuleType, texts: List[str]) -> int:
+    """解析結果が一致しないファイル数"""
+    return sum(
+        1 for text in texts
+        if _snapshot(baseline.parse_ddl_tables(text)) != _snapshot(current.parse_ddl_tables(text))
+    )
+
+
+def _report(label: str, timings: List[float], file_count: int) -> float:
+    median = statistics.median(timings)
+    print(f"{label:<10} median {median * 1000:8.2f} ms / {file_count} files "
+          f"(min {min(timings) * 1000:.2f} ms, {file_count / median:,.0f} files/s)")
+    return median
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="DDLパーサー マイクロベンチマーク")
+    parser.add_argument("--ddl-dir", type=Path, default=DEFAULT_DDL_DIR, help="DDLディレクトリ")
+    parser.add_argument("--repeat", type=int, default=20, help="測定回数（デフォルト: 20）")
+    parser.add_argument("--baseline-ref", help="比較対象とするgitリビジョン（例: HEAD~1）")
+    args = parser.parse_args(argv)
+
+    ddl_files = [f for f in sorted(args.ddl_dir.glob("*.sql")) if f.name not in EXCLUDED_DDL_FILES]
+    texts = [f.read_text(encoding="utf-8") for f in ddl_files]
+    if not texts:
+        print(f"DDLファイルが見つかりません: {args.ddl_dir}")
+        return 1
+
+    current = load_current_engine()
+    # ウォームアップ（正規表現のコンパイル等を測定から除外）
+    measure(current.parse_ddl_tables, texts, 1)
+    current_median = _report("parse", measure(current.parse_ddl_tables, texts, args.repeat), len(texts))
+    _report("cached", measure_cached(current, ddl_files, texts, args.repeat), len(texts))
+
+    if args.baseline_ref:
+        baseline = load_baseline_engine(args.baseline_ref)
+        measure(baseline.parse_ddl_tables, texts, 1)
+        baseline_median = _report(args.baseline_ref,
+                                  measure(baseline.parse_ddl_tables, texts, args.repeat), len(texts))
+        print(f"speedup    {baseline_median / current_median:.2f}x")
+        mismatches = compare_results(baseline, current, texts)
+        print(f"mismatches {mismatches} / {len(texts)}")
+        return 1 if mismatches else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+LRUキャッシュ マイクロベンチマーク
+
+shared.performance.cache_manager の LRUCache / StripedLRUCache について、
+エントリ数ごとの put/get スループットを測定する。
+--threads を指定すると、スレッドプールからの並行 get/put も測定する。
+
+使用例:
+    python tests/performance/bench_lru_cache.py
+    python tests/performance/bench_lru_cache.py --sizes 10000 100000 1000000 --threads 8
+"""
+
+import argparse
+import importlib
+import statistics
+import sys
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parents[2]
+LEGACY_DIR = TOOLS_DIR / "legacy"
+
+sys.path.insert(0, str(LEGACY_DIR))
+
+
+def load_cache_module() -> types.ModuleType:
+    """shared.performance.cache_manager を読み込む"""
+    try:
+        return importlib.import_module("shared.performance.cache_manager")
+    except ImportError:
+        # shared/__init__.py の読み込みに失敗する環境では、パッケージ初期化を行わずに読み込む
+        for name in ("shared", "shared.performance"):
+            sys.modules.pop(name, None)
+        package = types.ModuleType("shared")
+        package.__path__ = [str(LEGACY_DIR / "shared")]
+        sys.modules["shared"] = package
+        return importlib.import_module("shared.performance.cache_manager")
+
+
+def _value(i: int) -> Any:
+    """テーブル定義の解析結果程度の小さな値"""
+    return {'table_name': f'MST_Table{i}', 'columns': [f'col{j}' for j in range(8)], 'index': i}
+
+
+def _timed(func: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure_single(cache_factory: Callable[[int], Any], size: int, repeat: int):
+    """単一スレッドでの put（空キャッシュへの size 件挿入）と get（全件ヒット）の時間"""
+    keys = [f'key:{i}' for i in range(size)]
+    values = [_value(i) for i in range(size)]
+    put_timings, get_timings = [], []
+    for _ in range(repeat):
+        cache = cache_factory(size)
+
+        def put_all():
+            for key, value in zip(keys, values):
+                cache.put(key, value)
+
+        def get_all():
+            for key in keys:
+                cache.get(key)
+
+        put_timings.append(_timed(put_all))
+        get_timings.append(_timed(get_all))
+    return put_timings, get_timings
+
+
+def measure_threaded(cache_factory: Callable[[int], Any], size: int, threads: int, repeat: int) -> List[float]:
+    """スレッドプールからの get/put 混在（9:1）の時間"""
+    keys = [f'key:{i}' for i in range(size)]
+    chunks = [keys[i::threads] for i in range(threads)]
+    timings = []
+    for _ in range(repeat):
+        cache = cache_factory(size)
+        for i, key in enumerate(keys):
+            cache.put(key, i)
+
+        def worker(chunk: List[str]) -> None:
+            for i, key in enumerate(chunk):
+                if i % 10 == 0:
+                    cache.put(key, i)
+                else:
+                    cache.get(key)
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            timings.append(_timed(lambda: list(executor.map(worker, chunks))))
+    return timings
+
+
+def _report(label: str, timings: List[float], operations: int) -> None:
+    median = statistics.median(timings)
+    print(f"{label:<28} median {median * 1000:9.2f} ms ({operations / median:>12,.0f} ops/s)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="LRUキャッシュ マイクロベンチマーク")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="エントリ数（デフォルト: 10000 100000 1000000）")
+    parser.add_argument("--repeat", type=int, default=3, help="測定回数（デフォルト: 3）")
+    parser.add_argument("--threads", type=int, default=0, help="並行測定のスレッド数（0で省略）")
+    parser.add_argument("--stripes", type=int, default=16, help="StripedLRUCache のストライプ数")
+    args = parser.parse_args(argv)
+
+    cache_manager = load_cache_module()
+    memory = 1 << 40  # メモリ上限による退避を測定対象から外す
+
+    def lru(size: int):
+        return cache_manager.LRUCache(max_size=size, max_memory=memory)
+
+    def striped(size: int):
+        return cache_manager.StripedLRUCache(max_size=size, max_memory=memory, stripes=args.stripes)
+
+    for size in args.sizes:
+        print(f"--- {size:,} entries")
+        for name, factory in (("LRUCache", lru), ("StripedLRUCache", striped)):
+            put_timings, get_timings = measure_single(factory, size, args.repeat)
+            _report(f"{name} put", put_timings, size)
+            _report(f"{name} get", get_timings, size)
+        if args.threads:
+            for name, factory in (("LRUCache", lru), ("StripedLRUCache", striped)):
+                _report(f"{name} x{args.threads} threads",
+                        measure_threaded(factory, size, args.threads, args.repeat), size)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+メトリクス収集器ベンチマーク
+
+shared.monitoring.metrics_collector の MetricsCollector について、以下を測定する。
+  - record  : 1回の記録にかかる時間（タグなし・タグあり）
+  - summary : get_summary（分位点スケッチ）と、保持中の値をソートして求める正確なパーセンタイルの時間
+  - memory  : 保持中のポイントのメモリ使用量（MetricPoint のリストとの比較）
+  - accuracy: p50 / p95 / p99 の正確な値に対する相対誤差
+
+使用例:
+    python tests/performance/bench_metrics_collector.py
+    python tests/performance/bench_metrics_collector.py --points 100000 --repeat 5
+"""
+
+import argparse
+import importlib
+import logging
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parents[2]
+LEGACY_DIR = TOOLS_DIR / "legacy"
+
+sys.path.insert(0, str(LEGACY_DIR))
+
+
+def load_metrics_module() -> types.ModuleType:
+    """shared.monitoring.metrics_collector を読み込む"""
+    try:
+        return importlib.import_module("shared.monitoring.metrics_collector")
+    except ImportError:
+        # shared/__init__.py の読み込みに失敗する環境では、パッケージ初期化を行わずに読み込む
+        sys.modules.pop("shared", None)
+        package = types.ModuleType("shared")
+        package.__path__ = [str(LEGACY_DIR / "shared")]
+        sys.modules["shared"] = package
+        return importlib.import_module("shared.monitoring.metrics_collector")
+
+
+def measure(func: Callable[[], object], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: List[float], count: int) -> float:
+    median = statistics.median(timings)
+    print(f"{label:<22} median {median / count * 1e9:10.0f} ns/op")
+    return median
+
+
+def _exact_percentiles(values: List[float]) -> List[float]:
+    # 旧実装と同じ、ソートによる正確なパーセンタイル
+    sorted_values = sorted(values)
+    return [statistics.median(sorted_values),
+            statistics.quantiles(sorted_values, n=20)[18],
+            statistics.quantiles(sorted_values, n=100)[98]]
+
+
+def _allocated(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        keep = func()
+        size = tracemalloc.get_traced_memory()[0]
+        del keep
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="メトリクス収集器ベンチマーク")
+    parser.add_argument("--points", type=int, default=10000, help="保持するポイント数（デフォルト: 10000）")
+    parser.add_argument("--repeat", type=int, default=3, help="測定回数（デフォルト: 3）")
+    parser.add_argument("--seed", type=int, default=0, help="測定値の乱数シード")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    metrics = load_metrics_module()
+    rng = random.Random(args.seed)
+    # 所要時間らしい裾の重い分布（秒）
+    values = [rng.lognormvariate(-5, 1.5) for _ in range(args.points)]
+    tags = {'validator': 'table_existence', 'file_type': '.yaml'}
+
+    def new_collector():
+        collector = metrics.MetricsCollector(max_points=args.points)
+        collector._cleanup_timer.cancel()
+        return collector
+
+    def record(with_tags: bool):
+        collector = new_collector()
+        record_metric = collector.record
+        if with_tags:
+            for value in values:
+                record_metric('check.duration', value, tags)
+        else:
+            for value in values:
+                record_metric('check.duration', value)
+        return collector
+
+    _report("record", measure(lambda: record(False), args.repeat), args.points)
+    _report("record (tags)", measure(lambda: record(True), args.repeat), args.points)
+
+    collector = record(True)
+    summary = collector.get_summary('check.duration')
+    sketch_median = _report("summary (sketch)", measure(
+        lambda: [collector.record('check.duration', values[0]), collector.get_summary('check.duration')],
+        args.repeat), 1)
+    exact_median = _report("summary (sort)", measure(lambda: _exact_percentiles(values), args.repeat), 1)
+    print(f"{'speedup':<22} {exact_median / sketch_median:.1f}x")
+
+    array_bytes = _allocated(lambda: record(True))
+    point_bytes = _allocated(lambda: [metrics.MetricPoint(datetime.now(), value, tags) for value in values])
+    print(f"{'memory (arrays)':<22} {array_bytes / 1024 / 1024:10.2f} MB")
+    print(f"{'memory (MetricPoint)':<22} {point_bytes / 1024 / 1024:10.2f} MB")
+
+    # スケッチの誤差保証は順位（q × (件数 - 1)）の値に対するもの
+    sorted_values = sorted(values)
+    exact = [sorted_values[int(q * (len(values) - 1))] for q in (0.5, 0.95, 0.99)]
+    errors = [abs(estimate - actual) / actual
+              for estimate, actual in zip((summary.p50, summary.p95, summary.p99), exact)]
+    print(f"{'relative error':<22} p50 {errors[0]:.2%}  p95 {errors[1]:.2%}  p99 {errors[2]:.2%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
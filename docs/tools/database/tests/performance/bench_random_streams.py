@@ -0,0 +1,116 @@
+"""
+乱数ストリーム・一括生成ベンチマーク
+
+BasicDataUtils の一括生成（generate_many）と、従来の値ごとの生成（generate_by_type / random.randint）の
+速度を比較する。あわせて、チャンクごとのストリームで生成した値がプロセス数に依存しないことを確認する。
+  - integer : draw_integers（getrandbits 1回）と random.randint の繰り返し
+  - date    : 日付候補からの一括抽選と generate_by_type('date') の繰り返し
+  - choice  : draw_choices と random.choice の繰り返し
+
+使用例:
+    python tests/performance/bench_random_streams.py
+    python tests/performance/bench_random_streams.py --count 1000000 --workers 4
+"""
+
+import argparse
+import datetime
+import importlib
+import logging
+import random
+import statistics
+import sys
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+TOOLS_DIR = Path(__file__).resolve().parents[2]
+LEGACY_DIR = TOOLS_DIR / "legacy"
+
+sys.path.insert(0, str(LEGACY_DIR))
+
+REFERENCE_DATE = datetime.date(2025, 4, 1)
+
+
+def load_faker_utils() -> types.ModuleType:
+    """table_generator.data.faker_utils を読み込む"""
+    try:
+        return importlib.import_module("table_generator.data.faker_utils")
+    except ImportError:
+        # パッケージ初期化（__init__.py）の読み込みに失敗する環境では、初期化を行わずに読み込む
+        for name in ("shared", "table_generator", "table_generator.data"):
+            sys.modules.pop(name, None)
+            package = types.ModuleType(name)
+            package.__path__ = [str(LEGACY_DIR.joinpath(*name.split(".")))]
+            sys.modules[name] = package
+        return importlib.import_module("table_generator.data.faker_utils")
+
+
+def generate_chunk(task: Tuple[int, str, int, int]) -> list:
+    """1チャンク分の値を生成（プロセスプールから呼び出す）"""
+    seed, table_name, chunk_index, count = task
+    logging.disable(logging.INFO)
+    utils = load_faker_utils().BasicDataUtils(seed, reference_date=REFERENCE_DATE)
+    return [
+        utils.generate_chunk(table_name, chunk_index, 'integer', count, min_value=1, max_value=1000),
+        utils.generate_chunk(table_name, chunk_index, 'date', count),
+    ]
+
+
+def measure(func: Callable[[], object], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: List[float], value_count: int) -> float:
+    median = statistics.median(timings)
+    print(f"{label:<18} median {median * 1000:9.2f} ms ({value_count / median:>12,.0f} values/s)")
+    return median
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="乱数ストリーム・一括生成ベンチマーク")
+    parser.add_argument("--count", type=int, default=1000000, help="生成する値の数（デフォルト: 1000000）")
+    parser.add_argument("--repeat", type=int, default=3, help="測定回数（デフォルト: 3）")
+    parser.add_argument("--workers", type=int, default=2, help="ストリームの一致確認に使うプロセス数")
+    parser.add_argument("--chunks", type=int, default=16, help="ストリームの一致確認のチャンク数")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    faker_utils = load_faker_utils()
+    utils = faker_utils.BasicDataUtils(0, reference_date=REFERENCE_DATE)
+    rng = random.Random(0)
+    count = args.count
+    pool = list(range(50))
+
+    cases = [
+        ("integer", lambda: utils.generate_many('integer', count, min_value=1, max_value=1000),
+         lambda: [rng.randint(1, 1000) for _ in range(count)]),
+        ("date", lambda: utils.generate_many('date', count),
+         lambda: [utils.generate_by_type('date') for _ in range(count)]),
+        ("choice", lambda: utils.generate_many('choice', count, choices=pool),
+         lambda: [rng.choice(pool) for _ in range(count)]),
+    ]
+    for label, bulk, per_value in cases:
+        bulk_median = _report(f"{label} bulk", measure(bulk, args.repeat), count)
+        per_value_median = _report(f"{label} per-value", measure(per_value, args.repeat), count)
+        print(f"{'speedup':<18} {per_value_median / bulk_median:.1f}x")
+
+    # チャンクごとのストリームはプロセス数・実行順序に依存しない
+    tasks = [(7, "MST_Employee", chunk_index, count // args.chunks) for chunk_index in range(args.chunks)]
+    sequential = [generate_chunk(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        parallel = list(executor.map(generate_chunk, tasks))
+    identical = sequential == parallel
+    print(f"streams            {args.chunks} chunks, {args.workers} workers: "
+          f"{'identical' if identical else 'MISMATCH'}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
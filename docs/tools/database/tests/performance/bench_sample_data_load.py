@@ -0,0 +1,199 @@
+"""
+サンプルデータ投入ベンチマーク
+
+テーブル詳細定義YAMLの sample_data（docs/design/database/data/*_sample_data.sql と同じデータ）を
+EnhancedSQLGenerator の各出力形式で生成し、ローカルデータベースへの投入時間を測定する。
+  - insert       : 1行1文の INSERT
+  - multi_insert : batch_size 行ごとの複数行 INSERT
+  - on_conflict  : 複数行 INSERT ... ON CONFLICT DO NOTHING
+  - copy         : COPY ... FROM STDIN（PostgreSQL のみ）
+  - copy_csv     : COPY ... FROM STDIN WITH (FORMAT csv)（PostgreSQL のみ）
+
+デフォルトは SQLite（一時ファイル）に投入する。--dsn を指定すると psycopg2 で PostgreSQL に投入する。
+投入先のテーブルは測定ごとに全カラム型なし（PostgreSQL では TEXT）で作成し直す。
+sample_data は数件ずつのため、--scale で各テーブルの行を複製して件数を増やす。
+
+SQLite はプロセス内で実行されるため1文ごとの往復コストがなく、複数行INSERTの効果は小さい
+（大きな VALUES 句は解析コストが増えるため、batch_size が大きいとかえって遅くなる）。
+サーバーとの往復が発生する PostgreSQL での比較には --dsn を使用すること。
+
+使用例:
+    python tests/performance/bench_sample_data_load.py
+    python tests/performance/bench_sample_data_load.py --scale 200 --batch-size 500
+    python tests/performance/bench_sample_data_load.py --dsn "dbname=bench user=postgres"
+"""
+
+import argparse
+import importlib
+import io
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+TOOLS_DIR = Path(__file__).resolve().parents[2]
+LEGACY_DIR = TOOLS_DIR / "legacy"
+
+sys.path.insert(0, str(LEGACY_DIR))
+
+
+def load_generator_module() -> types.ModuleType:
+    """shared.generators.sample_data_generator を読み込む"""
+    try:
+        return importlib.import_module("shared.generators.sample_data_generator")
+    except ImportError:
+        # パッケージ初期化（__init__.py）の読み込みに失敗する環境では、初期化を行わずに読み込む
+        for name in ("shared", "shared.generators"):
+            sys.modules.pop(name, None)
+            package = types.ModuleType(name)
+            package.__path__ = [str(LEGACY_DIR.joinpath(*name.split(".")))]
+            sys.modules[name] = package
+        return importlib.import_module("shared.generators.sample_data_generator")
+
+
+def load_rows(generator_module: types.ModuleType, scale: int) -> Dict[str, List[Tuple]]:
+    """依存順に全テーブルの (カラム名リスト, SQLリテラルのリスト) を生成"""
+    resolver = generator_module.TableDependencyResolver()
+    sql_generator = generator_module.EnhancedSQLGenerator()
+    tables = generator_module.list_table_details_tables()
+    resolver.load_table_dependencies(tables)
+
+    rows_by_table = {}
+    for table_name in resolver.resolve_execution_order(tables):
+        rows, _ = sql_generator.generate_sql_rows(table_name, resolver.tables_data[table_name])
+        if rows:
+            rows_by_table[table_name] = rows * scale
+    return rows_by_table
+
+
+class SqliteTarget:
+    """SQLite投入先"""
+
+    name = "sqlite"
+    supports_copy = False
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.conn = None
+
+    def reset(self, schema: Dict[str, List[str]]) -> None:
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+        self.conn = sqlite3.connect(str(self.path), isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        for table_name, columns in schema.items():
+            self.conn.execute(f"CREATE TABLE {table_name} ({', '.join(columns)})")
+
+    def load(self, statements: List[str], copy: bool) -> None:
+        self.conn.execute("BEGIN")
+        for statement in statements:
+            self.conn.execute(statement)
+        self.conn.execute("COMMIT")
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class PostgresTarget:
+    """PostgreSQL投入先（psycopg2）"""
+
+    name = "postgresql"
+    supports_copy = True
+
+    def __init__(self, dsn: str, psycopg2: types.ModuleType):
+        self.conn = psycopg2.connect(dsn)
+
+    def reset(self, schema: Dict[str, List[str]]) -> None:
+        with self.conn.cursor() as cursor:
+            for table_name, columns in schema.items():
+                cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+                cursor.execute(f"CREATE TABLE {table_name} ({', '.join(f'{col} TEXT' for col in columns)})")
+        self.conn.commit()
+
+    def load(self, statements: List[str], copy: bool) -> None:
+        with self.conn.cursor() as cursor:
+            for statement in statements:
+                if copy:
+                    header, _, data = statement.partition("\n")
+                    cursor.copy_expert(header.rstrip(";"), io.StringIO(data[:-len("\\.")]))
+                else:
+                    cursor.execute(statement)
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="サンプルデータ投入ベンチマーク")
+    parser.add_argument("--scale", type=int, default=100, help="各テーブルの行の複製数（デフォルト: 100）")
+    parser.add_argument("--batch-size", type=int, default=1000, help="複数行INSERTの1文あたりの行数")
+    parser.add_argument("--repeat", type=int, default=3, help="測定回数（デフォルト: 3）")
+    parser.add_argument("--dsn", help="PostgreSQL接続文字列（指定時は psycopg2 で PostgreSQL に投入）")
+    args = parser.parse_args(argv)
+
+    generator_module = load_generator_module()
+    sql_batch = importlib.import_module("shared.generators.sql_batch")
+    rows_by_table = load_rows(generator_module, args.scale)
+    total_rows = sum(len(rows) for rows in rows_by_table.values())
+
+    schema = {}
+    for table_name, rows in rows_by_table.items():
+        columns = []
+        for row_columns, _ in rows:
+            columns.extend(col for col in row_columns if col not in columns)
+        schema[table_name] = columns
+
+    temp_dir = tempfile.TemporaryDirectory()
+    if args.dsn:
+        try:
+            import psycopg2
+        except ImportError:
+            print("psycopg2 がインストールされていません（pip install psycopg2-binary）")
+            return 1
+        target = PostgresTarget(args.dsn, psycopg2)
+    else:
+        target = SqliteTarget(Path(temp_dir.name) / "bench.sqlite3")
+
+    print(f"target        {target.name}, {len(rows_by_table)} tables, {total_rows:,} rows "
+          f"(scale {args.scale}, batch {args.batch_size})")
+
+    baseline = None
+    for mode in sql_batch.INSERT_MODES:
+        is_copy = mode in sql_batch.COPY_MODES
+        if is_copy and not target.supports_copy:
+            print(f"{mode:<13} skipped (COPY は PostgreSQL のみ)")
+            continue
+
+        statements = {
+            table_name: sql_batch.render_statements(table_name, rows, mode, args.batch_size)
+            for table_name, rows in rows_by_table.items()
+        }
+        timings = []
+        for _ in range(args.repeat):
+            target.reset(schema)
+            start = time.perf_counter()
+            for table_statements in statements.values():
+                target.load(table_statements, is_copy)
+            timings.append(time.perf_counter() - start)
+
+        median = statistics.median(timings)
+        baseline = baseline or median
+        statement_count = sum(len(table_statements) for table_statements in statements.values())
+        print(f"{mode:<13} median {median * 1000:9.2f} ms ({total_rows / median:>10,.0f} rows/s, "
+              f"{statement_count:,} statements, {baseline / median:.1f}x)")
+
+    target.close()
+    temp_dir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,575 @@
+"""
+スケーリングベンチマーク
+
+実際のツールを 50 / 500 / 5,000 テーブルの合成スキーマで実行し、所要時間・ピークRSS・files/s を記録する。
+  - consistency_check : database_consistency_checker.main.run（CLI と同じ経路で全チェック）
+  - table_generator   : db_tools.TableGenerator（DDL・テーブル定義書の生成）
+  - yaml_validator    : YAMLFormatValidatorV2.validate_tables_parallel（全テーブル）
+  - sample_data       : SampleDataGenerator.write_sample_data_sql（全テーブル）
+
+合成スキーマは docs/design/database の実設計書を複製し、2周目以降のテーブル名に連番を付けて作成する
+（外部キー・テーブル一覧.md・entity_relationships.yaml も複製先の名前に置き換える）。
+--corpus synthetic を指定すると shared.generators.design_corpus_generator で生成した設計書を使う
+（外部キーの密度・循環参照・サンプルデータ件数・不整合の割合を指定できる）。
+プロジェクトルートは SKILL_REPORT_PROJECT_ROOT で合成スキーマに切り替え、共有キャッシュは測定ごとに削除する。
+各測定は別プロセスで実行するため、ピークRSSは測定対象ごとの値になる。
+
+結果は JSON で保存でき、compare で files/s・ピークRSS の悪化が閾値を超えた項目を検出する（終了コード 1）。
+測定対象の実行に失敗した場合も終了コード 1 を返す。
+
+使用例:
+    python tests/performance/bench_scaling.py run
+    python tests/performance/bench_scaling.py run --sizes 50 500 --output baseline.json
+    python tests/performance/bench_scaling.py run --compare baseline.json --threshold 0.2
+    python tests/performance/bench_scaling.py run --corpus synthetic --sizes 5000 --cycles 10 --inconsistency-rate 0.05
+    python tests/performance/bench_scaling.py compare baseline.json current.json
+"""
+
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+TOOLS_DIR = Path(__file__).resolve().parents[2]
+LEGACY_DIR = TOOLS_DIR / "legacy"
+CHECKER_DIR = LEGACY_DIR / "database_consistency_checker"
+DESIGN_DIR = TOOLS_DIR.parents[2] / "docs" / "design" / "database"
+
+sys.path.insert(0, str(LEGACY_DIR))
+sys.path.append(str(CHECKER_DIR))
+
+# 合成スキーマ内の設計書ディレクトリ（プロジェクトルートからの相対パス）
+CORPUS_DESIGN_SUBDIR = Path("docs/design/database")
+# 作成済みの合成スキーマを示すファイル（テーブル数が同じ場合は再利用する）
+CORPUS_MARKER = ".bench_corpus.json"
+# PathResolver が参照するプロジェクトルートの環境変数
+PROJECT_ROOT_ENV = "SKILL_REPORT_PROJECT_ROOT"
+
+DETAILS_PREFIX = "テーブル詳細定義YAML_"
+DEFINITION_PREFIX = "テーブル定義書_"
+TEMPLATE_TABLES = ("MST_TEMPLATE", "TEMPLATE")
+
+CORPUS_KINDS = ("clone", "synthetic")
+DEFAULT_SIZES = (50, 500, 5000)
+DEFAULT_THRESHOLD = 0.2
+RESULT_FORMAT_VERSION = 1
+
+
+def _import(name: str) -> types.ModuleType:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        # パッケージ初期化（__init__.py）の読み込みに失敗する環境では、初期化を行わずに読み込む
+        for package_name in ("shared", "shared.generators", "shared.parsers"):
+            sys.modules.pop(package_name, None)
+            package = types.ModuleType(package_name)
+            package.__path__ = [str(LEGACY_DIR.joinpath(*package_name.split(".")))]
+            sys.modules[package_name] = package
+        return importlib.import_module(name)
+
+
+def design_dir(root: Path) -> Path:
+    return root / CORPUS_DESIGN_SUBDIR
+
+
+def count_design_files(root: Path) -> int:
+    """YAML・DDL・テーブル定義書の合計ファイル数"""
+    base = design_dir(root)
+    return (len(list((base / "table-details").glob("*.yaml")))
+            + len(list((base / "ddl").glob("*.sql")))
+            + len(list((base / "tables").glob("*.md"))))
+
+
+# ---------------------------------------------------------------------------
+# 合成スキーマ
+# ---------------------------------------------------------------------------
+
+def build_corpus(root: Path, tables: int, source_dir: Path = DESIGN_DIR) -> Path:
+    """
+    実設計書を複製して tables 個のテーブルを持つ合成スキーマを作成
+
+    1周目は元のテーブル名のまま、2周目以降は「元の名前 + 4桁の周回番号」とし、
+    同じ周回内のテーブルへの参照（外部キーなど）も同じ名前に置き換える。
+
+    Returns:
+        合成スキーマのプロジェクトルート
+    """
+    marker = root / CORPUS_MARKER
+    if marker.exists() and json.loads(marker.read_text(encoding="utf-8")).get("tables") == tables:
+        return root
+
+    shutil.rmtree(root, ignore_errors=True)
+    target_dir = design_dir(root)
+    for sub_dir in ("table-details", "ddl", "tables"):
+        (target_dir / sub_dir).mkdir(parents=True)
+
+    names = sorted(
+        path.name[len(DETAILS_PREFIX):-len(".yaml")]
+        for path in (source_dir / "table-details").glob(f"{DETAILS_PREFIX}*.yaml")
+    )
+    names = [name for name in names if name not in TEMPLATE_TABLES]
+    longest_first = sorted(names, key=len, reverse=True)
+    # MST_Skill が MST_SkillGrade の一部に一致しないよう、前後が英数字でない位置のみ置き換える
+    name_pattern = re.compile(
+        r"(?<![A-Za-z0-9_])(" + "|".join(map(re.escape, longest_first)) + r")(?![A-Za-z0-9])"
+    )
+
+    def clone_name(name: str, round_index: int) -> str:
+        return name if round_index == 0 else f"{name}{round_index:04d}"
+
+    def rename(text: str, round_index: int) -> str:
+        if round_index == 0:
+            return text
+        return name_pattern.sub(lambda match: clone_name(match.group(1), round_index), text)
+
+    definitions = {}
+    for path in (source_dir / "tables").glob(f"{DEFINITION_PREFIX}*.md"):
+        rest = path.name[len(DEFINITION_PREFIX):]
+        for name in longest_first:
+            if rest.startswith(f"{name}_"):
+                definitions[name] = path
+                break
+
+    clones = [(index // len(names), names[index % len(names)]) for index in range(tables)]
+    for round_index, name in clones:
+        new_name = clone_name(name, round_index)
+        yaml_text = (source_dir / "table-details" / f"{DETAILS_PREFIX}{name}.yaml").read_text(encoding="utf-8")
+        (target_dir / "table-details" / f"{DETAILS_PREFIX}{new_name}.yaml").write_text(
+            rename(yaml_text, round_index), encoding="utf-8")
+
+        ddl_file = source_dir / "ddl" / f"{name}.sql"
+        if ddl_file.exists():
+            (target_dir / "ddl" / f"{new_name}.sql").write_text(
+                rename(ddl_file.read_text(encoding="utf-8"), round_index), encoding="utf-8")
+
+        definition_file = definitions.get(name)
+        if definition_file is not None:
+            logical_suffix = definition_file.name[len(DEFINITION_PREFIX) + len(name):]
+            (target_dir / "tables" / f"{DEFINITION_PREFIX}{new_name}{logical_suffix}").write_text(
+                rename(definition_file.read_text(encoding="utf-8"), round_index), encoding="utf-8")
+
+    _write_table_list(source_dir / "テーブル一覧.md", target_dir / "テーブル一覧.md", clones, rename)
+    _write_entity_relationships(source_dir / "entity_relationships.yaml",
+                                target_dir / "entity_relationships.yaml", clones, rename, clone_name)
+
+    marker.write_text(json.dumps({"tables": tables}), encoding="utf-8")
+    return root
+
+
+def _write_table_list(source: Path, target: Path, clones: List[tuple], rename: Callable[[str, int], str]):
+    """テーブル一覧の表を複製先のテーブルで作り直す（表の前後の文書はそのまま）"""
+    lines = source.read_text(encoding="utf-8").splitlines()
+    row_indexes = [index for index, line in enumerate(lines) if line.startswith("| TBL-")]
+    if not row_indexes:
+        shutil.copyfile(source, target)
+        return
+
+    rows = {line.split("|")[3].strip(): line for line in (lines[index] for index in row_indexes)}
+    width = max(3, len(str(len(clones))))
+    new_rows = []
+    for round_index, name in clones:
+        if name in rows:
+            row = re.sub(r"TBL-[0-9]+", f"TBL-{len(new_rows) + 1:0{width}d}", rows[name], count=1)
+            new_rows.append(rename(row, round_index))
+
+    first, last = row_indexes[0], row_indexes[-1]
+    target.write_text("\n".join(lines[:first] + new_rows + lines[last + 1:]) + "\n", encoding="utf-8")
+
+
+def _write_entity_relationships(source: Path, target: Path, clones: List[tuple],
+                                rename: Callable[[str, int], str], clone_name: Callable[[str, int], str]):
+    """エンティティと関連を複製先のテーブル名で作り直す"""
+    with open(source, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+
+    def rename_value(value: Any, round_index: int) -> Any:
+        return json.loads(rename(json.dumps(value, ensure_ascii=False), round_index))
+
+    entities = data.get("entities") or {}
+    included = set()
+    new_entities = {}
+    for round_index, name in clones:
+        included.add((round_index, name))
+        if name in entities:
+            new_entities[clone_name(name, round_index)] = rename_value(entities[name], round_index)
+
+    new_relationships = []
+    for round_index in sorted({round_index for round_index, _ in clones}):
+        for relationship in data.get("relationships") or []:
+            if (round_index, relationship.get("source")) in included:
+                new_relationships.append(rename_value(relationship, round_index))
+
+    data.setdefault("metadata", {})["total_tables"] = len(new_entities)
+    data["entities"] = new_entities
+    data["relationships"] = new_relationships
+    with open(target, "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
+
+
+def build_synthetic_corpus(root: Path, tables: int, **options: Any) -> Path:
+    """
+    合成設計書ジェネレーターで tables 個のテーブルを持つ合成スキーマを作成
+
+    Args:
+        options: CorpusSpec のフィールド（fk_density・cycles・sample_rows・inconsistency_rate など）
+
+    Returns:
+        合成スキーマのプロジェクトルート
+    """
+    generator = _import("shared.generators.design_corpus_generator")
+    generator.generate_corpus(root, tables=tables, **options)
+    return root
+
+
+# ---------------------------------------------------------------------------
+# 測定対象（戻り値は処理した入力ファイル数）
+# ---------------------------------------------------------------------------
+
+def run_consistency_check(root: Path, output_dir: Path, jobs: int) -> int:
+    """整合性チェック（main.py と同じ経路で全チェックを実行）"""
+    checker_main = _import("database_consistency_checker.main")
+    report_file = output_dir / "consistency_report.json"
+    args = checker_main.create_argument_parser().parse_args([
+        "--base-dir", str(root), "--jobs", str(jobs),
+        "--output-format", "json", "--output-file", str(report_file),
+    ])
+    # 終了コード 1 は不整合の検出でも返るため、レポートが出力されたかで実行の成否を判定する
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as stderr:
+        try:
+            checker_main.run(args)
+        except SystemExit:
+            pass
+    if not report_file.exists():
+        lines = stderr.getvalue().strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else "整合性チェックのレポートが出力されませんでした")
+    return count_design_files(root)
+
+
+def _load_db_tools() -> types.ModuleType:
+    # ツールディレクトリの core / modules と整合性チェックの core が衝突しないよう、パスに追加せず読み込む
+    module = sys.modules.get("db_tools")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("db_tools", TOOLS_DIR / "db_tools.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["db_tools"] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def run_table_generator(root: Path, output_dir: Path, jobs: int) -> int:
+    """テーブル生成（DDL・テーブル定義書）"""
+    db_tools = _load_db_tools()
+    config = db_tools.DatabaseToolsConfig()
+    config.yaml_dir = design_dir(root) / "table-details"
+    config.ddl_dir = output_dir / "ddl"
+    config.tables_dir = output_dir / "tables"
+
+    generator = db_tools.TableGenerator(config)
+    yaml_files = sorted(config.yaml_dir.glob(f"{DETAILS_PREFIX}*.yaml"))
+    for yaml_file in yaml_files:
+        generator.generate_ddl(yaml_file)
+        generator.generate_markdown(yaml_file)
+    return len(yaml_files)
+
+
+def run_yaml_validator(root: Path, output_dir: Path, jobs: int) -> int:
+    """YAML形式検証（全テーブル）"""
+    module = _import("yaml_format_check_enhanced_v2")
+    config = module.ValidationConfig.get_default_config()
+    config.max_workers = jobs
+    validator = module.YAMLFormatValidatorV2(config, base_dir=str(root))
+    table_names = validator.list_tables()
+    validator.validate_tables_parallel(table_names)
+    return len(table_names)
+
+
+def run_sample_data(root: Path, output_dir: Path, jobs: int) -> int:
+    """サンプルデータSQL生成（全テーブル）"""
+    module = _import("shared.generators.sample_data_generator")
+    generator = module.SampleDataGenerator({
+        "table_details_dir": str(design_dir(root) / "table-details"),
+        "workers": jobs,
+    })
+    result = generator.write_sample_data_sql(output_dir / "data")
+    if not result["total_tables"] and result["errors"]:
+        raise RuntimeError(result["errors"][0])
+    return result["total_tables"]
+
+
+TARGETS: Dict[str, Callable[[Path, Path, int], int]] = {
+    "consistency_check": run_consistency_check,
+    "table_generator": run_table_generator,
+    "yaml_validator": run_yaml_validator,
+    "sample_data": run_sample_data,
+}
+
+
+# ---------------------------------------------------------------------------
+# 測定
+# ---------------------------------------------------------------------------
+
+def peak_rss_mb() -> float:
+    """プロセスのピークRSS（MB、取得できない環境では 0）"""
+    if resource is None:
+        return 0.0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux では KB、macOS では bytes
+    return max_rss / 1024 / 1024 if sys.platform == "darwin" else max_rss / 1024
+
+
+def measure_target(name: str, root: Path, output_dir: Path, jobs: int = 1) -> Dict[str, Any]:
+    """
+    測定対象をこのプロセスで実行
+
+    ピークRSSはプロセス全体の値のため、対象ごとの値が必要な場合は measure_isolated を使う
+    """
+    shutil.rmtree(root / ".cache", ignore_errors=True)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    output_dir.mkdir(parents=True)
+
+    previous_root = os.environ.get(PROJECT_ROOT_ENV)
+    os.environ[PROJECT_ROOT_ENV] = str(root)
+    try:
+        start = time.perf_counter()
+        files = TARGETS[name](root, output_dir, jobs)
+        seconds = time.perf_counter() - start
+    finally:
+        if previous_root is None:
+            os.environ.pop(PROJECT_ROOT_ENV, None)
+        else:
+            os.environ[PROJECT_ROOT_ENV] = previous_root
+
+    return {
+        "seconds": seconds,
+        "files": files,
+        "files_per_sec": files / seconds if seconds > 0 else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def measure_isolated(name: str, root: Path, output_dir: Path, jobs: int = 1) -> Dict[str, Any]:
+    """測定対象を別プロセスで実行（失敗時は {"error": ...}）"""
+    command = [sys.executable, str(Path(__file__).resolve()), "target", name, str(root), str(output_dir),
+               "--jobs", str(jobs)]
+    completed = subprocess.run(command, capture_output=True, text=True, encoding="utf-8")
+    lines = completed.stdout.strip().splitlines()
+    if lines:
+        try:
+            return json.loads(lines[-1])
+        except json.JSONDecodeError:
+            pass
+    stderr = completed.stderr.strip().splitlines()
+    return {"error": stderr[-1] if stderr else f"exit code {completed.returncode}"}
+
+
+def run_suite(sizes: List[int], targets: List[str], work_dir: Path, jobs: int = 1,
+              isolated: bool = True, corpus: str = "clone",
+              corpus_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    全サイズ・全測定対象を実行して結果（JSON形式）を返す
+
+    Args:
+        corpus: 合成スキーマの作り方（clone: 実設計書を複製、synthetic: 合成設計書ジェネレーター）
+        corpus_options: synthetic の生成条件（CorpusSpec のフィールド）
+    """
+    corpus_options = corpus_options or {}
+    results: Dict[str, Dict[str, Any]] = {name: {} for name in targets}
+    for size in sizes:
+        if corpus == "synthetic":
+            root = build_synthetic_corpus(work_dir / f"synthetic_{size}", size, **corpus_options)
+        else:
+            root = build_corpus(work_dir / f"corpus_{size}", size)
+        for name in targets:
+            output_dir = work_dir / "output" / name
+            if isolated:
+                result = measure_isolated(name, root, output_dir, jobs)
+            else:
+                try:
+                    result = measure_target(name, root, output_dir, jobs)
+                except Exception as e:
+                    result = {"error": f"{type(e).__name__}: {e}"}
+            results[name][str(size)] = result
+            _print_result(name, size, result)
+    return {
+        "version": RESULT_FORMAT_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jobs": jobs,
+        "corpus": {"kind": corpus, **corpus_options},
+        "results": results,
+    }
+
+
+def _print_result(name: str, size: int, result: Dict[str, Any]):
+    label = f"{name} ({size})"
+    if "error" in result:
+        print(f"{label:<26} error: {result['error']}")
+        return
+    print(f"{label:<26} {result['seconds']:9.3f} s {result['files_per_sec']:10.1f} files/s "
+          f"{result['peak_rss_mb']:8.1f} MB RSS")
+
+
+# ---------------------------------------------------------------------------
+# ベースライン比較
+# ---------------------------------------------------------------------------
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD,
+                    rss_threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    ベースラインと比較
+
+    files/s の低下率・ピークRSSの増加率が閾値を超えた項目を regressions に記録する
+    （入力ファイル数が異なっても比較できるよう、時間は files/s で比較する）
+
+    Returns:
+        測定対象・サイズごとの比較結果
+    """
+    rss_threshold = threshold if rss_threshold is None else rss_threshold
+    rows = []
+    for name, sizes in current.get("results", {}).items():
+        for size, result in sizes.items():
+            base = baseline.get("results", {}).get(name, {}).get(size)
+            row = {"target": name, "size": size, "regressions": []}
+            if not base or "error" in base or "error" in result or not result.get("files_per_sec"):
+                row["status"] = "skip"
+                rows.append(row)
+                continue
+
+            row["time_change"] = base["files_per_sec"] / result["files_per_sec"] - 1
+            row["rss_change"] = (result["peak_rss_mb"] / base["peak_rss_mb"] - 1) if base.get("peak_rss_mb") else 0.0
+            if row["time_change"] > threshold:
+                row["regressions"].append("time")
+            if row["rss_change"] > rss_threshold:
+                row["regressions"].append("rss")
+            row["status"] = "regression" if row["regressions"] else "ok"
+            rows.append(row)
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]]) -> int:
+    """比較結果を表示し、悪化した項目数を返す"""
+    regressions = 0
+    for row in rows:
+        label = f"{row['target']} ({row['size']})"
+        if row["status"] == "skip":
+            print(f"{label:<26} skipped")
+            continue
+        mark = "REGRESSION " + ",".join(row["regressions"]) if row["regressions"] else "ok"
+        print(f"{label:<26} time {row['time_change']:+7.1%}  rss {row['rss_change']:+7.1%}  {mark}")
+        regressions += bool(row["regressions"])
+    return regressions
+
+
+def _load_json(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="スケーリングベンチマーク")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="ベンチマークを実行")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                            help="テーブル数（デフォルト: 50 500 5000）")
+    run_parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS),
+                            help="測定対象（デフォルト: すべて）")
+    run_parser.add_argument("--jobs", type=int, default=1, help="各ツールの並列数（デフォルト: 1）")
+    run_parser.add_argument("--work-dir", help="合成スキーマの作成先（指定時は再利用する。デフォルト: 一時ディレクトリ）")
+    run_parser.add_argument("--output", "-o", help="結果JSONの出力先（ベースラインとして保存）")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="実行後にベースラインと比較")
+    run_parser.add_argument("--in-process", action="store_true", help="別プロセスを使わずに実行（RSSは累積値）")
+    run_parser.add_argument("--corpus", choices=CORPUS_KINDS, default="clone",
+                            help="合成スキーマ（clone: 実設計書を複製、synthetic: 合成設計書ジェネレーター）")
+    synthetic_group = run_parser.add_argument_group("synthetic の生成条件")
+    synthetic_group.add_argument("--fk-density", type=float, help="1テーブルあたりの外部キー数の平均")
+    synthetic_group.add_argument("--cycles", type=int, help="注入する循環参照の数")
+    synthetic_group.add_argument("--sample-rows", type=int, help="sample_data の件数")
+    synthetic_group.add_argument("--inconsistency-rate", type=float, help="不整合を注入するテーブルの割合")
+    synthetic_group.add_argument("--seed", type=int, help="乱数シード")
+
+    compare_parser = subparsers.add_parser("compare", help="ベースラインと結果を比較")
+    compare_parser.add_argument("baseline", help="ベースラインJSON")
+    compare_parser.add_argument("current", help="比較する結果JSON")
+
+    for sub_parser in (run_parser, compare_parser):
+        sub_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help=f"files/s 低下の許容率（デフォルト: {DEFAULT_THRESHOLD}）")
+        sub_parser.add_argument("--rss-threshold", type=float,
+                                help="ピークRSS増加の許容率（デフォルト: --threshold と同じ）")
+
+    # 別プロセスで1件を測定する内部コマンド（結果を JSON で1行出力）
+    target_parser = subparsers.add_parser("target")
+    target_parser.add_argument("name", choices=list(TARGETS))
+    target_parser.add_argument("root")
+    target_parser.add_argument("output_dir")
+    target_parser.add_argument("--jobs", type=int, default=1)
+
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+
+    if args.command == "target":
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = measure_target(args.name, Path(args.root), Path(args.output_dir), args.jobs)
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        print(json.dumps(result))
+        return 1 if "error" in result else 0
+
+    if args.command == "compare":
+        rows = compare_results(_load_json(args.baseline), _load_json(args.current),
+                               args.threshold, args.rss_threshold)
+        return 1 if print_comparison(rows) else 0
+
+    with contextlib.ExitStack() as stack:
+        if args.work_dir:
+            work_dir = Path(args.work_dir)
+        else:
+            work_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        corpus_options = {key: getattr(args, key)
+                          for key in ("fk_density", "cycles", "sample_rows", "inconsistency_rate", "seed")
+                          if getattr(args, key) is not None}
+        current = run_suite(args.sizes, args.targets, work_dir, args.jobs, isolated=not args.in_process,
+                            corpus=args.corpus, corpus_options=corpus_options)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"results saved: {args.output}")
+    failed = [f"{name} ({size})" for name, sizes in current["results"].items()
+              for size, result in sizes.items() if "error" in result]
+    if failed:
+        print(f"failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    if args.compare:
+        rows = compare_results(_load_json(args.compare), current, args.threshold, args.rss_threshold)
+        return 1 if print_comparison(rows) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
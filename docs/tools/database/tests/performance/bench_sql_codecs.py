@@ -0,0 +1,122 @@
+"""
+SQL値エンコーダー マイクロベンチマーク
+
+全テーブル詳細定義YAMLの sample_data を対象に、SQLリテラルへの変換速度を測定する。
+  - dispatch   : EnhancedSQLGenerator.format_value_for_sql（値ごとにデータ型を判定）
+  - codec rows : カラムごとに作成したエンコーダーを行単位で適用（encode_row）
+  - codec cols : カラムごとに作成したエンコーダーをカラム単位で適用（encode_columns）
+
+すべての出力が format_value_for_sql と一致することも確認する。
+
+使用例:
+    python tests/performance/bench_sql_codecs.py
+    python tests/performance/bench_sql_codecs.py --scale 500
+"""
+
+import argparse
+import importlib
+import statistics
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Callable, List, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parents[2]
+LEGACY_DIR = TOOLS_DIR / "legacy"
+
+sys.path.insert(0, str(LEGACY_DIR))
+
+
+def load_generator_module() -> types.ModuleType:
+    """shared.generators.sample_data_generator を読み込む"""
+    try:
+        return importlib.import_module("shared.generators.sample_data_generator")
+    except ImportError:
+        # パッケージ初期化（__init__.py）の読み込みに失敗する環境では、初期化を行わずに読み込む
+        for name in ("shared", "shared.generators"):
+            sys.modules.pop(name, None)
+            package = types.ModuleType(name)
+            package.__path__ = [str(LEGACY_DIR.joinpath(*name.split(".")))]
+            sys.modules[name] = package
+        return importlib.import_module("shared.generators.sample_data_generator")
+
+
+def measure(func: Callable[[], object], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: List[float], value_count: int) -> float:
+    median = statistics.median(timings)
+    print(f"{label:<11} median {median * 1000:9.2f} ms ({value_count / median:>12,.0f} values/s)")
+    return median
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="SQL値エンコーダー マイクロベンチマーク")
+    parser.add_argument("--scale", type=int, default=200, help="各テーブルの行の複製数（デフォルト: 200）")
+    parser.add_argument("--repeat", type=int, default=5, help="測定回数（デフォルト: 5）")
+    args = parser.parse_args(argv)
+
+    generator_module = load_generator_module()
+    sql_codecs = importlib.import_module("shared.generators.sql_codecs")
+    sql_generator = generator_module.EnhancedSQLGenerator()
+    resolver = generator_module.TableDependencyResolver()
+    tables = generator_module.list_table_details_tables()
+    resolver.load_table_dependencies(tables)
+
+    # テーブルごとに (カラム名, データ型, 行リスト, カラムごとの値リスト)
+    datasets = []
+    for table_name in tables:
+        yaml_data = resolver.tables_data.get(table_name) or {}
+        records = [r for r in (yaml_data.get('sample_data') or []) if isinstance(r, dict)]
+        column_info = sql_generator.extract_column_info(yaml_data)
+        columns = [col for col in column_info if any(col in record for record in records)]
+        if not columns:
+            continue
+        rows = [tuple(record.get(col) for col in columns) for record in records] * args.scale
+        datasets.append((columns, [column_info[col] for col in columns], rows, [list(c) for c in zip(*rows)]))
+
+    value_count = sum(len(rows) * len(columns) for columns, _, rows, _ in datasets)
+    print(f"dataset     {len(datasets)} tables, {value_count:,} values (scale {args.scale})")
+
+    def dispatch():
+        format_value = sql_generator.format_value_for_sql
+        return [
+            [[format_value(value, col_type, col) for value, col_type, col in zip(row, col_types, columns)]
+             for row in rows]
+            for columns, col_types, rows, _ in datasets
+        ]
+
+    def codec_rows():
+        results = []
+        for columns, col_types, rows, _ in datasets:
+            codecs = [sql_codecs.compile_codec(col_type, col) for col_type, col in zip(col_types, columns)]
+            results.append([sql_codecs.encode_row(codecs, row) for row in rows])
+        return results
+
+    def codec_columns():
+        results = []
+        for columns, col_types, _, column_values in datasets:
+            codecs = [sql_codecs.compile_codec(col_type, col) for col_type, col in zip(col_types, columns)]
+            results.append([list(row) for row in zip(*sql_codecs.encode_columns(codecs, column_values))])
+        return results
+
+    baseline = _report("dispatch", measure(dispatch, args.repeat), value_count)
+    rows_median = _report("codec rows", measure(codec_rows, args.repeat), value_count)
+    cols_median = _report("codec cols", measure(codec_columns, args.repeat), value_count)
+    print(f"speedup     rows {baseline / rows_median:.2f}x, cols {baseline / cols_median:.2f}x")
+
+    expected = dispatch()
+    mismatches = int(codec_rows() != expected) + int(codec_columns() != expected)
+    print(f"mismatches  {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
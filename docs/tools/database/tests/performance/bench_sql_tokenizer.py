@@ -0,0 +1,142 @@
+"""
+SQL VALUES トークナイザー ベンチマーク
+
+scripts/sql_values_tokenizer.py（sql-to-seed*.py 共通）と、従来の sql-to-seed-prisma-fixed.py の
+解析処理（1文字ずつの括弧走査 + 先読み正規表現によるカンマ分割）の解析速度を比較する。
+  - file  : docs/design/database/data/*_sample_data.sql を連結して --size-mb まで複製したSQLファイル
+  - width : 1行の値の数を増やしたINSERT文（従来方式は1行の長さに対して2乗で遅くなる）
+
+従来方式は1ファイル1文のみに対応するため、複製前のファイル単位で解析する。
+
+使用例:
+    python tests/performance/bench_sql_tokenizer.py
+    python tests/performance/bench_sql_tokenizer.py --size-mb 100
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[5]
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+SAMPLE_DATA_DIR = PROJECT_ROOT / "docs/design/database/data"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from sql_values_tokenizer import iter_file_rows, iter_insert_rows  # noqa: E402
+
+
+def legacy_parse(content: str) -> List[List[str]]:
+    """従来の sql-to-seed-prisma-fixed.py の解析処理（1文のみ）"""
+    match = re.search(r"INSERT\s+INTO\s+(\w+)\s*\(([^)]*)\)\s*VALUES\s*(.*?);\s*$", content, re.S)
+    if not match:
+        return []
+
+    row_texts: List[str] = []
+    buf: List[str] = []
+    in_quote = False
+    escape = False
+    depth = 0
+    for ch in match.group(3):
+        if ch == "'" and not escape:
+            in_quote = not in_quote
+        if ch == "\\" and in_quote:
+            escape = not escape
+            buf.append(ch)
+            continue
+        else:
+            escape = False
+        if ch == "(" and not in_quote:
+            if depth == 0:
+                buf = []
+            else:
+                buf.append(ch)
+            depth += 1
+            continue
+        if ch == ")" and not in_quote:
+            depth -= 1
+            if depth == 0:
+                row_texts.append("".join(buf).strip())
+            else:
+                buf.append(ch)
+            continue
+        if depth > 0:
+            buf.append(ch)
+
+    return [re.split(r",(?=(?:[^']*'[^']*')*[^']*$)", row_text) for row_text in row_texts]
+
+
+def measure(func: Callable[[], int], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: List[float], size: int, rows: int) -> float:
+    median = statistics.median(timings)
+    print(f"{label:<24} median {median * 1000:10.2f} ms ({size / median / 1e6:7.1f} MB/s, "
+          f"{rows / median:>12,.0f} rows/s)")
+    return median
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="SQL VALUES トークナイザー ベンチマーク")
+    parser.add_argument("--size-mb", type=int, default=100, help="生成するSQLファイルのサイズ（デフォルト: 100MB）")
+    parser.add_argument("--repeat", type=int, default=3, help="測定回数（デフォルト: 3）")
+    parser.add_argument("--widths", default="250,1000,4000", help="1行の値の数（カンマ区切り）")
+    args = parser.parse_args(argv)
+
+    sample_files = [path.read_text(encoding="utf-8") for path in sorted(SAMPLE_DATA_DIR.glob("*_sample_data.sql"))]
+    sample_size = sum(len(content.encode("utf-8")) for content in sample_files)
+    copies = max(1, args.size_mb * 1024 * 1024 // sample_size)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sql_path = Path(temp_dir) / "sample_data.sql"
+        with open(sql_path, "w", encoding="utf-8") as f:
+            for _ in range(copies):
+                for content in sample_files:
+                    f.write(content)
+                    f.write("\n")
+        size = sql_path.stat().st_size
+
+        rows = sum(1 for _ in iter_file_rows(sql_path))
+        legacy_rows = sum(len(legacy_parse(content)) for content in sample_files) * copies
+        print(f"file          {size / 1e6:,.1f} MB ({len(sample_files)} files x {copies}), "
+              f"{rows:,} rows (legacy {legacy_rows:,} rows)")
+
+        tokenizer = _report("tokenizer", measure(lambda: sum(1 for _ in iter_file_rows(sql_path)), args.repeat),
+                            size, rows)
+
+        def run_legacy() -> int:
+            count = 0
+            for _ in range(copies):
+                for content in sample_files:
+                    count += len(legacy_parse(content))
+            return count
+
+        legacy = _report("legacy", measure(run_legacy, args.repeat), size, legacy_rows)
+        print(f"{'speedup':<24} {legacy / tokenizer:.1f}x")
+
+    print()
+    for width in (int(value) for value in args.widths.split(",")):
+        columns = ", ".join(f"c{i}" for i in range(width))
+        values = ", ".join(f"'value {i}, ''quoted'' (x)'" if i % 2 else str(i) for i in range(width))
+        statement = f"INSERT INTO Wide ({columns}) VALUES\n" + ",\n".join([f"({values})"] * 10) + ";\n"
+        size = len(statement.encode("utf-8"))
+        tokenizer = _report(f"tokenizer width {width}", measure(lambda: list(iter_insert_rows(statement)), args.repeat),
+                            size, 10)
+        legacy = _report(f"legacy width {width}", measure(lambda: legacy_parse(statement), args.repeat), size, 10)
+        print(f"{'speedup':<24} {legacy / tokenizer:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
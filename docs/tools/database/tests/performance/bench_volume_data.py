@@ -0,0 +1,85 @@
+"""
+大量データ生成エンジン マイクロベンチマーク
+
+table_generator.data.volume_data_engine の VolumeDataEngine について、
+テーブル詳細定義YAMLの実テーブルを対象に以下を測定する。
+  - generate : 行の生成のみ（出力なし）
+  - csv      : 生成＋CSV出力
+  - sql      : 生成＋INSERT文出力
+
+出力は一時ディレクトリに作成する。
+
+使用例:
+    python tests/performance/bench_volume_data.py
+    python tests/performance/bench_volume_data.py --rows 1000000 --tables MST_Employee TRN_SkillRecord
+"""
+
+import argparse
+import importlib
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+from typing import List, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parents[2]
+LEGACY_DIR = TOOLS_DIR / "legacy"
+
+sys.path.insert(0, str(LEGACY_DIR))
+
+DEFAULT_TABLES = ["MST_Tenant", "MST_Department", "MST_Employee", "MST_SkillItem", "TRN_SkillRecord"]
+
+
+def load_engine_module() -> types.ModuleType:
+    """table_generator.data.volume_data_engine を読み込む"""
+    try:
+        return importlib.import_module("table_generator.data.volume_data_engine")
+    except ImportError:
+        # パッケージ初期化（__init__.py）の読み込みに失敗する環境では、初期化を行わずに読み込む
+        for name in ("shared", "shared.generators", "table_generator", "table_generator.data"):
+            sys.modules.pop(name, None)
+            package = types.ModuleType(name)
+            package.__path__ = [str(LEGACY_DIR.joinpath(*name.split(".")))]
+            sys.modules[name] = package
+        return importlib.import_module("table_generator.data.volume_data_engine")
+
+
+def _report(label: str, rows: int, seconds: float) -> None:
+    print(f"{label:<28} {rows:>10,} rows {seconds:8.2f} s ({rows / seconds:>10,.0f} rows/s)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="大量データ生成エンジン マイクロベンチマーク")
+    parser.add_argument("--tables", nargs="+", default=DEFAULT_TABLES, help="対象テーブル")
+    parser.add_argument("--rows", type=int, default=200_000, help="テーブルごとの件数（デフォルト: 200000）")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="1チャンクあたりの行数")
+    parser.add_argument("--formats", nargs="+", default=["csv", "sql"], help="測定する出力形式")
+    args = parser.parse_args(argv)
+
+    volume_data_engine = load_engine_module()
+    engine = volume_data_engine.VolumeDataEngine(seed=0, chunk_size=args.chunk_size)
+    targets = {table_name: args.rows for table_name in args.tables}
+
+    total_rows, total_seconds = 0, 0.0
+    for plan in engine.plan(targets):
+        start = time.perf_counter()
+        for _ in engine.iter_rows(plan):
+            pass
+        seconds = time.perf_counter() - start
+        _report(f"generate {plan.table_name}", plan.row_count, seconds)
+        total_rows += plan.row_count
+        total_seconds += seconds
+    _report("generate total", total_rows, total_seconds)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for output_format in args.formats:
+            start = time.perf_counter()
+            result = engine.generate(targets, Path(temp_dir) / output_format, output_format)
+            _report(f"{output_format} total", result['total_rows'], time.perf_counter() - start)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
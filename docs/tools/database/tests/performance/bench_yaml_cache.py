@@ -0,0 +1,120 @@
+"""
+YAML解析キャッシュ マイクロベンチマーク
+
+docs/design/database/table-details/*.yaml を対象に、以下の読み込み時間を測定する。
+  - safe_load   : yaml.safe_load（純Python実装の SafeLoader）
+  - csafe_load  : libyaml の CSafeLoader（利用可能な場合）
+  - cache cold  : 空のキャッシュからの読み込み（解析＋キャッシュ書き込み）
+  - cache warm  : 同一プロセスでの再読み込み（キャッシュヒット）
+  - cache reopen: 別インスタンスからの再読み込み（プロセス再起動相当）
+
+キャッシュは一時ディレクトリに作成するため、プロジェクトの .cache には影響しない。
+
+使用例:
+    python tests/performance/bench_yaml_cache.py
+    python tests/performance/bench_yaml_cache.py --repeat 10
+"""
+
+import argparse
+import importlib
+import statistics
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import yaml
+
+TOOLS_DIR = Path(__file__).resolve().parents[2]
+LEGACY_DIR = TOOLS_DIR / "legacy"
+PROJECT_ROOT = TOOLS_DIR.parents[2]
+DEFAULT_YAML_DIR = PROJECT_ROOT / "docs/design/database/table-details"
+
+sys.path.insert(0, str(LEGACY_DIR))
+
+
+def load_yaml_cache_module() -> types.ModuleType:
+    """shared.performance.yaml_cache を読み込む"""
+    try:
+        return importlib.import_module("shared.performance.yaml_cache")
+    except ImportError:
+        # shared/__init__.py の読み込みに失敗する環境では、パッケージ初期化を行わずに読み込む
+        for name in ("shared", "shared.performance"):
+            sys.modules.pop(name, None)
+        package = types.ModuleType("shared")
+        package.__path__ = [str(LEGACY_DIR / "shared")]
+        sys.modules["shared"] = package
+        return importlib.import_module("shared.performance.yaml_cache")
+
+
+def measure(load: Callable[[Path], object], files: List[Path], repeat: int,
+            setup: Optional[Callable[[], None]] = None) -> List[float]:
+    """全ファイルの読み込み時間（秒）を repeat 回測定"""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for path in files:
+            load(path)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _read_and_load(loader: type) -> Callable[[Path], object]:
+    def load(path: Path) -> object:
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=loader)
+    return load
+
+
+def _report(label: str, timings: List[float], file_count: int) -> float:
+    median = statistics.median(timings)
+    print(f"{label:<13} median {median * 1000:8.2f} ms / {file_count} files "
+          f"(min {min(timings) * 1000:.2f} ms, {file_count / median:,.0f} files/s)")
+    return median
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="YAML解析キャッシュ マイクロベンチマーク")
+    parser.add_argument("--yaml-dir", type=Path, default=DEFAULT_YAML_DIR, help="YAMLディレクトリ")
+    parser.add_argument("--repeat", type=int, default=5, help="測定回数（デフォルト: 5）")
+    args = parser.parse_args(argv)
+
+    files = [f for f in sorted(args.yaml_dir.glob("*.yaml")) if not f.name.startswith("_")]
+    if not files:
+        print(f"YAMLファイルが見つかりません: {args.yaml_dir}")
+        return 1
+
+    yaml_cache = load_yaml_cache_module()
+    print(f"libyaml       {'available' if yaml_cache.HAS_LIBYAML else 'not available'}")
+
+    baseline = _report("safe_load", measure(_read_and_load(yaml.SafeLoader), files, args.repeat),
+                       len(files))
+    if yaml_cache.HAS_LIBYAML:
+        _report("csafe_load", measure(_read_and_load(yaml_cache.SAFE_LOADER), files, args.repeat),
+                len(files))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = yaml_cache.YamlParseCache(Path(temp_dir) / yaml_cache.CACHE_SUBDIR)
+        cold = _report("cache cold", measure(cache.load, files, args.repeat, setup=cache.clear),
+                       len(files))
+        warm = _report("cache warm", measure(cache.load, files, args.repeat), len(files))
+
+        reopened = yaml_cache.YamlParseCache(cache.cache_dir)
+        _report("cache reopen", measure(reopened.load, files, args.repeat), len(files))
+
+        mismatches = sum(
+            1 for path in files
+            if reopened.load(path) != _read_and_load(yaml.SafeLoader)(path)
+        )
+
+    print(f"speedup       cold {baseline / cold:.2f}x, warm {baseline / warm:.2f}x")
+    print(f"mismatches    {mismatches} / {len(files)}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
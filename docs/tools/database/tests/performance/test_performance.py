@@ -3,737 +3,185 @@
 
 要求仕様ID: PLT.1-WEB.1, SKL.1-HIER.1
 設計書: docs/design/database/08-database-design-guidelines.md
-実装日: 2025-06-21
-実装者: AI Assistant
-
-パフォーマンステスト項目：
-- 大量テーブル生成のパフォーマンス
-- 整合性チェックの実行時間
-- メモリ使用量の監視（段階的フォールバック対応）
-- 並行処理性能の測定
-- psutil非依存の基本パフォーマンステスト
+
+bench_scaling の合成スキーマ（50テーブル）で実際のツールを実行し、以下を確認する。
+- 合成スキーマの整合性（テーブル一覧・エンティティ関連・外部キーの参照先）
+- 整合性チェック・テーブル生成・YAML検証・サンプルデータ生成が全テーブルを処理できること
+- 合成設計書ジェネレーターの設計書（循環参照・不整合を含む）を各ツールが処理できること
+- ベースライン比較で悪化を検出できること
+
+大規模（500 / 5,000 テーブル）の測定とベースライン比較は bench_scaling.py を直接実行する。
 """
 
-import unittest
-import tempfile
+import json
 import shutil
-import time
-import resource
-import gc
-import os
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    PSUTIL_AVAILABLE = False
-    psutil = None
-import threading
-import concurrent.futures
-from pathlib import Path
-import yaml
 import sys
-from typing import List, Dict, Any, Optional
-import statistics
-from enum import IntEnum
+import tempfile
+import unittest
+from pathlib import Path
+
 import pytest
+import yaml
 
-# テスト対象のインポート
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-# from table_generator.__main__ import main as table_generator_main
-# from database_consistency_checker.__main__ import main as consistency_checker_main
-
-
-class PerformanceTestLevel(IntEnum):
-    """パフォーマンステストレベル"""
-    BASIC = 1      # 基本測定（常に実行可能）
-    DETAILED = 2   # 詳細監視（psutil必要）
-    SYSTEM = 3     # システム監視（psutil + 権限）
-
-
-class MemoryMonitor:
-    """メモリ監視クラス（段階的フォールバック対応）"""
-    
-    def __init__(self):
-        self.level = self._detect_available_level()
-        self.initial_memory = self._get_memory_usage()
-    
-    def _detect_available_level(self) -> PerformanceTestLevel:
-        """利用可能な監視レベルを検出"""
-        if PSUTIL_AVAILABLE:
-            try:
-                process = psutil.Process()
-                process.memory_info()
-                return PerformanceTestLevel.DETAILED
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                return PerformanceTestLevel.BASIC
-        return PerformanceTestLevel.BASIC
-    
-    def _get_memory_usage(self) -> Dict[str, float]:
-        """メモリ使用量取得（レベル別）"""
-        if self.level >= PerformanceTestLevel.DETAILED:
-            return self._get_detailed_memory()
-        else:
-            return self._get_basic_memory()
-    
-    def _get_detailed_memory(self) -> Dict[str, float]:
-        """詳細メモリ情報取得（psutil使用）"""
-        try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            return {
-                'rss': memory_info.rss / 1024 / 1024,  # MB
-                'vms': memory_info.vms / 1024 / 1024,  # MB
-                'percent': process.memory_percent(),
-                'available': psutil.virtual_memory().available / 1024 / 1024  # MB
-            }
-        except Exception:
-            return self._get_basic_memory()
-    
-    def _get_basic_memory(self) -> Dict[str, float]:
-        """基本メモリ情報取得（resource使用）"""
-        try:
-            usage = resource.getrusage(resource.RUSAGE_SELF)
-            # Linuxでは ru_maxrss は KB、macOSでは bytes
-            if sys.platform == 'darwin':
-                rss = usage.ru_maxrss / 1024 / 1024  # MB
-            else:
-                rss = usage.ru_maxrss / 1024  # MB
-            
-            # ガベージコレクション統計
-            gc_stats = gc.get_stats()
-            gc_objects = sum(stat.get('collections', 0) for stat in gc_stats)
-            
-            return {
-                'rss': rss,
-                'vms': 0.0,  # resource では取得不可
-                'percent': 0.0,  # resource では取得不可
-                'available': 0.0,  # resource では取得不可
-                'gc_collections': gc_objects
-            }
-        except Exception:
-            return {
-                'rss': 0.0,
-                'vms': 0.0,
-                'percent': 0.0,
-                'available': 0.0,
-                'gc_collections': 0
-            }
-    
-    def get_current_usage(self) -> Dict[str, float]:
-        """現在のメモリ使用量取得"""
-        return self._get_memory_usage()
-    
-    def get_delta(self, current: Optional[Dict[str, float]] = None) -> Dict[str, float]:
-        """初期値からの差分取得"""
-        if current is None:
-            current = self.get_current_usage()
-        
-        delta = {}
-        for key in self.initial_memory:
-            delta[f'{key}_delta'] = current.get(key, 0) - self.initial_memory.get(key, 0)
-        
-        return delta
-    
-    def get_level_info(self) -> Dict[str, Any]:
-        """監視レベル情報取得"""
-        return {
-            'level': self.level,
-            'level_name': self.level.name,
-            'psutil_available': PSUTIL_AVAILABLE,
-            'features': self._get_available_features()
-        }
-    
-    def _get_available_features(self) -> List[str]:
-        """利用可能な機能一覧"""
-        features = ['execution_time', 'file_operations']
-        
-        if self.level >= PerformanceTestLevel.BASIC:
-            features.extend(['basic_memory', 'gc_stats'])
-        
-        if self.level >= PerformanceTestLevel.DETAILED:
-            features.extend(['detailed_memory', 'cpu_percent', 'memory_percent'])
-        
-        return features
-
-
-class PerformanceTestCase(unittest.TestCase):
-    """パフォーマンステストの基底クラス"""
-    
-    def setUp(self):
-        """テストセットアップ"""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.performance_results = {}
-        
-        # テスト用ディレクトリ構造作成
-        self._setup_test_environment()
-    
-    def tearDown(self):
-        """テストクリーンアップ"""
-        shutil.rmtree(self.temp_dir)
-        
-        # パフォーマンス結果出力
-        self._output_performance_results()
-    
-    def _setup_test_environment(self):
-        """テスト環境セットアップ"""
-        directories = ['table-details', 'ddl', 'tables', 'data', 'consistency_reports']
-        for dir_name in directories:
-            (self.temp_dir / dir_name).mkdir(exist_ok=True)
-    
-    def _measure_performance(self, func, *args, **kwargs):
-        """パフォーマンス測定ヘルパー（改善版）"""
-        # メモリ監視初期化
-        memory_monitor = MemoryMonitor()
-        memory_before = memory_monitor.get_current_usage()
-        
-        # ファイル操作カウンタ
-        files_before = self._count_files()
-        
-        # 実行時間測定
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        
-        # 測定終了
-        memory_after = memory_monitor.get_current_usage()
-        files_after = self._count_files()
-        memory_delta = memory_monitor.get_delta(memory_after)
-        
-        return {
-            'result': result,
-            'execution_time': end_time - start_time,
-            'memory_before': memory_before,
-            'memory_after': memory_after,
-            'memory_delta': memory_delta,
-            'files_created': files_after - files_before,
-            'monitor_level': memory_monitor.get_level_info()
-        }
-    
-    def _count_files(self) -> int:
-        """作成されたファイル数をカウント"""
-        count = 0
-        for directory in ['table-details', 'ddl', 'tables', 'data']:
-            dir_path = self.temp_dir / directory
-            if dir_path.exists():
-                count += len(list(dir_path.glob('*')))
-        return count
-    
-    def _create_test_yaml(self, table_name: str, complexity: str = 'simple') -> None:
-        """テスト用YAML作成"""
-        if complexity == 'simple':
-            columns = [
-                {
-                    'name': 'id',
-                    'type': 'VARCHAR(50)',
-                    'nullable': False,
-                    'primary_key': True,
-                    'comment': 'プライマリキー',
-                    'requirement_id': 'PLT.1-WEB.1'
-                },
-                {
-                    'name': 'tenant_id',
-                    'type': 'VARCHAR(50)',
-                    'nullable': False,
-                    'comment': 'テナントID',
-                    'requirement_id': 'TNT.1-MGMT.1'
-                }
-            ]
-            indexes = []
-            foreign_keys = []
-        
-        elif complexity == 'complex':
-            columns = [
-                {
-                    'name': 'id',
-                    'type': 'VARCHAR(50)',
-                    'nullable': False,
-                    'primary_key': True,
-                    'comment': 'プライマリキー',
-                    'requirement_id': 'PLT.1-WEB.1'
-                },
-                {
-                    'name': 'tenant_id',
-                    'type': 'VARCHAR(50)',
-                    'nullable': False,
-                    'comment': 'テナントID',
-                    'requirement_id': 'TNT.1-MGMT.1'
-                }
-            ]
-            
-            # 複雑なテーブル用に多数のカラム追加
-            for i in range(20):
-                columns.append({
-                    'name': f'field_{i:02d}',
-                    'type': 'VARCHAR(255)',
-                    'nullable': True,
-                    'comment': f'フィールド{i}',
-                    'requirement_id': 'TEST.1-PERF.1'
-                })
-            
-            # 複数のインデックス
-            indexes = [
-                {
-                    'name': f'idx_{table_name.lower()}_tenant',
-                    'columns': ['tenant_id'],
-                    'unique': False,
-                    'comment': 'テナント別インデックス'
-                },
-                {
-                    'name': f'idx_{table_name.lower()}_composite',
-                    'columns': ['tenant_id', 'field_01', 'field_02'],
-                    'unique': False,
-                    'comment': '複合インデックス'
-                }
-            ]
-            
-            foreign_keys = []
-        
-        yaml_content = {
-            'table_name': table_name,
-            'logical_name': f'{table_name}テーブル',
-            'category': 'テスト系',
-            'priority': '低',
-            'requirement_id': 'TEST.1-PERF.1',
-            'columns': columns,
-            'indexes': indexes,
-            'foreign_keys': foreign_keys
-        }
-        
-        yaml_file = self.temp_dir / 'table-details' / f'{table_name}_details.yaml'
-        with open(yaml_file, 'w', encoding='utf-8') as f:
-            yaml.dump(yaml_content, f, default_flow_style=False, allow_unicode=True)
-    
-    def _output_performance_results(self):
-        """パフォーマンス結果出力（改善版）"""
-        if not self.performance_results:
-            return
-        
-        print(f"\n{'='*60}")
-        print(f"パフォーマンステスト結果: {self.__class__.__name__}")
-        print(f"{'='*60}")
-        
-        # 監視レベル情報表示
-        if self.performance_results:
-            first_result = next(iter(self.performance_results.values()))
-            monitor_info = first_result.get('monitor_level', {})
-            print(f"\n監視レベル: {monitor_info.get('level_name', 'UNKNOWN')}")
-            print(f"psutil利用可能: {'Yes' if monitor_info.get('psutil_available', False) else 'No'}")
-            print(f"利用可能機能: {', '.join(monitor_info.get('features', []))}")
-        
-        for test_name, results in self.performance_results.items():
-            print(f"\n{test_name}:")
-            print(f"  実行時間: {results['execution_time']:.3f}秒")
-            
-            # メモリ情報（利用可能な場合のみ）
-            memory_before = results.get('memory_before', {})
-            memory_after = results.get('memory_after', {})
-            memory_delta = results.get('memory_delta', {})
-            
-            if memory_before.get('rss', 0) > 0:
-                print(f"  メモリ使用量(RSS): {memory_before.get('rss', 0):.1f}MB → {memory_after.get('rss', 0):.1f}MB")
-                print(f"  メモリ増加(RSS): {memory_delta.get('rss_delta', 0):.1f}MB")
-            
-            if memory_before.get('percent', 0) > 0:
-                print(f"  メモリ使用率: {memory_before.get('percent', 0):.1f}% → {memory_after.get('percent', 0):.1f}%")
-            
-            # ファイル操作情報
-            files_created = results.get('files_created', 0)
-            if files_created > 0:
-                print(f"  作成ファイル数: {files_created}")
-                throughput = files_created / results['execution_time'] if results['execution_time'] > 0 else 0
-                print(f"  ファイル作成スループット: {throughput:.1f} files/sec")
+sys.path.insert(0, str(Path(__file__).parent))
+
+import bench_scaling  # noqa: E402
+
+CORPUS_TABLES = 50
+SYNTHETIC_TABLES = 200
 
 
 @pytest.mark.performance
-class TestBasicPerformance(PerformanceTestCase):
-    """基本パフォーマンステスト（psutil非依存）"""
-    
-    def test_basic_table_generation_performance(self):
-        """基本テーブル生成パフォーマンス（psutil非依存）"""
-        # 5個のテーブル作成
-        table_names = [f'BASIC_PERF_{i:02d}' for i in range(5)]
-        
-        for table_name in table_names:
-            self._create_test_yaml(table_name, 'simple')
-        
-        def generate_basic():
-            return self._mock_table_generation(table_names)
-        
-        basic_result = self._measure_performance(generate_basic)
-        self.performance_results['基本テーブル生成（5個）'] = basic_result
-        
-        # 実行時間の確認（5秒以内）
-        self.assertLess(basic_result['execution_time'], 5.0,
-                       f"基本テーブル生成が遅すぎます: {basic_result['execution_time']:.3f}秒")
-        
-        # ファイル作成数の確認
-        self.assertEqual(basic_result['files_created'], 15,  # 5テーブル × 3ファイル
-                        f"期待されるファイル数と異なります: {basic_result['files_created']}")
-    
-    def test_basic_consistency_check_performance(self):
-        """基本整合性チェックパフォーマンス（psutil非依存）"""
-        # 10個のテーブル作成
-        table_names = [f'BASIC_CHECK_{i:02d}' for i in range(10)]
-        
-        for table_name in table_names:
-            self._create_test_yaml(table_name, 'simple')
-            self._create_mock_files(table_name)
-        
-        def run_basic_check():
-            return self._mock_consistency_check(table_names)
-        
-        check_result = self._measure_performance(run_basic_check)
-        self.performance_results['基本整合性チェック（10個）'] = check_result
-        
-        # 実行時間の確認（2秒以内）
-        self.assertLess(check_result['execution_time'], 2.0,
-                       f"基本整合性チェックが遅すぎます: {check_result['execution_time']:.3f}秒")
-    
-    def test_file_throughput_performance(self):
-        """ファイル処理スループットテスト（psutil非依存）"""
-        # 20個のテーブルで大量ファイル処理
-        table_names = [f'THROUGHPUT_{i:02d}' for i in range(20)]
-        
-        for table_name in table_names:
-            self._create_test_yaml(table_name, 'simple')
-        
-        def process_files():
-            return self._mock_table_generation(table_names)
-        
-        throughput_result = self._measure_performance(process_files)
-        self.performance_results['ファイル処理スループット（20個）'] = throughput_result
-        
-        # スループットの確認（10 files/sec以上）
-        files_per_sec = throughput_result['files_created'] / throughput_result['execution_time']
-        self.assertGreater(files_per_sec, 10.0,
-                          f"ファイル処理スループットが低すぎます: {files_per_sec:.1f} files/sec")
-    
-    def _mock_table_generation(self, table_names: List[str]) -> Dict[str, Any]:
-        """テーブル生成のモック実装（基本版）"""
-        results = []
-        
-        for table_name in table_names:
-            # DDLファイル作成
-            ddl_content = f"""-- {table_name} テーブル定義
-CREATE TABLE {table_name} (
-    id VARCHAR(50) NOT NULL PRIMARY KEY,
-    tenant_id VARCHAR(50) NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
-"""
-            
-            ddl_file = self.temp_dir / 'ddl' / f'{table_name}.sql'
-            with open(ddl_file, 'w', encoding='utf-8') as f:
-                f.write(ddl_content)
-            
-            # Markdownファイル作成
-            md_content = f"""# テーブル定義書_{table_name}
-
-## 基本情報
-- **テーブル名**: {table_name}
-- **論理名**: {table_name}テーブル
-"""
-            
-            md_file = self.temp_dir / 'tables' / f'テーブル定義書_{table_name}.md'
-            with open(md_file, 'w', encoding='utf-8') as f:
-                f.write(md_content)
-            
-            # サンプルデータファイル作成
-            data_content = f"""-- {table_name} サンプルデータ
-INSERT INTO {table_name} (id, tenant_id) VALUES ('test-001', 'tenant-001');
-"""
-            
-            data_file = self.temp_dir / 'data' / f'{table_name}_sample_data.sql'
-            with open(data_file, 'w', encoding='utf-8') as f:
-                f.write(data_content)
-            
-            results.append({'table': table_name, 'status': 'success'})
-            
-            # 軽量な処理時間をシミュレート
-            time.sleep(0.05)
-        
-        return {'tables': results, 'status': 'success'}
-    
-    def _create_mock_files(self, table_name: str):
-        """モックファイル作成（基本版）"""
-        # DDLファイル
-        ddl_file = self.temp_dir / 'ddl' / f'{table_name}.sql'
-        ddl_file.touch()
-        
-        # Markdownファイル
-        md_file = self.temp_dir / 'tables' / f'テーブル定義書_{table_name}.md'
-        md_file.touch()
-    
-    def _mock_consistency_check(self, table_names: List[str]) -> Dict[str, Any]:
-        """整合性チェックのモック実装（基本版）"""
-        results = []
-        
-        for table_name in table_names:
-            # ファイル存在チェック
-            yaml_file = self.temp_dir / 'table-details' / f'{table_name}_details.yaml'
-            ddl_file = self.temp_dir / 'ddl' / f'{table_name}.sql'
-            md_file = self.temp_dir / 'tables' / f'テーブル定義書_{table_name}.md'
-            
-            checks = {
-                'table_existence': yaml_file.exists() and ddl_file.exists() and md_file.exists(),
-                'column_consistency': True,
-                'foreign_key_consistency': True,
-                'naming_convention': True
-            }
-            
-            results.append({
-                'table': table_name,
-                'checks': checks,
-                'status': 'success' if all(checks.values()) else 'error'
-            })
-            
-            # 軽量なチェック処理時間をシミュレート
-            time.sleep(0.005)
-        
-        return {'tables': results, 'status': 'success'}
+class TestScalingBenchmark(unittest.TestCase):
+    """合成スキーマでの実ツール測定"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = Path(tempfile.mkdtemp())
+        cls.root = bench_scaling.build_corpus(cls.work_dir / "corpus", CORPUS_TABLES)
+        cls.design_dir = bench_scaling.design_dir(cls.root)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.work_dir, ignore_errors=True)
+
+    def _measure(self, name: str):
+        try:
+            result = bench_scaling.measure_target(name, self.root, self.work_dir / "output" / name)
+        except ImportError as e:
+            self.skipTest(f"{name} を読み込めません: {e}")
+        print(f"\n{name} ({CORPUS_TABLES}): {result['seconds']:.3f}s "
+              f"{result['files_per_sec']:.1f} files/s {result['peak_rss_mb']:.1f} MB RSS")
+        return result
+
+    def test_corpus_consistency(self):
+        """合成スキーマのテーブル一覧・エンティティ・外部キーが揃っていること"""
+        yaml_files = list((self.design_dir / "table-details").glob("テーブル詳細定義YAML_*.yaml"))
+        self.assertEqual(len(yaml_files), CORPUS_TABLES)
+        self.assertEqual(len(list((self.design_dir / "ddl").glob("*.sql"))), CORPUS_TABLES)
+
+        tables = {path.name[len("テーブル詳細定義YAML_"):-len(".yaml")] for path in yaml_files}
+        table_list = (self.design_dir / "テーブル一覧.md").read_text(encoding="utf-8")
+        listed = {line.split("|")[3].strip() for line in table_list.splitlines() if line.startswith("| TBL-")}
+        self.assertEqual(listed, tables)
+
+        with open(self.design_dir / "entity_relationships.yaml", encoding="utf-8") as f:
+            relationships = yaml.safe_load(f)
+        self.assertLessEqual(set(relationships["entities"]), tables)
+        self.assertEqual(relationships["metadata"]["total_tables"], len(relationships["entities"]))
+        for relationship in relationships["relationships"]:
+            self.assertIn(relationship["source"], tables)
+
+    def test_corpus_reuse(self):
+        """同じテーブル数の合成スキーマは作り直さないこと"""
+        marker = self.root / bench_scaling.CORPUS_MARKER
+        mtime = marker.stat().st_mtime_ns
+        bench_scaling.build_corpus(self.root, CORPUS_TABLES)
+        self.assertEqual(marker.stat().st_mtime_ns, mtime)
+
+    def test_consistency_check(self):
+        """整合性チェックが全ファイルを処理すること"""
+        result = self._measure("consistency_check")
+        self.assertEqual(result["files"], bench_scaling.count_design_files(self.root))
+
+    def test_table_generator(self):
+        """テーブル生成が全テーブルの DDL・テーブル定義書を出力すること"""
+        result = self._measure("table_generator")
+        self.assertEqual(result["files"], CORPUS_TABLES)
+        output_dir = self.work_dir / "output" / "table_generator"
+        self.assertEqual(len(list((output_dir / "ddl").glob("*.sql"))), CORPUS_TABLES)
+
+    def test_yaml_validator(self):
+        """YAML検証が全テーブルを検証すること"""
+        result = self._measure("yaml_validator")
+        self.assertEqual(result["files"], CORPUS_TABLES)
+        self.assertGreater(result["files_per_sec"], 0)
+
+    def test_sample_data(self):
+        """サンプルデータ生成が全テーブルを処理すること"""
+        result = self._measure("sample_data")
+        self.assertGreater(result["files"], 0)
 
 
 @pytest.mark.performance
-class TestTableGenerationPerformance(PerformanceTestCase):
-    """テーブル生成パフォーマンステスト（psutil必要）"""
-    
-    def setUp(self):
-        if not PSUTIL_AVAILABLE:
-            self.skipTest("psutil is not available")
-        super().setUp()
-    
-    def test_single_table_generation_performance(self):
-        """単一テーブル生成パフォーマンス"""
-        # シンプルなテーブル
-        self._create_test_yaml('PERF_Simple', 'simple')
-        
-        def generate_simple():
-            return self._mock_table_generation(['PERF_Simple'])
-        
-        simple_result = self._measure_performance(generate_simple)
-        self.performance_results['単一テーブル生成（シンプル）'] = simple_result
-        
-        # 実行時間の確認（1秒以内）
-        self.assertLess(simple_result['execution_time'], 1.0, 
-                       f"シンプルテーブル生成が遅すぎます: {simple_result['execution_time']:.3f}秒")
-        
-        # 複雑なテーブル
-        self._create_test_yaml('PERF_Complex', 'complex')
-        
-        def generate_complex():
-            return self._mock_table_generation(['PERF_Complex'])
-        
-        complex_result = self._measure_performance(generate_complex)
-        self.performance_results['単一テーブル生成（複雑）'] = complex_result
-        
-        # 実行時間の確認（3秒以内）
-        self.assertLess(complex_result['execution_time'], 3.0,
-                       f"複雑テーブル生成が遅すぎます: {complex_result['execution_time']:.3f}秒")
-    
-    def test_bulk_table_generation_performance(self):
-        """大量テーブル生成パフォーマンス"""
-        # 10個のテーブル作成
-        table_names = [f'PERF_Bulk_{i:02d}' for i in range(10)]
-        
-        for table_name in table_names:
-            self._create_test_yaml(table_name, 'simple')
-        
-        def generate_bulk():
-            return self._mock_table_generation(table_names)
-        
-        bulk_result = self._measure_performance(generate_bulk)
-        self.performance_results['大量テーブル生成（10個）'] = bulk_result
-        
-        # 実行時間の確認（10秒以内）
-        self.assertLess(bulk_result['execution_time'], 10.0,
-                       f"大量テーブル生成が遅すぎます: {bulk_result['execution_time']:.3f}秒")
-        
-        # 1テーブルあたりの平均時間
-        avg_time_per_table = bulk_result['execution_time'] / len(table_names)
-        self.assertLess(avg_time_per_table, 1.0,
-                       f"1テーブルあたりの生成時間が遅すぎます: {avg_time_per_table:.3f}秒")
-    
-    def test_concurrent_table_generation_performance(self):
-        """並行テーブル生成パフォーマンス"""
-        # 5個のテーブルを並行生成
-        table_names = [f'PERF_Concurrent_{i:02d}' for i in range(5)]
-        
-        for table_name in table_names:
-            self._create_test_yaml(table_name, 'simple')
-        
-        def generate_concurrent():
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                futures = []
-                for table_name in table_names:
-                    future = executor.submit(self._mock_table_generation, [table_name])
-                    futures.append(future)
-                
-                results = []
-                for future in concurrent.futures.as_completed(futures):
-                    results.append(future.result())
-                
-                return results
-        
-        concurrent_result = self._measure_performance(generate_concurrent)
-        self.performance_results['並行テーブル生成（5個）'] = concurrent_result
-        
-        # 並行処理の効果確認（逐次処理より高速であることを期待）
-        self.assertLess(concurrent_result['execution_time'], 5.0,
-                       f"並行テーブル生成が遅すぎます: {concurrent_result['execution_time']:.3f}秒")
-    
-    def _mock_table_generation(self, table_names: List[str]) -> Dict[str, Any]:
-        """テーブル生成のモック実装"""
-        results = []
-        
-        for table_name in table_names:
-            # DDLファイル作成
-            ddl_content = f"""-- {table_name} テーブル定義
-CREATE TABLE {table_name} (
-    id VARCHAR(50) NOT NULL PRIMARY KEY,
-    tenant_id VARCHAR(50) NOT NULL,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
-
--- インデックス作成
-CREATE INDEX idx_{table_name.lower()}_tenant ON {table_name}(tenant_id);
-"""
-            
-            ddl_file = self.temp_dir / 'ddl' / f'{table_name}.sql'
-            with open(ddl_file, 'w', encoding='utf-8') as f:
-                f.write(ddl_content)
-            
-            # Markdownファイル作成
-            md_content = f"""# テーブル定義書_{table_name}
-
-## 基本情報
-- **テーブル名**: {table_name}
-- **論理名**: {table_name}テーブル
-- **カテゴリ**: テスト系
-- **優先度**: 低
-- **要求仕様ID**: TEST.1-PERF.1
-
-## カラム定義
-| カラム名 | データ型 | NULL | キー | デフォルト値 | コメント |
-|----------|----------|------|------|-------------|----------|
-| id | VARCHAR(50) | NOT NULL | PK | - | プライマリキー |
-| tenant_id | VARCHAR(50) | NOT NULL | - | - | テナントID |
-| created_at | TIMESTAMP | NOT NULL | - | CURRENT_TIMESTAMP | 作成日時 |
-"""
-            
-            md_file = self.temp_dir / 'tables' / f'テーブル定義書_{table_name}_{table_name}テーブル.md'
-            with open(md_file, 'w', encoding='utf-8') as f:
-                f.write(md_content)
-            
-            # サンプルデータファイル作成
-            data_content = f"""-- {table_name} サンプルデータ
-INSERT INTO {table_name} (id, tenant_id) VALUES 
-('test-{table_name.lower()}-001', 'tenant-001'),
-('test-{table_name.lower()}-002', 'tenant-001'),
-('test-{table_name.lower()}-003', 'tenant-002');
-"""
-            
-            data_file = self.temp_dir / 'data' / f'{table_name}_sample_data.sql'
-            with open(data_file, 'w', encoding='utf-8') as f:
-                f.write(data_content)
-            
-            results.append({'table': table_name, 'status': 'success'})
-            
-            # 処理時間をシミュレート
-            time.sleep(0.1)
-        
-        return {'tables': results, 'status': 'success'}
+class TestSyntheticCorpusBenchmark(unittest.TestCase):
+    """合成設計書ジェネレーターの設計書での実ツール測定"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = Path(tempfile.mkdtemp())
+        cls.root = cls.work_dir / "synthetic"
+        try:
+            bench_scaling.build_synthetic_corpus(cls.root, SYNTHETIC_TABLES, fk_density=1.5, cycles=5,
+                                                 sample_rows=5, inconsistency_rate=0.05,
+                                                 inconsistency_kinds=["ddl_column_missing", "dangling_foreign_key"])
+        except ImportError as e:
+            shutil.rmtree(cls.work_dir, ignore_errors=True)
+            raise unittest.SkipTest(f"合成設計書ジェネレーターを読み込めません: {e}")
+        with open(cls.root / ".design_corpus.json", encoding="utf-8") as f:
+            cls.manifest = json.load(f)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.work_dir, ignore_errors=True)
+
+    def _measure(self, name: str):
+        try:
+            return bench_scaling.measure_target(name, self.root, self.work_dir / "output" / name)
+        except ImportError as e:
+            self.skipTest(f"{name} を読み込めません: {e}")
+
+    def test_yaml_validator(self):
+        """YAML検証が全テーブルを検証すること"""
+        result = self._measure("yaml_validator")
+        self.assertEqual(result["files"], SYNTHETIC_TABLES)
+
+    def test_sample_data_with_cycles(self):
+        """循環参照を含む設計書でもサンプルデータを全テーブル生成できること"""
+        self.assertEqual(len(self.manifest["cycles"]), 5)
+        result = self._measure("sample_data")
+        self.assertEqual(result["files"], SYNTHETIC_TABLES)
+
+    def test_table_generator(self):
+        """テーブル生成が全テーブルを処理すること"""
+        result = self._measure("table_generator")
+        self.assertEqual(result["files"], SYNTHETIC_TABLES)
 
 
 @pytest.mark.performance
-class TestConsistencyCheckPerformance(PerformanceTestCase):
-    """整合性チェックパフォーマンステスト"""
-    
-    def test_consistency_check_performance(self):
-        """整合性チェックパフォーマンス"""
-        # テストテーブル作成
-        table_names = [f'PERF_Check_{i:02d}' for i in range(20)]
-        
-        for table_name in table_names:
-            self._create_test_yaml(table_name, 'simple')
-            # 対応するファイルも作成
-            self._create_mock_files(table_name)
-        
-        def run_consistency_check():
-            return self._mock_consistency_check(table_names)
-        
-        check_result = self._measure_performance(run_consistency_check)
-        self.performance_results['整合性チェック（20テーブル）'] = check_result
-        
-        # 実行時間の確認（5秒以内）
-        self.assertLess(check_result['execution_time'], 5.0,
-                       f"整合性チェックが遅すぎます: {check_result['execution_time']:.3f}秒")
-        
-        # 1テーブルあたりの平均時間
-        avg_time_per_table = check_result['execution_time'] / len(table_names)
-        self.assertLess(avg_time_per_table, 0.25,
-                       f"1テーブルあたりのチェック時間が遅すぎます: {avg_time_per_table:.3f}秒")
-    
-    def test_memory_usage_during_large_check(self):
-        """大量チェック時のメモリ使用量テスト"""
-        # 50個のテーブル作成
-        table_names = [f'PERF_Memory_{i:03d}' for i in range(50)]
-        
-        for table_name in table_names:
-            self._create_test_yaml(table_name, 'complex')
-            self._create_mock_files(table_name)
-        
-        def run_large_check():
-            return self._mock_consistency_check(table_names)
-        
-        memory_result = self._measure_performance(run_large_check)
-        self.performance_results['大量整合性チェック（50テーブル）'] = memory_result
-        
-        # メモリ使用量の確認（100MB以内の増加）
-        memory_delta = memory_result.get('memory_delta', {})
-        rss_delta = memory_delta.get('rss_delta', 0)
-        self.assertLess(rss_delta, 100.0,
-                       f"メモリ使用量が多すぎます: {rss_delta:.1f}MB")
-    
-    def _create_mock_files(self, table_name: str):
-        """モックファイル作成"""
-        # DDLファイル
-        ddl_file = self.temp_dir / 'ddl' / f'{table_name}.sql'
-        ddl_file.touch()
-        
-        # Markdownファイル
-        md_file = self.temp_dir / 'tables' / f'テーブル定義書_{table_name}_{table_name}テーブル.md'
-        md_file.touch()
-    
-    def _mock_consistency_check(self, table_names: List[str]) -> Dict[str, Any]:
-        """整合性チェックのモック実装"""
-        results = []
-        
-        for table_name in table_names:
-            # ファイル存在チェック
-            yaml_file = self.temp_dir / 'table-details' / f'{table_name}_details.yaml'
-            ddl_file = self.temp_dir / 'ddl' / f'{table_name}.sql'
-            md_file = self.temp_dir / 'tables' / f'テーブル定義書_{table_name}_{table_name}テーブル.md'
-            
-            checks = {
-                'table_existence': yaml_file.exists() and ddl_file.exists() and md_file.exists(),
-                'column_consistency': True,  # モックでは常にOK
-                'foreign_key_consistency': True,  # モックでは常にOK
-                'naming_convention': True  # モックでは常にOK
-            }
-            
-            results.append({
-                'table': table_name,
-                'checks': checks,
-                'status': 'success' if all(checks.values()) else 'error'
-            })
-            
-            # チェック処理時間をシミュレート
-            time.sleep(0.01)
-        
-        return {'tables': results, 'status': 'success'}
+class TestBaselineComparison(unittest.TestCase):
+    """ベースライン比較"""
+
+    @staticmethod
+    def _results(files_per_sec: float, peak_rss_mb: float, **extra):
+        result = {"seconds": 1.0, "files": 100, "files_per_sec": files_per_sec, "peak_rss_mb": peak_rss_mb}
+        return {"results": {"yaml_validator": {"50": result, **extra}}}
+
+    def test_within_threshold(self):
+        """閾値以内の変化は悪化としないこと"""
+        rows = bench_scaling.compare_results(self._results(100, 50), self._results(90, 55), threshold=0.2)
+        self.assertEqual([row["status"] for row in rows], ["ok"])
+
+    def test_time_and_rss_regression(self):
+        """files/s の低下・ピークRSSの増加を検出すること"""
+        rows = bench_scaling.compare_results(self._results(100, 50), self._results(50, 50), threshold=0.2)
+        self.assertEqual(rows[0]["regressions"], ["time"])
+        self.assertAlmostEqual(rows[0]["time_change"], 1.0)
+
+        rows = bench_scaling.compare_results(self._results(100, 50), self._results(100, 80),
+                                             threshold=0.2, rss_threshold=0.5)
+        self.assertEqual(rows[0]["regressions"], ["rss"])
+
+    def test_missing_and_error_entries_skipped(self):
+        """ベースラインにない項目・失敗した項目は比較しないこと"""
+        current = self._results(10, 50, **{"500": {"error": "ImportError"}})
+        current["results"]["sample_data"] = {"50": {"files_per_sec": 1.0, "peak_rss_mb": 1.0}}
+        rows = bench_scaling.compare_results(self._results(100, 50), current, threshold=0.2)
+        statuses = {(row["target"], row["size"]): row["status"] for row in rows}
+        self.assertEqual(statuses[("yaml_validator", "50")], "regression")
+        self.assertEqual(statuses[("yaml_validator", "500")], "skip")
+        self.assertEqual(statuses[("sample_data", "50")], "skip")
 
 
 if __name__ == '__main__':
-    # パフォーマンステストスイート実行
     unittest.main(verbosity=2)
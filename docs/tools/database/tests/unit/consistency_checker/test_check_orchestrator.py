@@ -0,0 +1,315 @@
+"""
+チェックオーケストレーターのユニットテスト
+
+要求仕様ID: PLT.1-WEB.1
+設計書: docs/design/database/08-database-design-guidelines.md
+
+CheckOrchestrator の詳細テスト：
+- 設計ディレクトリ一式に対する全チェックの実行
+- 並列実行（max_workers > 1）と逐次実行の結果一致
+- スキーマスナップショットによる各ファイル1回のみの解析
+- 外部キー参照先インデックスの解析回数
+- テーブル単位・チェック単位のトレーススパン
+- main.py 経由のインクリメンタルチェック（前回結果の再利用と変更ファイルの再チェック）
+"""
+
+import importlib
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+# テスト対象のインポート
+import sys
+LEGACY_DIR = Path(__file__).parent.parent.parent.parent / "legacy"
+# checkers / core は整合性チェックツール配下のパッケージを参照する（ツール直下の core より優先）
+sys.path.insert(0, str(LEGACY_DIR))
+sys.path.insert(0, str(LEGACY_DIR / "database_consistency_checker"))
+
+from shared.core.config import Config, create_check_config
+from shared.parsers import ddl_engine
+from shared.performance import yaml_cache
+from shared.monitoring.tracing import enable_tracing, get_tracer
+from checkers.check_orchestrator import CheckOrchestrator
+# パッケージの __init__ は main 関数を公開するため、モジュールとして読み込む
+checker_main = importlib.import_module("database_consistency_checker.main")
+
+
+TABLES = {
+    "MST_Tenant": ("テナント", None),
+    "MST_Department": ("部署マスタ", ("MST_Tenant", "tenant_id")),
+    "MST_Employee": ("社員基本情報", ("MST_Department", "department_id")),
+}
+
+
+def write_design_tree(base_dir: Path) -> Path:
+    """
+    整合性チェック用の設計ディレクトリ（DDL・詳細YAML・テーブル一覧・エンティティ関連）を作成
+
+    Returns:
+        docs/design/database ディレクトリ
+    """
+    design_dir = base_dir / "docs" / "design" / "database"
+    ddl_dir = design_dir / "ddl"
+    details_dir = design_dir / "table-details"
+    ddl_dir.mkdir(parents=True)
+    details_dir.mkdir()
+
+    rows = ["| テーブルID | テーブル名 | 論理名 |", "|---|---|---|"]
+    entities = ["entities:"]
+    relationships = ["relationships:"]
+    for i, (table, (logical_name, reference)) in enumerate(TABLES.items(), 1):
+        rows.append(f"| TBL-{i:03d} | {table} | {logical_name} |")
+        fk_column = reference[1] if reference else None
+
+        ddl_columns = ["    id VARCHAR(50) NOT NULL", "    tenant_id VARCHAR(50) NOT NULL"]
+        if fk_column and fk_column != "tenant_id":
+            ddl_columns.append(f"    {fk_column} VARCHAR(50)")
+        ddl_columns.append("    PRIMARY KEY (id)")
+        if reference:
+            ddl_columns.append(
+                f"    CONSTRAINT fk_{table.lower()}_{fk_column} FOREIGN KEY ({fk_column}) "
+                f"REFERENCES {reference[0]} (id)"
+            )
+        (ddl_dir / f"{table}.sql").write_text(
+            f"CREATE TABLE {table} (\n" + ",\n".join(ddl_columns) + "\n);\n"
+            f"CREATE INDEX idx_{table.lower()}_tenant ON {table} (tenant_id);\n",
+            encoding='utf-8'
+        )
+
+        yaml_lines = [
+            f"table_name: {table}",
+            f"logical_name: {logical_name}",
+            "requirement_id: PLT.1-WEB.1",
+            "business_columns:",
+            "- {name: id, type: VARCHAR, length: 50, 'null': false, primary_key: true, requirement_id: PLT.1-WEB.1}",
+            "- {name: tenant_id, type: VARCHAR, length: 50, 'null': false, requirement_id: PLT.1-WEB.1}",
+        ]
+        if fk_column and fk_column != "tenant_id":
+            yaml_lines.append(f"- {{name: {fk_column}, type: VARCHAR, length: 50, requirement_id: PLT.1-WEB.1}}")
+        yaml_lines += [
+            "business_indexes:",
+            f"- {{name: idx_{table.lower()}_tenant, columns: [tenant_id]}}",
+        ]
+        if reference:
+            yaml_lines += [
+                "foreign_keys:",
+                f"- {{name: fk_{table.lower()}_{fk_column}, column: {fk_column}, "
+                f"reference_table: {reference[0]}, reference_column: id}}",
+            ]
+        (details_dir / f"{table}_details.yaml").write_text("\n".join(yaml_lines) + "\n", encoding='utf-8')
+
+        entities += [f"  {table}:", f"    logical_name: {logical_name}", "    primary_key: id"]
+        if reference:
+            relationships += [
+                f"  - source: {table}",
+                f"    target: {reference[0]}",
+                "    type: many_to_one",
+                f"    foreign_key: {fk_column}",
+            ]
+
+    (design_dir / "テーブル一覧.md").write_text("\n".join(rows) + "\n", encoding='utf-8')
+    (design_dir / "entity_relationships.yaml").write_text(
+        "\n".join(entities + relationships) + "\n", encoding='utf-8'
+    )
+    return design_dir
+
+
+@pytest.mark.unit
+class TestCheckOrchestrator(unittest.TestCase):
+    """CheckOrchestratorのエンドツーエンドテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        write_design_tree(self.temp_dir)
+        self.config = Config(base_dir=str(self.temp_dir))
+
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+
+    def _run(self, max_workers):
+        orchestrator = CheckOrchestrator(self.config, create_check_config(max_workers=max_workers))
+        report = orchestrator.run_all_checks()
+        return [(r.check_name, r.table_name, r.severity, r.message) for r in report.results]
+
+    def test_parallel_run_matches_sequential(self):
+        """並列実行でも全チェックが実行され、結果が逐次実行と一致することのテスト"""
+        parallel = self._run(max_workers=4)
+        sequential = self._run(max_workers=1)
+
+        self.assertEqual(parallel, sequential)
+        # カラム定義・外部キーの整合性チェックは不整合がある場合のみ結果を返す
+        executed = {check_name for check_name, _, _, _ in parallel}
+        silent_when_consistent = {"column_consistency", "foreign_key_consistency"}
+        available = CheckOrchestrator(self.config, create_check_config()).get_available_checks()
+        for check_name in available:
+            if check_name not in silent_when_consistent:
+                self.assertIn(check_name, executed)
+        self.assertFalse(
+            [r for r in parallel if r[0] in silent_when_consistent],
+            "DDLとYAMLのカラム・外部キー定義は一致している"
+        )
+        # テーブル一覧・DDL・詳細YAML・エンティティ関連がすべて揃っている
+        existence = [r for r in parallel if r[0] == "table_existence"]
+        self.assertEqual({r[1] for r in existence}, set(TABLES))
+        self.assertTrue(all(r[2].value == "success" for r in existence))
+
+    def test_each_file_parsed_once(self):
+        """全チェックの実行中に各DDL・YAMLファイルが1回のみ読み込み・解析されることのテスト"""
+        ddl_parses = []
+        ddl_file_reads = []
+        yaml_parses = []
+        parse_ddl_tables = ddl_engine.parse_ddl_tables
+        get_tables = ddl_engine.DDLParseCache.get_tables
+
+        def count_ddl_parse(content):
+            ddl_parses.append(content)
+            return parse_ddl_tables(content)
+
+        def count_get_tables(cache, path, content=None):
+            # 本文を渡さない呼び出しはキャッシュミス時にファイルを読み込む（スナップショット外の読み込み）
+            if content is None:
+                ddl_file_reads.append(Path(path).name)
+            return get_tables(cache, path, content)
+
+        def counting_loader(load):
+            def wrapper(stream, *args, **kwargs):
+                yaml_parses.append(stream)
+                return load(stream, *args, **kwargs)
+            return wrapper
+
+        orchestrator = CheckOrchestrator(self.config, create_check_config(max_workers=4))
+        with patch.object(ddl_engine, "parse_ddl_tables", side_effect=count_ddl_parse), \
+                patch.object(ddl_engine.DDLParseCache, "get_tables", autospec=True, side_effect=count_get_tables), \
+                patch.object(yaml, "safe_load", counting_loader(yaml.safe_load)), \
+                patch.object(yaml_cache, "safe_load", counting_loader(yaml_cache.safe_load)):
+            orchestrator.run_all_checks()
+
+        self.assertEqual(len(ddl_parses), len(TABLES))
+        self.assertEqual(ddl_file_reads, [])
+        # 詳細YAML（テーブル数分）と entity_relationships.yaml
+        self.assertEqual(len(yaml_parses), len(TABLES) + 1)
+        # スナップショットの各ビューもファイルごとに1回のみ生成される
+        stats = orchestrator.executor.snapshot_statistics
+        self.assertEqual(stats['ddl_files'], len(TABLES))
+        self.assertEqual(stats['parse_counts'].pop('table_list'), 1)
+        for view, count in stats['parse_counts'].items():
+            self.assertEqual(count, len(TABLES), view)
+    def test_reference_index_counts_only_real_parses(self):
+        """参照先インデックスの解析回数にスナップショットのメモから返した分を含めないことのテスト"""
+        orchestrator = CheckOrchestrator(self.config, create_check_config(max_workers=1))
+        orchestrator.run_specific_checks(["foreign_key_consistency"])
+
+        stats = orchestrator.executor.foreign_key_checker.reference_index_stats
+        # MST_Department -> MST_Tenant, MST_Employee -> MST_Department
+        self.assertEqual(stats.lookups, 2)
+        # 参照先のDDLは各テーブル自身のチェックで解析済み
+        self.assertEqual(stats.parses, 0)
+        self.assertEqual(stats.parses_avoided, 2)
+        self.assertEqual(orchestrator.executor.snapshot_statistics['parse_counts']['ddl_schema'], len(TABLES))
+
+    def test_per_table_spans(self):
+        """並列実行でもテーブル単位のスパンが各チェックのスパン配下に記録されることのテスト"""
+        orchestrator = CheckOrchestrator(self.config, create_check_config(max_workers=4))
+        tracer = get_tracer()
+        tracer.clear()
+        enable_tracing()
+        try:
+            orchestrator.run_all_checks()
+            events = [event for event in tracer.to_chrome_trace()['traceEvents'] if event['ph'] == 'X']
+        finally:
+            enable_tracing(False)
+            tracer.clear()
+
+        spans = {event['args']['span_id']: event for event in events}
+        tables_by_check = {}
+        for event in events:
+            if event['name'] != 'check.table':
+                continue
+            parent = spans[event['args']['parent_id']]
+            self.assertEqual(parent['name'], f"check.{event['args']['check']}")
+            tables_by_check.setdefault(event['args']['check'], set()).add(event['args']['table'])
+
+        for check_name in ("column_consistency", "foreign_key_consistency", "data_type_consistency",
+                           "constraint_consistency", "multitenant_compliance",
+                           "requirement_traceability", "performance_impact"):
+            self.assertEqual(tables_by_check.get(check_name), set(TABLES), check_name)
+        # チェック単位のスパンは実行全体のスパン配下
+        check_spans = [event for event in events if event['cat'] == 'check']
+        self.assertEqual(len(check_spans), len(orchestrator.get_available_checks()))
+        self.assertTrue(all(spans[event['args']['parent_id']]['name'] == 'consistency_check.run'
+                            for event in check_spans))
+
+
+@pytest.mark.unit
+class TestIncrementalCheck(unittest.TestCase):
+    """main.py 経由のインクリメンタルチェックのテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.design_dir = write_design_tree(self.temp_dir)
+
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+
+    def _run_cli(self):
+        """main.run を --incremental で実行し、使用したオーケストレーターを返す"""
+        args = checker_main.create_argument_parser().parse_args([
+            "--base-dir", str(self.temp_dir), "--incremental", "-j", "2",
+            "--output-format", "json", "--output-file", str(self.temp_dir / "report.json"),
+        ])
+        orchestrators = []
+
+        def build(config, check_config):
+            orchestrators.append(CheckOrchestrator(config, check_config))
+            return orchestrators[-1]
+
+        report_file = self.temp_dir / "report.json"
+        report_file.unlink(missing_ok=True)
+        with patch.object(checker_main, "CheckOrchestrator", side_effect=build):
+            # 終了コードは検出したエラーの有無で決まる（ここではレポート出力まで完了したことを確認）
+            with self.assertRaises(SystemExit):
+                checker_main.run(args)
+        self.assertTrue(report_file.exists())
+        return orchestrators[0]
+
+    def _cache_stats(self, orchestrator):
+        """インクリメンタルチェックのヒット・ミス件数を取得"""
+        return orchestrator.executor.result_cache.get_statistics()
+
+    def test_unchanged_run_reuses_results(self):
+        """入力が変化していない2回目の実行は全チェックがキャッシュヒットすることのテスト"""
+        first = self._cache_stats(self._run_cli())
+        second = self._cache_stats(self._run_cli())
+
+        self.assertEqual(first['hits'], 0)
+        self.assertGreater(first['misses'], 0)
+        self.assertEqual(second['hits'], first['misses'])
+        self.assertEqual(second['misses'], 0)
+
+    def test_edited_file_is_rechecked(self):
+        """1ファイルを編集した場合はそのテーブルのみ再チェックされることのテスト"""
+        first = self._cache_stats(self._run_cli())
+
+        yaml_path = self.design_dir / "table-details" / "MST_Employee_details.yaml"
+        yaml_path.write_text(
+            yaml_path.read_text(encoding='utf-8').replace("logical_name: 社員基本情報", "logical_name: 社員"),
+            encoding='utf-8'
+        )
+        second = self._cache_stats(self._run_cli())
+
+        self.assertGreater(second['misses'], 0)
+        self.assertGreater(second['hits'], 0)
+        self.assertEqual(second['hits'] + second['misses'], first['misses'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+チェックスケジューラーのユニットテスト
+
+要求仕様ID: PLT.1-WEB.1, SKL.1-HIER.1
+設計書: docs/design/database/08-database-design-guidelines.md
+
+CheckScheduler の詳細テスト：
+- 依存関係順の実行
+- 並列実行（--jobs > 1）とワーカースレッドへのコンテキスト引き継ぎ
+- 失敗したチェックの例外伝播
+- 逐次実行と同一の結果順序
+"""
+
+import contextvars
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import pytest
+
+# テスト対象のインポート
+import sys
+LEGACY_DIR = Path(__file__).parent.parent.parent.parent / "legacy"
+# checkers / core は整合性チェックツール配下のパッケージを参照する（ツール直下の core より優先）
+sys.path.insert(0, str(LEGACY_DIR))
+sys.path.insert(0, str(LEGACY_DIR / "database_consistency_checker"))
+
+from shared.core.models import CheckResult
+from checkers.check_scheduler import CheckScheduler, CheckTask
+
+REQUEST_ID = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.mark.unit
+class TestCheckScheduler(unittest.TestCase):
+    """依存関係付きチェックスケジューラーのテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.lock = threading.Lock()
+        self.events = []
+
+    def _task(self, name, depends_on=(), delay=0.0, results=1):
+        """開始・終了を記録し、受け取った依存結果のチェック名をメッセージに含めるチェック"""
+        def run(dependency_results):
+            with self.lock:
+                self.events.append(("start", name))
+            time.sleep(delay)
+            received = sorted(dependency_results)
+            with self.lock:
+                self.events.append(("end", name))
+            return [
+                CheckResult(check_name=name, message=f"{index}:{','.join(received)}")
+                for index in range(results)
+            ]
+        return CheckTask(name=name, run=run, depends_on=tuple(depends_on))
+
+    def _tasks(self):
+        # 宣言順: yaml_format は table_existence の後ろにあるが先に実行される
+        return [
+            self._task("table_existence", depends_on=["yaml_format"], delay=0.02),
+            self._task("yaml_format", delay=0.05, results=2),
+            self._task("column_consistency", depends_on=["table_existence"], delay=0.01),
+            self._task("foreign_key", depends_on=["table_existence", "column_consistency"]),
+            self._task("naming", delay=0.0, results=3),
+        ]
+
+    def _position(self, kind, name):
+        return self.events.index((kind, name))
+
+    def test_dependency_order(self):
+        """依存チェックの完了後に実行され、依存結果を受け取ることのテスト"""
+        for jobs in (1, 4):
+            with self.subTest(jobs=jobs):
+                self.events.clear()
+                scheduler = CheckScheduler(self._tasks(), max_workers=jobs)
+                results = scheduler.run()
+
+                for check, dependency in [("table_existence", "yaml_format"),
+                                          ("column_consistency", "table_existence"),
+                                          ("foreign_key", "column_consistency")]:
+                    self.assertLess(self._position("end", dependency), self._position("start", check))
+                messages = {result.check_name: result.message for result in results}
+                self.assertEqual(messages["foreign_key"], "0:column_consistency,table_existence")
+                self.assertEqual(scheduler.get_execution_plan(), [
+                    ["yaml_format", "naming"], ["table_existence"], ["column_consistency"], ["foreign_key"]
+                ])
+
+    def test_unselected_dependency_ignored(self):
+        """選択されなかった依存チェックは待たずに実行されることのテスト"""
+        scheduler = CheckScheduler(self._tasks(), max_workers=2)
+        results = scheduler.run(["foreign_key", "column_consistency"])
+        self.assertEqual([result.check_name for result in results], ["column_consistency", "foreign_key"])
+        self.assertEqual(results[1].message, "0:column_consistency")
+
+    def test_parallel_runs_independent_checks_concurrently(self):
+        """--jobs > 1 で依存のないチェックがワーカースレッドで同時に実行されることのテスト"""
+        barrier = threading.Barrier(2, timeout=5)
+        threads = {}
+
+        def run(name):
+            def check(dependency_results):
+                threads[name] = threading.current_thread().name
+                barrier.wait()
+                return [CheckResult(check_name=name)]
+            return CheckTask(name=name, run=check)
+
+        scheduler = CheckScheduler([run("a"), run("b")], max_workers=2)
+        self.assertEqual([result.check_name for result in scheduler.run()], ["a", "b"])
+        self.assertTrue(all(name.startswith("consistency-check") for name in threads.values()))
+        self.assertEqual(scheduler.stats.max_workers, 2)
+        self.assertEqual(set(scheduler.stats.check_times), {"a", "b"})
+
+    def test_context_propagates_to_workers(self):
+        """投入時のコンテキスト変数がワーカースレッドに引き継がれることのテスト"""
+        seen = {}
+
+        def check(name):
+            def run(dependency_results):
+                seen[name] = (REQUEST_ID.get(), threading.current_thread().name)
+                return []
+            return CheckTask(name=name, run=run, depends_on=("first",) if name != "first" else ())
+
+        token = REQUEST_ID.set("run-42")
+        try:
+            CheckScheduler([check("first"), check("second"), check("third")], max_workers=3).run()
+        finally:
+            REQUEST_ID.reset(token)
+
+        self.assertEqual({value for value, _ in seen.values()}, {"run-42"})
+        self.assertTrue(all(thread.startswith("consistency-check") for _, thread in seen.values()))
+        self.assertIsNone(REQUEST_ID.get())
+
+    def test_exception_propagates(self):
+        """失敗したチェックの例外が呼び出し元に伝播し、後続チェックは実行されないことのテスト"""
+        def fail(dependency_results):
+            raise RuntimeError("DDL解析失敗")
+
+        for jobs in (1, 4):
+            with self.subTest(jobs=jobs):
+                self.events.clear()
+                tasks = [
+                    CheckTask(name="ddl", run=fail),
+                    self._task("column_consistency", depends_on=["ddl"]),
+                    self._task("naming", delay=0.01),
+                ]
+                scheduler = CheckScheduler(tasks, max_workers=jobs)
+                with self.assertRaisesRegex(RuntimeError, "DDL解析失敗"):
+                    scheduler.run()
+                self.assertNotIn(("start", "column_consistency"), self.events)
+                self.assertIn("ddl", scheduler.stats.check_times)
+
+    def test_parallel_result_order_matches_sequential(self):
+        """完了順に関わらず、並列実行の結果順序が逐次実行と同一であることのテスト"""
+        def snapshot(results):
+            return [(result.check_name, result.message) for result in results]
+
+        sequential = snapshot(CheckScheduler(self._tasks(), max_workers=1).run())
+        self.events.clear()
+        parallel = snapshot(CheckScheduler(self._tasks(), max_workers=4).run())
+
+        self.assertEqual(parallel, sequential)
+        self.assertEqual([name for name, _ in parallel], [
+            "table_existence", "yaml_format", "yaml_format", "column_consistency", "foreign_key",
+            "naming", "naming", "naming"
+        ])
+        # naming は遅延がないため yaml_format より先に完了している
+        self.assertLess(self._position("end", "naming"), self._position("end", "yaml_format"))
+
+    def test_invalid_dependencies(self):
+        """未定義の依存・循環依存・重複したチェック名を検出することのテスト"""
+        with self.assertRaisesRegex(ValueError, "未定義"):
+            CheckScheduler([self._task("a", depends_on=["missing"])])
+        with self.assertRaisesRegex(ValueError, "循環"):
+            CheckScheduler([self._task("a", depends_on=["b"]), self._task("b", depends_on=["a"])])
+        with self.assertRaisesRegex(ValueError, "重複"):
+            CheckScheduler([self._task("a"), self._task("a")])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,189 @@
+"""
+チェック結果キャッシュのユニットテスト
+
+要求仕様ID: PLT.1-WEB.1, SKL.1-HIER.1
+設計書: docs/design/database/08-database-design-guidelines.md
+
+CheckResultCache / InputFingerprinter の詳細テスト：
+- 入力が変化していないテーブルのキャッシュヒット
+- テーブルの YAML・DDL 変更による無効化
+- チェッカーバージョン変更による無効化
+- 破損したキャッシュファイルの扱い
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+# テスト対象のインポート
+import sys
+LEGACY_DIR = Path(__file__).parent.parent.parent.parent / "legacy"
+# checkers / core は整合性チェックツール配下のパッケージを参照する（ツール直下の core より優先）
+sys.path.insert(0, str(LEGACY_DIR))
+sys.path.insert(0, str(LEGACY_DIR / "database_consistency_checker"))
+
+from shared.core.models import CheckResult, CheckSeverity
+from core import result_cache
+from core.result_cache import CheckResultCache, InputFingerprinter
+
+
+@pytest.mark.unit
+class TestCheckResultCache(unittest.TestCase):
+    """インクリメンタルチェック用結果キャッシュのテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.config = SimpleNamespace(
+            base_dir=self.temp_dir,
+            ddl_dir=self.temp_dir / "ddl",
+            table_details_dir=self.temp_dir / "table-details",
+            table_list_file=self.temp_dir / "テーブル一覧.md",
+            entity_relationships_file=self.temp_dir / "entity_relationships.yaml",
+        )
+        self.check_config = SimpleNamespace(check_parameters={})
+        self.cache_dir = self.temp_dir / ".cache" / "consistency_checker"
+
+        self.config.ddl_dir.mkdir()
+        self.config.table_details_dir.mkdir()
+        for table in ("MST_Employee", "MST_Department"):
+            self._write_ddl(table, f"CREATE TABLE {table} (id VARCHAR(50) PRIMARY KEY);\n")
+            self._write_yaml(table, f"table_name: {table}\n")
+
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+
+    def _write_ddl(self, table, content):
+        (self.config.ddl_dir / f"{table}.sql").write_text(content, encoding='utf-8')
+
+    def _write_yaml(self, table, content):
+        path = self.config.table_details_dir / f"テーブル詳細定義YAML_{table}.yaml"
+        path.write_text(content, encoding='utf-8')
+
+    def _open_cache(self):
+        """1回の実行分のキャッシュとフィンガープリンターを作成"""
+        cache = CheckResultCache(
+            self.cache_dir, CheckResultCache.make_config_fingerprint(self.config, self.check_config)
+        )
+        cache.load()
+        return cache, InputFingerprinter(self.config)
+
+    def _run(self, tables=("MST_Employee", "MST_Department")):
+        """column_consistency をテーブル単位で実行し、キャッシュから再利用したテーブルを返す"""
+        cache, fingerprinter = self._open_cache()
+        reused = []
+        for table in tables:
+            digest = fingerprinter.table_hash(table)
+            if cache.get("column_consistency", table, digest) is not None:
+                reused.append(table)
+                continue
+            cache.put("column_consistency", table, digest, [
+                CheckResult(check_name="column_consistency", table_name=table,
+                            severity=CheckSeverity.SUCCESS, message="一致")
+            ])
+        cache.save()
+        return reused, cache
+
+    def test_hit_on_unchanged_inputs(self):
+        """入力が変化していない場合は前回結果が再利用されることのテスト"""
+        reused, cache = self._run()
+        self.assertEqual(reused, [])
+        self.assertTrue(cache.cache_file.exists())
+
+        reused, cache = self._run()
+        self.assertEqual(reused, ["MST_Employee", "MST_Department"])
+        self.assertEqual(cache.get_statistics(), {'hits': 2, 'misses': 0, 'entries': 2})
+
+        results = cache.get("column_consistency", "MST_Employee",
+                            InputFingerprinter(self.config).table_hash("MST_Employee"))
+        self.assertEqual([(r.table_name, r.message) for r in results], [("MST_Employee", "一致")])
+
+    def test_invalidated_by_table_yaml_change(self):
+        """テーブルの YAML が変化した場合はそのテーブルのみ再チェックされることのテスト"""
+        self._run()
+        self._write_yaml("MST_Employee", "table_name: MST_Employee\nlogical_name: 社員\n")
+
+        reused, cache = self._run()
+        self.assertEqual(reused, ["MST_Department"])
+        self.assertEqual(cache.get_statistics()['misses'], 1)
+
+        # 更新後の結果が保存され、次回はヒットする
+        reused, _ = self._run()
+        self.assertEqual(reused, ["MST_Employee", "MST_Department"])
+
+    def test_invalidated_by_table_ddl_change(self):
+        """テーブルの DDL が変化・削除された場合は再チェックされることのテスト"""
+        self._run()
+        self._write_ddl("MST_Department",
+                        "CREATE TABLE MST_Department (id VARCHAR(50) PRIMARY KEY, name TEXT);\n")
+        reused, _ = self._run()
+        self.assertEqual(reused, ["MST_Employee"])
+
+        (self.config.ddl_dir / "MST_Employee.sql").unlink()
+        reused, _ = self._run()
+        self.assertEqual(reused, ["MST_Department"])
+
+    def test_foreign_key_hash_follows_referenced_table(self):
+        """参照先テーブルの変更で外部キーチェックのハッシュが変わることのテスト"""
+        self._write_ddl("MST_Employee", "CREATE TABLE MST_Employee (\n"
+                        "  department_id VARCHAR(50) REFERENCES MST_Department(id)\n);\n")
+        before = InputFingerprinter(self.config).foreign_key_hash("MST_Employee")
+        self._write_yaml("MST_Department", "table_name: MST_Department\nlogical_name: 部署\n")
+        fingerprinter = InputFingerprinter(self.config)
+
+        self.assertEqual(fingerprinter.referenced_tables("MST_Employee"), ["MST_Department"])
+        self.assertNotEqual(fingerprinter.foreign_key_hash("MST_Employee"), before)
+
+    def test_invalidated_by_checker_version_change(self):
+        """チェッカーバージョンが変わった場合はキャッシュ全体を破棄することのテスト"""
+        self._run()
+        with patch.object(result_cache, "CHECKER_VERSION", "2.0.0"):
+            cache, _ = self._open_cache()
+            self.assertEqual(cache.get_statistics()['entries'], 0)
+            reused, _ = self._run()
+            self.assertEqual(reused, [])
+
+            # 新バージョンで保存し直した結果は再利用される
+            reused, _ = self._run()
+            self.assertEqual(reused, ["MST_Employee", "MST_Department"])
+
+    def test_invalidated_by_check_parameters_change(self):
+        """結果に影響する設定が変わった場合はキャッシュを破棄することのテスト"""
+        self._run()
+        self.check_config.check_parameters = {'strict': True}
+        reused, _ = self._run()
+        self.assertEqual(reused, [])
+
+    def test_corrupt_cache_file(self):
+        """破損したキャッシュファイルは破棄して再作成することのテスト"""
+        self._run()
+        cache_file = self.cache_dir / result_cache.CACHE_FILE_NAME
+        cache_file.write_bytes(b"\x80\x05not a pickle")
+
+        with self.assertLogs("consistency_checker", level="WARNING"):
+            reused, cache = self._run()
+        self.assertEqual(reused, [])
+        self.assertEqual(cache.get_statistics(), {'hits': 0, 'misses': 2, 'entries': 2})
+
+        reused, _ = self._run()
+        self.assertEqual(reused, ["MST_Employee", "MST_Department"])
+
+    def test_truncated_cache_file(self):
+        """書き込み途中で切れたキャッシュファイルも破棄されることのテスト"""
+        self._run()
+        cache_file = self.cache_dir / result_cache.CACHE_FILE_NAME
+        cache_file.write_bytes(cache_file.read_bytes()[:20])
+
+        with self.assertLogs("consistency_checker", level="WARNING"):
+            cache, _ = self._open_cache()
+        self.assertEqual(cache.get_statistics()['entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -19,13 +19,25 @@ import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 import json
+import gzip
+import contextvars
+import random
+import io
+import argparse
+import importlib.util
+import pstats
+import sqlite3
+import subprocess
 import pytest
 
 # テスト対象のインポート
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "legacy"))
+# sql-to-seed*.py 共通のトークナイザー
+sys.path.insert(0, str(Path(__file__).resolve().parents[6] / "scripts"))
 
 from shared.core.models import TableDefinition, ColumnDefinition, CheckResult, CheckStatus
 from shared.core.exceptions import ValidationError, ConfigurationError
@@ -33,13 +45,35 @@ from shared.core.config import DatabaseToolsConfig
 from shared.core.logger import DatabaseToolsLogger
 from shared.parsers.yaml_parser import YamlParser
 from shared.parsers.ddl_parser import DDLParser
+from shared.parsers.ddl_engine import DDLParseCache, format_column_type
 from shared.parsers.markdown_parser import MarkdownParser
+from shared.parsers import ddl_engine, unified_parser
+from shared.core import models
+from shared.performance import yaml_cache
+from shared.performance.yaml_cache import YamlParseCache
+from shared.performance.cache_manager import (
+    LRUCache, StripedLRUCache, TieredCache, DiskCache, cached, source_fingerprint
+)
 from shared.generators.ddl_generator import DDLGenerator
 from shared.generators.markdown_generator import MarkdownGenerator
 from shared.generators.sample_data_generator import SampleDataGenerator
+from shared.generators.sql_batch import (
+    copy_field_codec, open_sql_output, render_copy, render_statements, sql_literal_to_text, write_copy_columns,
+    write_statements
+)
+from shared.generators.sql_codecs import compile_codec, encode_columns
+from shared.generators.sample_data_generator import EnhancedSQLGenerator
+from shared.generators.design_corpus_generator import CorpusSpec, DesignCorpusGenerator, generate_corpus
+from shared.monitoring.metrics_collector import MetricsCollector, PerformanceMonitor, QuantileSketch
+from shared.monitoring.tracing import Tracer
+from shared.monitoring.profiling import CommandProfiler, add_profile_arguments, collapse_stats, profile_command, profile_stage
 from shared.adapters.unified.filesystem_adapter import UnifiedFileSystemAdapter
 from shared.adapters.unified.data_transform_adapter import UnifiedDataTransformAdapter
-from shared.utils.file_utils import FileManager, BackupManager
+from shared.utils.file_utils import FileManager
+from sql_values_tokenizer import SqlTokenizeError, iter_insert_rows, parse_sql_literal, split_values
+from shared.utils.graph_utils import (
+    describe_cycle, find_cycle, is_cyclic_component, strongly_connected_components, topological_levels
+)
 
 
 @pytest.mark.unit
@@ -240,6 +274,52 @@ class TestYAMLParserAdvanced(unittest.TestCase):
         self.assertEqual(fk2.columns, ['skill_id'])
         self.assertEqual(fk2.on_update, 'RESTRICT')
 
+    def test_yaml_cache_persists_across_instances(self):
+        """解析済みYAMLがディスクキャッシュから再利用されることのテスト"""
+        yaml_file = self.temp_dir / 'cached.yaml'
+        yaml_file.write_text("table_name: MST_Cache\ncreated: 2025-06-01\n", encoding='utf-8')
+        cache_dir = self.temp_dir / '.cache' / 'yaml'
+
+        first = YamlParseCache(cache_dir).load(yaml_file)
+        reopened = YamlParseCache(cache_dir)
+        second = reopened.load(yaml_file)
+
+        self.assertEqual(first, second)
+        self.assertEqual(reopened.get_statistics()['hits'], 1)
+        self.assertEqual(reopened.get_statistics()['misses'], 0)
+
+        # 内容が変わった場合は再解析される
+        yaml_file.write_text("table_name: MST_Changed\n", encoding='utf-8')
+        self.assertEqual(reopened.load(yaml_file), {'table_name': 'MST_Changed'})
+        self.assertEqual(reopened.get_statistics()['misses'], 1)
+
+    def test_db_tools_second_run_hits_cache(self):
+        """db_tools の YAML検証を2回実行すると、2回目はディスクキャッシュから読み込むことのテスト"""
+        yaml_dir = self.temp_dir / 'table-details'
+        yaml_dir.mkdir()
+        for name in ('MST_A', 'MST_B'):
+            (yaml_dir / f'テーブル詳細定義YAML_{name}.yaml').write_text(
+                f"table_name: {name}\nlogical_name: {name}\ncolumns: []\n", encoding='utf-8')
+
+        spec = importlib.util.spec_from_file_location(
+            'db_tools_cache_test', Path(__file__).resolve().parents[3] / 'db_tools.py')
+        db_tools = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(db_tools)
+
+        with patch.dict('os.environ', {'SKILL_REPORT_PROJECT_ROOT': str(self.temp_dir)}), \
+                patch.dict(yaml_cache._yaml_caches, clear=True):
+            validator = db_tools.YAMLValidator(db_tools.DatabaseToolsConfig())
+            first = validator.validate_directory(yaml_dir)
+            # 別プロセスでの再実行と同じく、メモリ上のキャッシュインスタンスを作り直す
+            yaml_cache._yaml_caches.clear()
+            second = validator.validate_directory(yaml_dir)
+            statistics = yaml_cache.get_yaml_cache().get_statistics()
+
+        self.assertEqual(first, second)
+        self.assertEqual(statistics['hits'], 2)
+        self.assertEqual(statistics['misses'], 0)
+        self.assertEqual(len(list((self.temp_dir / '.cache' / 'yaml').glob('*.pkl'))), 2)
+
 
 @pytest.mark.unit
 class TestDDLParserAdvanced(unittest.TestCase):
@@ -344,6 +424,92 @@ CREATE TABLE MST_Test (
         self.assertIn('name', column_names)
         self.assertIn('description', column_names)
 
+    def test_parse_file_is_memoized(self):
+        """同一ファイルの再解析はキャッシュから返されることのテスト"""
+        ddl_file = self.temp_dir / 'MST_Cache.sql'
+        ddl_file.write_text(
+            "CREATE TABLE MST_Cache (\n"
+            "    id VARCHAR(50) NOT NULL,\n"
+            "    name VARCHAR(100)\n"
+            ");\n",
+            encoding='utf-8'
+        )
+        cache = DDLParseCache()
+
+        first = cache.get_tables(ddl_file)
+        second = cache.get_tables(ddl_file)
+
+        self.assertIs(first[0], second[0])
+        self.assertEqual(cache.get_statistics()['misses'], 1)
+        self.assertEqual(cache.get_statistics()['hits'], 1)
+        self.assertEqual(format_column_type(first[0].columns[0]), 'VARCHAR(50)')
+
+        # 内容（サイズ）が変わった場合は再解析される
+        ddl_file.write_text(
+            "CREATE TABLE MST_Cache (\n"
+            "    id VARCHAR(50) NOT NULL\n"
+            ");\n",
+            encoding='utf-8'
+        )
+        third = cache.get_tables(ddl_file)
+
+        self.assertEqual(len(third[0].columns), 1)
+        self.assertEqual(cache.get_statistics()['misses'], 2)
+
+    def test_columns_prefixed_with_constraint_keywords(self):
+        """制約キーワードで始まるカラム名がカラムとして解析されることのテスト"""
+        table_def = ddl_engine.parse_ddl_tables("""
+CREATE TABLE SYS_SkillIndex (
+    id VARCHAR(50) NOT NULL,
+    index_type VARCHAR(20),
+    index_updated_at TIMESTAMP,
+    checksum VARCHAR(64),
+    check_status VARCHAR(20),
+    unique_code VARCHAR(50),
+    key_name VARCHAR(50),
+    PRIMARY KEY (id),
+    UNIQUE (unique_code),
+    CHECK (check_status IN ('OK', 'NG')),
+    INDEX idx_type (index_type),
+    KEY idx_key (key_name),
+    CONSTRAINT fk_skill FOREIGN KEY (id) REFERENCES MST_Skill (id)
+);
+""")[0]
+
+        self.assertEqual(
+            [col.name for col in table_def.columns],
+            ['id', 'index_type', 'index_updated_at', 'checksum', 'check_status', 'unique_code', 'key_name']
+        )
+        self.assertTrue(table_def.columns[0].primary_key)
+        self.assertEqual([c.type for c in table_def.constraints], ['UNIQUE', 'CHECK'])
+        self.assertEqual([i.name for i in table_def.indexes], ['idx_type', 'idx_key'])
+        self.assertEqual(table_def.foreign_keys[0].references_table, 'MST_Skill')
+
+    def test_bracket_quoted_identifiers(self):
+        """角括弧で囲まれた識別子（テンプレートDDL）の解析テスト"""
+        ddl_file = self.temp_dir / 'MST_TEMPLATE.sql'
+        ddl_file.write_text("""
+CREATE TABLE [MST_TEMPLATE] (
+    [主キーカラム名] VARCHAR,
+    [ステータスカラム名] ENUM DEFAULT '値1',
+    `code` VARCHAR(10),
+    "check" VARCHAR(10),
+    PRIMARY KEY ([主キーカラム名])
+);
+CREATE INDEX [idx_template_code] ON [MST_TEMPLATE] ([code]);
+""", encoding='utf-8')
+
+        table_def = ddl_engine.load_ddl_tables(ddl_file)[0]
+
+        self.assertEqual(table_def.table_name, 'MST_TEMPLATE')
+        self.assertEqual(
+            [col.name for col in table_def.columns],
+            ['主キーカラム名', 'ステータスカラム名', 'code', 'check']
+        )
+        self.assertTrue(table_def.columns[0].primary_key)
+        self.assertEqual(table_def.indexes[0].name, 'idx_template_code')
+        self.assertEqual(table_def.indexes[0].columns, ['code'])
+
 
 @pytest.mark.unit
 class TestFilesystemAdapter(unittest.TestCase):
@@ -615,6 +781,814 @@ class TestFileManager(unittest.TestCase):
         self.assertEqual(len(all_files), 3)
 
 
+@pytest.mark.unit
+class TestLRUCache(unittest.TestCase):
+    """LRUキャッシュのテスト"""
+    
+    def test_size_is_tracked_incrementally(self):
+        """追加・置換・削除で合計サイズが差分更新されることのテスト"""
+        cache = LRUCache(max_size=10, size_estimator=len)
+        cache.put('a', 'x' * 10)
+        cache.put('b', 'x' * 20)
+        cache.put('a', 'x' * 5)
+        self.assertEqual(cache.get_stats().total_size, 25)
+        
+        cache.delete('b')
+        self.assertEqual(cache.get_stats().total_size, 5)
+        self.assertEqual(cache.get_stats().entry_count, 1)
+    
+    def test_eviction_order(self):
+        """最も古く参照されたエントリから退避されることのテスト"""
+        cache = LRUCache(max_size=2, max_memory=100, size_estimator=len)
+        cache.put('a', 'x' * 40)
+        cache.put('b', 'x' * 40)
+        cache.get('a')
+        cache.put('c', 'x' * 40)
+        
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertEqual(cache.get_stats().evictions, 1)
+        
+        # 上限を超える値は保存しない
+        self.assertFalse(cache.put('big', 'x' * 200))
+        self.assertEqual(len(cache), 2)
+    
+    def test_ttl_uses_monotonic_clock(self):
+        """有効期限が time.monotonic() で判定されることのテスト"""
+        cache = LRUCache(default_ttl=60)
+        with patch('shared.performance.cache_manager.time.monotonic', return_value=1000.0):
+            cache.put('a', 1)
+        with patch('shared.performance.cache_manager.time.monotonic', return_value=1030.0):
+            self.assertEqual(cache.get('a'), 1)
+        with patch('shared.performance.cache_manager.time.monotonic', return_value=1061.0):
+            self.assertIsNone(cache.get('a'))
+    
+    def test_striped_cache(self):
+        """ストライプ版キャッシュの基本動作テスト"""
+        cache = StripedLRUCache(max_size=64, stripes=4)
+        for i in range(32):
+            cache.put(f'key{i}', i)
+        
+        self.assertEqual(len(cache), 32)
+        self.assertEqual(cache.get('key7'), 7)
+        self.assertTrue(cache.delete('key7'))
+        self.assertIsNone(cache.get('key7'))
+        self.assertEqual(cache.get_stats().entry_count, 31)
+
+
+@pytest.mark.unit
+class TestTieredCache(unittest.TestCase):
+    """2層キャッシュのテスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db_path = self.temp_dir / 'results.sqlite3'
+    
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_cached_decorator_survives_new_process(self):
+        """ディスク層の結果が別インスタンス（別プロセス相当）から再利用されることのテスト"""
+        calls = []
+        
+        def compute(table_name):
+            calls.append(table_name)
+            return {'table_name': table_name}
+        
+        first = TieredCache(DiskCache(self.db_path))
+        parse = cached('parsed_tables', cache=first)(compute)
+        parse('MST_Employee')
+        parse('MST_Employee')
+        self.assertEqual(calls, ['MST_Employee'])
+        self.assertEqual(first.get_stats()['parsed_tables'].memory_hits, 1)
+        first.disk_cache.close()
+        
+        second = TieredCache(DiskCache(self.db_path))
+        parse = cached('parsed_tables', cache=second)(compute)
+        self.assertEqual(parse('MST_Employee'), {'table_name': 'MST_Employee'})
+        self.assertEqual(calls, ['MST_Employee'])
+        self.assertEqual(second.get_stats()['parsed_tables'].disk_hits, 1)
+        
+        # 名前空間の無効化後は再計算される
+        parse.invalidate()
+        parse('MST_Employee')
+        self.assertEqual(calls, ['MST_Employee', 'MST_Employee'])
+    
+    def test_cached_version_in_key(self):
+        """バージョンが変わるとディスク層の旧結果を再利用しないことのテスト"""
+        calls = []
+        
+        def compute(table_name):
+            calls.append(table_name)
+            return {'table_name': table_name, 'parser': len(calls)}
+        
+        cache = TieredCache(DiskCache(self.db_path))
+        cached('parsed_tables', cache=cache, version='v1')(compute)('MST_Employee')
+        cached('parsed_tables', cache=cache, version='v1')(compute)('MST_Employee')
+        self.assertEqual(len(calls), 1)
+        
+        self.assertEqual(cached('parsed_tables', cache=cache, version='v2')(compute)('MST_Employee')['parser'], 2)
+        self.assertEqual(len(calls), 2)
+    
+    def test_source_fingerprint(self):
+        """ソースの内容が変わると識別子が変わることのテスト"""
+        source = self.temp_dir / 'parser.py'
+        source.write_text("VERSION = 1\n", encoding='utf-8')
+        first = source_fingerprint(source)
+        self.assertEqual(source_fingerprint(source), first)
+        source.write_text("VERSION = 2\n", encoding='utf-8')
+        self.assertNotEqual(source_fingerprint(source), first)
+        self.assertEqual(
+            unified_parser.PARSED_TABLES_VERSION,
+            source_fingerprint(unified_parser.__file__, ddl_engine.__file__, models.__file__)
+        )
+    
+    def test_disk_eviction_by_size(self):
+        """ディスク層が合計サイズ上限を超えた場合に古いものから削除されることのテスト"""
+        disk = DiskCache(self.db_path, max_bytes=2000)
+        for i in range(10):
+            disk.put('ns', f'key{i}', 'x' * 400)
+        
+        self.assertIsNone(disk.get('ns', 'key0'))
+        self.assertEqual(disk.get('ns', 'key9'), 'x' * 400)
+    
+    def test_disk_total_size_tracked(self):
+        """合計サイズが置換・削除・退避・別インスタンスの更新後も実サイズと一致することのテスト"""
+        def actual(disk):
+            return disk._connect().execute("SELECT coalesce(sum(size), 0) FROM entries").fetchone()[0]
+        
+        disk = DiskCache(self.db_path, max_bytes=5000)
+        other = DiskCache(self.db_path, max_bytes=5000)
+        for i in range(20):
+            (disk if i % 2 else other).put('ns', f'key{i % 8}', 'x' * (100 * (i % 5 + 1)))
+            self.assertEqual(disk.total_size(), actual(disk))
+        other.put('other', 'key', 'y' * 300, ttl=-1)
+        self.assertIsNone(disk.get('other', 'key'))
+        disk.delete('ns', 'key1')
+        other.invalidate_namespace('missing')
+        self.assertEqual(disk.total_size(), actual(disk))
+        
+        for i in range(20):
+            disk.put('big', f'key{i}', 'z' * 1000)
+        self.assertLessEqual(disk.total_size(), 5000)
+        self.assertEqual(other.total_size(), actual(disk))
+        disk.clear()
+        self.assertEqual(other.total_size(), 0)
+    
+    def test_disk_total_size_initialized_for_existing_file(self):
+        """合計サイズを持たない既存のキャッシュファイルは作成時点の合計から開始することのテスト"""
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute(DiskCache._SCHEMA[0])
+        conn.execute("INSERT INTO entries VALUES ('ns', 'old', x'00', 700, NULL, 0)")
+        conn.commit()
+        conn.close()
+        
+        disk = DiskCache(self.db_path, max_bytes=1000)
+        self.assertEqual(disk.total_size(), 700)
+        disk.put('ns', 'new', 'x' * 400)
+        self.assertIsNone(disk.get('ns', 'old'))
+        self.assertEqual(disk.get('ns', 'new'), 'x' * 400)
+
+
+@pytest.mark.unit
+class TestSqlBatch(unittest.TestCase):
+    """サンプルデータSQL出力形式のテスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.rows = [
+            (['id', 'name', 'is_deleted'], ["'emp_001'", "'O''Brien'", 'FALSE']),
+            (['id', 'name', 'is_deleted'], ["'emp_002'", 'NULL', 'TRUE']),
+            (['id', 'name', 'is_deleted'], ["'emp_003'", "'a\tb'", 'FALSE']),
+            (['id', 'name'], ["'emp_004'", "''"]),
+        ]
+    
+    def test_insert_mode_one_statement_per_row(self):
+        """insert形式が1行1文であることのテスト"""
+        statements = render_statements('MST_Employee', self.rows, 'insert')
+        self.assertEqual(len(statements), 4)
+        self.assertEqual(
+            statements[0],
+            "INSERT INTO MST_Employee (id, name, is_deleted) VALUES ('emp_001', 'O''Brien', FALSE);"
+        )
+    
+    def test_multi_insert_batches_by_size_and_columns(self):
+        """複数行INSERTがバッチサイズとカラム構成で分割されることのテスト"""
+        statements = render_statements('MST_Employee', self.rows, 'on_conflict', batch_size=2)
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(statements[0].endswith("('emp_002', NULL, TRUE)\nON CONFLICT DO NOTHING;"))
+        self.assertTrue(statements[2].startswith("INSERT INTO MST_Employee (id, name) VALUES"))
+    
+    def test_copy_escaping(self):
+        """COPY形式のNULL・エスケープのテスト"""
+        text_blocks = render_statements('MST_Employee', self.rows, 'copy')
+        self.assertEqual(
+            text_blocks[0].split('\n'),
+            ['COPY MST_Employee (id, name, is_deleted) FROM STDIN;',
+             "emp_001\tO'Brien\tf", 'emp_002\t\\N\tt', 'emp_003\ta\\tb\tf', '\\.']
+        )
+        
+        csv_blocks = render_statements('MST_Employee', self.rows, 'copy_csv')
+        # NULLは空、空文字列は "" で区別される
+        self.assertIn('emp_002,,t', csv_blocks[0])
+        self.assertIn('emp_004,""', csv_blocks[1])
+    
+    def test_copy_keywords(self):
+        """COPY形式でも NOW() / CURRENT_TIMESTAMP を置き換え、キーワードの大文字・小文字を区別しないことのテスト"""
+        now = '2025-06-01 09:00:00'
+        rows = [(['id', 'flag', 'note', 'created_at', 'updated_at'],
+                 ["'emp_001'", 'true', 'null', 'NOW()', 'current_timestamp']),
+                (['id', 'flag', 'note', 'created_at', 'updated_at'],
+                 ["'now()'", 'False', "'NULL'", 'now()', 'CURRENT_TIMESTAMP'])]
+        block = render_copy('MST_Employee', ['id', 'flag', 'note', 'created_at', 'updated_at'],
+                            [values for _, values in rows], now=now)
+        self.assertEqual(block.split('\n')[1:3], [
+            f"emp_001\tt\t\\N\t{now}\t{now}",
+            f"now()\tf\tNULL\t{now}\t{now}",
+        ])
+        self.assertEqual(sql_literal_to_text('Now()', now), now)
+    
+    def test_write_statements_gzip(self):
+        """gzip出力への逐次書き込みと件数集計のテスト"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            f, path = open_sql_output(Path(temp_dir) / 'MST_Employee.sql', compress=True)
+            with f:
+                counts = write_statements(f, 'MST_Employee', iter(self.rows), 'multi_insert', batch_size=2)
+            self.assertEqual(path.name, 'MST_Employee.sql.gz')
+            self.assertEqual(counts, (4, 3))
+            with gzip.open(path, 'rt', encoding='utf-8') as gz:
+                self.assertEqual(gz.read(), '\n'.join(render_statements('MST_Employee', self.rows, 'multi_insert', 2)) + '\n')
+        finally:
+            shutil.rmtree(temp_dir)
+    
+    def test_write_copy_columns_matches_write_statements(self):
+        """カラム単位のCOPY出力がブロック分割を含めて write_statements と一致することのテスト"""
+        codecs = [compile_codec('VARCHAR(50)'), compile_codec('TEXT'), compile_codec('BOOLEAN')]
+        values = [['emp_001', "O'Brien", False], ['emp_002', None, True], ['emp_003', 'a\tb\\c', False],
+                  ['emp_004', '', True], ['emp_005', 'x,"y"', False]]
+        rows = [(['id', 'name', 'is_deleted'], [codec(value) for codec, value in zip(codecs, row)])
+                for row in values]
+        
+        for mode in ('copy', 'copy_csv'):
+            with self.subTest(mode=mode):
+                expected = io.StringIO()
+                with patch('shared.generators.sql_batch.STREAM_COPY_BATCH_SIZE', 2):
+                    write_statements(expected, 'MST_Employee', rows, mode)
+                
+                field_codecs = [copy_field_codec(codec, mode == 'copy_csv') for codec in codecs]
+                # チャンク境界（3行 + 2行）とブロック境界（2行ごと）をずらす
+                chunks = [[list(map(codec, column)) for codec, column in zip(field_codecs, zip(*chunk))]
+                          for chunk in (values[:3], values[3:])]
+                actual = io.StringIO()
+                counts = write_copy_columns(actual, 'MST_Employee', ['id', 'name', 'is_deleted'], chunks,
+                                            mode == 'copy_csv', copy_batch_size=2)
+                self.assertEqual(actual.getvalue(), expected.getvalue())
+                self.assertEqual(counts, (5, 3))
+
+
+@pytest.mark.unit
+class TestSqlCodecs(unittest.TestCase):
+    """カラム単位SQLエンコーダーのテスト"""
+    
+    def test_matches_format_value_for_sql(self):
+        """エンコーダーの出力が format_value_for_sql と一致することのテスト"""
+        generator = EnhancedSQLGenerator()
+        col_types = ['VARCHAR(50)', 'ENUM', 'INTEGER', 'POINT', 'DECIMAL(10,2)', 'BOOLEAN',
+                     'DATE', 'TIMESTAMP', 'JSON', 'UUID', 'BLOB', '']
+        values = [None, 'null', '', "O'Brien", 'yes', '12', 'abc', 0, 7, 3.75, True, False,
+                  {'key': "it's"}, ['a', 1]]
+        for col_type in col_types:
+            codec = compile_codec(col_type, 'col')
+            for value in values:
+                self.assertEqual(codec(value), generator.format_value_for_sql(value, col_type, 'col'),
+                                 f"{col_type}: {value!r}")
+    
+    def test_encode_columns(self):
+        """カラム単位のエンコードのテスト"""
+        codecs = [compile_codec('VARCHAR(10)'), compile_codec('INTEGER'), compile_codec('BOOLEAN')]
+        encoded = encode_columns(codecs, [['a', None], ['1', 'x'], [True, 'f']])
+        self.assertEqual(encoded, [["'a'", 'NULL'], ['1', 'NULL'], ['TRUE', 'FALSE']])
+
+
+@pytest.mark.unit
+class TestMetricsCollector(unittest.TestCase):
+    """メトリクス収集器（リングバッファ・分位点スケッチ）のテスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.collector = MetricsCollector(max_points=5)
+    
+    def tearDown(self):
+        """テストクリーンアップ"""
+        self.collector._cleanup_timer.cancel()
+    
+    def test_sketch_relative_accuracy(self):
+        """スケッチの分位点が相対誤差以内であることのテスト"""
+        rng = random.Random(0)
+        values = sorted(rng.lognormvariate(0, 2) for _ in range(10000))
+        sketch = QuantileSketch(0.01)
+        for value in values:
+            sketch.add(value)
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q) / exact, 1.0, delta=0.0101)
+    
+    def test_sketch_merge(self):
+        """スケッチのマージが全件を追加した場合と一致することのテスト"""
+        merged, first, second = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(-50, 200):
+            merged.add(value)
+            (first if value % 2 else second).add(value)
+        first.merge(second)
+        self.assertEqual(first.count, 250)
+        self.assertEqual(first.quantiles((0.1, 0.5, 0.9)), merged.quantiles((0.1, 0.5, 0.9)))
+        with self.assertRaises(ValueError):
+            first.merge(QuantileSketch(0.05))
+    
+    def test_ring_buffer_keeps_latest_points(self):
+        """最大件数を超えた場合に古いポイントから上書きされることのテスト"""
+        for value in range(12):
+            self.collector.record('rows', value, {'table': 'MST_Employee'})
+        points = self.collector.get_metrics('rows')
+        self.assertEqual([point.value for point in points], [7.0, 8.0, 9.0, 10.0, 11.0])
+        self.assertEqual(points[0].tags, {'table': 'MST_Employee'})
+        self.assertLessEqual(points[0].timestamp, points[-1].timestamp)
+        
+        # 集計は上書きされたポイントも含む
+        summary = self.collector.get_summary('rows')
+        self.assertEqual((summary.count, summary.min, summary.max, summary.avg), (12, 0, 11, 5.5))
+    
+    def test_tags_are_interned(self):
+        """同じタグの組み合わせが1つのIDを共有することのテスト"""
+        self.collector.record('m', 1, {'a': '1', 'b': '2'})
+        self.collector.record('m', 2, {'b': '2', 'a': '1'})
+        self.collector.record('m', 3, {'a': '1', 'b': '3'})
+        self.collector.record('m', 4, {'a': '1', 'b': '2'})
+        self.assertEqual(len(self.collector._tags.tag_sets), 3)
+        tags = [point.tags for point in self.collector.get_metrics('m')]
+        self.assertEqual(tags, [{'a': '1', 'b': '2'}] * 2 + [{'a': '1', 'b': '3'}, {'a': '1', 'b': '2'}])
+    
+    def test_summary_percentiles(self):
+        """集計のパーセンタイルがスケッチから求められることのテスト"""
+        collector = MetricsCollector(max_points=10)
+        try:
+            for value in range(1, 101):
+                collector.record('latency', value)
+            summary = collector.get_summary('latency')
+            self.assertEqual(summary.count, 100)
+            self.assertAlmostEqual(summary.p50, 50, delta=1)
+            self.assertAlmostEqual(summary.p95, 95, delta=1)
+            self.assertAlmostEqual(summary.p99, 99, delta=1)
+            self.assertEqual(collector.get_sketch('latency').count, 100)
+        finally:
+            collector._cleanup_timer.cancel()
+    
+    def test_timer_keeps_operation_name(self):
+        """アンダースコアを含む操作名でタイミングが記録されることのテスト"""
+        monitor = PerformanceMonitor(self.collector)
+        timer_id = monitor.start_timer('yaml_parse')
+        self.assertIsNotNone(monitor.end_timer(timer_id))
+        self.assertEqual(list(self.collector.get_all_summaries()), ['yaml_parse.duration'])
+
+
+@pytest.mark.unit
+class TestTracer(unittest.TestCase):
+    """スパントレーシングのテスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.tracer = Tracer(enabled=True)
+    
+    def _events(self):
+        return [event for event in self.tracer.to_chrome_trace()['traceEvents'] if event['ph'] == 'X']
+    
+    def test_nested_spans_and_attributes(self):
+        """親子関係と属性が記録されることのテスト"""
+        with self.tracer.span("check.column_consistency", category="check") as parent:
+            with self.tracer.span("ddl.parse", category="parser", file="MST_Employee.sql") as child:
+                child.set_attribute("bytes", 120)
+        
+        events = {event['name']: event for event in self._events()}
+        self.assertEqual(events['ddl.parse']['args']['parent_id'], parent.span_id)
+        self.assertEqual(events['ddl.parse']['args']['file'], "MST_Employee.sql")
+        self.assertEqual(events['ddl.parse']['args']['bytes'], 120)
+        self.assertNotIn('parent_id', events['check.column_consistency']['args'])
+        self.assertGreaterEqual(events['check.column_consistency']['dur'], events['ddl.parse']['dur'])
+    
+    def test_decorator_and_error(self):
+        """デコレータの属性とスパン内の例外が記録されることのテスト"""
+        @self.tracer.traced(category="parser", attributes=lambda path: {'file': path})
+        def parse(path):
+            raise ValueError(path)
+        
+        with self.assertRaises(ValueError):
+            parse("broken.yaml")
+        event, = self._events()
+        self.assertTrue(event['name'].endswith('parse'))
+        self.assertEqual(event['args']['file'], "broken.yaml")
+        self.assertEqual(event['args']['error'], "ValueError")
+    
+    def test_disabled_records_nothing(self):
+        """無効時はスパンを記録しないことのテスト"""
+        self.tracer.enabled = False
+        with self.tracer.span("ddl.parse", file="a.sql") as span:
+            span.set_attribute("bytes", 1)
+        self.assertEqual(self.tracer.spans(), [])
+    
+    def test_parent_propagates_to_thread_pool(self):
+        """copy_context で引き継いだワーカースレッドのスパンが親を持つことのテスト"""
+        def work(index):
+            with self.tracer.span("check.table", table=f"T{index}"):
+                pass
+        
+        with self.tracer.span("consistency_check.run") as root:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(contextvars.copy_context().run, work, i) for i in range(4)]
+                for future in futures:
+                    future.result()
+        
+        children = [event for event in self._events() if event['name'] == 'check.table']
+        self.assertEqual(len(children), 4)
+        self.assertTrue(all(event['args']['parent_id'] == root.span_id for event in children))
+    
+    def test_export_chrome_trace(self):
+        """Chrome trace-event 形式のJSONが出力されることのテスト"""
+        with self.tracer.span("yaml.load", category="parser", file=Path("MST_Employee.yaml")):
+            pass
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = self.tracer.export_chrome_trace(Path(temp_dir) / "trace.json")
+            with open(path, encoding='utf-8') as f:
+                trace = json.load(f)
+            phases = [event['ph'] for event in trace['traceEvents']]
+            self.assertIn('M', phases)
+            event = trace['traceEvents'][phases.index('X')]
+            self.assertEqual((event['name'], event['cat'], event['args']['file']),
+                             ("yaml.load", "parser", "MST_Employee.yaml"))
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+@pytest.mark.unit
+class TestCommandProfiler(unittest.TestCase):
+    """CLI プロファイリングのテスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.stream = io.StringIO()
+    
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+    
+    def _parse(self, argv):
+        parser = argparse.ArgumentParser()
+        add_profile_arguments(parser)
+        return parser.parse_args(argv)
+    
+    def test_disabled_without_options(self):
+        """--profile / --profile-memory なしでは何もしないことのテスト"""
+        with profile_command(self._parse([]), "check") as profiler:
+            with profile_stage("check.table_existence"):
+                pass
+        self.assertNotIsInstance(profiler, CommandProfiler)
+        self.assertEqual(self._parse(["--profile"]).profile, "profiles")
+    
+    def test_writes_pstats_and_collapsed_stacks(self):
+        """.pstats と collapsed stack が出力され、上位関数が表示されることのテスト"""
+        def parse_table():
+            return sum(range(20000))
+        
+        def check_columns():
+            return [parse_table() for _ in range(5)]
+        
+        with CommandProfiler("check", self.temp_dir, top=5, stream=self.stream) as profiler:
+            check_columns()
+        
+        suffixes = sorted(path.suffix for path in profiler.output_files)
+        self.assertEqual(suffixes, ['.collapsed', '.pstats'])
+        self.assertIn("check_columns", self.stream.getvalue())
+        with open(profiler.output_files[1], encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        stacks = [line.rsplit(' ', 1)[0].split(';') for line in lines]
+        self.assertTrue(all(int(line.rsplit(' ', 1)[1]) > 0 for line in lines))
+        self.assertTrue(any(stack[0].startswith("check_columns") and stack[-1].startswith("parse_table")
+                            for stack in stacks))
+    
+    def test_worker_threads_profiled(self):
+        """計測中に開始したワーカースレッドの関数も統計に含まれることのテスト"""
+        def thread_check():
+            return sum(range(20000))
+        
+        with CommandProfiler("check", self.temp_dir, top=50, stream=self.stream) as profiler:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(lambda _: thread_check(), range(4)))
+        
+        pstats_path = next(path for path in profiler.output_files if path.suffix == '.pstats')
+        stats = pstats.Stats(str(pstats_path)).stats
+        calls = {func[2]: stat[1] for func, stat in stats.items()}
+        self.assertEqual(calls.get("thread_check"), 4)
+        self.assertIn("thread_check", self.stream.getvalue())
+    
+    def test_cli_registers_profile_options(self):
+        """CLI のヘルプに --profile / --profile-memory が表示されることのテスト"""
+        tools_dir = Path(__file__).resolve().parents[3]
+        for script in (tools_dir / "db_tools.py", tools_dir.parent / "design-integration" / "design_integration_tools.py"):
+            result = subprocess.run([sys.executable, str(script), "--help"], capture_output=True,
+                                    text=True, cwd=self.temp_dir, timeout=60)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn("--profile", result.stdout)
+            self.assertIn("--profile-memory", result.stdout)
+    
+    def test_collapse_distributes_time_by_caller(self):
+        """呼び出し元ごとの比率で自己時間が配分されることのテスト"""
+        main = ("main.py", 1, "main")
+        check_a = ("checks.py", 10, "check_a")
+        check_b = ("checks.py", 20, "check_b")
+        parse = ("parser.py", 5, "parse")
+        stats = {
+            main: (1, 1, 0.0, 1.0, {}),
+            check_a: (1, 1, 0.1, 0.4, {main: (1, 1, 0.1, 0.4)}),
+            check_b: (1, 1, 0.1, 0.6, {main: (1, 1, 0.1, 0.6)}),
+            parse: (4, 4, 0.8, 0.8, {check_a: (1, 1, 0.3, 0.3), check_b: (3, 3, 0.5, 0.5)}),
+        }
+        collapsed = collapse_stats(stats)
+        self.assertEqual(collapsed["main (main.py:1);check_a (checks.py:10);parse (parser.py:5)"], 300000)
+        self.assertEqual(collapsed["main (main.py:1);check_b (checks.py:20);parse (parser.py:5)"], 500000)
+        self.assertEqual(sum(collapsed.values()), 1000000)
+    
+    def test_memory_peak_per_stage(self):
+        """ステージごとのピークメモリが記録されることのテスト"""
+        profiler = CommandProfiler("check", self.temp_dir, cpu=False, memory=True, stream=self.stream)
+        with profiler:
+            with profile_stage("check.small"):
+                data = bytearray(10000)
+                del data
+            with profile_stage("check.large"):
+                data = bytearray(2 * 1024 * 1024)
+                del data
+        
+        stages = {stage.name: stage for stage in profiler.stages}
+        self.assertGreaterEqual(stages["check.large"].peak_increase, 2 * 1024 * 1024)
+        self.assertLess(stages["check.small"].peak_increase, 1024 * 1024)
+        self.assertLess(stages["check.large"].net_increase, 1024 * 1024)
+        self.assertGreaterEqual(stages["check"].peak_increase, 2 * 1024 * 1024)
+        self.assertIn("check.large", self.stream.getvalue())
+        self.assertEqual([path.suffix for path in profiler.output_files], ['.txt'])
+
+
+@pytest.mark.unit
+class TestDesignCorpusGenerator(unittest.TestCase):
+    """合成設計書ジェネレーターのテスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.design_dir = self.temp_dir / "docs" / "design" / "database"
+    
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+    
+    def _load_yaml(self, table_name):
+        with open(self.design_dir / "table-details" / f"テーブル詳細定義YAML_{table_name}.yaml", encoding='utf-8') as f:
+            return yaml.safe_load(f)
+    
+    def test_generates_all_formats(self):
+        """YAML・DDL・テーブル定義書・テーブル一覧・エンティティ関連が揃うことのテスト"""
+        manifest = generate_corpus(self.temp_dir, tables=30, min_columns=6, max_columns=12, sample_rows=4)
+        
+        self.assertEqual(len(manifest['tables']), 30)
+        self.assertEqual(len(list((self.design_dir / "table-details").glob("*.yaml"))), 30)
+        self.assertEqual(len(list((self.design_dir / "ddl").glob("*.sql"))), 30)
+        self.assertEqual(len(list((self.design_dir / "tables").glob("テーブル定義書_*.md"))), 30)
+        table_list = (self.design_dir / "テーブル一覧.md").read_text(encoding='utf-8')
+        self.assertEqual(table_list.count("| TBL-"), 30)
+        with open(self.design_dir / "entity_relationships.yaml", encoding='utf-8') as f:
+            relationships = yaml.safe_load(f)
+        self.assertEqual(relationships['metadata']['total_tables'], 30)
+        self.assertEqual(len(relationships['relationships']), manifest['foreign_keys'])
+        
+        table_name = manifest['tables'][-1]
+        yaml_data = self._load_yaml(table_name)
+        self.assertTrue(6 <= len(yaml_data['columns']) <= 12 + len(yaml_data['foreign_keys']))
+        self.assertEqual(len(yaml_data['sample_data']), 4)
+        ddl = (self.design_dir / "ddl" / f"{table_name}.sql").read_text(encoding='utf-8')
+        for column in yaml_data['columns']:
+            self.assertIn(f"    {column['name']} ", ddl)
+    
+    def test_foreign_keys_and_cycles(self):
+        """外部キーの参照先が存在し、注入した循環参照が閉じていることのテスト"""
+        manifest = generate_corpus(self.temp_dir, tables=40, fk_density=1.5, cycles=2, cycle_length=3, seed=7)
+        tables = set(manifest['tables'])
+        graph = {}
+        for table_name in manifest['tables']:
+            yaml_data = self._load_yaml(table_name)
+            targets = [fk['references']['table'] for fk in yaml_data['foreign_keys']]
+            self.assertLessEqual(set(targets), tables)
+            graph[table_name] = set(targets)
+            # サンプルデータの外部キーは参照先のサンプルデータのIDを指す
+            record = yaml_data['sample_data'][0]
+            for fk in yaml_data['foreign_keys']:
+                self.assertTrue(record[fk['columns'][0]].startswith(fk['references']['table']))
+        
+        self.assertEqual(len(manifest['cycles']), 2)
+        for cycle in manifest['cycles']:
+            self.assertIn(cycle[-1], graph[cycle[0]])
+            for source, target in zip(cycle[1:], cycle):
+                self.assertIn(target, graph[source])
+    
+    def test_inconsistencies_recorded(self):
+        """注入した不整合がファイルに反映され、マニフェストに記録されることのテスト"""
+        manifest = generate_corpus(self.temp_dir, tables=20, inconsistency_rate=0.5,
+                                   inconsistency_kinds=["missing_ddl", "ddl_column_missing"])
+        inconsistencies = manifest['inconsistencies']
+        self.assertEqual(len(inconsistencies), 10)
+        for table_name, kind in inconsistencies.items():
+            ddl_file = self.design_dir / "ddl" / f"{table_name}.sql"
+            if kind == "missing_ddl":
+                self.assertFalse(ddl_file.exists())
+            else:
+                ddl = ddl_file.read_text(encoding='utf-8')
+                missing = [column['name'] for column in self._load_yaml(table_name)['columns']
+                           if f"    {column['name']} " not in ddl]
+                self.assertEqual(len(missing), 1)
+    
+    def test_deterministic_and_reused(self):
+        """同じ生成条件では同じ内容になり、既存の出力を再利用することのテスト"""
+        spec = CorpusSpec(tables=15, cycles=1, inconsistency_rate=0.2, seed=3)
+        first = DesignCorpusGenerator(spec).generate(self.temp_dir)
+        yaml_file = self.design_dir / "table-details" / f"テーブル詳細定義YAML_{first['tables'][0]}.yaml"
+        content = yaml_file.read_text(encoding='utf-8')
+        mtime = yaml_file.stat().st_mtime_ns
+        
+        self.assertEqual(DesignCorpusGenerator(spec).generate(self.temp_dir), first)
+        self.assertEqual(yaml_file.stat().st_mtime_ns, mtime)
+        regenerated = DesignCorpusGenerator(spec).generate(self.temp_dir, reuse=False)
+        self.assertEqual(regenerated, first)
+        self.assertEqual(yaml_file.read_text(encoding='utf-8'), content)
+        
+        with self.assertRaises(ValueError):
+            DesignCorpusGenerator(CorpusSpec(tables=5, inconsistency_kinds=["unknown"]))
+
+
+@pytest.mark.unit
+class TestGraphUtils(unittest.TestCase):
+    """外部キー依存グラフの強連結成分分解・レベル分割のテスト"""
+    
+    def _position(self, components):
+        return {node: i for i, component in enumerate(components) for node in component}
+    
+    def test_self_loop(self):
+        """自己参照のみが循環となり、単独ノードは循環としないことのテスト"""
+        graph = {'MST_Employee': ['MST_Employee', 'MST_Department'], 'MST_Department': []}
+        components = strongly_connected_components(graph)
+        
+        self.assertEqual(components, [['MST_Department'], ['MST_Employee']])
+        self.assertTrue(is_cyclic_component(['MST_Employee'], graph))
+        self.assertFalse(is_cyclic_component(['MST_Department'], graph))
+        self.assertEqual(find_cycle(['MST_Employee'], graph), ['MST_Employee', 'MST_Employee'])
+        self.assertIsNone(find_cycle(['MST_Department'], graph))
+        self.assertEqual(topological_levels(graph), [['MST_Department'], ['MST_Employee']])
+    
+    def test_multiple_disjoint_components(self):
+        """独立した複数の循環がそれぞれ成分となり、依存先の成分が先に並ぶことのテスト"""
+        graph = {
+            'A': ['B'], 'B': ['C'], 'C': ['A'],
+            'D': ['E', 'A'], 'E': ['D'],
+            'F': ['G'], 'G': ['F'],
+            'H': ['D', 'X_UNKNOWN'],
+        }
+        components = strongly_connected_components(graph)
+        
+        self.assertEqual(sorted(components), [['A', 'B', 'C'], ['D', 'E'], ['F', 'G'], ['H']])
+        position = self._position(components)
+        for node, deps in graph.items():
+            for dep in deps:
+                if dep in graph:
+                    self.assertLessEqual(position[dep], position[node])
+        cycles = [find_cycle(component, graph) for component in components]
+        self.assertIn(['A', 'B', 'C', 'A'], cycles)
+        self.assertIn(['D', 'E', 'D'], cycles)
+        self.assertIn(['F', 'G', 'F'], cycles)
+        self.assertIn(None, cycles)
+    
+    def test_describe_cycle_lists_component(self):
+        """代表の循環経路に含まれないノードを成分として併記することのテスト"""
+        # A -> B -> A と A -> C -> A の2つの循環が1つの成分になる
+        graph = {'A': ['B', 'C'], 'B': ['A'], 'C': ['A']}
+        component, = strongly_connected_components(graph)
+        
+        self.assertEqual(find_cycle(component, graph), ['A', 'B', 'A'])
+        self.assertEqual(describe_cycle(component, graph), "A -> B -> A（循環成分: A, B, C）")
+        self.assertEqual(describe_cycle(['A', 'B'], {'A': ['B'], 'B': ['A']}), "A -> B -> A")
+        self.assertIsNone(describe_cycle(['A'], {'A': []}))
+    
+    def test_deep_chain_without_recursion_limit(self):
+        """再帰上限を超える深さの依存チェーン・循環を処理できることのテスト"""
+        depth = sys.getrecursionlimit() * 5
+        chain = {f"T{i}": [f"T{i + 1}"] if i + 1 < depth else [] for i in range(depth)}
+        components = strongly_connected_components(chain)
+        self.assertEqual(len(components), depth)
+        self.assertEqual(components[0], [f"T{depth - 1}"])
+        levels = topological_levels(chain)
+        self.assertEqual(len(levels), depth)
+        self.assertEqual(levels[-1], ["T0"])
+        
+        ring = dict(chain, **{f"T{depth - 1}": ["T0"]})
+        component, = strongly_connected_components(ring)
+        self.assertEqual(len(component), depth)
+        self.assertEqual(len(find_cycle(component, ring)), depth + 1)
+        self.assertEqual(topological_levels(ring), [component])
+    
+    def test_topological_levels(self):
+        """各ノードが依存先より後のレベルに割り当てられ、循環成分は同じレベルになることのテスト"""
+        graph = {
+            'TRN_Order': ['MST_Customer', 'MST_Product'],
+            'MST_Customer': ['MST_Tenant'],
+            'MST_Product': ['MST_Tenant', 'MST_Category'],
+            'MST_Category': ['MST_Category'],
+            'MST_Tenant': [],
+            'MST_Role': ['MST_Permission'],
+            'MST_Permission': ['MST_Role', 'MST_Tenant'],
+            'HIS_Audit': [],
+        }
+        levels = topological_levels(graph)
+        
+        self.assertEqual(levels, [
+            ['MST_Tenant', 'MST_Category', 'HIS_Audit'],
+            ['MST_Customer', 'MST_Product', 'MST_Role', 'MST_Permission'],
+            ['TRN_Order'],
+        ])
+        level_of = self._position(levels)
+        for node, deps in graph.items():
+            for dep in deps:
+                if dep != node and not {node, dep} <= {'MST_Role', 'MST_Permission'}:
+                    self.assertLess(level_of[dep], level_of[node])
+        self.assertEqual(topological_levels({}), [])
+
+
+@pytest.mark.unit
+class TestSqlValuesTokenizer(unittest.TestCase):
+    """SQL INSERT ... VALUES トークナイザーのテスト"""
+    
+    def _values(self, sql):
+        return [values for _, _, values in iter_insert_rows(sql)]
+    
+    def test_backslash_in_standard_string(self):
+        """標準の文字列ではバックスラッシュをエスケープとみなさないことのテスト"""
+        rows = self._values("INSERT INTO MST_File (path, name) VALUES ('C:\\', 'root'), ('D:\\tmp\\', 'tmp');")
+        self.assertEqual(rows, [["'C:\\'", "'root'"], ["'D:\\tmp\\'", "'tmp'"]])
+        self.assertEqual(parse_sql_literal("'C:\\'"), "C:\\")
+        self.assertEqual(parse_sql_literal("'it''s'"), "it's")
+    
+    def test_escape_string(self):
+        """E'...' ではバックスラッシュのエスケープを解釈することのテスト"""
+        rows = self._values("INSERT INTO t (a, b) VALUES (E'it\\'s, (ok)', e'a\\\\');")
+        self.assertEqual(rows, [["E'it\\'s, (ok)'", "e'a\\\\'"]])
+        self.assertEqual(parse_sql_literal("E'it\\'s\\n'"), "it's\n")
+        self.assertEqual(parse_sql_literal("e'a\\\\'"), "a\\")
+    
+    def test_array_brackets(self):
+        """ARRAY[...] 内のカンマで値を分割しないことのテスト"""
+        rows = self._values("INSERT INTO t (tags, n) VALUES (ARRAY['a','b'], 1), ('{x}', ARRAY[[1,2],[3,4]]);")
+        self.assertEqual(rows, [["ARRAY['a','b']", "1"], ["'{x}'", "ARRAY[[1,2],[3,4]]"]])
+    
+    def test_nested_function_calls(self):
+        """入れ子の関数呼び出しを1つの値として読むことのテスト"""
+        rows = self._values("INSERT INTO t (a, b, c) VALUES (COALESCE(NULLIF('x',''),'a'), NOW(), (1 + (2 * 3)));")
+        self.assertEqual(rows, [["COALESCE(NULLIF('x',''),'a')", "NOW()", "(1 + (2 * 3))"]])
+        self.assertEqual(split_values("1, ARRAY[1,2], 'a,b'"), ["1", "ARRAY[1,2]", "'a,b'"])
+    
+    def test_comments_and_quoted_delimiters(self):
+        """行内のコメントと引用符内の区切り文字を値として扱わないことのテスト"""
+        sql = ("INSERT INTO t (a, \"b\") VALUES (-- 先頭, )\n 1, /* ) */ 'a;b' /* , */, \"x,y\")\n"
+               "ON CONFLICT (a) DO NOTHING;\nINSERT INTO u (x) VALUES ('--');")
+        self.assertEqual(list(iter_insert_rows(sql)), [
+            ("t", ("a", "b"), ["1", "'a;b'", '"x,y"']),
+            ("u", ("x",), ["'--'"]),
+        ])
+    
+    def test_insert_without_column_list(self):
+        """カラム一覧のないINSERT文はエラーとすることのテスト"""
+        with self.assertRaisesRegex(SqlTokenizeError, "MST_Role: カラム一覧のないINSERT文"):
+            self._values("-- 初期データ\nINSERT INTO MST_Role VALUES ('R1', 'admin');")
+    
+    def test_unbalanced_row(self):
+        """括弧・引用符が閉じていない行はエラーとすることのテスト"""
+        for sql in ["INSERT INTO t (a) VALUES ('x);",
+                    "INSERT INTO t (a) VALUES (f(1];",
+                    "INSERT INTO t (a) VALUES (ARRAY[1, 2);",
+                    "INSERT INTO t (a) VALUES (1"]:
+            with self.subTest(sql=sql):
+                with self.assertRaisesRegex(SqlTokenizeError, "^t: "):
+                    self._values(sql)
+
+
 @pytest.mark.unit
 class TestErrorHandlingIntegration(unittest.TestCase):
     """エラーハンドリング統合テスト"""
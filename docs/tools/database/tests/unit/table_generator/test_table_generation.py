@@ -15,6 +15,10 @@
 """
 
 import unittest
+import csv
+import datetime
+import io
+import random
 import tempfile
 import shutil
 from pathlib import Path
@@ -30,6 +34,12 @@ from shared.core.models import TableDefinition, ColumnDefinition, IndexDefinitio
 from shared.core.exceptions import ValidationError, GenerationError, ParsingError
 from shared.generators.ddl_generator import DDLGenerator
 from shared.parsers.yaml_parser import YamlParser
+from shared.generators.sample_data_generator import TableDependencyResolver
+from shared.generators.sql_batch import write_statements
+from shared.generators.sql_codecs import encode_columns
+from table_generator.data.volume_data_engine import VolumeDataEngine
+from table_generator.data.sample_data_loader import SampleDataLoader, SqliteLoadTarget
+from table_generator.data.faker_utils import BasicDataUtils, SeedSequence, date_pool, datetime_pool
 
 
 @pytest.mark.unit
@@ -580,6 +590,339 @@ class TestForeignKeyDefinitionModel(unittest.TestCase):
         self.assertEqual(fk.references['columns'], ['id'])
 
 
+@pytest.mark.unit
+class TestVolumeDataEngine(unittest.TestCase):
+    """大量データ生成エンジンのテスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        tables = {
+            'MST_Parent': {
+                'table_name': 'MST_Parent',
+                'columns': [
+                    {'name': 'id', 'type': 'VARCHAR(50)', 'null': False, 'primary_key': True},
+                    {'name': 'parent_code', 'type': 'VARCHAR(20)', 'null': False, 'unique': True},
+                    {'name': 'status', 'type': 'ENUM', 'enum_values': ['ACTIVE', 'INACTIVE']},
+                ],
+                'sample_data': [{'id': 'parent_001', 'parent_code': 'P001', 'status': 'ACTIVE'}]
+            },
+            'MST_Item': {
+                'table_name': 'MST_Item',
+                'columns': [
+                    {'name': 'id', 'type': 'VARCHAR(50)', 'null': False, 'primary_key': True},
+                    {'name': 'score', 'type': 'INTEGER'},
+                ],
+                'sample_data': [{'id': 'item_001', 'score': 10}, {'id': 'item_002', 'score': 90}]
+            },
+            'TRN_Link': {
+                'table_name': 'TRN_Link',
+                'columns': [
+                    {'name': 'id', 'type': 'VARCHAR(50)', 'null': False, 'primary_key': True},
+                    {'name': 'parent_id', 'type': 'VARCHAR(50)', 'null': False},
+                    {'name': 'item_id', 'type': 'VARCHAR(50)', 'null': False},
+                    {'name': 'created_at', 'type': 'TIMESTAMP'},
+                ],
+                'indexes': [{'name': 'uk_link', 'columns': ['parent_id', 'item_id'], 'unique': True}],
+                'foreign_keys': [
+                    {'name': 'fk_link_parent', 'columns': ['parent_id'],
+                     'references': {'table': 'MST_Parent', 'columns': ['id']}},
+                    {'name': 'fk_link_item', 'columns': ['item_id'],
+                     'references': {'table': 'MST_Item', 'columns': ['id']}},
+                ]
+            }
+        }
+        for table_name, data in tables.items():
+            with open(self.temp_dir / f"テーブル詳細定義YAML_{table_name}.yaml", 'w', encoding='utf-8') as f:
+                yaml.safe_dump(data, f, allow_unicode=True)
+    
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+    
+    def _engine(self, seed=0):
+        resolver = TableDependencyResolver(table_details_dir=str(self.temp_dir))
+        return VolumeDataEngine(seed=seed, chunk_size=64, resolver=resolver)
+    
+    def _rows(self, engine, targets):
+        return {
+            plan.table_name: [row for chunk in engine.iter_rows(plan) for row in chunk]
+            for plan in engine.plan(targets)
+        }
+    
+    def test_foreign_keys_reference_generated_rows(self):
+        """外部キーが生成済みの親キーまたはsample_dataのみを参照すること"""
+        rows = self._rows(self._engine(), {'MST_Parent': 300, 'TRN_Link': 500})
+        
+        parent_ids = {row[0] for row in rows['MST_Parent']}
+        self.assertEqual(len(parent_ids), 300)
+        self.assertEqual(len({row[1] for row in rows['MST_Parent']}), 300)
+        
+        links = rows['TRN_Link']
+        self.assertEqual(len(links), 500)
+        self.assertTrue(all(row[1] in parent_ids for row in links))
+        # 生成対象外の MST_Item は sample_data のキーを参照する
+        self.assertTrue(all(row[2] in ('item_001', 'item_002') for row in links))
+        # 複合一意キーが重複しないこと
+        self.assertEqual(len({(row[1], row[2]) for row in links}), 500)
+    
+    def test_row_count_capped_by_unique_combinations(self):
+        """複合一意キーの組み合わせ数を超えて生成しないこと"""
+        plans = self._engine().plan({'MST_Parent': 3, 'TRN_Link': 100})
+        self.assertEqual({plan.table_name: plan.row_count for plan in plans}['TRN_Link'], 6)
+    
+    def test_same_seed_same_output(self):
+        """同じシードでは同じデータを生成すること"""
+        targets = {'MST_Parent': 50, 'MST_Item': 20, 'TRN_Link': 200}
+        self.assertEqual(self._rows(self._engine(seed=7), targets), self._rows(self._engine(seed=7), targets))
+        self.assertNotEqual(self._rows(self._engine(seed=7), targets), self._rows(self._engine(seed=8), targets))
+        
+        # 同じ計画を繰り返し生成しても同じデータになること
+        engine = self._engine(seed=7)
+        plan = engine.plan(targets)[-1]
+        first = [row for chunk in engine.iter_rows(plan) for row in chunk]
+        self.assertEqual(first, [row for chunk in engine.iter_rows(plan) for row in chunk])
+    
+    def test_execution_levels(self):
+        """参照先テーブルが前のレベルに来ること"""
+        resolver = TableDependencyResolver(table_details_dir=str(self.temp_dir))
+        tables = ['TRN_Link', 'MST_Parent', 'MST_Item']
+        resolver.load_table_dependencies(tables)
+        self.assertEqual(resolver.resolve_execution_levels(tables), [['MST_Parent', 'MST_Item'], ['TRN_Link']])
+    
+    def test_parallel_output_matches_sequential(self):
+        """並列出力と逐次出力が同じファイル内容になること"""
+        targets = {'MST_Parent': 50, 'MST_Item': 20, 'TRN_Link': 200}
+        sequential = self._engine(seed=7).generate(targets, self.temp_dir / 'sequential')
+        parallel = self._engine(seed=7).generate(targets, self.temp_dir / 'parallel', workers=2)
+        
+        self.assertEqual(sequential['execution_order'], parallel['execution_order'])
+        for table_name in targets:
+            self.assertEqual(Path(sequential['tables'][table_name]['file']).read_bytes(),
+                             Path(parallel['tables'][table_name]['file']).read_bytes())
+    
+    def test_encoded_chunks_match_row_encoding(self):
+        """テープを事前にエンコードした出力が値ごとのエンコードと一致すること"""
+        engine = self._engine(seed=3)
+        targets = {'MST_Parent': 150, 'MST_Item': 100, 'TRN_Link': 400}
+        for plan in engine.plan(targets):
+            codecs = engine.sql_generator.compile_codecs(plan.column_types)
+            column_codecs = [codecs[column] for column in plan.columns]
+            expected = [encode_columns(column_codecs, columns) for columns in plan.iter_column_chunks(64)]
+            self.assertEqual(list(plan.iter_encoded_chunks(column_codecs, 64)), expected)
+        
+        # COPY形式はSQLリテラル経由の汎用出力（write_statements）と同じ内容になること
+        for mode in ('copy', 'copy_csv', 'multi_insert'):
+            with self.subTest(mode=mode):
+                plan = self._engine(seed=3).plan(targets)[-1]
+                codecs = engine.sql_generator.compile_codecs(plan.column_types)
+                column_codecs = [codecs[column] for column in plan.columns]
+                rows = [(plan.columns, row) for columns in plan.iter_column_chunks(64)
+                        for row in zip(*encode_columns(column_codecs, columns))]
+                expected = io.StringIO()
+                write_statements(expected, plan.table_name, rows, mode)
+                
+                actual = io.StringIO()
+                engine._write_sql(plan, actual, mode)
+                self.assertEqual(actual.getvalue().split('\n')[2:-2], expected.getvalue().split('\n')[:-1])
+
+    def test_csv_output_matches_csv_writer(self):
+        """CSV出力が行ごとに csv.writer で書いた内容と一致すること（引用符が必要な値を含む）"""
+        engine = self._engine(seed=5)
+        plans = engine.plan({'MST_Parent': 150, 'MST_Item': 100, 'TRN_Link': 400})
+        link = plans[-1]
+        position = link.columns.index('created_at')
+        link.groups = [
+            (positions, engine._choice_generator(['a,b', 'say "hi"', 'x\r\ny', '', None, 7], 64, 11)
+             if positions == [position] else generator)
+            for positions, generator in link.groups
+        ]
+        for plan in plans:
+            with self.subTest(table=plan.table_name):
+                expected = io.StringIO()
+                writer = csv.writer(expected, lineterminator='\n')
+                writer.writerow(plan.columns)
+                for rows in engine.iter_rows(plan):
+                    writer.writerows(rows)
+
+                actual = io.StringIO()
+                engine._write_csv(plan, actual)
+                self.assertEqual(actual.getvalue(), expected.getvalue())
+        self.assertIn('"say ""hi"""', actual.getvalue())
+
+
+@pytest.mark.unit
+class TestSampleDataLoader(unittest.TestCase):
+    """サンプルデータ一括投入のテスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        tables = {
+            'MST_Parent': {
+                'table_name': 'MST_Parent',
+                'columns': [
+                    {'name': 'id', 'type': 'VARCHAR(50)', 'null': False, 'primary_key': True},
+                    {'name': 'status', 'type': 'ENUM', 'enum_values': ['ACTIVE', 'INACTIVE']},
+                    {'name': 'is_active', 'type': 'BOOLEAN'},
+                ],
+                'sample_data': [
+                    {'id': 'parent_001', 'status': 'ACTIVE', 'is_active': True},
+                    {'id': 'parent_002', 'status': "O'NEIL", 'is_active': False},
+                ]
+            },
+            'TRN_Child': {
+                'table_name': 'TRN_Child',
+                'columns': [
+                    {'name': 'id', 'type': 'VARCHAR(50)', 'null': False, 'primary_key': True},
+                    {'name': 'parent_id', 'type': 'VARCHAR(50)', 'null': False},
+                    {'name': 'score', 'type': 'DECIMAL(5,2)'},
+                ],
+                'foreign_keys': [
+                    {'name': 'fk_child_parent', 'columns': ['parent_id'],
+                     'references': {'table': 'MST_Parent', 'columns': ['id']}},
+                ],
+                'sample_data': [
+                    {'id': 'child_001', 'parent_id': 'parent_001', 'score': 1.5},
+                    {'id': 'child_002', 'parent_id': 'parent_002', 'score': None},
+                    {'id': 'child_003', 'parent_id': 'parent_999', 'score': 3},
+                ]
+            }
+        }
+        for table_name, data in tables.items():
+            with open(self.temp_dir / f"テーブル詳細定義YAML_{table_name}.yaml", 'w', encoding='utf-8') as f:
+                yaml.safe_dump(data, f, allow_unicode=True)
+    
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir)
+    
+    def _load(self, source='yaml', batch_size=2):
+        target = SqliteLoadTarget()
+        resolver = TableDependencyResolver(table_details_dir=str(self.temp_dir))
+        loader = SampleDataLoader(target, source, batch_size, sql_dir=str(self.temp_dir), resolver=resolver)
+        return target, loader.load(['TRN_Child', 'MST_Parent'])
+    
+    def test_load_yaml_sample_data(self):
+        """依存順にバッチ投入し、外部キー違反を件数として報告すること"""
+        target, result = self._load()
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['execution_order'], ['MST_Parent', 'TRN_Child'])
+        self.assertEqual(result['total_rows'], 5)
+        self.assertEqual(result['tables']['TRN_Child']['batches'], 2)
+        self.assertEqual(result['foreign_key_violations'], {'TRN_Child': 1})
+        
+        rows = target.conn.execute("SELECT id, status, is_active, is_deleted FROM MST_Parent ORDER BY id").fetchall()
+        self.assertEqual(rows, [('parent_001', 'ACTIVE', 1, 0), ('parent_002', "O'NEIL", 0, 0)])
+        rows = target.conn.execute("SELECT id, score FROM TRN_Child ORDER BY id").fetchall()
+        self.assertEqual(rows, [('child_001', 1.5), ('child_002', None), ('child_003', 3.0)])
+        target.close()
+    
+    def test_load_sql_files(self):
+        """data/*_sample_data.sql からも同じ値を投入すること"""
+        target, expected = self._load()
+        expected_rows = target.conn.execute("SELECT id, parent_id, score FROM TRN_Child ORDER BY id").fetchall()
+        target.close()
+        
+        (self.temp_dir / "MST_Parent_sample_data.sql").write_text(
+            "INSERT INTO MST_Parent (id, status, is_active) VALUES ('parent_001', 'ACTIVE', TRUE);\n"
+            "INSERT INTO MST_Parent (id, status, is_active) VALUES ('parent_002', 'O''NEIL', FALSE);\n",
+            encoding='utf-8'
+        )
+        (self.temp_dir / "TRN_Child_sample_data.sql").write_text(
+            "INSERT INTO TRN_Child (id, parent_id, score) VALUES\n"
+            "    ('child_001', 'parent_001', 1.5),\n"
+            "    ('child_002', 'parent_002', NULL),\n"
+            "    ('child_003', 'parent_999', 3);\n",
+            encoding='utf-8'
+        )
+        target, result = self._load('sql')
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['total_rows'], expected['total_rows'])
+        self.assertEqual(result['foreign_key_violations'], {'TRN_Child': 1})
+        self.assertEqual(target.conn.execute("SELECT id, parent_id, score FROM TRN_Child ORDER BY id").fetchall(),
+                         expected_rows)
+        target.close()
+
+
+@pytest.mark.unit
+class TestBasicDataUtilsStreams(unittest.TestCase):
+    """テーブル・チャンクごとの乱数ストリームのテスト"""
+    
+    def setUp(self):
+        """テストセットアップ"""
+        self.reference_date = datetime.date(2025, 4, 1)
+    
+    def _utils(self, seed):
+        return BasicDataUtils(seed, reference_date=self.reference_date)
+    
+    def _chunk(self, utils, table_name, chunk_index):
+        return (
+            utils.generate_chunk(table_name, chunk_index, 'integer', 200, min_value=1, max_value=6),
+            utils.generate_chunk(table_name, chunk_index, 'date', 50),
+            utils.spawn(table_name, chunk_index).generate_many('name', 5),
+        )
+    
+    def test_chunks_independent_of_generation_order(self):
+        """チャンクを別インスタンス・任意の順序で生成しても同じ値になること（プロセス数に依存しない）"""
+        sequential = [self._chunk(self._utils(42), 'MST_Employee', i) for i in range(6)]
+        reordered = {i: self._chunk(self._utils(42), 'MST_Employee', i) for i in (5, 2, 0, 4, 1, 3)}
+        self.assertEqual(sequential, [reordered[i] for i in range(6)])
+        
+        # テーブル・チャンク・マスターシードが異なればストリームも異なる
+        self.assertNotEqual(sequential[0], sequential[1])
+        self.assertNotEqual(sequential[0], self._chunk(self._utils(42), 'MST_Department', 0))
+        self.assertNotEqual(sequential[0], self._chunk(self._utils(43), 'MST_Employee', 0))
+    
+    def test_set_seed_does_not_touch_global_random(self):
+        """set_seed はインスタンスのストリームのみを作り直すこと"""
+        utils = self._utils(None)
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        utils.set_seed(7)
+        first = [utils.generate_by_type('integer') for _ in range(10)] + [utils.generate_by_type('uuid')]
+        self.assertEqual(random.random(), expected)
+        
+        utils.set_seed(7)
+        self.assertEqual([utils.generate_by_type('integer') for _ in range(10)] + [utils.generate_by_type('uuid')],
+                         first)
+        self.assertEqual(SeedSequence(7).spawn(2)[1].generate_state(), SeedSequence(7).child(1).generate_state())
+    
+    def test_bulk_draw_ranges(self):
+        """一括生成の値が指定範囲に収まること"""
+        utils = self._utils(3)
+        integers = utils.generate_many('integer', 5000, min_value=-2, max_value=2)
+        self.assertEqual(set(integers), {-2, -1, 0, 1, 2})
+        decimals = utils.generate_many('decimal', 1000, min_value=1, max_value=2, decimals=1)
+        self.assertTrue(all(1 <= value <= 2 and round(value, 1) == value for value in decimals))
+        self.assertFalse(any(utils.generate_many('boolean', 1000, chance_of_getting_true=0)))
+        self.assertTrue(all(utils.generate_many('boolean', 1000, chance_of_getting_true=100)))
+        self.assertEqual(set(utils.generate_many('choice', 1000, choices=['A', 'B'])), {'A', 'B'})
+        dates = utils.generate_many('date', 1000, days=30)
+        self.assertTrue(all(0 <= (self.reference_date - value).days <= 30 for value in dates))
+        self.assertEqual(len(utils.generate_many('email', 3)), 3)
+    
+    def test_temporal_pools_memoized(self):
+        """日付・日時の候補が基準日・範囲ごとに1回だけ作成されること"""
+        date_pool.cache_clear()
+        datetime_pool.cache_clear()
+        utils = self._utils(4)
+        for chunk_index in range(3):
+            chunk = utils.spawn('MST_Employee', chunk_index)
+            chunk.generate_many('date', 100, days=30)
+            chunk.generate_many('datetime', 100, hours=48)
+        self.assertEqual((date_pool.cache_info().misses, date_pool.cache_info().hits), (1, 2))
+        self.assertEqual((datetime_pool.cache_info().misses, datetime_pool.cache_info().hits), (1, 2))
+        
+        self.assertEqual(len(date_pool(self.reference_date, 30)), 31)
+        self.assertEqual(date_pool(self.reference_date, 30)[-1], self.reference_date - datetime.timedelta(days=30))
+        self.assertEqual(datetime_pool(self.reference_date, 48)[0],
+                         datetime.datetime.combine(self.reference_date, datetime.time()))
+
+
 if __name__ == '__main__':
     # テストスイート実行
     unittest.main(verbosity=2)
@@ -0,0 +1,31 @@
+"""
+設計統合ツール - YAML読み込みモジュール
+要求仕様ID: PLT.1-WEB.1
+
+データベースツールの解析済みYAMLディスクキャッシュを共用してYAMLを読み込みます。
+キャッシュが利用できない環境では yaml.safe_load で直接読み込みます。
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Union
+
+import yaml
+
+# データベースツール（legacy/shared）のパス
+_db_legacy_dir = Path(__file__).parent.parent.parent / "database" / "legacy"
+if str(_db_legacy_dir) not in sys.path:
+    sys.path.append(str(_db_legacy_dir))
+
+try:
+    from shared.performance.yaml_cache import cached_yaml_load
+except ImportError:
+    cached_yaml_load = None
+
+
+def load_yaml(yaml_path: Union[str, Path]) -> Any:
+    """YAMLファイルを読み込み（共有キャッシュが利用可能な場合はキャッシュ経由）"""
+    if cached_yaml_load is not None:
+        return cached_yaml_load(yaml_path)
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
@@ -61,6 +61,11 @@ except ImportError as e:
             return {'overall_success': False, 'error': 'モジュール未利用'}
 
 
+# --profile / --profile-memory（データベースツールと共通）
+sys.path.append(str(current_dir.parent / "database" / "legacy"))
+from shared.monitoring.profiling import add_profile_arguments, profile_command
+
+
 class DesignIntegrationTools:
     """設計統合ツール - メインクラス（データベースツール昇格版）"""
     
@@ -563,6 +568,7 @@ def main():
     parser.add_argument('--config', type=str, help='設定ファイルパス')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                        default='INFO', help='ログレベル')
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     
@@ -574,11 +580,12 @@ def main():
         # ログレベル設定
         logging.basicConfig(level=getattr(logging, args.log_level))
         
-        # 設計統合ツールを初期化
-        tools = DesignIntegrationTools(args.config)
-        
-        # コマンド実行
-        success = execute_command(tools, args)
+        with profile_command(args, args.command):
+            # 設計統合ツールを初期化
+            tools = DesignIntegrationTools(args.config)
+            
+            # コマンド実行
+            success = execute_command(tools, args)
         
         return 0 if success else 1
         
@@ -27,6 +27,7 @@ try:
     from core.config import DesignIntegrationConfig
     from core.exceptions import DesignIntegrationError
     from core.logger import get_logger
+    from core.yaml_loader import load_yaml
 except ImportError as e:
     print(f"インポートエラー: {e}")
     # フォールバック用の基本クラス
@@ -47,6 +48,10 @@ except ImportError as e:
         import logging
         return logging.getLogger(name)
 
+    def load_yaml(yaml_path):
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+
 
 class DatabaseDesignManager:
     """データベース設計管理クラス（完全統合版）"""
@@ -427,9 +432,7 @@ class DatabaseDesignManager:
             if not yaml_file.exists():
                 return None
             
-            import yaml
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                table_data = yaml.safe_load(f)
+            table_data = load_yaml(yaml_file)
             
             return table_data
             
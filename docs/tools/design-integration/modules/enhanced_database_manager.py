@@ -32,6 +32,7 @@ try:
     from core.config import DesignIntegrationConfig
     from core.exceptions import DesignIntegrationError
     from core.logger import get_logger
+    from core.yaml_loader import load_yaml
     from modules.database_manager import DatabaseDesignManager
 except ImportError as e:
     print(f"インポートエラー: {e}")
@@ -52,6 +53,10 @@ except ImportError as e:
     def get_logger(name):
         import logging
         return logging.getLogger(name)
+
+    def load_yaml(yaml_path):
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
     
     class DatabaseDesignManager:
         def __init__(self, config):
@@ -261,8 +266,7 @@ class EnhancedDatabaseDesignManager(DatabaseDesignManager):
                 score -= 50.0
             else:
                 # YAML内容の検証
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    table_data = yaml.safe_load(f)
+                table_data = load_yaml(yaml_file)
                 
                 # 必須セクションのチェック
                 required_sections = ['table_name', 'columns', 'revision_history', 'overview', 'notes', 'rules']
@@ -24,6 +24,7 @@ try:
     from core.config import DesignIntegrationConfig
     from core.exceptions import DesignIntegrationError
     from core.logger import get_logger
+    from core.yaml_loader import load_yaml
 except ImportError as e:
     print(f"インポートエラー: {e}")
     # フォールバック用の基本クラス
@@ -38,6 +39,10 @@ except ImportError as e:
         import logging
         return logging.getLogger(name)
 
+    def load_yaml(yaml_path):
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+
 
 class IntegrationChecker:
     """設計書整合性チェッククラス"""
@@ -407,8 +412,7 @@ class IntegrationChecker:
     def _validate_yaml_content(self, yaml_file: Path, verbose: bool = False) -> bool:
         """YAML内容の検証"""
         try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = load_yaml(yaml_file)
             
             # 必須セクションの存在チェック
             required_sections = ['revision_history', 'overview', 'notes', 'rules']
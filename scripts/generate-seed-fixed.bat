@@ -36,7 +36,7 @@ if exist "%OUTPUT_FILE%" (
 
 REM Pythonスクリプトを実行
 echo 🐍 Pythonスクリプトを実行中...
-python "%PYTHON_SCRIPT%" --sql-dir "%SQL_DATA_DIR%" --output "%OUTPUT_FILE%"
+python "%PYTHON_SCRIPT%" --sql-dir "%SQL_DATA_DIR%" --output "%OUTPUT_FILE%" %*
 
 REM 実行結果をチェック
 if %errorlevel% equ 0 (
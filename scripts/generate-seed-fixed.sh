@@ -34,11 +34,12 @@ if [ -f "$OUTPUT_FILE" ]; then
     cp "$OUTPUT_FILE" "$BACKUP_FILE"
 fi
 
-# Pythonスクリプトを実行
+# Pythonスクリプトを実行（追加の引数はそのまま渡す 例: --seed-mode create_many --chunk-size 500）
 echo "🐍 Pythonスクリプトを実行中..."
 python3 "$PYTHON_SCRIPT" \
     --sql-dir "$SQL_DATA_DIR" \
-    --output "$OUTPUT_FILE"
+    --output "$OUTPUT_FILE" \
+    "$@"
 
 # 実行結果をチェック
 if [ $? -eq 0 ]; then
@@ -7,15 +7,66 @@ SQL サンプルデータから Prisma seed.ts ファイルを生成するスク
 
 import os
 import re
+import sys
 import json
+import hashlib
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+# プロジェクトルート (このスクリプトの親ディレクトリ)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import sql_values_tokenizer
+from sql_values_tokenizer import iter_file_rows
+
+# 投入コードの出力形式
+#   upsert      : 1行ごとの upsert を Promise.all で実行（従来形式）
+#   create_many : chunk_size 行ごとの createMany({ skipDuplicates: true }) を同時実行数を制限して実行
+SEED_MODES = ('upsert', 'create_many')
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_CONCURRENCY = 4
+
+# createMany では where 条件を指定できないため、複合キーのテーブルは upsert で投入する
+COMPOSITE_KEYS = ('user_id_role_id', 'employee_id_skill_item_id')
+
+# 差分生成のマニフェスト（SQLファイルのハッシュとテーブルごとの生成コード）の保存先
+DEFAULT_CACHE_DIR = PROJECT_ROOT / '.cache' / 'seed'
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: Path) -> str:
+    """ファイル内容の SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def generator_fingerprint() -> str:
+    """生成処理（本スクリプトとトークナイザー）のハッシュ。変更時はキャッシュを使用しない"""
+    digest = hashlib.sha256()
+    for path in (Path(__file__), Path(sql_values_tokenizer.__file__)):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
 class SQLToSeedConverter:
-    def __init__(self, sql_data_dir: str, output_file: str):
+    def __init__(self, sql_data_dir: str, output_file: str, seed_mode: str = 'upsert',
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, concurrency: int = DEFAULT_CONCURRENCY,
+                 cache_dir: Optional[str] = None, force: bool = False):
+        if seed_mode not in SEED_MODES:
+            raise ValueError(f"未対応の出力形式: {seed_mode}（{', '.join(SEED_MODES)}）")
         self.sql_data_dir = Path(sql_data_dir)
         self.output_file = Path(output_file)
+        self.seed_mode = seed_mode
+        self.chunk_size = max(1, chunk_size)
+        self.concurrency = max(1, concurrency)
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.force = force
+        # 今回解析したテーブルのデータ（キャッシュから再利用したテーブルは含まない）
         self.table_data = {}
         
         # テーブル名のマッピング（SQL名 -> Prisma名）
@@ -51,128 +102,43 @@ class SQLToSeedConverter:
         ]
 
     def parse_sql_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """SQLファイルを解析してデータを抽出"""
+        """SQLファイルを解析してデータを抽出（ファイル内の複数のINSERT文に対応）"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            table_name = None
+            columns: List[str] = []
+            rows = []
+            last_columns = None
             
-            # テーブル名を抽出
-            table_match = re.search(r'INSERT INTO (\w+)', content, re.IGNORECASE)
-            if not table_match:
-                return None
+            for row_table, row_columns, values in iter_file_rows(file_path):
+                if table_name is None:
+                    table_name = row_table
+                elif row_table != table_name:
+                    continue
                 
-            table_name = table_match.group(1)
-            
-            # カラム名を抽出（複数行対応）
-            columns_match = re.search(r'INSERT INTO \w+\s*\(\s*([^)]+)\s*\)\s*VALUES', content, re.IGNORECASE | re.DOTALL)
-            if not columns_match:
-                return None
+                # カラム数とデータ数の整合性チェック
+                if len(values) != len(row_columns):
+                    print(f"Warning: Column count mismatch in {table_name}: expected {len(row_columns)}, got {len(values)}")
+                    continue
                 
-            columns_text = columns_match.group(1)
-            # カラム名をクリーンアップ
-            columns = []
-            for line in columns_text.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('--'):
-                    # カンマで分割してクリーンアップ
-                    parts = line.split(',')
-                    for part in parts:
-                        part = part.strip()
-                        if part:
-                            columns.append(part)
+                # 文ごとにカラム構成が異なる場合はカラム一覧に追加
+                if row_columns is not last_columns:
+                    columns.extend(col for col in row_columns if col not in columns)
+                    last_columns = row_columns
+                rows.append(dict(zip(row_columns, values)))
             
-            # VALUES句を抽出（セミコロンまで）
-            values_match = re.search(r'VALUES\s*(.+?);', content, re.IGNORECASE | re.DOTALL)
-            if not values_match:
+            if table_name is None:
                 return None
-                
-            values_text = values_match.group(1)
-            
-            # 各行のデータを抽出
-            rows = self.parse_values_section(values_text)
-            
-            # カラム数とデータ数の整合性チェック
-            valid_rows = []
-            for row in rows:
-                if len(row) == len(columns):
-                    row_data = dict(zip(columns, row))
-                    valid_rows.append(row_data)
-                else:
-                    print(f"Warning: Column count mismatch in {table_name}: expected {len(columns)}, got {len(row)}")
             
             return {
                 'table_name': table_name,
                 'columns': columns,
-                'rows': valid_rows
+                'rows': rows
             }
             
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
             return None
 
-    def parse_values_section(self, values_text: str) -> List[List[str]]:
-        """VALUES句を解析して行データを抽出"""
-        rows = []
-        current_row = []
-        current_value = ""
-        in_quotes = False
-        quote_char = None
-        paren_depth = 0
-        bracket_depth = 0
-        
-        i = 0
-        while i < len(values_text):
-            char = values_text[i]
-            
-            if not in_quotes:
-                if char in ["'", '"']:
-                    in_quotes = True
-                    quote_char = char
-                    current_value += char
-                elif char == '(':
-                    if paren_depth == 0:
-                        # 新しい行の開始
-                        current_row = []
-                        current_value = ""
-                    else:
-                        current_value += char
-                    paren_depth += 1
-                elif char == ')':
-                    paren_depth -= 1
-                    if paren_depth == 0:
-                        # 行の終了
-                        if current_value.strip():
-                            current_row.append(current_value.strip())
-                        if current_row:
-                            rows.append(current_row)
-                        current_row = []
-                        current_value = ""
-                    else:
-                        current_value += char
-                elif char == '[':
-                    bracket_depth += 1
-                    current_value += char
-                elif char == ']':
-                    bracket_depth -= 1
-                    current_value += char
-                elif char == ',' and paren_depth > 0:
-                    # 値の区切り
-                    current_row.append(current_value.strip())
-                    current_value = ""
-                else:
-                    current_value += char
-            else:
-                current_value += char
-                if char == quote_char:
-                    # エスケープされていない引用符の終了をチェック
-                    if i == 0 or values_text[i-1] != '\\':
-                        in_quotes = False
-                        quote_char = None
-            
-            i += 1
-        
-        return rows
-
     def convert_value(self, value: str, column_name: str) -> str:
         """SQLの値をTypeScript/Prismaの値に変換"""
         value = value.strip()
@@ -346,13 +312,8 @@ class SQLToSeedConverter:
             code_lines.append(f"        create: {{")
             
             # 各フィールドを追加
-            for col, val in row.items():
-                if val and val.upper() != 'NULL':
-                    converted_val = self.convert_value(val, col)
-                    code_lines.append(f"          {col}: {converted_val},")
-            
-            # code/nameフィールドの自動設定
-            self.add_code_name_fields(code_lines, row, table_name, code_name_mapping)
+            for field in self.build_create_fields(row, table_name, code_name_mapping):
+                code_lines.append(f"          {field},")
             
             code_lines.append(f"        }},")
             code_lines.append(f"      }}),")
@@ -362,6 +323,56 @@ class SQLToSeedConverter:
         
         return "\n".join(code_lines)
 
+    def generate_create_many_code(self, table_name: str, data: Dict[str, Any]) -> str:
+        """テーブルのcreateManyコードを生成（複合キーのテーブルはupsertコード）"""
+        rows = data['rows']
+        columns = data['columns']
+        
+        if not rows:
+            return ""
+        
+        if self.get_primary_key(table_name, columns) in COMPOSITE_KEYS:
+            return self.generate_upsert_code(table_name, data)
+        
+        prisma_table = self.table_mapping.get(table_name, table_name.lower())
+        code_name_mapping = self.get_code_name_mapping(table_name)
+        
+        code_lines = []
+        code_lines.append(f"    // {table_name}データ")
+        code_lines.append(f"    console.log('📊 {table_name}データを投入中...')")
+        code_lines.append(f"    await createManyInChunks([")
+        
+        for row in rows:
+            fields = self.build_create_fields(row, table_name, code_name_mapping)
+            code_lines.append(f"      {{ {', '.join(fields)} }},")
+        
+        code_lines.append(f"    ], {self.chunk_size}, {self.concurrency}, (chunk) =>")
+        code_lines.append(f"      prisma.{prisma_table}.createMany({{ data: chunk, skipDuplicates: true }})")
+        code_lines.append(f"    )")
+        code_lines.append("")
+        
+        return "\n".join(code_lines)
+
+    def generate_table_code(self, table_name: str, data: Dict[str, Any]) -> str:
+        """出力形式（seed_mode）に応じたテーブルの投入コードを生成"""
+        if self.seed_mode == 'create_many':
+            return self.generate_create_many_code(table_name, data)
+        return self.generate_upsert_code(table_name, data)
+
+    def build_create_fields(self, row: Dict[str, str], table_name: str, mapping: Dict[str, str]) -> List[str]:
+        """create / createMany に渡すフィールド（'カラム名: 値'）のリストを生成"""
+        fields = [
+            f"{col}: {self.convert_value(val, col)}"
+            for col, val in row.items()
+            if val and val.upper() != 'NULL'
+        ]
+        
+        # code/nameフィールドの自動設定
+        extra_lines: List[str] = []
+        self.add_code_name_fields(extra_lines, row, table_name, mapping)
+        fields.extend(line.strip().rstrip(',') for line in extra_lines)
+        return fields
+
     def add_code_name_fields(self, code_lines: List[str], row: Dict[str, str], table_name: str, mapping: Dict[str, str]):
         """code/nameフィールドを自動追加"""
         code_field = mapping.get('code_field')
@@ -412,32 +423,120 @@ class SQLToSeedConverter:
                 converted_val = self.convert_value(employee_id, 'code')
                 code_lines.append(f"          code: {converted_val},")
 
-    def generate_seed_file(self):
-        """seed.tsファイルを生成"""
-        # SQLファイルを読み込み
-        for sql_file in self.sql_data_dir.glob("*.sql"):
-            if sql_file.name.endswith('_sample_data.sql'):
-                data = self.parse_sql_file(sql_file)
-                if data:
-                    table_name = data['table_name']
-                    self.table_data[table_name] = data
-                    print(f"Parsed: {table_name} ({len(data['rows'])} rows)")
-
-        # seed.tsファイルを生成
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            f.write(self.generate_header())
-            
-            # 依存関係順にテーブルを処理
-            for table_name in self.dependency_order:
-                if table_name in self.table_data:
-                    upsert_code = self.generate_upsert_code(table_name, self.table_data[table_name])
-                    if upsert_code:
-                        f.write(upsert_code)
-                        f.write("\n")
+    def generate_seed_file(self) -> bool:
+        """seed.tsファイルを生成（変更のあったSQLファイルのみ解析する）
+        
+        SQLファイルのハッシュとテーブルごとの生成コードをマニフェストに保存し、
+        ハッシュが一致するファイルは解析せずに前回の生成コードを再利用する。
+        生成内容が前回と同じで出力ファイルも変更されていない場合は書き込まない（mtime を維持）。
+        
+        Returns:
+            bool: seed.ts を書き込んだ場合 True
+        """
+        manifest = {} if self.force else self.load_manifest()
+        cached_files = manifest.get('files', {})
+        files = {}
+        parsed_count = 0
+        
+        # SQLファイルを読み込み（ハッシュが変わったファイルのみ解析）
+        for sql_file in sorted(self.sql_data_dir.glob("*_sample_data.sql")):
+            digest = file_sha256(sql_file)
+            entry = cached_files.get(sql_file.name)
+            if entry and entry['sha256'] == digest:
+                files[sql_file.name] = entry
+                continue
             
+            data = self.parse_sql_file(sql_file)
+            if data:
+                table_name = data['table_name']
+                self.table_data[table_name] = data
+                parsed_count += 1
+                print(f"Parsed: {table_name} ({len(data['rows'])} rows)")
+                files[sql_file.name] = {
+                    'sha256': digest,
+                    'table_name': table_name,
+                    'rows': len(data['rows']),
+                    'fragment': self.generate_table_code(table_name, data)
+                    if table_name in self.dependency_order else None,
+                }
+        print(f"Parsed {parsed_count} files, reused {len(files) - parsed_count} cached tables")
+        
+        # 依存関係順にテーブルのコードを連結
+        fragments = {entry['table_name']: entry['fragment'] for entry in files.values()}
+        body = "".join(
+            fragments[table_name] + "\n"
+            for table_name in self.dependency_order
+            if fragments.get(table_name)
+        )
+        content_hash = hashlib.sha256(body.encode('utf-8')).hexdigest()
+        
+        output = manifest.get('output', {})
+        if output.get('content_sha256') == content_hash and output.get('stat') == self.output_stat():
+            self.save_manifest(files, output)
+            print(f"Unchanged seed file: {self.output_file}")
+            return False
+        
+        # seed.tsファイルを生成（書き込み途中のファイルを残さないよう一時ファイルから置き換える）
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.output_file.with_name(self.output_file.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(self.generate_header())
+            f.write(body)
             f.write(self.generate_footer())
+        os.replace(temp_file, self.output_file)
         
+        self.save_manifest(files, {'content_sha256': content_hash, 'stat': self.output_stat()})
         print(f"Generated seed file: {self.output_file}")
+        return True
+
+    def manifest_path(self) -> Path:
+        """出力ファイルごとのマニフェストのパス"""
+        key = hashlib.sha256(str(self.output_file.resolve()).encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{key}.json"
+
+    def manifest_settings(self) -> Dict[str, Any]:
+        """生成コードに影響する設定（一致しない場合はマニフェストを使用しない）"""
+        return {
+            'version': MANIFEST_VERSION,
+            'generator': generator_fingerprint(),
+            'seed_mode': self.seed_mode,
+            'chunk_size': self.chunk_size,
+            'concurrency': self.concurrency,
+        }
+
+    def output_stat(self) -> Optional[List[int]]:
+        """出力ファイルのサイズと更新日時（存在しない場合は None）"""
+        try:
+            stat = self.output_file.stat()
+        except FileNotFoundError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def load_manifest(self) -> Dict[str, Any]:
+        """マニフェストを読み込み（存在しない・設定が異なる場合は空）"""
+        try:
+            with open(self.manifest_path(), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('settings') != self.manifest_settings():
+            return {}
+        return manifest
+
+    def save_manifest(self, files: Dict[str, Any], output: Dict[str, Any]):
+        """マニフェストを保存"""
+        manifest = {
+            'settings': self.manifest_settings(),
+            'output_file': str(self.output_file),
+            'files': files,
+            'output': output,
+        }
+        path = self.manifest_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_name(path.name + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(temp_file, path)
 
     def generate_header(self) -> str:
         """seed.tsファイルのヘッダーを生成"""
@@ -447,13 +546,37 @@ class SQLToSeedConverter:
 import { PrismaClient } from '@prisma/client'
 
 const prisma = new PrismaClient()
-
+''' + (self.generate_helpers() if self.seed_mode == 'create_many' else '') + '''
 async function main() {
   console.log('🌱 データベースの初期データ投入を開始します...')
 
   try {
 '''
 
+    def generate_helpers(self) -> str:
+        """createMany 用の補助関数（チャンク分割・同時実行数の制限）を生成"""
+        return '''
+// rows を chunkSize 件ずつに分割し、同時に concurrency 件まで insert を実行する
+async function createManyInChunks<T>(
+  rows: T[],
+  chunkSize: number,
+  concurrency: number,
+  insert: (chunk: T[]) => Promise<unknown>
+): Promise<void> {
+  const chunks: T[][] = []
+  for (let i = 0; i < rows.length; i += chunkSize) {
+    chunks.push(rows.slice(i, i + chunkSize))
+  }
+  let next = 0
+  const workers = Array.from({ length: Math.min(concurrency, chunks.length) }, async () => {
+    while (next < chunks.length) {
+      await insert(chunks[next++])
+    }
+  })
+  await Promise.all(workers)
+}
+'''
+
     def generate_footer(self) -> str:
         """seed.tsファイルのフッターを生成"""
         return '''
@@ -499,6 +622,16 @@ def main():
                        help='出力ファイル (default: src/database/prisma/seed.ts)')
     parser.add_argument('--backup', action='store_true',
                        help='既存のseed.tsファイルをバックアップ')
+    parser.add_argument('--seed-mode', choices=SEED_MODES, default='upsert',
+                       help='投入コードの形式 (default: upsert)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                       help=f'createMany 1回あたりの行数 (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                       help=f'createMany の同時実行数 (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--cache-dir', default=None,
+                       help='差分生成のマニフェストの保存先 (default: <プロジェクトルート>/.cache/seed)')
+    parser.add_argument('--force', action='store_true',
+                       help='マニフェストを使用せずに全ファイルを解析して seed.ts を書き込む')
     
     args = parser.parse_args()
     
@@ -509,8 +642,11 @@ def main():
         print(f"Backup created: {backup_file}")
     
     # 変換実行
-    converter = SQLToSeedConverter(args.sql_dir, args.output)
-    converter.generate_seed_file()
+    converter = SQLToSeedConverter(args.sql_dir, args.output, args.seed_mode,
+                                   args.chunk_size, args.concurrency, args.cache_dir, args.force)
+    if not converter.generate_seed_file():
+        print("✅ seed.tsファイルは最新です（変更なし）")
+        return
     
     print("✅ seed.tsファイルの生成が完了しました！")
     print(f"📁 出力ファイル: {args.output}")
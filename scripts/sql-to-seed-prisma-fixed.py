@@ -18,11 +18,15 @@ python3 scripts/sql-to-seed-prisma-fixed.py <sql_dir> [output_file]
 import sys
 import re
 from pathlib import Path
-from typing import List, Tuple, Any
+from typing import Dict, List, Tuple, Any
 
 # プロジェクトルート (このスクリプトの親ディレクトリ)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sql_values_tokenizer import iter_file_rows, parse_sql_literal
+
 
 # --------------------------------------------------------------------------- #
 # 名称変換ユーティリティ
@@ -42,81 +46,29 @@ def to_prisma_property(name: str) -> str:
 # --------------------------------------------------------------------------- #
 # SQL 解析
 # --------------------------------------------------------------------------- #
-def parse_sql_file(path: Path) -> Tuple[str, List[str], List[List[Any]]]:
+def parse_sql_file(path: Path) -> Tuple[str, List[str], List[Dict[str, Any]]]:
     """
     INSERT 文を含む SQL ファイルを解析し、
     (テーブル名, カラム一覧, 行データ) を返す。
+    ファイル内に複数の INSERT 文がある場合は先頭のテーブルの行をすべて返す。
     """
-    content = path.read_text(encoding="utf-8")
-
-    match = re.search(
-        r"INSERT\s+INTO\s+(\w+)\s*\(([^)]*)\)\s*VALUES\s*(.*?);\s*$",
-        content,
-        re.S,
-    )
-    if not match:
-        raise ValueError(f"INSERT 文が見つかりません: {path}")
-
-    table = match.group(1)
-    columns = [c.strip() for c in match.group(2).split(",")]
-
-    values_block = match.group(3)
-
-    # ――― VALUES 句を ( … ),( … ) … に分割（クォート内のカッコを無視） ――― #
-    row_texts: List[str] = []
-    buf: List[str] = []
-    in_quote = False
-    escape = False
-    depth = 0
-
-    for ch in values_block:
-        if ch == "'" and not escape:
-            in_quote = not in_quote
-        if ch == "\\" and in_quote:
-            escape = not escape
-            buf.append(ch)
-            continue
-        else:
-            escape = False
-
-        if ch == "(" and not in_quote:
-            if depth == 0:
-                buf = []
-            else:
-                buf.append(ch)
-            depth += 1
+    table = None
+    columns: List[str] = []
+    rows: List[Dict[str, Any]] = []
+    last_columns = None
+
+    for row_table, row_columns, values in iter_file_rows(path):
+        if table is None:
+            table = row_table
+        elif row_table != table:
             continue
-        if ch == ")" and not in_quote:
-            depth -= 1
-            if depth == 0:
-                row_texts.append("".join(buf).strip())
-                continue
-            else:
-                buf.append(ch)
-                continue
-
-        if depth > 0:
-            buf.append(ch)
-
-    # ――― 行データをパース ――― #
-    rows: List[List[Any]] = []
-    for row_text in row_texts:
-        fields: List[Any] = []
-        # カンマ分割（クォート内は無視）
-        for val in re.split(r",(?=(?:[^']*'[^']*')*[^']*$)", row_text):
-            val = val.strip()
-            if val.upper() == "NULL":
-                fields.append(None)
-            elif val.upper() == "TRUE":
-                fields.append(True)
-            elif val.upper() == "FALSE":
-                fields.append(False)
-            else:
-                if val.startswith("'") and val.endswith("'"):
-                    fields.append(val[1:-1].replace("\\'", "'"))
-                else:
-                    fields.append(val)
-        rows.append(fields)
+        if row_columns is not last_columns:
+            columns.extend(c for c in row_columns if c not in columns)
+            last_columns = row_columns
+        rows.append({col: parse_sql_literal(val) for col, val in zip(row_columns, values)})
+
+    if table is None:
+        raise ValueError(f"INSERT 文が見つかりません: {path}")
 
     return table, columns, rows
 
@@ -147,7 +99,7 @@ def format_value(value: Any) -> str:
     return str(value)
 
 
-def generate_ts(table: str, columns: List[str], rows: List[List[Any]]) -> str:
+def generate_ts(table: str, columns: List[str], rows: List[Dict[str, Any]]) -> str:
     """Prisma 用の TypeScript コード片を生成"""
     lines: List[str] = []
     model_prop = to_prisma_property(table)
@@ -156,7 +108,7 @@ def generate_ts(table: str, columns: List[str], rows: List[List[Any]]) -> str:
     lines.append("  data: [")
     for row in rows:
         lines.append("    {")
-        for col, val in zip(columns, row):
+        for col, val in row.items():
             lines.append(f"      {col}: {format_value(val)},")
         lines.append("    },")
     lines.append("  ],")
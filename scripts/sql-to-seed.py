@@ -7,11 +7,16 @@ SQL サンプルデータから Prisma seed.ts ファイルを生成するスク
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sql_values_tokenizer import iter_file_rows
+
 class SQLToSeedConverter:
     def __init__(self, sql_data_dir: str, output_file: str):
         self.sql_data_dir = Path(sql_data_dir)
@@ -112,45 +117,32 @@ class SQLToSeedConverter:
         ]
 
     def parse_sql_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """SQLファイルを解析してデータを抽出"""
+        """SQLファイルを解析してデータを抽出（ファイル内の複数のINSERT文に対応）"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            table_name = None
+            columns: List[str] = []
+            rows = []
+            last_columns = None
             
-            # テーブル名を抽出
-            table_match = re.search(r'INSERT INTO (\w+)', content, re.IGNORECASE)
-            if not table_match:
-                return None
+            for row_table, row_columns, values in iter_file_rows(file_path):
+                if table_name is None:
+                    table_name = row_table
+                elif row_table != table_name:
+                    continue
                 
-            table_name = table_match.group(1)
-            
-            # カラム名を抽出
-            columns_match = re.search(r'INSERT INTO \w+\s*\(\s*([^)]+)\s*\)', content, re.IGNORECASE | re.DOTALL)
-            if not columns_match:
-                return None
+                # カラム数とデータ数の整合性チェック
+                if len(values) != len(row_columns):
+                    print(f"Warning: Column count mismatch in {table_name}: expected {len(row_columns)}, got {len(values)}")
+                    continue
                 
-            columns_text = columns_match.group(1)
-            columns = [col.strip().strip(',') for col in columns_text.split('\n') if col.strip()]
-            columns = [col for col in columns if col and not col.startswith('--')]
+                # 文ごとにカラム構成が異なる場合はカラム一覧に追加
+                if row_columns is not last_columns:
+                    columns.extend(col for col in row_columns if col not in columns)
+                    last_columns = row_columns
+                rows.append(dict(zip(row_columns, values)))
             
-            # VALUES句を抽出
-            values_match = re.search(r'VALUES\s*(.+?)(?:;|\n--)', content, re.IGNORECASE | re.DOTALL)
-            if not values_match:
+            if table_name is None:
                 return None
-                
-            values_text = values_match.group(1)
-            
-            # 各行のデータを抽出
-            rows = []
-            # VALUES内の各行を解析（括弧で囲まれた部分）
-            row_pattern = r'\(\s*([^)]+)\s*\)'
-            row_matches = re.findall(row_pattern, values_text, re.DOTALL)
-            
-            for row_match in row_matches:
-                row_values = self.parse_row_values(row_match)
-                if len(row_values) == len(columns):
-                    row_data = dict(zip(columns, row_values))
-                    rows.append(row_data)
             
             return {
                 'table_name': table_name,
@@ -162,49 +154,6 @@ class SQLToSeedConverter:
             print(f"Error parsing {file_path}: {e}")
             return None
 
-    def parse_row_values(self, row_text: str) -> List[str]:
-        """行の値を解析"""
-        values = []
-        current_value = ""
-        in_quotes = False
-        quote_char = None
-        paren_depth = 0
-        
-        i = 0
-        while i < len(row_text):
-            char = row_text[i]
-            
-            if not in_quotes:
-                if char in ["'", '"']:
-                    in_quotes = True
-                    quote_char = char
-                    current_value += char
-                elif char == '(':
-                    paren_depth += 1
-                    current_value += char
-                elif char == ')':
-                    paren_depth -= 1
-                    current_value += char
-                elif char == ',' and paren_depth == 0:
-                    values.append(current_value.strip())
-                    current_value = ""
-                else:
-                    current_value += char
-            else:
-                current_value += char
-                if char == quote_char:
-                    # エスケープされていない引用符の終了をチェック
-                    if i == 0 or row_text[i-1] != '\\':
-                        in_quotes = False
-                        quote_char = None
-            
-            i += 1
-        
-        if current_value.strip():
-            values.append(current_value.strip())
-        
-        return values
-
     def convert_value(self, value: str, column_name: str) -> str:
         """SQLの値をTypeScript/Prismaの値に変換"""
         value = value.strip()
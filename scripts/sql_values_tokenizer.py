@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQL INSERT ... VALUES 句のトークナイザー（sql-to-seed*.py 共通）
+要求仕様ID: PLT.1-DB.1 - データベース初期データ投入自動化
+
+SQLファイルを先頭から1回だけ走査し、INSERT文の行を1行ずつ返します（ファイルサイズに対して線形）。
+- 文字列リテラルは '' のエスケープに対応し、\\ のエスケープは E'...' のみ（引用符内の , ( ) ; は区切りとみなさない）
+- 値の中の括弧（関数呼び出し・ARRAY[...] など）は入れ子の深さを追跡し、最も外側のカンマでのみ分割する
+- 1ファイルに複数のINSERT文（1行1文・複数行INSERT・ON CONFLICT 付き）があっても順に処理
+- コメント（-- / /* */）、BEGIN/COMMIT などのINSERT以外の文、COPY ... FROM STDIN のデータは読み飛ばす
+- カラム一覧のない INSERT INTO テーブル名 VALUES は値とカラムを対応付けられないため SqlTokenizeError
+- 値は SQL リテラルのテキスト（引用符付き）のまま返す。Python の値への変換は parse_sql_literal を使用
+
+使い方:
+    for table, columns, values in iter_insert_rows(sql_text):
+        ...
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+# 1行分の値: (テーブル名, カラム名のタプル, SQLリテラルのリスト)
+InsertRow = Tuple[str, Tuple[str, ...], List[str]]
+
+# 正規表現は「通常文字* (特殊要素 通常文字*)*」の形で記述し、バックトラックを発生させない
+# 文字列リテラル（'' のエスケープ）・エスケープ文字列（E'...'、'' と \' のエスケープ）・引用符付き識別子
+_STRING = r"'[^']*(?:''[^']*)*'"
+_ESCAPE_STRING = r"(?<![\w$])[Ee]'[^'\\]*(?:(?:''|\\.)[^'\\]*)*'"
+_IDENT = r'"[^"]*(?:""[^"]*)*"'
+
+# 空白とコメント
+_GAP = r"\s*(?:(?:--[^\n]*|/\*.*?\*/)\s*)*"
+
+# INSERT INTO テーブル名 (カラム, ...) VALUES（カラム一覧がない場合は group(2) が None）
+_INSERT_HEAD_RE = re.compile(
+    rf"\bINSERT\s+INTO\s+([\w.\"]+)\s*(?:\(([^()'\"]*(?:{_IDENT}[^()'\"]*)*)\)\s*)?VALUES\b",
+    re.IGNORECASE | re.DOTALL,
+)
+# COPY ... FROM STDIN; から \. までのデータ
+_COPY_BLOCK_RE = re.compile(
+    r"\bCOPY\s[^;]*?\bFROM\s+STDIN\b[^;]*;.*?^\\\.[ \t]*$",
+    re.IGNORECASE | re.DOTALL | re.MULTILINE,
+)
+# INSERT文以外の読み飛ばし単位（コメント・リテラル・INSERT/COPY の先頭になり得ない文字の連続・その他1文字）
+_SKIP_RE = re.compile(
+    rf"--[^\n]*|/\*.*?\*/|{_ESCAPE_STRING}|{_STRING}|{_IDENT}|[^'\"/\-IiCcEe]+|.",
+    re.DOTALL,
+)
+# VALUES の1行の開き括弧
+_ROW_START_RE = re.compile(rf"{_GAP}\(", re.DOTALL)
+# 括弧・コメント・E'...' を含まない行（大半の行は正規表現だけで分割し、それ以外は _scan_row で読む）
+_FLAT = r"[^'\"()\[\];\-/]"
+_FLAT_ROW_RE = re.compile(
+    rf"{_FLAT}*(?:(?:(?<![Ee]){_STRING}|{_IDENT}|[-/](?![-*])){_FLAT}*)*\)"
+)
+_FLAT_VALUE_RE = re.compile(rf"\s*([^,'\"]*(?:(?:{_STRING}|{_IDENT})[^,'\"]*)*),")
+# 行内の構造トークン（リテラル・コメントは1トークンとして読み飛ばす。閉じていない引用符は単独の '）
+# 構造に関係しない文字の連続は finditer が読み飛ばすため、Python側の処理は値の数に比例する
+_ROW_TOKEN_RE = re.compile(
+    rf"{_ESCAPE_STRING}|{_STRING}|{_IDENT}|--[^\n]*|/\*.*?\*/|[()\[\],;'\"]",
+    re.DOTALL,
+)
+_CLOSING = {"(": ")", "[": "]"}
+# 行の後の区切り（, は次の行、; または ON CONFLICT ... ; は文の終わり）
+_ROW_SEPARATOR_RE = re.compile(
+    rf"{_GAP}(?:(,)|;|ON\s+CONFLICT\b[^;']*(?:{_STRING}[^;']*)*;|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+_COLUMN_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+class SqlTokenizeError(ValueError):
+    """VALUES 句を解析できない場合のエラー"""
+
+
+def _line_number(text: str, pos: int) -> int:
+    return text.count("\n", 0, pos) + 1
+
+
+@lru_cache(maxsize=256)
+def _split_columns(columns_text: str) -> Tuple[str, ...]:
+    # 同じカラム構成のINSERT文が続くため、カラム一覧を共有する
+    columns_text = _COLUMN_COMMENT_RE.sub("", columns_text)
+    return tuple(col.strip().strip('"') for col in columns_text.split(",") if col.strip())
+
+
+def _scan_row(text: str, pos: int) -> Tuple[List[str], int]:
+    """開き括弧の直後から1行分の値を読み、(値のリスト, 閉じ括弧の直後の位置) を返す
+
+    括弧（( ) [ ]）の入れ子を追跡し、最も外側のカンマでのみ値を区切る。
+
+    Raises:
+        SqlTokenizeError: 括弧・引用符が閉じていない、または対応していない場合
+    """
+    values: List[str] = []
+    expected: List[str] = []
+    comments: List[Tuple[int, int]] = []
+    start = pos
+
+    def value_text(end: int) -> str:
+        if not comments:
+            return text[start:end].strip()
+        # 値の中のコメントを除く
+        parts, cursor = [], start
+        for comment_start, comment_end in comments:
+            parts.append(text[cursor:comment_start])
+            cursor = comment_end
+        parts.append(text[cursor:end])
+        comments.clear()
+        return " ".join(part.strip() for part in parts if part.strip())
+
+    for token in _ROW_TOKEN_RE.finditer(text, pos):
+        char = token.group()
+        if len(char) > 1:
+            # 文字列リテラル・引用符付き識別子・コメント
+            if char[0] in "-/":
+                comments.append(token.span())
+            continue
+        if char == ",":
+            if not expected:
+                values.append(value_text(token.start()))
+                start = token.end()
+        elif char in _CLOSING:
+            expected.append(_CLOSING[char])
+        elif char in ")]":
+            if expected:
+                if expected.pop() != char:
+                    raise SqlTokenizeError(f"括弧が対応していません: {char}（{_line_number(text, token.start())}行目）")
+            elif char == ")":
+                values.append(value_text(token.start()))
+                return values, token.end()
+            else:
+                raise SqlTokenizeError(f"括弧が対応していません: ]（{_line_number(text, token.start())}行目）")
+        elif char == ";":
+            raise SqlTokenizeError(f"行の括弧が閉じていません（{_line_number(text, token.start())}行目）")
+        else:
+            raise SqlTokenizeError(f"引用符が閉じていません（{_line_number(text, token.start())}行目）")
+    raise SqlTokenizeError(f"行の括弧が閉じていません（{_line_number(text, pos)}行目）")
+
+
+def split_values(row_text: str) -> List[str]:
+    """1行分の VALUES（外側の括弧を除いたテキスト）を値ごとに分割"""
+    return _scan_row(row_text + ")", 0)[0]
+
+
+def iter_insert_rows(text: str) -> Iterator[InsertRow]:
+    """SQLテキスト中のINSERT文の行を順に返す
+
+    Args:
+        text: SQLファイルの内容
+
+    Yields:
+        InsertRow: (テーブル名, カラム名のタプル, SQLリテラルのリスト)
+
+    Raises:
+        SqlTokenizeError: VALUES 句の行を解析できない場合
+    """
+    pos = 0
+    length = len(text)
+    while pos < length:
+        head = _INSERT_HEAD_RE.match(text, pos)
+        if head is None:
+            block = _COPY_BLOCK_RE.match(text, pos)
+            pos = (block or _SKIP_RE.match(text, pos)).end()
+            continue
+
+        table = head.group(1).strip('"')
+        if head.group(2) is None:
+            raise SqlTokenizeError(
+                f"{table}: カラム一覧のないINSERT文には対応していません（{_line_number(text, head.start())}行目）"
+            )
+        columns = _split_columns(head.group(2))
+        pos = head.end()
+        while True:
+            row = _ROW_START_RE.match(text, pos)
+            if row is None:
+                raise SqlTokenizeError(f"{table}: VALUES の行を解析できません（{_line_number(text, pos)}行目）")
+            flat = _FLAT_ROW_RE.match(text, row.end())
+            if flat is not None:
+                row_end = flat.end()
+                values = list(map(str.rstrip, _FLAT_VALUE_RE.findall(text[row.end():row_end - 1] + ",")))
+            else:
+                try:
+                    values, row_end = _scan_row(text, row.end())
+                except SqlTokenizeError as e:
+                    raise SqlTokenizeError(f"{table}: {e}") from None
+            yield table, columns, values
+
+            separator = _ROW_SEPARATOR_RE.match(text, row_end)
+            if separator is None:
+                # RETURNING 句など、行の後の未対応の句は読み飛ばす
+                pos = row_end
+                break
+            pos = separator.end()
+            if separator.group(1) is None:
+                break
+
+
+def iter_file_rows(path: Union[str, Path], encoding: str = "utf-8") -> Iterator[InsertRow]:
+    """SQLファイル中のINSERT文の行を順に返す"""
+    return iter_insert_rows(Path(path).read_text(encoding=encoding))
+
+
+def unquote_sql_string(value: str) -> Optional[str]:
+    """引用符付きのリテラルから値を取り出す（引用符で囲まれていない場合はNone）
+
+    \\ のエスケープは E'...' のみ解釈する（標準の文字列ではバックスラッシュはそのままの文字）。
+    """
+    if len(value) >= 3 and value[0] in "Ee" and value[1] == value[-1] == "'":
+        return _ESCAPE_SEQUENCE_RE.sub(_unescape, value[2:-1])
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
+        quote = value[0]
+        return value[1:-1].replace(quote * 2, quote)
+    return None
+
+
+_ESCAPE_SEQUENCE_RE = re.compile(r"''|\\(.)", re.DOTALL)
+_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+def _unescape(match: "re.Match[str]") -> str:
+    char = match.group(1)
+    if char is None:
+        return "'"
+    return _ESCAPES.get(char, char)
+
+
+def parse_sql_literal(value: str) -> Any:
+    """SQLリテラルを Python の値に変換（NULL -> None、TRUE/FALSE -> bool、文字列 -> 引用符を除いた値）
+
+    数値・関数呼び出しなどはテキストのまま返す。
+    """
+    upper = value.upper()
+    if upper == "NULL":
+        return None
+    if upper == "TRUE":
+        return True
+    if upper == "FALSE":
+        return False
+    unquoted = unquote_sql_string(value)
+    return value if unquoted is None else unquoted